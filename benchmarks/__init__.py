@@ -0,0 +1,4 @@
+"""Throughput and memory benchmarks for the kloppy loaders.
+
+See `benchmarks/README.md`.
+"""
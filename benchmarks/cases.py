@@ -0,0 +1,170 @@
+"""The benchmark cases: one per provider loader."""
+
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from . import generators
+from .generators import Generator
+
+
+@dataclass(frozen=True)
+class Case:
+    """A loader call on generated (or fixture) inputs.
+
+    Args:
+        name: A unique name, used to compare results between runs.
+        provider: The kloppy provider module (e.g. "tracab").
+        loader: The name of the loader function in the provider module.
+        kind: "tracking" or "event".
+        generator: Writes the inputs and returns the loader arguments.
+        kwargs: Extra keyword arguments for the loader.
+    """
+
+    name: str
+    provider: str
+    loader: str
+    kind: Literal["tracking", "event"]
+    generator: Generator
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+CASES = [
+    # Tracking data, scaled to a full match
+    Case(
+        "tracab_dat",
+        "tracab",
+        "load",
+        "tracking",
+        generators.tracab_dat,
+    ),
+    Case(
+        "secondspectrum",
+        "secondspectrum",
+        "load",
+        "tracking",
+        generators.secondspectrum,
+    ),
+    Case(
+        "statsperform_tracking",
+        "statsperform",
+        "load_tracking",
+        "tracking",
+        generators.statsperform,
+    ),
+    Case("pff", "pff", "load_tracking", "tracking", generators.pff),
+    Case(
+        "metrica_csv",
+        "metrica",
+        "load_tracking_csv",
+        "tracking",
+        generators.metrica_csv,
+    ),
+    # Tracking data, the fixtures as they are
+    Case(
+        "tracab_json",
+        "tracab",
+        "load",
+        "tracking",
+        generators.fixtures(
+            meta_data="tracab_meta.json", raw_data="tracab_raw.json"
+        ),
+    ),
+    Case(
+        "metrica_epts",
+        "metrica",
+        "load_tracking_epts",
+        "tracking",
+        generators.fixtures(
+            meta_data="epts_metrica_metadata.xml",
+            raw_data="epts_metrica_tracking.txt",
+        ),
+    ),
+    Case(
+        "skillcorner",
+        "skillcorner",
+        "load",
+        "tracking",
+        generators.fixtures(
+            meta_data="skillcorner_meta_data.json",
+            raw_data="skillcorner_v3_raw_data.jsonl",
+        ),
+        {"include_empty_frames": True},
+    ),
+    Case(
+        "sportec_tracking",
+        "sportec",
+        "load_tracking",
+        "tracking",
+        generators.fixtures(
+            meta_data="sportec_meta.xml", raw_data="sportec_positional.xml"
+        ),
+    ),
+    Case(
+        "signality",
+        "signality",
+        "load",
+        "tracking",
+        generators.fixtures(
+            meta_data="signality_meta_data.json",
+            raw_data_feeds=[
+                "signality_p1_raw_data_subset.json",
+                "signality_p2_raw_data_subset.json",
+            ],
+            venue_information="signality_venue_information.json",
+        ),
+    ),
+    # Event data, scaled to a full match
+    Case("opta", "opta", "load", "event", generators.opta),
+    Case(
+        "sportec_event",
+        "sportec",
+        "load_event",
+        "event",
+        generators.sportec_event,
+    ),
+    # Event data, the fixtures contain complete matches
+    Case(
+        "statsbomb",
+        "statsbomb",
+        "load",
+        "event",
+        generators.fixtures(
+            event_data="statsbomb_event.json",
+            lineup_data="statsbomb_lineup.json",
+        ),
+    ),
+    Case(
+        "wyscout_v2",
+        "wyscout",
+        "load",
+        "event",
+        generators.fixtures(event_data="wyscout_events_v2.json"),
+    ),
+    Case(
+        "statsperform_event",
+        "statsperform",
+        "load_event",
+        "event",
+        generators.fixtures(
+            ma1_data="statsperform_event_ma1.json",
+            ma3_data="statsperform_event_ma3.json",
+        ),
+    ),
+    Case(
+        "metrica_json",
+        "metrica",
+        "load_event",
+        "event",
+        generators.fixtures(
+            event_data="metrica_events.json",
+            meta_data="epts_metrica_metadata.xml",
+        ),
+    ),
+    Case(
+        "datafactory",
+        "datafactory",
+        "load",
+        "event",
+        generators.fixtures(event_data="datafactory_events.json"),
+    ),
+]
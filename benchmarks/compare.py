@@ -0,0 +1,102 @@
+"""Compare two benchmark result files.
+
+Usage:
+    python -m benchmarks.compare baseline.json current.json [--threshold 0.1]
+
+Prints the relative change of every metric per case and exits with status 1
+when a metric got worse by more than the threshold or a case started to
+fail.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+from typing import Optional
+
+# Lower is better for all compared metrics
+METRICS = ["load_s", "transform_s", "to_df_s", "peak_rss_mb"]
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = 0.1
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """
+    Compare the results of two runs.
+
+    Returns:
+        All changes, the regressions (changes above the threshold) and the
+        cases that failed in the current run but not in the baseline.
+    """
+    baseline_results = {
+        result["name"]: result for result in baseline["results"]
+    }
+
+    changes, failures = [], []
+    for result in current["results"]:
+        other = baseline_results.get(result["name"])
+        if other is None:
+            continue
+        if "error" in result and "error" not in other:
+            failures.append(result)
+            continue
+        for metric in METRICS:
+            before, after = other.get(metric), result.get(metric)
+            if not before or after is None:
+                continue
+            changes.append(
+                {
+                    "name": result["name"],
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change": after / before - 1,
+                }
+            )
+    regressions = [change for change in changes if change["change"] > threshold]
+    return changes, regressions, failures
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative increase that counts as a regression (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    changes, regressions, failures = compare(baseline, current, args.threshold)
+
+    print(
+        f"baseline: kloppy {baseline['kloppy_version']} "
+        f"({baseline.get('git_commit')})"
+    )
+    print(
+        f"current:  kloppy {current['kloppy_version']} "
+        f"({current.get('git_commit')})"
+    )
+    print()
+    print(f"{'case':<24}{'metric':<14}{'baseline':>12}{'current':>12}  change")
+    for change in changes:
+        flag = "  REGRESSION" if change in regressions else ""
+        print(
+            f"{change['name']:<24}{change['metric']:<14}"
+            f"{change['baseline']:>12.3f}{change['current']:>12.3f}"
+            f"  {change['change']:+.1%}{flag}"
+        )
+
+    for failure in failures:
+        print(f"{failure['name']:<24}FAILED: {failure['error']}")
+
+    if regressions or failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""Synthetic full-match inputs built from the test fixtures.
+
+The tracking fixtures in `kloppy/tests/files` contain a few seconds of
+data. The generators below cycle through their frames and rewrite the
+frame ids, timestamps and periods so the output covers two full halves at
+the provider's frame rate. Most event fixtures contain complete matches
+and are used as they are. The Opta F24 and Sportec event fixtures only
+contain a few dozen events; their generators repeat the events in play to
+the size of a full match.
+
+Every generator writes its files to a directory and returns the keyword
+arguments for the provider's loader.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterator
+import copy
+from datetime import datetime
+import json
+from pathlib import Path
+import shutil
+from typing import Any, Callable, Optional, Union
+
+from lxml import etree
+
+FIXTURES = Path(__file__).parent.parent / "kloppy" / "tests" / "files"
+
+HALF_SECONDS = 45 * 60
+
+# The number of events in a match of the complete event fixtures
+EVENTS_PER_MATCH = 1700
+
+Generator = Callable[[Path, float], dict[str, Any]]
+
+
+def _fixture(name: str) -> Path:
+    return FIXTURES / name
+
+
+def _cycle(items: list, n: int) -> Iterator:
+    for i in range(n):
+        yield i, items[i % len(items)]
+
+
+def _copy(target_dir: Path, *names: str) -> list[Path]:
+    paths = []
+    for name in names:
+        path = target_dir / name
+        if not path.exists():
+            shutil.copy(_fixture(name), path)
+        paths.append(path)
+    return paths
+
+
+def tracab_dat(target_dir: Path, scale: float) -> dict[str, Any]:
+    """TRACAB .dat at 25 Hz, within the period bounds of the metadata."""
+    # The metadata periods: 1848508 - 1916408 and 1942114 - 2017933
+    periods = [(1848508, 1916408), (1942114, 2017933)]
+    lines = [
+        line.split(":", 1)[1]
+        for line in _fixture("tracab_raw.dat").read_text().splitlines()
+        if line.strip()
+    ]
+
+    (meta_data,) = _copy(target_dir, "tracab_meta.xml")
+    raw_data = target_dir / "tracab_raw.dat"
+    with open(raw_data, "w") as fp:
+        for start, end in periods:
+            n = int((end - start + 1) * scale)
+            for i, line in _cycle(lines, n):
+                fp.write(f"{start + i}:{line}\n")
+    return {"meta_data": meta_data, "raw_data": raw_data}
+
+
+def secondspectrum(target_dir: Path, scale: float) -> dict[str, Any]:
+    """Second Spectrum JSON Lines at 25 Hz."""
+    frames = defaultdict(list)
+    with open(_fixture("second_spectrum_fake_data.jsonl"), "rb") as fp:
+        for line in fp:
+            if line.strip():
+                frame = json.loads(line)
+                frames[frame["period"]].append(frame)
+
+    meta_data, additional_meta_data = _copy(
+        target_dir,
+        "second_spectrum_fake_metadata.xml",
+        "second_spectrum_fake_metadata.json",
+    )
+    raw_data = target_dir / "second_spectrum_data.jsonl"
+    n = int(HALF_SECONDS * 25 * scale)
+    frame_idx = 0
+    with open(raw_data, "w") as fp:
+        for period, templates in sorted(frames.items()):
+            for i, frame in _cycle(templates, n):
+                frame = dict(
+                    frame,
+                    frameIdx=frame_idx,
+                    gameClock=i / 25,
+                    wallClock=frame_idx * 40,
+                )
+                fp.write(json.dumps(frame) + "\n")
+                frame_idx += 1
+    return {
+        "meta_data": meta_data,
+        "raw_data": raw_data,
+        "additional_meta_data": additional_meta_data,
+    }
+
+
+def statsperform(target_dir: Path, scale: float) -> dict[str, Any]:
+    """Stats Perform MA25 at 10 Hz."""
+    lines = defaultdict(list)
+    for line in (
+        _fixture("statsperform_tracking_ma25.txt").read_text().split("\n")
+    ):
+        if line.strip():
+            header, rest = line.split(":", 1)
+            _, info = header.split(";")
+            _, period, status = info.split(",")
+            lines[int(period)].append((status, rest))
+
+    (ma1_data,) = _copy(target_dir, "statsperform_tracking_ma1.json")
+    ma25_data = target_dir / "statsperform_tracking_ma25.txt"
+    n = int(HALF_SECONDS * 10 * scale)
+    wall_clock = 1598184000000
+    with open(ma25_data, "w") as fp:
+        for period, templates in sorted(lines.items()):
+            for i, (status, rest) in _cycle(templates, n):
+                fp.write(
+                    f"{wall_clock + i * 100};{i * 100},{period},{status}:"
+                    f"{rest}\n"
+                )
+            wall_clock += (HALF_SECONDS + 15 * 60) * 1000
+    return {"ma1_data": ma1_data, "ma25_data": ma25_data}
+
+
+def pff(target_dir: Path, scale: float) -> dict[str, Any]:
+    """PFF JSON Lines at the frame rate of the metadata."""
+    meta_data, roster_meta_data = _copy(
+        target_dir, "pff_metadata_10517.json", "pff_rosters_10517.json"
+    )
+    frame_rate = json.loads(meta_data.read_text())[0]["fps"]
+
+    frames = defaultdict(list)
+    with open(_fixture("pff_10517.jsonl"), "rb") as fp:
+        for line in fp:
+            if line.strip():
+                frame = json.loads(line)
+                if frame["period"] is not None:
+                    frames[frame["period"]].append(frame)
+
+    raw_data = target_dir / "pff_10517.jsonl"
+    n = int(HALF_SECONDS * frame_rate * scale)
+    frame_num = 0
+    with open(raw_data, "w") as fp:
+        for period, templates in sorted(frames.items()):
+            for i, frame in _cycle(templates, n):
+                frame = dict(
+                    frame,
+                    frameNum=frame_num,
+                    periodElapsedTime=i / frame_rate,
+                    periodGameClockTime=i / frame_rate,
+                )
+                fp.write(json.dumps(frame) + "\n")
+                frame_num += 1
+    return {
+        "meta_data": meta_data,
+        "roster_meta_data": roster_meta_data,
+        "raw_data": raw_data,
+    }
+
+
+def metrica_csv(target_dir: Path, scale: float) -> dict[str, Any]:
+    """Metrica CSV (home and away file) at 25 Hz."""
+    paths = {}
+    n = int(HALF_SECONDS * 25 * scale)
+    for ground in ("home", "away"):
+        header, rows = [], []
+        for line in _fixture(f"metrica_{ground}.csv").read_text().splitlines():
+            if len(header) < 3:
+                header.append(line)
+            elif line.strip():
+                rows.append(line.split(",", 3)[3])
+
+        path = paths[f"{ground}_data"] = target_dir / f"metrica_{ground}.csv"
+        with open(path, "w") as fp:
+            fp.write("\n".join(header) + "\n")
+            frame = 1
+            for period in (1, 2):
+                for _, row in _cycle(rows, n):
+                    fp.write(f"{period},{frame},{frame / 25:.2f},{row}\n")
+                    frame += 1
+    return paths
+
+
+def _spread(
+    templates: list, n: int, start: datetime, end: datetime
+) -> Iterator[tuple[int, Any, datetime]]:
+    """Cycle through the templates, spread evenly between start and end."""
+    step = (end - start) / (n + 1)
+    for i, template in _cycle(templates, n):
+        yield i, template, start + step * (i + 1)
+
+
+def opta(target_dir: Path, scale: float) -> dict[str, Any]:
+    """Opta F7 and F24, with the events of both halves repeated."""
+    (f7_data,) = _copy(target_dir, "opta_f7.xml")
+    tree = etree.parse(str(_fixture("opta_f24.xml")))
+    game = tree.getroot().find("Game")
+
+    def period_id(event) -> int:
+        return int(event.attrib["period_id"])
+
+    def type_id(event) -> int:
+        return int(event.attrib["type_id"])
+
+    def timestamp(event) -> datetime:
+        return datetime.fromisoformat(event.attrib["timestamp"])
+
+    # The events in play, without the period markers (start 32 and end 30)
+    # and the substitutions (18 and 19)
+    events = list(game.iterchildren("Event"))
+    templates = [
+        event
+        for event in events
+        if period_id(event) in (1, 2) and type_id(event) not in (18, 19, 30, 32)
+    ]
+    for event in templates:
+        game.remove(event)
+
+    n = int(EVENTS_PER_MATCH / 2 * scale)
+    for period in (1, 2):
+        markers = [event for event in events if period_id(event) == period]
+        start = max(map(timestamp, (e for e in markers if type_id(e) == 32)))
+        end = min(map(timestamp, (e for e in markers if type_id(e) == 30)))
+        position = game.index(next(e for e in markers if type_id(e) == 30))
+        for i, template, time in _spread(templates, n, start, end):
+            event = copy.deepcopy(template)
+            seconds = (
+                int((time - start).total_seconds()) + (period - 1) * 45 * 60
+            )
+            event.attrib.update(
+                {
+                    "id": str(3_000_000_000 + period * n + i),
+                    "event_id": str(10_000 + period * n + i),
+                    "period_id": str(period),
+                    "min": str(seconds // 60),
+                    "sec": str(seconds % 60),
+                    "timestamp": time.isoformat(timespec="milliseconds"),
+                }
+            )
+            game.insert(position + i, event)
+
+    f24_data = target_dir / "opta_f24.xml"
+    tree.write(str(f24_data), xml_declaration=True, encoding="UTF-8")
+    return {"f7_data": f7_data, "f24_data": f24_data}
+
+
+def sportec_event(target_dir: Path, scale: float) -> dict[str, Any]:
+    """Sportec events, with the events of both halves repeated."""
+    (meta_data,) = _copy(target_dir, "sportec_meta.xml")
+    tree = etree.parse(str(_fixture("sportec_events.xml")))
+    root = tree.getroot()
+
+    def game_section(event) -> Optional[str]:
+        return event[0].attrib.get("GameSection")
+
+    def event_time(event) -> datetime:
+        return datetime.fromisoformat(event.attrib["EventTime"])
+
+    # The events between the kick-off and the final whistle of each half
+    events = list(root.iterchildren("Event"))
+    markers = [event for event in events if game_section(event)]
+    templates = [event for event in events if not game_section(event)]
+    for event in templates:
+        root.remove(event)
+
+    n = int(EVENTS_PER_MATCH / 2 * scale)
+    for half, (kick_off, final_whistle) in enumerate(
+        zip(markers[::2], markers[1::2])
+    ):
+        position = root.index(final_whistle)
+        for i, template, time in _spread(
+            templates, n, event_time(kick_off), event_time(final_whistle)
+        ):
+            event = copy.deepcopy(template)
+            event.attrib.update(
+                {
+                    "EventId": str(10_000_000 + half * n + i),
+                    "EventTime": time.isoformat(timespec="milliseconds"),
+                }
+            )
+            root.insert(position + i, event)
+
+    event_data = target_dir / "sportec_events.xml"
+    tree.write(str(event_data), encoding="UTF-8")
+    return {"event_data": event_data, "meta_data": meta_data}
+
+
+def fixtures(**inputs: Union[str, list[str]]) -> Generator:
+    """Use the fixture files as they are."""
+
+    def generator(target_dir: Path, scale: float) -> dict[str, Any]:
+        return {
+            name: (
+                _copy(target_dir, *filenames)
+                if isinstance(filenames, list)
+                else _copy(target_dir, filenames)[0]
+            )
+            for name, filenames in inputs.items()
+        }
+
+    return generator
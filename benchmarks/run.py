@@ -0,0 +1,205 @@
+"""Run the benchmarks and write the results to a JSON file.
+
+Usage:
+    python -m benchmarks.run --output results.json [--scale 1.0]
+        [--repeat 3] [--case tracab_dat --case statsbomb]
+
+Every case runs in a fresh process, so the peak RSS of one case is not
+influenced by the others.
+"""
+
+import argparse
+from datetime import datetime, timezone
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+from .cases import CASES, Case
+
+RESULTS_VERSION = 1
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    if sys.platform == "darwin":
+        return peak / 1024**2
+    return peak / 1024
+
+
+def _timed(func: Callable[[], Any], repeat: int) -> tuple[Any, float]:
+    """Return the last result and the median duration in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+    return result, statistics.median(durations)
+
+
+def _measure(name: str, kwargs: dict[str, Any], repeat: int) -> dict:
+    from importlib import import_module
+
+    case = next(case for case in CASES if case.name == name)
+    loader = getattr(import_module(f"kloppy.{case.provider}"), case.loader)
+    baseline_rss_mb = _peak_rss_mb()
+
+    dataset, load_s = _timed(lambda: loader(**kwargs, **case.kwargs), repeat=1)
+    peak_rss_mb = _peak_rss_mb()
+    if repeat > 1:
+        del dataset
+        dataset, load_s = _timed(
+            lambda: loader(**kwargs, **case.kwargs), repeat
+        )
+
+    _, transform_s = _timed(
+        lambda: dataset.transform(to_coordinate_system="tracab"), repeat
+    )
+    _, to_df_s = _timed(lambda: dataset.to_df(engine="pandas"), repeat)
+
+    return {
+        "records": len(dataset),
+        "load_s": load_s,
+        "records_per_s": len(dataset) / load_s if load_s else None,
+        "transform_s": transform_s,
+        "to_df_s": to_df_s,
+        "baseline_rss_mb": baseline_rss_mb,
+        "peak_rss_mb": peak_rss_mb,
+    }
+
+
+def _run_case(case: Case, kwargs: dict[str, Any], repeat: int) -> dict:
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(_measure, (case.name, kwargs, repeat))
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    cases: list[Case],
+    data_dir: Path,
+    scale: float = 1.0,
+    repeat: int = 3,
+    log: Callable[[str], None] = print,
+) -> dict:
+    """Run the cases and return the results."""
+    import kloppy
+
+    results = []
+    for case in cases:
+        case_dir = data_dir / f"{case.name}-{scale:g}"
+        case_dir.mkdir(parents=True, exist_ok=True)
+        kwargs = case.generator(case_dir, scale)
+
+        log(f"Running {case.name}")
+        try:
+            result = _run_case(case, kwargs, repeat)
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        results.append(
+            {
+                "name": case.name,
+                "provider": case.provider,
+                "loader": case.loader,
+                "kind": case.kind,
+                "input_bytes": sum(
+                    os.path.getsize(path)
+                    for value in kwargs.values()
+                    for path in (value if isinstance(value, list) else [value])
+                ),
+                **result,
+            }
+        )
+        log(f"{case.name}: {json.dumps(result)}")
+
+    return {
+        "version": RESULTS_VERSION,
+        "kloppy_version": kloppy.__version__,
+        "git_commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scale": scale,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the results to this JSON file (default: stdout)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Fraction of a full match to generate for tracking data",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of timed runs per measurement (the median is reported)",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=[case.name for case in CASES],
+        help="Only run this case (can be given multiple times)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        help="Directory for the generated inputs (default: a temporary "
+        "directory that is removed afterwards)",
+    )
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if not args.case or case.name in args.case]
+
+    def log(message: str) -> None:
+        print(message, file=sys.stderr)
+
+    if args.data_dir:
+        results = run(cases, args.data_dir, args.scale, args.repeat, log)
+    else:
+        with tempfile.TemporaryDirectory() as data_dir:
+            results = run(cases, Path(data_dir), args.scale, args.repeat, log)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
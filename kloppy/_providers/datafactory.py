@@ -2,6 +2,7 @@ from typing import Optional
 
 from kloppy.config import get_config
 from kloppy.domain import EventDataset, EventFactory
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.event.datafactory import (
     DatafactoryDeserializer,
     DatafactoryInputs,
@@ -9,6 +10,7 @@ from kloppy.infra.serializers.event.datafactory import (
 from kloppy.io import FileLike, open_as_file
 
 
+@cached_load("event_data")
 def load(
     event_data: FileLike,
     event_types: Optional[list[str]] = None,
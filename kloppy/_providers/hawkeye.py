@@ -2,6 +2,7 @@ from collections.abc import Iterable
 from typing import Optional, Union
 
 from kloppy.domain import TrackingDataset
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.tracking.hawkeye import (
     HawkEyeDeserializer,
     HawkEyeInputs,
@@ -9,6 +10,12 @@ from kloppy.infra.serializers.tracking.hawkeye import (
 from kloppy.io import FileLike, expand_inputs
 
 
+@cached_load(
+    "ball_feeds",
+    "player_centroid_feeds",
+    "meta_data",
+    ignore=("show_progress", "workers"),
+)
 def load(
     ball_feeds: Union[FileLike, Iterable[FileLike]],
     player_centroid_feeds: Union[FileLike, Iterable[FileLike]],
@@ -19,6 +26,7 @@ def load(
     limit: Optional[int] = None,
     coordinates: Optional[str] = None,
     show_progress: Optional[bool] = False,
+    workers: Optional[int] = 1,
 ) -> TrackingDataset:
     """
     Load HawkEye tracking data.
@@ -45,12 +53,22 @@ def load(
         limit: Limit the number of frames to load to the first `limit` frames.
         coordinates: The coordinate system to use.
         show_progress: Show a progress bar while parsing the data.
+        workers: The number of worker processes used to decode the feeds.
+            By default, the feeds are processed one by one in the current
+            process. With more than one worker, the feeds are fetched in a
+            pool of threads and decoded in a pool of processes, and merged
+            in their original order.
 
     Returns:
         The parsed tracking data.
 
     Note:
         Pose tracking data is not yet supported.
+
+    Note:
+        On platforms that start worker processes with "spawn" (Windows and
+        macOS), call this function from within an
+        `if __name__ == "__main__":` block when `workers` is more than one.
     """
     ball_feeds = expand_inputs(ball_feeds, regex_filter="samples.ball")
     player_centroid_feeds = expand_inputs(
@@ -70,5 +88,6 @@ def load(
             player_centroid_feeds=player_centroid_feeds,
             meta_data=meta_data,
             show_progress=show_progress,
+            workers=workers,
         )
     )
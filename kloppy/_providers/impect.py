@@ -3,6 +3,7 @@ import warnings
 
 from kloppy.config import get_config
 from kloppy.domain import EventDataset, EventFactory
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.event.impect import (
     ImpectDeserializer,
     ImpectInputs,
@@ -10,6 +11,7 @@ from kloppy.infra.serializers.event.impect import (
 from kloppy.io import FileLike, Source, open_as_file
 
 
+@cached_load("event_data", "lineup_data", "squads_data", "players_data")
 def load(
     event_data: FileLike,
     lineup_data: FileLike,
@@ -3,6 +3,7 @@ from typing import Optional, Union
 from kloppy.config import get_config
 from kloppy.domain import EventDataset, EventFactory, TrackingDataset
 from kloppy.exceptions import KloppyError
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.event.metrica import (
     MetricaJsonEventDataDeserializer,
     MetricaJsonEventDataInputs,
@@ -19,6 +20,7 @@ from kloppy.io import FileLike, open_as_file
 from kloppy.utils import github_resolve_raw_data_url
 
 
+@cached_load("home_data", "away_data")
 def load_tracking_csv(
     home_data: FileLike,
     away_data: FileLike,
@@ -53,6 +55,7 @@ def load_tracking_csv(
         )
 
 
+@cached_load("meta_data", "raw_data")
 def load_tracking_epts(
     meta_data: FileLike,
     raw_data: FileLike,
@@ -87,6 +90,7 @@ def load_tracking_epts(
         )
 
 
+@cached_load("event_data", "meta_data")
 def load_event(
     event_data: FileLike,
     meta_data: FileLike,
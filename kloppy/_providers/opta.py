@@ -2,6 +2,7 @@ from typing import Optional
 
 from kloppy.config import get_config
 from kloppy.domain import EventDataset, EventFactory
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.event.statsperform import (
     StatsPerformDeserializer,
     StatsPerformInputs,
@@ -9,6 +10,7 @@ from kloppy.infra.serializers.event.statsperform import (
 from kloppy.io import FileLike, open_as_file
 
 
+@cached_load("f7_data", "f24_data")
 def load(
     f7_data: FileLike,
     f24_data: FileLike,
@@ -1,4 +1,5 @@
 from kloppy.domain import Optional, TrackingDataset
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.tracking.pff import (
     PFF_TrackingDeserializer,
     PFF_TrackingInputs,
@@ -6,6 +7,7 @@ from kloppy.infra.serializers.tracking.pff import (
 from kloppy.io import FileLike, open_as_file
 
 
+@cached_load("meta_data", "roster_meta_data", "raw_data")
 def load_tracking(
     meta_data: FileLike,
     roster_meta_data: FileLike,
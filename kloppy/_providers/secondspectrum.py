@@ -1,13 +1,17 @@
-from typing import Optional
+from contextlib import ExitStack
+from typing import Optional, Union
 
-from kloppy.domain import TrackingDataset
+from kloppy.domain import Time, TrackingDataset, TrackingDataStream
+from kloppy.infra.cache import cached_load
+from kloppy.infra.serializers.tracking.frame_index import FrameIndex
 from kloppy.infra.serializers.tracking.secondspectrum import (
     SecondSpectrumDeserializer,
     SecondSpectrumInputs,
 )
-from kloppy.io import FileLike, Source, open_as_file
+from kloppy.io import FileLike, Source, open_as_file, open_as_seekable_file
 
 
+@cached_load("meta_data", "raw_data", "additional_meta_data")
 def load(
     meta_data: FileLike,
     raw_data: FileLike,
@@ -16,6 +20,9 @@ def load(
     limit: Optional[int] = None,
     coordinates: Optional[str] = None,
     only_alive: Optional[bool] = False,
+    frame_range: Optional[tuple[int, int]] = None,
+    time_range: Optional[tuple[Time, Time]] = None,
+    frame_index: Optional[Union[FrameIndex, str]] = None,
 ) -> TrackingDataset:
     """
     Load SecondSpectrum tracking data.
@@ -30,6 +37,15 @@ def load(
         limit: Limit the number of frames to load to the first `limit` frames.
         coordinates: The coordinate system to use.
         only_alive: Only include frames in which the game is not paused.
+        frame_range: Only load the frames with an id within this
+            `(first, last)` range (inclusive).
+        time_range: Only load the frames within this `(start, end)` range of
+            [`Time`][kloppy.domain.Time] objects (inclusive).
+        frame_index: A [`FrameIndex`][kloppy.infra.serializers.tracking.frame_index.FrameIndex]
+            or the path of a sidecar file to store it in. The index maps
+            frames to their byte offset in `raw_data`, such that only the
+            frames in `frame_range` and `time_range` are read. When no index
+            is given, it is built on each load.
 
     Returns:
         The parsed tracking data.
@@ -39,10 +55,17 @@ def load(
         limit=limit,
         coordinate_system=coordinates,
         only_alive=only_alive,
+        frame_range=frame_range,
+        time_range=time_range,
+        frame_index=frame_index,
     )
     with (
         open_as_file(meta_data) as meta_data_fp,
-        open_as_file(raw_data) as raw_data_fp,
+        (
+            open_as_seekable_file(raw_data)
+            if frame_range is not None or time_range is not None
+            else open_as_file(raw_data)
+        ) as raw_data_fp,
         open_as_file(
             Source.create(additional_meta_data, optional=True)
         ) as additional_meta_data_fp,
@@ -54,3 +77,73 @@ def load(
                 additional_meta_data=additional_meta_data_fp,
             )
         )
+
+
+def iter_frames(
+    meta_data: FileLike,
+    raw_data: FileLike,
+    additional_meta_data: Optional[FileLike] = None,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    only_alive: Optional[bool] = False,
+    frame_range: Optional[tuple[int, int]] = None,
+    time_range: Optional[tuple[Time, Time]] = None,
+    frame_index: Optional[Union[FrameIndex, str]] = None,
+) -> TrackingDataStream:
+    """
+    Stream SecondSpectrum tracking data.
+
+    The metadata is parsed immediately, but the frames are only parsed while
+    the stream is iterated.
+
+    Args:
+        meta_data: A json or xml feed containing the meta data.
+        raw_data: A json feed containing the raw tracking data.
+        additional_meta_data: A dict with additional data that will be added to
+            the metadata. See the [`Metadata`][kloppy.domain.Metadata] entity
+            for a list of possible keys.
+        sample_rate: Sample the data at a specific rate.
+        limit: Limit the number of frames to load to the first `limit` frames.
+        coordinates: The coordinate system to use.
+        only_alive: Only include frames in which the game is not paused.
+        frame_range: Only load the frames with an id within this
+            `(first, last)` range (inclusive).
+        time_range: Only load the frames within this `(start, end)` range of
+            [`Time`][kloppy.domain.Time] objects (inclusive).
+        frame_index: A [`FrameIndex`][kloppy.infra.serializers.tracking.frame_index.FrameIndex]
+            or the path of a sidecar file to store it in. The index maps
+            frames to their byte offset in `raw_data`, such that only the
+            frames in `frame_range` and `time_range` are read. When no index
+            is given, it is built on each load.
+
+    Returns:
+        A single-pass stream of frames.
+    """
+    deserializer = SecondSpectrumDeserializer(
+        sample_rate=sample_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        only_alive=only_alive,
+        frame_range=frame_range,
+        time_range=time_range,
+        frame_index=frame_index,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.deserialize_stream(
+            inputs=SecondSpectrumInputs(
+                meta_data=stack.enter_context(open_as_file(meta_data)),
+                raw_data=stack.enter_context(
+                    open_as_seekable_file(raw_data)
+                    if frame_range is not None or time_range is not None
+                    else open_as_file(raw_data)
+                ),
+                additional_meta_data=stack.enter_context(
+                    open_as_file(
+                        Source.create(additional_meta_data, optional=True)
+                    )
+                ),
+            )
+        )
+        stream.call_on_close(stack.pop_all().close)
+    return stream
@@ -2,6 +2,7 @@ from collections.abc import Iterable
 from typing import Optional
 
 from kloppy.domain import TrackingDataset
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.tracking.signality import (
     SignalityDeserializer,
     SignalityInputs,
@@ -9,6 +10,7 @@ from kloppy.infra.serializers.tracking.signality import (
 from kloppy.io import FileLike, expand_inputs, open_as_file
 
 
+@cached_load("meta_data", "raw_data_feeds", "venue_information")
 def load(
     meta_data: FileLike,
     raw_data_feeds: Iterable[FileLike],
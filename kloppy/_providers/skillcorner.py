@@ -3,6 +3,7 @@ from typing import Optional, Union
 
 from kloppy.domain import TrackingDataset
 from kloppy.exceptions import DeserializationError
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.tracking.skillcorner import (
     SkillCornerDeserializer,
     SkillCornerInputs,
@@ -11,6 +12,7 @@ from kloppy.io import FileLike, open_as_file
 from kloppy.utils import github_resolve_raw_data_url
 
 
+@cached_load("meta_data", "raw_data")
 def load(
     meta_data: FileLike,
     raw_data: FileLike,
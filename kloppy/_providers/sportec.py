@@ -2,6 +2,7 @@ from typing import Optional
 
 from kloppy.config import get_config
 from kloppy.domain import EventDataset, EventFactory, TrackingDataset
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.event.sportec import (
     SportecEventDataDeserializer,
     SportecEventDataInputs,
@@ -14,6 +15,7 @@ from kloppy.io import FileLike, open_as_file
 from kloppy.utils import deprecated
 
 
+@cached_load("event_data", "meta_data")
 def load_event(
     event_data: FileLike,
     meta_data: FileLike,
@@ -50,6 +52,7 @@ def load_event(
         )
 
 
+@cached_load("meta_data", "raw_data")
 def load_tracking(
     meta_data: FileLike,
     raw_data: FileLike,
@@ -4,6 +4,7 @@ import warnings
 from kloppy.config import get_config
 from kloppy.domain import EventDataset, EventFactory
 from kloppy.domain.models.statsbomb.event import StatsBombEventFactory
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.event.statsbomb import (
     StatsBombDeserializer,
     StatsBombInputs,
@@ -12,6 +13,7 @@ from kloppy.io import FileLike, Source, open_as_file
 from kloppy.utils import github_resolve_raw_data_url
 
 
+@cached_load("event_data", "lineup_data", "three_sixty_data")
 def load(
     event_data: FileLike,
     lineup_data: FileLike,
@@ -1,20 +1,30 @@
-from typing import Optional
+from contextlib import ExitStack
+from typing import Optional, Union
 
 from kloppy.config import get_config
-from kloppy.domain import EventDataset, EventFactory, Provider, TrackingDataset
+from kloppy.domain import (
+    EventDataset,
+    EventFactory,
+    Provider,
+    Time,
+    TrackingDataset,
+    TrackingDataStream,
+)
+from kloppy.infra.cache import cached_load
 from kloppy.infra.serializers.event.statsperform import (
     StatsPerformDeserializer as StatsPerformEventDeserializer,
 )
 from kloppy.infra.serializers.event.statsperform import (
     StatsPerformInputs as StatsPerformEventInputs,
 )
+from kloppy.infra.serializers.tracking.frame_index import FrameIndex
 from kloppy.infra.serializers.tracking.statsperform import (
     StatsPerformDeserializer as StatsPerformTrackingDeserializer,
 )
 from kloppy.infra.serializers.tracking.statsperform import (
     StatsPerformInputs as StatsPerformTrackingInputs,
 )
-from kloppy.io import FileLike, open_as_file
+from kloppy.io import FileLike, open_as_file, open_as_seekable_file
 from kloppy.utils import deprecated
 
 
@@ -51,6 +61,7 @@ def load(
         )
 
 
+@cached_load("ma1_data", "ma3_data")
 def load_event(
     ma1_data: FileLike,
     ma3_data: FileLike,
@@ -95,6 +106,7 @@ def load_event(
         )
 
 
+@cached_load("ma1_data", "ma25_data")
 def load_tracking(
     ma1_data: FileLike,
     ma25_data: FileLike,
@@ -105,6 +117,9 @@ def load_tracking(
     limit: Optional[int] = None,
     coordinates: Optional[str] = None,
     only_alive: Optional[bool] = False,
+    frame_range: Optional[tuple[int, int]] = None,
+    time_range: Optional[tuple[Time, Time]] = None,
+    frame_index: Optional[Union[FrameIndex, str]] = None,
 ) -> TrackingDataset:
     """
     Load Stats Perform tracking data.
@@ -119,6 +134,15 @@ def load_tracking(
         limit: Limit the number of frames to load to the first `limit` frames.
         coordinates: The coordinate system to use.
         only_alive: Only include frames in which the game is not paused.
+        frame_range: Only load the frames with an id within this
+            `(first, last)` range (inclusive).
+        time_range: Only load the frames within this `(start, end)` range of
+            [`Time`][kloppy.domain.Time] objects (inclusive).
+        frame_index: A [`FrameIndex`][kloppy.infra.serializers.tracking.frame_index.FrameIndex]
+            or the path of a sidecar file to store it in. The index maps
+            frames to their byte offset in `raw_data`, such that only the
+            frames in `frame_range` and `time_range` are read. When no index
+            is given, it is built on each load.
 
     Returns:
         The parsed tracking data.
@@ -129,10 +153,17 @@ def load_tracking(
         limit=limit,
         coordinate_system=coordinates,
         only_alive=only_alive,
+        frame_range=frame_range,
+        time_range=time_range,
+        frame_index=frame_index,
     )
     with (
         open_as_file(ma1_data) as ma1_data_fp,
-        open_as_file(ma25_data) as ma25_data_fp,
+        (
+            open_as_seekable_file(ma25_data)
+            if frame_range is not None or time_range is not None
+            else open_as_file(ma25_data)
+        ) as ma25_data_fp,
     ):
         return deserializer.deserialize(
             inputs=StatsPerformTrackingInputs(
@@ -142,3 +173,74 @@ def load_tracking(
                 pitch_width=pitch_width,
             )
         )
+
+
+def iter_frames(
+    ma1_data: FileLike,
+    ma25_data: FileLike,
+    tracking_system: str = "sportvu",
+    pitch_length: Optional[float] = None,
+    pitch_width: Optional[float] = None,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    only_alive: Optional[bool] = False,
+    frame_range: Optional[tuple[int, int]] = None,
+    time_range: Optional[tuple[Time, Time]] = None,
+    frame_index: Optional[Union[FrameIndex, str]] = None,
+) -> TrackingDataStream:
+    """
+    Stream Stats Perform tracking data.
+
+    The metadata is parsed immediately, but the frames are only parsed while
+    the stream is iterated. The tracking data is scanned once upfront to
+    infer the frame rate.
+
+    Args:
+        ma1_data: A json or xml feed containing the lineup information.
+        ma25_data: A txt file linked in the MA25 Match Tracking Feed; also known as an OPT file.
+        tracking_system: The system that generated the tracking data.
+        pitch_length: The length of the pitch (in meters).
+        pitch_width: The width of the pitch (in meters).
+        sample_rate: Sample the data at a specific rate.
+        limit: Limit the number of frames to load to the first `limit` frames.
+        coordinates: The coordinate system to use.
+        only_alive: Only include frames in which the game is not paused.
+        frame_range: Only load the frames with an id within this
+            `(first, last)` range (inclusive).
+        time_range: Only load the frames within this `(start, end)` range of
+            [`Time`][kloppy.domain.Time] objects (inclusive).
+        frame_index: A [`FrameIndex`][kloppy.infra.serializers.tracking.frame_index.FrameIndex]
+            or the path of a sidecar file to store it in. The index maps
+            frames to their byte offset in `raw_data`, such that only the
+            frames in `frame_range` and `time_range` are read. When no index
+            is given, it is built on each load.
+
+    Returns:
+        A single-pass stream of frames.
+    """
+    deserializer = StatsPerformTrackingDeserializer(
+        provider=Provider[tracking_system.upper()],
+        sample_rate=sample_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        only_alive=only_alive,
+        frame_range=frame_range,
+        time_range=time_range,
+        frame_index=frame_index,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.deserialize_stream(
+            inputs=StatsPerformTrackingInputs(
+                meta_data=stack.enter_context(open_as_file(ma1_data)),
+                raw_data=stack.enter_context(
+                    open_as_seekable_file(ma25_data)
+                    if frame_range is not None or time_range is not None
+                    else open_as_file(ma25_data)
+                ),
+                pitch_length=pitch_length,
+                pitch_width=pitch_width,
+            )
+        )
+        stream.call_on_close(stack.pop_all().close)
+    return stream
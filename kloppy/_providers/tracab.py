@@ -1,14 +1,18 @@
-from typing import Optional
+from contextlib import ExitStack
+from typing import Optional, Union
 import warnings
 
-from kloppy.domain import TrackingDataset
+from kloppy.domain import Time, TrackingDataset, TrackingDataStream
+from kloppy.infra.cache import cached_load
+from kloppy.infra.serializers.tracking.frame_index import FrameIndex
 from kloppy.infra.serializers.tracking.tracab.deserializer import (
     TRACABDeserializer,
     TRACABInputs,
 )
-from kloppy.io import FileLike, open_as_file
+from kloppy.io import FileLike, open_as_file, open_as_seekable_file
 
 
+@cached_load("meta_data", "raw_data")
 def load(
     meta_data: FileLike,
     raw_data: FileLike,
@@ -17,6 +21,9 @@ def load(
     coordinates: Optional[str] = None,
     only_alive: bool = False,
     file_format: Optional[str] = None,
+    frame_range: Optional[tuple[int, int]] = None,
+    time_range: Optional[tuple[Time, Time]] = None,
+    frame_index: Optional[Union[FrameIndex, str]] = None,
 ) -> TrackingDataset:
     """
     Load TRACAB tracking data.
@@ -28,6 +35,15 @@ def load(
         limit: Limit the number of frames to load to the first `limit` frames.
         coordinates: The coordinate system to use.
         only_alive: Only include frames in which the game is not paused.
+        frame_range: Only load the frames with an id within this
+            `(first, last)` range (inclusive).
+        time_range: Only load the frames within this `(start, end)` range of
+            [`Time`][kloppy.domain.Time] objects (inclusive).
+        frame_index: A [`FrameIndex`][kloppy.infra.serializers.tracking.frame_index.FrameIndex]
+            or the path of a sidecar file to store it in. The index maps
+            frames to their byte offset in `raw_data`, such that only the
+            frames in `frame_range` and `time_range` are read. When no index
+            is given, it is built on each load.
         file_format: Deprecated. The format will be inferred based on the file extensions.
 
     Returns:
@@ -79,11 +95,86 @@ def load(
         limit=limit,
         coordinate_system=coordinates,
         only_alive=only_alive,
+        frame_range=frame_range,
+        time_range=time_range,
+        frame_index=frame_index,
     )
     with (
         open_as_file(meta_data) as meta_data_fp,
-        open_as_file(raw_data) as raw_data_fp,
+        (
+            open_as_seekable_file(raw_data)
+            if frame_range is not None or time_range is not None
+            else open_as_file(raw_data)
+        ) as raw_data_fp,
     ):
         return deserializer.deserialize(
             inputs=TRACABInputs(meta_data=meta_data_fp, raw_data=raw_data_fp)
         )
+
+
+def iter_frames(
+    meta_data: FileLike,
+    raw_data: FileLike,
+    sample_rate: Optional[float] = None,
+    limit: Optional[int] = None,
+    coordinates: Optional[str] = None,
+    only_alive: bool = False,
+    frame_range: Optional[tuple[int, int]] = None,
+    time_range: Optional[tuple[Time, Time]] = None,
+    frame_index: Optional[Union[FrameIndex, str]] = None,
+) -> TrackingDataStream:
+    """
+    Stream TRACAB tracking data.
+
+    The metadata is parsed immediately, but the frames are only parsed while
+    the stream is iterated. This allows processing a full match without
+    keeping all frames in memory.
+
+    Args:
+        meta_data: A JSON or XML feed containing the meta data.
+        raw_data: A JSON or dat feed containing the raw tracking data.
+        sample_rate: Sample the data at a specific rate.
+        limit: Limit the number of frames to load to the first `limit` frames.
+        coordinates: The coordinate system to use.
+        only_alive: Only include frames in which the game is not paused.
+        frame_range: Only load the frames with an id within this
+            `(first, last)` range (inclusive).
+        time_range: Only load the frames within this `(start, end)` range of
+            [`Time`][kloppy.domain.Time] objects (inclusive).
+        frame_index: A [`FrameIndex`][kloppy.infra.serializers.tracking.frame_index.FrameIndex]
+            or the path of a sidecar file to store it in. The index maps
+            frames to their byte offset in `raw_data`, such that only the
+            frames in `frame_range` and `time_range` are read. When no index
+            is given, it is built on each load.
+
+    Returns:
+        A single-pass stream of frames.
+
+    Examples:
+        >>> with tracab.iter_frames(meta_data, raw_data) as stream:
+        ...     print(stream.metadata.frame_rate)
+        ...     for frame in stream:
+        ...         ...
+    """
+    deserializer = TRACABDeserializer(
+        sample_rate=sample_rate,
+        limit=limit,
+        coordinate_system=coordinates,
+        only_alive=only_alive,
+        frame_range=frame_range,
+        time_range=time_range,
+        frame_index=frame_index,
+    )
+    with ExitStack() as stack:
+        stream = deserializer.deserialize_stream(
+            inputs=TRACABInputs(
+                meta_data=stack.enter_context(open_as_file(meta_data)),
+                raw_data=stack.enter_context(
+                    open_as_seekable_file(raw_data)
+                    if frame_range is not None or time_range is not None
+                    else open_as_file(raw_data)
+                ),
+            )
+        )
+        stream.call_on_close(stack.pop_all().close)
+    return stream
@@ -1,8 +1,9 @@
-import json
 from typing import Optional, Union
 
 from kloppy.config import get_config
 from kloppy.domain import EventDataset, EventFactory
+from kloppy.infra.cache import cached_load
+from kloppy.infra.serializers import json_stream
 from kloppy.infra.serializers.event.wyscout import (
     WyscoutDeserializerV2,
     WyscoutDeserializerV3,
@@ -12,6 +13,7 @@ from kloppy.io import FileLike, open_as_file
 from kloppy.utils import github_resolve_raw_data_url
 
 
+@cached_load("event_data")
 def load(
     event_data: FileLike,
     event_types: Optional[list[str]] = None,
@@ -93,11 +95,11 @@ def load_open_data(
 def identify_deserializer(
     event_data: FileLike,
 ) -> Union[type[WyscoutDeserializerV3], type[WyscoutDeserializerV2]]:
+    # Only the first event is needed to recognize the version
     with open_as_file(event_data) as event_data_fp:
-        events_with_meta = json.load(event_data_fp)
-
-    events = events_with_meta["events"]
-    first_event = events[0]
+        first_event = next(
+            json_stream.iter_items(event_data_fp, key="events"), {}
+        )
 
     deserializer = None
     if "eventName" in first_event:
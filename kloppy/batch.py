@@ -0,0 +1,208 @@
+"""Functions for loading many matches in parallel.
+
+Every match is described by a spec: a dict with the name of the provider
+module (e.g. `"tracab"`), optionally the name of the loader function in
+that module (defaults to `"load"`) and the keyword arguments for the
+loader. The matches are loaded in a pool of worker processes and the
+results are returned in the order of the specs.
+
+Examples:
+    >>> from kloppy import batch
+    >>> datasets = batch.load(
+    ...     [
+    ...         {
+    ...             "provider": "tracab",
+    ...             "meta_data": f"{match_id}_meta.xml",
+    ...             "raw_data": f"{match_id}_raw.dat",
+    ...         }
+    ...         for match_id in match_ids
+    ...     ],
+    ...     workers=8,
+    ... )
+
+Note:
+    The inputs, the results and the `apply` function are sent between
+    processes, so they must be picklable. Pass file paths or URLs instead
+    of open file objects. On platforms that start worker processes with
+    "spawn" (Windows and macOS), call the functions from within an
+    `if __name__ == "__main__":` block.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from importlib import import_module
+import os
+from typing import Any, Callable, Literal, Optional
+
+from kloppy.config import get_config, set_config
+from kloppy.exceptions import BatchLoadError, KloppyParameterError
+
+LoadSpec = dict[str, Any]
+
+
+def _parse_spec(spec: LoadSpec) -> tuple[str, str, dict[str, Any]]:
+    kwargs = dict(spec)
+    try:
+        provider = kwargs.pop("provider")
+    except KeyError:
+        raise KloppyParameterError(
+            f"Missing 'provider' in load spec: {spec}"
+        ) from None
+    loader = kwargs.pop("loader", "load")
+
+    try:
+        module = import_module(f"kloppy.{provider}")
+    except ImportError:
+        raise KloppyParameterError(f"Unknown provider: {provider}") from None
+    if not callable(getattr(module, loader, None)):
+        raise KloppyParameterError(
+            f"Provider {provider} has no loader named {loader}"
+        )
+    return provider, loader, kwargs
+
+
+def _load(
+    provider: str,
+    loader: str,
+    kwargs: dict[str, Any],
+    config: dict[str, Any],
+    apply: Optional[Callable[[Any], Any]],
+) -> Any:
+    # Worker processes don't share the config of the parent process
+    for key, value in config.items():
+        set_config(key, value)
+
+    dataset = getattr(import_module(f"kloppy.{provider}"), loader)(**kwargs)
+    if apply is not None:
+        return apply(dataset)
+    return dataset
+
+
+def iter_load(
+    specs: Iterable[LoadSpec],
+    workers: Optional[int] = None,
+    apply: Optional[Callable[[Any], Any]] = None,
+    on_error: Literal["raise", "return"] = "raise",
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Iterator[Any]:
+    """
+    Load matches in parallel and yield the results in the order of the specs.
+
+    At most two matches per worker are loaded ahead of the match that is
+    yielded next, so the number of datasets held in memory stays bounded.
+
+    Args:
+        specs: One spec per match. See the module documentation.
+        workers: The number of worker processes. Defaults to the number of
+            CPUs. With `workers=1`, the matches are loaded in the current
+            process.
+        apply: A function that is applied to each dataset in the worker
+            process, e.g. to export it to a table. Its result is yielded
+            instead of the dataset.
+        on_error: What to do when loading a match fails. "raise" raises a
+            [`BatchLoadError`][kloppy.exceptions.BatchLoadError];
+            "return" yields the `BatchLoadError` in the place of the
+            result and continues with the other matches.
+        progress: A function that is called with the number of finished
+            matches and the total number of matches after each match.
+
+    Yields:
+        The loaded datasets (or the results of `apply`).
+    """
+    if on_error not in ("raise", "return"):
+        raise KloppyParameterError(
+            f"on_error should be 'raise' or 'return', not {on_error}"
+        )
+
+    tasks = [_parse_spec(spec) for spec in specs]
+    total = len(tasks)
+    workers = workers or os.cpu_count() or 1
+    config = dict(get_config())
+
+    def _result(index: int, get_result: Callable[[], Any]) -> Any:
+        try:
+            result = get_result()
+        except Exception as e:
+            error = BatchLoadError(
+                f"Failed to load match {index} "
+                f"({tasks[index][0]}.{tasks[index][1]}): {e}",
+                index=index,
+            )
+            if on_error == "raise":
+                raise error from e
+            error.__cause__ = e
+            result = error
+        if progress is not None:
+            progress(index + 1, total)
+        return result
+
+    if workers == 1:
+        for index, (provider, loader, kwargs) in enumerate(tasks):
+            yield _result(
+                index, partial(_load, provider, loader, kwargs, config, apply)
+            )
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, total or 1)) as pool:
+        pending: deque[Future] = deque()
+        submitted = 0
+        try:
+            for index in range(total):
+                while submitted < total and len(pending) < 2 * workers:
+                    provider, loader, kwargs = tasks[submitted]
+                    pending.append(
+                        pool.submit(
+                            _load, provider, loader, kwargs, config, apply
+                        )
+                    )
+                    submitted += 1
+                yield _result(index, pending.popleft().result)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def load(
+    specs: Iterable[LoadSpec],
+    workers: Optional[int] = None,
+    apply: Optional[Callable[[Any], Any]] = None,
+    on_error: Literal["raise", "return"] = "raise",
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> list[Any]:
+    """
+    Load matches in parallel.
+
+    Like [`iter_load`][kloppy.batch.iter_load], but returns a list with
+    the results in the order of the specs.
+
+    Args:
+        specs: One spec per match. See the module documentation.
+        workers: The number of worker processes. Defaults to the number of
+            CPUs. With `workers=1`, the matches are loaded in the current
+            process.
+        apply: A function that is applied to each dataset in the worker
+            process, e.g. to export it to a table. Its result is returned
+            instead of the dataset.
+        on_error: What to do when loading a match fails. "raise" raises a
+            [`BatchLoadError`][kloppy.exceptions.BatchLoadError];
+            "return" puts the `BatchLoadError` in the place of the result.
+        progress: A function that is called with the number of finished
+            matches and the total number of matches after each match.
+
+    Returns:
+        The loaded datasets (or the results of `apply`).
+    """
+    return list(
+        iter_load(
+            specs,
+            workers=workers,
+            apply=apply,
+            on_error=on_error,
+            progress=progress,
+        )
+    )
+
+
+__all__ = ["iter_load", "load"]
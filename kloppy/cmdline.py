@@ -131,7 +131,12 @@ def run_query(argv=sys.argv[1:]):
         raise Exception("You have to specify a dataset.")
 
     with performance_logging("searching", logger=logger):
-        matches = pm.search(dataset, query.pattern)
+        matches = pm.search(
+            dataset,
+            query.pattern,
+            max_length=query.max_length,
+            max_duration=query.max_duration,
+        )
 
     # Construct new code dataset with same properties (eg periods)
     # as original event dataset.
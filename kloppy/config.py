@@ -18,6 +18,8 @@ Config = TypedDict(
     "Config",
     {
         "cache": Optional[str],
+        "cache.datasets": bool,
+        "cache.datasets.max_size": int,
         "coordinate_system": Optional[str],
         "event_factory": Optional[EventFactory],
         "adapters.http.basic_authentication": Optional[str],
@@ -26,18 +28,24 @@ Config = TypedDict(
         "dataframe.engine": Optional[
             Union[Literal["pandas"], Literal["polars"]]
         ],
+        "tracking.storage": Union[Literal["objects"], Literal["columnar"]],
+        "event_types.pushdown": bool,
     },
 )
 
 # https://github.com/python/mypy/issues/6262
 CONFIG_KEYS = Literal[
     "cache",
+    "cache.datasets",
+    "cache.datasets.max_size",
     "coordinate_system",
     "event_factory",
     "adapters.http.basic_authentication",
     "adapters.s3.s3fs",
     "adapters.zip.fo",
     "dataframe.engine",
+    "tracking.storage",
+    "event_types.pushdown",
 ]
 
 
@@ -47,12 +55,16 @@ class PartialConfig(Config, total=False):
 
 _default_config: Config = {
     "cache": cache_dir,
+    "cache.datasets": False,
+    "cache.datasets.max_size": 2 * 1024**3,
     "coordinate_system": "kloppy",
     "event_factory": None,
     "adapters.http.basic_authentication": None,
     "adapters.s3.s3fs": None,
     "adapters.zip.fo": None,
     "dataframe.engine": "pandas",
+    "tracking.storage": "objects",
+    "event_types.pushdown": False,
 }
 
 config = copy(_default_config)
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, timedelta
@@ -1552,6 +1551,21 @@ class DataRecord(ABC):
         self.prev_record = prev
         self.next_record = next_
 
+    def __getstate__(self):
+        # Pickling the links to the neighbouring records would recurse
+        # through the whole dataset. `Dataset.__setstate__` restores them.
+        state = self.__dict__.copy()
+        state.pop("prev_record", None)
+        state.pop("next_record", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # The links might already be restored when the dataset was
+        # unpickled first
+        self.__dict__.setdefault("prev_record", None)
+        self.__dict__.setdefault("next_record", None)
+
     @property
     def attacking_direction(self):
         if (
@@ -1679,16 +1693,131 @@ T = TypeVar("T", bound="DataRecord")
 
 class FilteredDataset:
     """
-    A marker class to identify datasets that have been filtered.
+    Mixin for datasets that have been filtered.
+
+    A filtered dataset is a view on the dataset it was filtered from: it
+    shares the metadata and the record objects with its parent and keeps
+    the positions of the selected records. It is created without running
+    the initialisation of the dataset again, so the records keep their
+    links to the neighbouring records in the parent.
+
+    Use [`get_prev_record`][kloppy.domain.FilteredDataset.get_prev_record]
+    and [`get_next_record`][kloppy.domain.FilteredDataset.get_next_record]
+    to navigate among the selected records only.
+
+    Attributes:
+        parent: The unfiltered dataset, or `None` when the records of the
+            view were replaced (e.g. by `map`).
+        positions: The position of every record in the parent.
     """
 
-    pass
+    parent: Optional["Dataset"] = None
+    positions: Optional[list[int]] = None
+
+    def _get_view_positions(self) -> dict[int, int]:
+        positions = self.__dict__.get("_view_positions")
+        if positions is None or len(positions) != len(self.records):
+            positions = self._view_positions = {
+                id(record): position
+                for position, record in enumerate(self.records)
+            }
+        return positions
+
+    def _get_view_position(self, record: "DataRecord") -> Optional[int]:
+        # Storage that builds its records on access knows their position
+        position_of = getattr(self.records, "position_of", None)
+        if position_of is not None:
+            return position_of(record)
+        return self._get_view_positions().get(id(record))
+
+    def get_prev_record(self, record: "DataRecord") -> Optional["DataRecord"]:
+        """Return the selected record before `record`, or `None`."""
+        position = self._get_view_position(record)
+        if position is None:
+            raise KloppyParameterError(f"{record} is not in the dataset")
+        return self.records[position - 1] if position > 0 else None
+
+    def get_next_record(self, record: "DataRecord") -> Optional["DataRecord"]:
+        """Return the selected record after `record`, or `None`."""
+        position = self._get_view_position(record)
+        if position is None:
+            raise KloppyParameterError(f"{record} is not in the dataset")
+        return (
+            self.records[position + 1]
+            if position + 1 < len(self.records)
+            else None
+        )
 
 
 # Helper to cache dynamic classes so we don't recreate them every time
 _FILTERED_CLASS_CACHE = {}
 
 
+def dict_to_df(
+    get_data: Callable[[], dict[str, Any]],
+    engine: Optional[Literal["polars", "pandas", "pandas[pyarrow]"]] = None,
+):
+    """Convert the columns returned by `get_data` to a dataframe.
+
+    The engine is checked before `get_data` is called, so a missing
+    dependency is reported before the columns are built.
+    """
+    from kloppy.config import get_config
+
+    if not engine:
+        engine = get_config("dataframe.engine")
+
+    if engine == "pandas[pyarrow]":
+        try:
+            import pandas as pd
+
+            types_mapper = pd.ArrowDtype
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have pandas installed. Please"
+                " install it using: pip install pandas"
+            )
+        except AttributeError:
+            raise AttributeError(
+                "Seems like you have an older version of pandas installed. Please"
+                " upgrade to at least 1.5 using: pip install pandas>=1.5"
+            )
+
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have pyarrow installed. Please"
+                " install it using: pip install pyarrow"
+            )
+
+        table = pa.Table.from_pydict(get_data())
+        return table.to_pandas(types_mapper=types_mapper)
+
+    elif engine == "pandas":
+        try:
+            from pandas import DataFrame
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have pandas installed. Please"
+                " install it using: pip install pandas"
+            )
+
+        return DataFrame.from_dict(get_data())
+    elif engine == "polars":
+        try:
+            from polars import from_dict
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have polars installed. Please"
+                " install it using: pip install polars"
+            )
+
+        return from_dict(get_data())
+    else:
+        raise KloppyParameterError(f"Engine {engine} is not valid")
+
+
 @dataclass
 class Dataset(ABC, Generic[T]):
     """
@@ -1716,6 +1845,36 @@ class Dataset(ABC, Generic[T]):
         return len(self.records)
 
     def __post_init__(self):
+        self._record_index = None
+        self._link_records()
+        self._init_player_positions()
+        self._update_formations_and_positions()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_record_index", None)
+        state.pop("_view_positions", None)
+        state.pop("_navigation_index", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._record_index = None
+        self._relink_records()
+
+    def _relink_records(self):
+        """Restore the links between records after unpickling."""
+        for i, record in enumerate(self.records):
+            # Records that are still being unpickled have no state yet
+            if record.__dict__.get("dataset", self) is not self:
+                # the record was linked by the dataset it was filtered from
+                continue
+            record.prev_record = self.records[i - 1] if i > 0 else None
+            record.next_record = (
+                self.records[i + 1] if i + 1 < len(self.records) else None
+            )
+
+    def _link_records(self):
         for i, record in enumerate(self.records):
             record.set_refs(
                 dataset=self,
@@ -1725,9 +1884,6 @@ class Dataset(ABC, Generic[T]):
                 ),
             )
 
-        self._init_player_positions()
-        self._update_formations_and_positions()
-
     def _init_player_positions(self):
         start_of_match = self.metadata.periods[0].start_time
         for team in self.metadata.teams:
@@ -1771,8 +1927,19 @@ class Dataset(ABC, Generic[T]):
             >>> dataset = dataset.filter(lambda event: event.event_type == EventType.PASS)
             >>> dataset = dataset.filter('pass')
         """
-        # 1. Perform filtering
-        filtered_records = self.find_all(filter_)
+        # 1. Perform filtering, in a single pass over the records
+        positions, filtered_records = [], []
+        for position, record in enumerate(self.records):
+            if record.matches(filter_):
+                positions.append(position)
+                filtered_records.append(record)
+        filtered_records = self._select_records(positions, filtered_records)
+
+        # Chained filters refer to the unfiltered dataset
+        parent = self
+        if isinstance(self, FilteredDataset) and self.parent is not None:
+            parent = self.parent
+            positions = [self.positions[position] for position in positions]
 
         # 2. Determine the target class
         current_class = self.__class__
@@ -1792,18 +1959,21 @@ class Dataset(ABC, Generic[T]):
                 )
             target_class = _FILTERED_CLASS_CACHE[current_class]
 
-        # 3. Gather arguments to instantiate the new class
-        # We only want fields that are defined in __init__
-        init_kwargs = {
-            f.name: getattr(self, f.name) for f in fields(self) if f.init
-        }
-
-        # 4. Update the records in the arguments
-        init_kwargs["records"] = filtered_records
-
-        # 5. Instantiate and return the new class
-        # This runs __init__ and __post_init__ of the new class naturally
-        return target_class(**init_kwargs)
+        # 3. Create the view without running __init__ and __post_init__.
+        # The records were already linked and the player positions and
+        # formations initialised by the parent.
+        dataset = target_class.__new__(target_class)
+        for f in fields(self):
+            setattr(dataset, f.name, getattr(self, f.name))
+        dataset.records = filtered_records
+        dataset.parent = parent
+        dataset.positions = positions
+        dataset._record_index = None
+        return dataset
+
+    def _select_records(self, positions: list[int], records: list[T]):
+        """Return the records of a filtered view on this dataset."""
+        return records
 
     def map(self, mapper):
         return replace(
@@ -1854,10 +2024,84 @@ class Dataset(ABC, Generic[T]):
             records=[mapper_fn(record) for record in dataset.records],
         )
 
+    def _record_ids(self) -> Iterable[Union[int, str]]:
+        return (record.record_id for record in self.records)
+
+    def _record_id_at(self, position: int) -> Union[int, str]:
+        return self.records[position].record_id
+
+    def _get_record_index(self) -> dict[Union[int, str], int]:
+        """The position of every record id, built on first use.
+
+        The index is rebuilt when the records are replaced or their number
+        changes. When an id occurs more than once, the first record wins.
+        """
+        index = self.__dict__.get("_record_index")
+        if (
+            index is None
+            or index[0] is not self.records
+            or index[1] != len(self.records)
+        ):
+            positions = {}
+            for position, record_id in enumerate(self._record_ids()):
+                positions.setdefault(record_id, position)
+            index = self._record_index = (
+                self.records,
+                len(self.records),
+                positions,
+            )
+        return index[2]
+
+    def get_record_position(self, record_id: Union[int, str]) -> Optional[int]:
+        """
+        Return the position of the record with the given id.
+
+        Args:
+            record_id: The id of the record.
+
+        Returns:
+            The index of the record in `records`, or `None` when there is
+            no record with this id.
+        """
+        position = self._get_record_index().get(record_id)
+        if position is not None and self._record_id_at(position) != record_id:
+            # A record was replaced in place, rebuild the index
+            self._record_index = None
+            position = self._get_record_index().get(record_id)
+        return position
+
     def get_record_by_id(self, record_id: Union[int, str]) -> Optional[T]:
-        for record in self.records:
-            if record.record_id == record_id:
-                return record
+        """
+        Return the record with the given id.
+
+        The lookup uses an index that is built the first time a record is
+        looked up, so every lookup after that takes constant time.
+
+        Args:
+            record_id: The id of the record.
+
+        Returns:
+            The record, or `None` when there is no record with this id.
+        """
+        position = self.get_record_position(record_id)
+        if position is None:
+            return None
+        return self.records[position]
+
+    def get_records_by_ids(
+        self, record_ids: Iterable[Union[int, str]]
+    ) -> list[Optional[T]]:
+        """
+        Return the records with the given ids.
+
+        Args:
+            record_ids: The ids of the records.
+
+        Returns:
+            A list with the record for every id, or `None` for ids that
+            are not in the dataset.
+        """
+        return [self.get_record_by_id(record_id) for record_id in record_ids]
 
     @overload
     def to_records(
@@ -1905,14 +2149,7 @@ class Dataset(ABC, Generic[T]):
                 *columns, **named_columns
             )
 
-            c = len(self.records)
-            items = defaultdict(lambda: [None] * c)
-            for i, record in enumerate(self.records):
-                item = transformer(record)
-                for k, v in item.items():
-                    items[k][i] = v
-
-            return items
+            return transformer.to_columns(self.records)
         else:
             raise KloppyParameterError(
                 f"Orient {orient} is not supported. Only orient='list' is supported"
@@ -1924,66 +2161,10 @@ class Dataset(ABC, Generic[T]):
         engine: Optional[Literal["polars", "pandas", "pandas[pyarrow]"]] = None,
         **named_columns: "NamedColumns",
     ):
-        from kloppy.config import get_config
-
-        if not engine:
-            engine = get_config("dataframe.engine")
-
-        if engine == "pandas[pyarrow]":
-            try:
-                import pandas as pd
-
-                types_mapper = pd.ArrowDtype
-            except ImportError:
-                raise ImportError(
-                    "Seems like you don't have pandas installed. Please"
-                    " install it using: pip install pandas"
-                )
-            except AttributeError:
-                raise AttributeError(
-                    "Seems like you have an older version of pandas installed. Please"
-                    " upgrade to at least 1.5 using: pip install pandas>=1.5"
-                )
-
-            try:
-                import pyarrow as pa
-            except ImportError:
-                raise ImportError(
-                    "Seems like you don't have pyarrow installed. Please"
-                    " install it using: pip install pyarrow"
-                )
-
-            table = pa.Table.from_pydict(
-                self.to_dict(*columns, orient="list", **named_columns)
-            )
-            return table.to_pandas(types_mapper=types_mapper)
-
-        elif engine == "pandas":
-            try:
-                from pandas import DataFrame
-            except ImportError:
-                raise ImportError(
-                    "Seems like you don't have pandas installed. Please"
-                    " install it using: pip install pandas"
-                )
-
-            return DataFrame.from_dict(
-                self.to_dict(*columns, orient="list", **named_columns)
-            )
-        elif engine == "polars":
-            try:
-                from polars import from_dict
-            except ImportError:
-                raise ImportError(
-                    "Seems like you don't have polars installed. Please"
-                    " install it using: pip install polars"
-                )
-
-            return from_dict(
-                self.to_dict(*columns, orient="list", **named_columns)
-            )
-        else:
-            raise KloppyParameterError(f"Engine {engine} is not valid")
+        return dict_to_df(
+            lambda: self.to_dict(*columns, orient="list", **named_columns),
+            engine,
+        )
 
     def __repr__(self):
         return f"<{self.__class__.__name__} record_count={len(self.records)}>"
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import Enum
+from functools import lru_cache
+import heapq
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -34,7 +38,7 @@ from .formation import FormationType
 from .pitch import Point
 
 if TYPE_CHECKING:
-    from .tracking import Frame
+    from .tracking import Frame, TrackingDataset
 
 QualifierValueType = TypeVar("QualifierValueType")
 EnumQualifierType = TypeVar("EnumQualifierType", bound=Enum)
@@ -213,50 +217,6 @@ class ResultMixin(Generic[ResultT]):
 
     result: ResultT
 
-    def matches(
-        self, filter_: Optional[Union[str, Callable[["Event"], bool]]]
-    ) -> bool:
-        if filter_ is None:
-            return True
-        elif callable(filter_):
-            return filter_(self)  # type: ignore
-        elif isinstance(filter_, str):
-            """
-            Allowed formats:
-            1. <event_type>
-            2. <event_type>.<result>
-
-            This format always us to go to css selectors without breaking existing code.
-            """
-            parts = filter_.upper().split(".")
-            if len(parts) == 2:
-                event_type, result = parts
-            elif len(parts) == 1:
-                event_type = parts[0]
-                result = None
-            else:
-                raise InvalidFilterError(
-                    f"Don't know how to apply filter {filter_}"
-                )
-
-            # Call the parent `matches` for event type filtering
-            if not super().matches(event_type):  # type: ignore
-                return False
-
-            if result:
-                if not self.result:
-                    return False
-
-                try:
-                    if self.result != self.result.__class__[result]:
-                        return False
-                except KeyError:
-                    # result isn't applicable for this event
-                    # example: result='GOAL' event=<Pass>
-                    return False
-
-            return True
-
     def __str__(self):
         return super().__str__()[:-1] + f" result='{self.result}'>"
 
@@ -756,8 +716,8 @@ class Event(DataRecord, ABC):
 
         return [
             event
-            for event_id in self.related_event_ids
-            if (event := self.dataset.get_record_by_id(event_id)) is not None
+            for event in self.dataset.get_records_by_ids(self.related_event_ids)
+            if event is not None
         ]
 
     def get_related_event(
@@ -840,37 +800,61 @@ class Event(DataRecord, ABC):
         elif callable(filter_):
             return filter_(self)
         elif isinstance(filter_, str):
-            """
-            Allowed formats:
-            1. <event_type>
-            2. <event_type>.<result>
-
-            This format always us to go to css selectors without breaking existing code.
-            """
-            parts = filter_.upper().split(".")
-            if len(parts) == 2:
-                event_type, result = parts
-            elif len(parts) == 1:
-                event_type = parts[0]
-                result = None
-            else:
-                raise InvalidFilterError(
-                    f"Don't know how to apply filter {filter_}"
-                )
+            return compile_event_filter(filter_)(self)
 
-            if event_type:
-                try:
-                    if self.event_type != EventType[event_type]:
-                        return False
-                except KeyError:
-                    raise InvalidFilterError(
-                        f"Cannot find event type {event_type}. Possible options: {[e.value.lower() for e in EventType]}"
-                    )
+    def prev(
+        self,
+        filter_: Optional[Union[str, Callable[["Event"], bool]]] = None,
+        team: Optional[Team] = None,
+    ) -> Optional["Event"]:
+        """
+        Return the closest event before this event that matches `filter_`.
 
-            if result:
-                return False
+        String filters are answered with a binary search in the position
+        index of the dataset, instead of visiting every event in between.
 
-            return True
+        Args:
+            filter_: A string filter (e.g. "shot" or "pass.complete") or a
+                callable that takes an event and returns a boolean.
+            team: Only consider the events of this team.
+        """
+        return self._find_neighbour(filter_, team, forward=False)
+
+    def next(
+        self,
+        filter_: Optional[Union[str, Callable[["Event"], bool]]] = None,
+        team: Optional[Team] = None,
+    ) -> Optional["Event"]:
+        """
+        Return the closest event after this event that matches `filter_`.
+
+        See [`prev`][kloppy.domain.Event.prev] for the arguments.
+        """
+        return self._find_neighbour(filter_, team, forward=True)
+
+    def _find_neighbour(
+        self, filter_, team: Optional[Team], forward: bool
+    ) -> Optional["Event"]:
+        if isinstance(filter_, str):
+            filter_ = compile_event_filter(filter_)
+        elif filter_ is None and team is not None:
+            filter_ = compile_event_filter("")
+
+        dataset = self.__dict__.get("dataset")
+        if isinstance(filter_, EventFilter) and isinstance(
+            dataset, EventDataset
+        ):
+            position = dataset.get_record_position(self.event_id)
+            if position is not None and dataset.records[position] is self:
+                return dataset._find_indexed(position, filter_, team, forward)
+
+        # Callable filters can't be indexed, visit the events one by one
+        event = self.next_record if forward else self.prev_record
+        while event:
+            if (team is None or event.team == team) and event.matches(filter_):
+                return event
+            event = event.next_record if forward else event.prev_record
+        return None
 
     def __str__(self):
         event_type = (
@@ -891,6 +875,76 @@ class Event(DataRecord, ABC):
         return str(self)
 
 
+class EventFilter:
+    """
+    A compiled string filter for events.
+
+    String filters have the format `<event_type>` or
+    `<event_type>.<result>`, e.g. "shot" or "pass.complete". Either part can
+    be left empty: ".goal" matches all events with the result GOAL. The
+    string is parsed and the event type is looked up once, when the filter
+    is compiled, instead of every time an event is matched.
+
+    Attributes:
+        event_type: The event type to match, or `None` for all event types.
+        result: The name of the result to match, or `None` for all results.
+    """
+
+    __slots__ = ("event_type", "result")
+
+    def __init__(self, event_type: Optional[EventType], result: Optional[str]):
+        self.event_type = event_type
+        self.result = result
+
+    def matches_key(
+        self, event_type: EventType, result: Optional[ResultType]
+    ) -> bool:
+        """Whether events with this type and result match the filter."""
+        if self.event_type is not None and event_type != self.event_type:
+            return False
+        if self.result is not None:
+            # The result doesn't apply to this event, e.g. "pass.goal"
+            return result is not None and result.name == self.result
+        return True
+
+    def __call__(self, event: Event) -> bool:
+        return self.matches_key(
+            event.event_type, getattr(event, "result", None)
+        )
+
+    def __repr__(self):
+        return (
+            f"EventFilter(event_type={self.event_type}, result={self.result})"
+        )
+
+
+@lru_cache(maxsize=256)
+def compile_event_filter(filter_: str) -> EventFilter:
+    """
+    Compile a string filter for events.
+
+    Raises:
+        InvalidFilterError: When the format or event type is not valid.
+    """
+    parts = filter_.upper().split(".")
+    if len(parts) == 2:
+        event_type, result = parts
+    elif len(parts) == 1:
+        event_type = parts[0]
+        result = None
+    else:
+        raise InvalidFilterError(f"Don't know how to apply filter {filter_}")
+
+    if event_type:
+        try:
+            event_type = EventType[event_type]
+        except KeyError:
+            raise InvalidFilterError(
+                f"Cannot find event type {event_type}. Possible options: {[e.value.lower() for e in EventType]}"
+            )
+    return EventFilter(event_type or None, result or None)
+
+
 @dataclass(repr=False)
 @docstring_inherit_attributes(Event)
 class GenericEvent(NoQualifierMixin, NoResultMixin, Event):
@@ -1473,6 +1527,79 @@ class EventDataset(Dataset[Event]):
     def events(self):
         return self.records
 
+    def _get_navigation_index(self):
+        """The positions of the events by type, result and team.
+
+        The index is built on first use and rebuilt when the records are
+        replaced or their number changes.
+        """
+        index = self.__dict__.get("_navigation_index")
+        if (
+            index is None
+            or index[0] is not self.records
+            or index[1] != len(self.records)
+        ):
+            positions = defaultdict(list)
+            for position, event in enumerate(self.records):
+                positions[
+                    (
+                        event.event_type,
+                        getattr(event, "result", None),
+                        event.team,
+                    )
+                ].append(position)
+            index = self._navigation_index = (
+                self.records,
+                len(self.records),
+                dict(positions),
+                {},
+            )
+        return index
+
+    def _find_indexed(
+        self,
+        position: int,
+        filter_: EventFilter,
+        team: Optional[Team],
+        forward: bool,
+    ) -> Optional[Event]:
+        """Find the closest matching event with a binary search."""
+        for _ in range(2):
+            _, _, positions, merged = self._get_navigation_index()
+            key = (filter_.event_type, filter_.result, team)
+            matching = merged.get(key)
+            if matching is None:
+                # The sorted positions of all events that match the filter
+                matching = merged[key] = list(
+                    heapq.merge(
+                        *(
+                            event_positions
+                            for (
+                                event_type,
+                                result,
+                                event_team,
+                            ), event_positions in positions.items()
+                            if filter_.matches_key(event_type, result)
+                            and (team is None or event_team == team)
+                        )
+                    )
+                )
+
+            if forward:
+                i = bisect_right(matching, position)
+                event = self.records[matching[i]] if i < len(matching) else None
+            else:
+                i = bisect_left(matching, position)
+                event = self.records[matching[i - 1]] if i > 0 else None
+
+            if event is None or (
+                filter_(event) and (team is None or event.team == team)
+            ):
+                return event
+            # An event was replaced in place, rebuild the index
+            self._navigation_index = None
+        return event
+
     def get_event_by_id(self, event_id: str) -> Optional[Event]:
         return self.get_record_by_id(event_id)
 
@@ -1484,6 +1611,36 @@ class EventDataset(Dataset[Event]):
 
         return add_state(self, *builder_keys)
 
+    def add_freeze_frames(
+        self,
+        tracking_dataset: "TrackingDataset",
+        offsets: Optional[dict[int, timedelta]] = None,
+        tolerance: Optional[timedelta] = None,
+        ball_window: Optional[timedelta] = None,
+        overwrite: bool = False,
+    ) -> int:
+        """
+        Set the `freeze_frame` of the events to the matching frame of the
+        tracking data of the same match.
+
+        See [`EventTrackingSynchronizer`][kloppy.domain.EventTrackingSynchronizer]
+        for the arguments.
+
+        Returns:
+            The number of updated events.
+        """
+        from kloppy.domain.services.synchronizer import (
+            EventTrackingSynchronizer,
+        )
+
+        synchronizer = EventTrackingSynchronizer(
+            tracking_dataset,
+            offsets=offsets,
+            tolerance=tolerance,
+            ball_window=ball_window,
+        )
+        return synchronizer.add_freeze_frames(self.events, overwrite=overwrite)
+
     def aggregate(self, type_: str, **aggregator_kwargs) -> list[Any]:
         if type_ == "minutes_played":
             from kloppy.domain.services.aggregators.minutes_played import (
@@ -1506,6 +1663,8 @@ __all__ = [
     "TakeOnResult",
     "CarryResult",
     "Event",
+    "EventFilter",
+    "compile_event_filter",
     "GenericEvent",
     "ShotEvent",
     "PassEvent",
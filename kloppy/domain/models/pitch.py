@@ -1,10 +1,12 @@
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, fields
 from enum import Enum
 from math import sqrt
 from typing import Optional
 import warnings
 
 from kloppy.exceptions import MissingDimensionError
+from kloppy.utils import import_numpy
 
 DEFAULT_PITCH_LENGTH = 105.0
 DEFAULT_PITCH_WIDTH = 68.0
@@ -301,106 +303,9 @@ class PitchDimensions:
         Returns:
             The point in the IFAB pitch dimensions
         """
-        if (
-            self.x_dim.min is None
-            or self.x_dim.max is None
-            or self.y_dim.min is None
-            or self.y_dim.max is None
-        ):
-            raise MissingDimensionError(
-                "The pitch boundaries need to be fully specified to convert coordinates."
-            )
-
-        ifab_dims = MetricPitchDimensions(
-            x_dim=Dimension(0, pitch_length),
-            y_dim=Dimension(0, pitch_width),
-            pitch_length=pitch_length,
-            pitch_width=pitch_width,
-            standardized=False,
-        )
-        x_ifab_zones = ifab_dims._transformation_zones_x(pitch_length)
-        y_ifab_zones = ifab_dims._transformation_zones_y(pitch_width)
-        x_from_zones = self._transformation_zones_x(
-            self.x_dim.max - self.x_dim.min
-        )
-        y_from_zones = self._transformation_zones_y(
-            self.y_dim.max - self.y_dim.min
-        )
-
-        def transform(v, from_zones, from_length, ifab_zones, ifab_length):
-            mirror = False
-            if v > from_zones[-1][1]:
-                v = from_length - (v - from_zones[0][0]) + from_zones[0][0]
-                mirror = True
-            # find the zone the v coordinate is in
-            try:
-                zone = next(
-                    (
-                        idx
-                        for idx, zone in enumerate(from_zones)
-                        if zone[0] <= v <= zone[1]
-                    )
-                )
-                scale = (
-                    # length of the zone in IFAB dimensions
-                    (ifab_zones[zone][1] - ifab_zones[zone][0])
-                    # length of the zone in the original dimensions
-                    / (from_zones[zone][1] - from_zones[zone][0])
-                )
-                # ifab = smallest IFAB value of the zone + (v - smallest v value of the zone) * scaling factor of the zone
-                ifab = ifab_zones[zone][0] + (v - from_zones[zone][0]) * scale
-            except StopIteration:
-                # value is outside of the pitch dimensions
-                ifab = ifab_zones[0][0] + (v - from_zones[0][0]) * (
-                    ifab_length / from_length
-                )
-            if mirror:
-                ifab = ifab_length - ifab
-            return ifab
-
-        if isinstance(point, Point3D):
-            return Point3D(
-                x=transform(
-                    point.x,
-                    x_from_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_from_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-                z=(
-                    (
-                        point.z * 2.44 / self.goal_height
-                        if self.goal_height is not None
-                        else point.z
-                    )
-                    if point.z is not None
-                    else None
-                ),
-            )
-        else:
-            return Point(
-                x=transform(
-                    point.x,
-                    x_from_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_from_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-            )
+        return get_transformation_plan(
+            self, None, pitch_length=pitch_length, pitch_width=pitch_width
+        ).apply(point)
 
     def from_metric_base(
         self,
@@ -417,106 +322,9 @@ class PitchDimensions:
         Returns:
             The point in the regular pitch dimensions
         """
-        if (
-            self.x_dim.min is None
-            or self.x_dim.max is None
-            or self.y_dim.min is None
-            or self.y_dim.max is None
-        ):
-            raise MissingDimensionError(
-                "The pitch boundaries need to be fully specified to convert coordinates."
-            )
-
-        ifab_dims = MetricPitchDimensions(
-            x_dim=Dimension(0, pitch_length),
-            y_dim=Dimension(0, pitch_width),
-            pitch_length=pitch_length,
-            pitch_width=pitch_width,
-            standardized=False,
-        )
-        x_ifab_zones = ifab_dims._transformation_zones_x(pitch_length)
-        y_ifab_zones = ifab_dims._transformation_zones_y(pitch_width)
-        x_to_zones = self._transformation_zones_x(
-            self.x_dim.max - self.x_dim.min
-        )
-        y_to_zones = self._transformation_zones_y(
-            self.y_dim.max - self.y_dim.min
-        )
-
-        def transform(v, to_zones, to_length, ifab_zones, ifab_length):
-            mirror = False
-            if v > ifab_length / 2:
-                v = ifab_length - v
-                mirror = True
-            # find the zone the v coordinate is in
-            try:
-                zone = next(
-                    (
-                        idx
-                        for idx, zone in enumerate(ifab_zones)
-                        if zone[0] <= v <= zone[1]
-                    )
-                )
-                scale = (
-                    # length of the zone in the original dimensions
-                    (to_zones[zone][1] - to_zones[zone][0])
-                    # length of the zone in IFAB dimensions
-                    / (ifab_zones[zone][1] - ifab_zones[zone][0])
-                )
-                # ifab = smallest IFAB value of the zone + (v - smallest v value of the zone) * scaling factor of the zone
-                v = to_zones[zone][0] + (v - ifab_zones[zone][0]) * scale
-            except StopIteration:
-                # value is outside of the pitch dimensions
-                v = to_zones[0][0] + (v - ifab_zones[0][0]) * (
-                    to_length / ifab_length
-                )
-            if mirror:
-                v = (to_length + to_zones[0][0] - v) + to_zones[0][0]
-            return v
-
-        if isinstance(point, Point3D):
-            return Point3D(
-                x=transform(
-                    point.x,
-                    x_to_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_to_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-                z=(
-                    (
-                        point.z * self.goal_height / 2.44
-                        if self.goal_height is not None
-                        else point.z
-                    )
-                    if point.z is not None
-                    else None
-                ),
-            )
-        else:
-            return Point(
-                x=transform(
-                    point.x,
-                    x_to_zones,
-                    self.x_dim.max - self.x_dim.min,
-                    x_ifab_zones,
-                    pitch_length,
-                ),
-                y=transform(
-                    point.y,
-                    y_to_zones,
-                    self.y_dim.max - self.y_dim.min,
-                    y_ifab_zones,
-                    pitch_width,
-                ),
-            )
+        return get_transformation_plan(
+            None, self, pitch_length=pitch_length, pitch_width=pitch_width
+        ).apply(point)
 
     def distance_between(
         self, point1: Point, point2: Point, unit: Unit = Unit.METERS
@@ -691,3 +499,301 @@ class WyscoutPitchDimensions(PitchDimensions):
     corner_radius: float = 0.97  # inferred
     penalty_spot_distance: float = 10.0
     penalty_arc_radius: float = 7.74  # inferred
+
+
+class _AxisMapping:
+    """Piecewise-linear mapping of one axis between two sets of zones.
+
+    The zones cover one half of the pitch. Values on the other half are
+    mirrored around `mirror_at` before they are mapped and mirrored back
+    afterwards. Values outside the zones are scaled linearly.
+    """
+
+    def __init__(
+        self,
+        from_zones: list[tuple[float, float]],
+        to_zones: list[tuple[float, float]],
+        from_length: float,
+        to_length: float,
+        mirror_at: float,
+    ):
+        self.bounds = [zone[0] for zone in from_zones] + [from_zones[-1][1]]
+        self.from_starts = [zone[0] for zone in from_zones]
+        self.to_starts = [zone[0] for zone in to_zones]
+        self.scales = [
+            (to_zone[1] - to_zone[0]) / (from_zone[1] - from_zone[0])
+            if from_zone[1] != from_zone[0]
+            else 0.0
+            for from_zone, to_zone in zip(from_zones, to_zones)
+        ]
+        self.outside_scale = to_length / from_length
+        self.from_offset = from_zones[0][0]
+        self.to_offset = to_zones[0][0]
+        self.from_length = from_length
+        self.to_length = to_length
+        self.mirror_at = mirror_at
+
+    def apply(self, v: float) -> float:
+        mirror = v > self.mirror_at
+        if mirror:
+            v = self.from_length - (v - self.from_offset) + self.from_offset
+        if self.bounds[0] <= v <= self.bounds[-1]:
+            # first zone that contains the value
+            zone = max(bisect_left(self.bounds, v) - 1, 0)
+            v = (
+                self.to_starts[zone]
+                + (v - self.from_starts[zone]) * self.scales[zone]
+            )
+        else:
+            # value is outside of the pitch dimensions
+            v = self.to_starts[0] + (v - self.from_starts[0]) * (
+                self.outside_scale
+            )
+        if mirror:
+            v = (self.to_length + self.to_offset - v) + self.to_offset
+        return v
+
+    def apply_array(self, np, values):
+        mirror = values > self.mirror_at
+        values = np.where(
+            mirror,
+            self.from_length - (values - self.from_offset) + self.from_offset,
+            values,
+        )
+        zone = np.clip(
+            np.searchsorted(self.bounds, values, side="left") - 1,
+            0,
+            len(self.scales) - 1,
+        )
+        outside = ~((values >= self.bounds[0]) & (values <= self.bounds[-1]))
+        mapped = np.where(
+            outside,
+            self.to_starts[0]
+            + (values - self.from_starts[0]) * self.outside_scale,
+            np.take(self.to_starts, zone)
+            + (values - np.take(self.from_starts, zone))
+            * np.take(self.scales, zone),
+        )
+        return np.where(
+            mirror,
+            (self.to_length + self.to_offset - mapped) + self.to_offset,
+            mapped,
+        )
+
+
+class TransformationPlan:
+    """
+    A compiled transformation of coordinates between two pitch dimensions.
+
+    The plan maps coordinates from the source pitch dimensions to the IFAB
+    pitch dimensions and from there to the target pitch dimensions. All
+    transformation zones and scaling factors are computed once when the
+    plan is built, after which the plan can be applied to single points or
+    to whole coordinate arrays. Use
+    [`get_transformation_plan`][kloppy.domain.get_transformation_plan] to
+    get a cached plan.
+
+    Attributes:
+        from_dimensions: The source pitch dimensions, or `None` for the IFAB
+            pitch dimensions.
+        to_dimensions: The target pitch dimensions, or `None` for the IFAB
+            pitch dimensions.
+        pitch_length: The true length of the pitch, in meters.
+        pitch_width: The true width of the pitch, in meters.
+        flip_vertical: Whether the y-axis is inverted along the way.
+    """
+
+    def __init__(
+        self,
+        from_dimensions: Optional[PitchDimensions],
+        to_dimensions: Optional[PitchDimensions],
+        pitch_length: float = DEFAULT_PITCH_LENGTH,
+        pitch_width: float = DEFAULT_PITCH_WIDTH,
+        flip_vertical: bool = False,
+    ):
+        for dimensions in (from_dimensions, to_dimensions):
+            if dimensions is not None and (
+                dimensions.x_dim.min is None
+                or dimensions.x_dim.max is None
+                or dimensions.y_dim.min is None
+                or dimensions.y_dim.max is None
+            ):
+                raise MissingDimensionError(
+                    "The pitch boundaries need to be fully specified to convert coordinates."
+                )
+
+        self.from_dimensions = from_dimensions
+        self.to_dimensions = to_dimensions
+        self.pitch_length = pitch_length
+        self.pitch_width = pitch_width
+        self.flip_vertical = flip_vertical
+
+        ifab_dims = MetricPitchDimensions(
+            x_dim=Dimension(0, pitch_length),
+            y_dim=Dimension(0, pitch_width),
+            pitch_length=pitch_length,
+            pitch_width=pitch_width,
+            standardized=False,
+        )
+        x_ifab_zones = ifab_dims._transformation_zones_x(pitch_length)
+        y_ifab_zones = ifab_dims._transformation_zones_y(pitch_width)
+
+        self._to_base = None
+        if from_dimensions is not None:
+            length = from_dimensions.x_dim.max - from_dimensions.x_dim.min
+            width = from_dimensions.y_dim.max - from_dimensions.y_dim.min
+            x_zones = from_dimensions._transformation_zones_x(length)
+            y_zones = from_dimensions._transformation_zones_y(width)
+            self._to_base = (
+                _AxisMapping(
+                    x_zones, x_ifab_zones, length, pitch_length, x_zones[-1][1]
+                ),
+                _AxisMapping(
+                    y_zones, y_ifab_zones, width, pitch_width, y_zones[-1][1]
+                ),
+                from_dimensions.goal_height,
+            )
+
+        self._from_base = None
+        if to_dimensions is not None:
+            length = to_dimensions.x_dim.max - to_dimensions.x_dim.min
+            width = to_dimensions.y_dim.max - to_dimensions.y_dim.min
+            self._from_base = (
+                _AxisMapping(
+                    x_ifab_zones,
+                    to_dimensions._transformation_zones_x(length),
+                    pitch_length,
+                    length,
+                    pitch_length / 2,
+                ),
+                _AxisMapping(
+                    y_ifab_zones,
+                    to_dimensions._transformation_zones_y(width),
+                    pitch_width,
+                    width,
+                    pitch_width / 2,
+                ),
+                to_dimensions.goal_height,
+            )
+
+    def apply_xyz(
+        self, x: float, y: float, z: Optional[float] = None
+    ) -> tuple[float, float, Optional[float]]:
+        """Transform a single x, y and (optional) z coordinate."""
+        if self._to_base is not None:
+            x_mapping, y_mapping, goal_height = self._to_base
+            x = x_mapping.apply(x)
+            y = y_mapping.apply(y)
+            if z is not None and goal_height is not None:
+                z = z * 2.44 / goal_height
+        if self.flip_vertical:
+            y = self.pitch_width - y
+        if self._from_base is not None:
+            x_mapping, y_mapping, goal_height = self._from_base
+            x = x_mapping.apply(x)
+            y = y_mapping.apply(y)
+            if z is not None and goal_height is not None:
+                z = z * goal_height / 2.44
+        return x, y, z
+
+    def apply(self, point: Point) -> Point:
+        """Transform a single point."""
+        if isinstance(point, Point3D):
+            x, y, z = self.apply_xyz(point.x, point.y, point.z)
+            return Point3D(x=x, y=y, z=z)
+        x, y, _ = self.apply_xyz(point.x, point.y)
+        return Point(x=x, y=y)
+
+    def apply_array(self, coordinates):
+        """
+        Transform an array of coordinates.
+
+        Arguments:
+            coordinates: A NumPy array whose last axis holds the x, y and
+                (optionally) z coordinates.
+
+        Returns:
+            A new array with the transformed coordinates.
+        """
+        np = import_numpy()
+
+        coordinates = np.asarray(coordinates, dtype=float)
+        result = coordinates.copy()
+        x = coordinates[..., 0]
+        y = coordinates[..., 1]
+        z = coordinates[..., 2] if coordinates.shape[-1] > 2 else None
+        if self._to_base is not None:
+            x_mapping, y_mapping, goal_height = self._to_base
+            x = x_mapping.apply_array(np, x)
+            y = y_mapping.apply_array(np, y)
+            if z is not None and goal_height is not None:
+                z = z * 2.44 / goal_height
+        if self.flip_vertical:
+            y = self.pitch_width - y
+        if self._from_base is not None:
+            x_mapping, y_mapping, goal_height = self._from_base
+            x = x_mapping.apply_array(np, x)
+            y = y_mapping.apply_array(np, y)
+            if z is not None and goal_height is not None:
+                z = z * goal_height / 2.44
+        result[..., 0] = x
+        result[..., 1] = y
+        if z is not None:
+            result[..., 2] = z
+        return result
+
+
+_TRANSFORMATION_PLAN_CACHE: dict[tuple, TransformationPlan] = {}
+_TRANSFORMATION_PLAN_CACHE_SIZE = 256
+
+
+def _dimensions_key(dimensions: Optional[PitchDimensions]) -> Optional[tuple]:
+    if dimensions is None:
+        return None
+    return (dimensions.__class__,) + tuple(
+        getattr(dimensions, f.name) for f in fields(dimensions)
+    )
+
+
+def get_transformation_plan(
+    from_dimensions: Optional[PitchDimensions],
+    to_dimensions: Optional[PitchDimensions],
+    pitch_length: float = DEFAULT_PITCH_LENGTH,
+    pitch_width: float = DEFAULT_PITCH_WIDTH,
+    flip_vertical: bool = False,
+) -> TransformationPlan:
+    """
+    Get a (cached) plan to transform coordinates between pitch dimensions.
+
+    Arguments:
+        from_dimensions: The source pitch dimensions, or `None` for the IFAB
+            pitch dimensions.
+        to_dimensions: The target pitch dimensions, or `None` for the IFAB
+            pitch dimensions.
+        pitch_length: The true length of the pitch, in meters.
+        pitch_width: The true width of the pitch, in meters.
+        flip_vertical: Whether to invert the y-axis.
+
+    Returns:
+        The compiled transformation plan.
+    """
+    key = (
+        _dimensions_key(from_dimensions),
+        _dimensions_key(to_dimensions),
+        pitch_length,
+        pitch_width,
+        flip_vertical,
+    )
+    plan = _TRANSFORMATION_PLAN_CACHE.get(key)
+    if plan is None:
+        plan = TransformationPlan(
+            from_dimensions,
+            to_dimensions,
+            pitch_length=pitch_length,
+            pitch_width=pitch_width,
+            flip_vertical=flip_vertical,
+        )
+        if len(_TRANSFORMATION_PLAN_CACHE) >= _TRANSFORMATION_PLAN_CACHE_SIZE:
+            _TRANSFORMATION_PLAN_CACHE.clear()
+        _TRANSFORMATION_PLAN_CACHE[key] = plan
+    return plan
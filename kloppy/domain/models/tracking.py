@@ -1,13 +1,38 @@
-from dataclasses import dataclass, field
-from typing import Any, Optional
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union
+
+if sys.version_info >= (3, 11):
+    from typing import Unpack
+else:
+    from typing_extensions import Unpack
 
 from kloppy.domain.models.common import DatasetType
+from kloppy.exceptions import KloppyParameterError
 from kloppy.utils import (
     docstring_inherit_attributes,
+    import_numpy,
 )
 
-from .common import DataRecord, Dataset, Player
+from .common import (
+    BallState,
+    DataRecord,
+    Dataset,
+    Metadata,
+    Player,
+    Team,
+    dict_to_df,
+)
 from .pitch import Point, Point3D
+from .time import Period
+
+if TYPE_CHECKING:
+    from kloppy.io import FileLike
+
+    from ..services.transformers.data_record import Column, NamedColumns
 
 
 @dataclass
@@ -56,6 +81,625 @@ class Frame(DataRecord):
         return str(self)
 
 
+# Encoding of the type of point stored in `ColumnarFrames.point_types`
+POINT_MISSING = 0
+POINT_2D = 1
+POINT_3D = 2
+POINT_3D_WITHOUT_Z = 3
+# The object is part of the frame, but without coordinates
+POINT_NONE = 4
+
+_BALL_STATES = list(BallState)
+
+
+class _ColumnarFrame(Frame):
+    """A `Frame` that is materialised on access from `ColumnarFrames`.
+
+    The links to the previous and next frame are resolved lazily, so
+    materialising a single frame does not materialise its neighbours.
+
+    Every access builds a new frame, so changes to a frame could not be
+    stored. Setting its attributes raises an `AttributeError`; use
+    `dataclasses.replace` or `TrackingDataset.map` instead.
+    """
+
+    # Attributes that kloppy links when a frame is added to a dataset
+    _MUTABLE_ATTRIBUTES = frozenset(("dataset", "prev_record", "next_record"))
+
+    def __setattr__(self, name: str, value: Any):
+        if (
+            self.__dict__.get("_read_only")
+            and name not in self._MUTABLE_ATTRIBUTES
+        ):
+            raise AttributeError(
+                f"Can't set '{name}': frames of columnar tracking data are "
+                "read-only. Use dataclasses.replace or TrackingDataset.map "
+                "to change them."
+            )
+        super().__setattr__(name, value)
+
+    @property
+    def prev_record(self) -> Optional[Frame]:
+        frames = self.__dict__.get("_frames")
+        if frames is None:
+            return self.__dict__.get("_prev_record")
+        index = self.__dict__["_index"]
+        return frames[index - 1] if index > 0 else None
+
+    @prev_record.setter
+    def prev_record(self, value: Optional[Frame]):
+        self.__dict__.pop("_frames", None)
+        self.__dict__["_prev_record"] = value
+
+    @property
+    def next_record(self) -> Optional[Frame]:
+        frames = self.__dict__.get("_frames")
+        if frames is None:
+            return self.__dict__.get("_next_record")
+        index = self.__dict__["_index"]
+        return frames[index + 1] if index + 1 < len(frames) else None
+
+    @next_record.setter
+    def next_record(self, value: Optional[Frame]):
+        self.__dict__.pop("_frames", None)
+        self.__dict__["_next_record"] = value
+
+
+class ColumnarFrames(Sequence):
+    """
+    Columnar storage for the frames of a tracking dataset.
+
+    Instead of keeping a [`Frame`][kloppy.domain.Frame] object (and a
+    [`PlayerData`][kloppy.domain.PlayerData] and `Point` object per player)
+    for every observation, all values are stored in contiguous NumPy arrays.
+    Indexing or iterating returns `Frame` objects that are built on access,
+    so code written against the object model keeps working. These frames
+    are read-only snapshots: every access returns a new object, setting
+    their attributes raises an `AttributeError` and changes to their
+    `players_data`, `other_data` or `PlayerData` objects are not stored.
+
+    The tracked objects are laid out along the second axis of the
+    per-object arrays. The first object is always the ball.
+
+    Attributes:
+        periods: The periods referenced by `period_indices`.
+        teams: The teams referenced by `ball_owning_team_indices`.
+        players: The players stored along the object axis (after the ball).
+        frame_ids: Array of shape (n_frames,) with the frame ids.
+        period_indices: Array of shape (n_frames,) with indices in `periods`.
+        timestamps: Array of shape (n_frames,) with the number of seconds
+            since the start of the period.
+        ball_states: Array of shape (n_frames,) with indices in `BallState`
+            or -1 when the ball state is unknown.
+        ball_owning_team_indices: Array of shape (n_frames,) with indices in
+            `teams` or -1 when the ball owning team is unknown.
+        coordinates: Array of shape (n_frames, n_objects, 3) with the x, y
+            and z coordinates of each object.
+        point_types: Array of shape (n_frames, n_objects) describing how each
+            coordinate should be materialised (`POINT_MISSING`, `POINT_2D`,
+            `POINT_3D`, `POINT_3D_WITHOUT_Z`, or `POINT_NONE` for objects
+            that are part of the frame without coordinates).
+        speeds: Array of shape (n_frames, n_objects). NaN when not set.
+        distances: Array of shape (n_frames, n_objects). NaN when not set.
+        other_data: Non-empty `Frame.other_data` dicts by frame index.
+        player_other_data: Non-empty `PlayerData.other_data` dicts by
+            (frame index, object index).
+        statistics: Non-empty `Frame.statistics` lists by frame index.
+        irregular_values: Speed or distance values that are not a number,
+            by (frame index, object index).
+    """
+
+    def __init__(
+        self,
+        periods: list[Period],
+        teams: list[Team],
+        players: list[Player],
+        frame_ids,
+        period_indices,
+        timestamps,
+        ball_states,
+        ball_owning_team_indices,
+        coordinates,
+        point_types,
+        speeds,
+        distances,
+        other_data: Optional[dict[int, dict[str, Any]]] = None,
+        player_other_data: Optional[
+            dict[tuple[int, int], dict[str, Any]]
+        ] = None,
+        statistics: Optional[dict[int, list]] = None,
+        irregular_values: Optional[
+            dict[tuple[int, int], dict[str, Any]]
+        ] = None,
+    ):
+        self.periods = periods
+        self.teams = teams
+        self.players = players
+        self.frame_ids = frame_ids
+        self.period_indices = period_indices
+        self.timestamps = timestamps
+        self.ball_states = ball_states
+        self.ball_owning_team_indices = ball_owning_team_indices
+        self.coordinates = coordinates
+        self.point_types = point_types
+        self.speeds = speeds
+        self.distances = distances
+        self.other_data = other_data or {}
+        self.player_other_data = player_other_data or {}
+        self.statistics = statistics or {}
+        self.irregular_values = irregular_values or {}
+        self.dataset: Optional[TrackingDataset] = None
+        # Set by `take`: the frames are materialised by the storage they
+        # were selected from, so they keep their dataset and neighbours
+        self.source: Optional[ColumnarFrames] = None
+        self.source_indices: Optional[list[int]] = None
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: Iterator[Frame],
+        periods: list[Period],
+        teams: list[Team],
+    ) -> "ColumnarFrames":
+        """Build columnar storage from `Frame` objects."""
+        builder = ColumnarFramesBuilder(periods, teams)
+        for frame in frames:
+            builder.append(frame)
+        return builder.build()
+
+    def bind(self, dataset: "TrackingDataset") -> "ColumnarFrames":
+        """
+        Return storage whose materialised frames refer to `dataset`.
+
+        The arrays are shared between datasets (for example after
+        `dataclasses.replace`), so storage that already belongs to another
+        dataset is copied instead of rebound.
+        """
+        if self.source is None and (
+            self.dataset is None or self.dataset is dataset
+        ):
+            self.dataset = dataset
+            return self
+        storage = self.replace_values()
+        storage.dataset = dataset
+        return storage
+
+    def replace_values(self, **changes) -> "ColumnarFrames":
+        """Return a copy of the storage with some of the arrays replaced."""
+        kwargs = {
+            name: getattr(self, name)
+            for name in (
+                "periods",
+                "teams",
+                "players",
+                "frame_ids",
+                "period_indices",
+                "timestamps",
+                "ball_states",
+                "ball_owning_team_indices",
+                "coordinates",
+                "point_types",
+                "speeds",
+                "distances",
+                "other_data",
+                "player_other_data",
+                "statistics",
+                "irregular_values",
+            )
+        }
+        kwargs.update(changes)
+        return ColumnarFrames(**kwargs)
+
+    def take(self, indices: Sequence[int]) -> "ColumnarFrames":
+        """
+        Return storage with the frames at the (unique, sorted) `indices`.
+
+        The arrays are copied, but the frames are still materialised by
+        this storage: like the records of a filtered dataset, they refer to
+        the dataset of this storage and their previous and next frames are
+        the neighbouring frames in this storage. Binding the new storage to
+        a dataset makes it standalone.
+        """
+        np = import_numpy()
+
+        indices = np.asarray(indices, dtype=np.intp)
+        new_indices = {i: k for k, i in enumerate(indices.tolist())}
+
+        def by_frame(values: dict) -> dict:
+            return {
+                new_indices[i]: value
+                for i, value in values.items()
+                if i in new_indices
+            }
+
+        def by_object(values: dict) -> dict:
+            return {
+                (new_indices[i], j): value
+                for (i, j), value in values.items()
+                if i in new_indices
+            }
+
+        storage = self.replace_values(
+            frame_ids=self.frame_ids[indices],
+            period_indices=self.period_indices[indices],
+            timestamps=self.timestamps[indices],
+            ball_states=self.ball_states[indices],
+            ball_owning_team_indices=self.ball_owning_team_indices[indices],
+            coordinates=self.coordinates[indices],
+            point_types=self.point_types[indices],
+            speeds=self.speeds[indices],
+            distances=self.distances[indices],
+            other_data=by_frame(self.other_data),
+            player_other_data=by_object(self.player_other_data),
+            statistics=by_frame(self.statistics),
+            irregular_values=by_object(self.irregular_values),
+        )
+        if self.source is not None:
+            storage.source = self.source
+            storage.source_indices = [
+                self.source_indices[i] for i in new_indices
+            ]
+        else:
+            storage.source = self
+            storage.source_indices = list(new_indices)
+        return storage
+
+    @property
+    def has_coordinates(self):
+        """Array of shape (n_frames, n_objects), whether each object has
+        coordinates."""
+        return (self.point_types != POINT_MISSING) & (
+            self.point_types != POINT_NONE
+        )
+
+    def position_of(self, frame: Frame) -> Optional[int]:
+        """The position of a frame built by this storage, or `None`."""
+        frames = frame.__dict__.get("_frames")
+        if frames is None or frames is not (self.source or self):
+            return None
+        if self.source is None:
+            return frame.__dict__["_index"]
+        positions = self.__dict__.get("_source_positions")
+        if positions is None:
+            positions = self._source_positions = {
+                index: position
+                for position, index in enumerate(self.source_indices)
+            }
+        return positions.get(frame.__dict__["_index"])
+
+    def __len__(self) -> int:
+        return len(self.frame_ids)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._frame_at(i) for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("frame index out of range")
+        return self._frame_at(item)
+
+    def __iter__(self) -> Iterator[Frame]:
+        for i in range(len(self)):
+            yield self._frame_at(i)
+
+    def _frame_at(self, i: int) -> Frame:
+        if self.source is not None:
+            return self.source._build_frame(self.source_indices[i])
+        return self._build_frame(i)
+
+    def _point(self, i: int, j: int, point_type: int):
+        if point_type == POINT_NONE:
+            return None
+        x, y, z = self.coordinates[i, j].tolist()
+        if point_type == POINT_2D:
+            return Point(x=x, y=y)
+        elif point_type == POINT_3D:
+            return Point3D(x=x, y=y, z=z)
+        return Point3D(x=x, y=y, z=None)
+
+    def _value(self, i: int, j: int, name: str, value: float) -> Any:
+        if value != value:
+            irregular = self.irregular_values.get((i, j))
+            return irregular.get(name) if irregular else None
+        return value
+
+    def _build_frame(self, i: int) -> Frame:
+        point_types = self.point_types[i].tolist()
+        speeds = self.speeds[i].tolist()
+        distances = self.distances[i].tolist()
+
+        players_data = {}
+        for j, player in enumerate(self.players, start=1):
+            point_type = point_types[j]
+            if point_type == POINT_MISSING:
+                continue
+            players_data[player] = PlayerData(
+                coordinates=self._point(i, j, point_type),
+                distance=self._value(i, j, "distance", distances[j]),
+                speed=self._value(i, j, "speed", speeds[j]),
+                other_data=dict(self.player_other_data.get((i, j), ())),
+            )
+
+        ball_state = int(self.ball_states[i])
+        ball_owning_team = int(self.ball_owning_team_indices[i])
+        frame = _ColumnarFrame(
+            frame_id=int(self.frame_ids[i]),
+            period=self.periods[self.period_indices[i]],
+            timestamp=timedelta(seconds=float(self.timestamps[i])),
+            statistics=list(self.statistics.get(i, ())),
+            ball_owning_team=(
+                self.teams[ball_owning_team] if ball_owning_team >= 0 else None
+            ),
+            ball_state=_BALL_STATES[ball_state] if ball_state >= 0 else None,
+            players_data=players_data,
+            other_data=dict(self.other_data.get(i, ())),
+            ball_coordinates=(
+                self._point(i, 0, point_types[0])
+                if point_types[0] != POINT_MISSING
+                else None
+            ),
+            ball_speed=self._value(i, 0, "speed", speeds[0]),
+        )
+        frame.__dict__["_frames"] = self
+        frame.__dict__["_index"] = i
+        if self.dataset is not None:
+            frame.dataset = self.dataset
+        frame.__dict__["_read_only"] = True
+        return frame
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes consumed by the arrays."""
+        return sum(
+            getattr(self, name).nbytes
+            for name in (
+                "frame_ids",
+                "period_indices",
+                "timestamps",
+                "ball_states",
+                "ball_owning_team_indices",
+                "coordinates",
+                "point_types",
+                "speeds",
+                "distances",
+            )
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} frame_count={len(self)} object_count={len(self.players) + 1}>"
+
+
+class ColumnarFramesBuilder:
+    """
+    Incrementally collects frames into [`ColumnarFrames`][kloppy.domain.ColumnarFrames].
+
+    Values are appended to compact typed buffers and only converted to
+    NumPy arrays when `build` is called. Deserializers can either `append`
+    complete `Frame` objects or write raw values with `add_frame` and
+    `add_object` to avoid creating the intermediate objects at all.
+    """
+
+    def __init__(self, periods: list[Period], teams: list[Team]):
+        self.periods = list(periods)
+        self.teams = list(teams)
+        self.players: list[Player] = []
+
+        self._period_index = {period.id: i for i, period in enumerate(periods)}
+        self._team_index = {team: i for i, team in enumerate(teams)}
+        self._player_index: dict[Player, int] = {}
+
+        self._frame_ids = array("q")
+        self._period_indices = array("h")
+        self._timestamps = array("d")
+        self._ball_states = array("b")
+        self._ball_owning_teams = array("b")
+
+        self._object_frame = array("q")
+        self._object_index = array("l")
+        self._object_x = array("d")
+        self._object_y = array("d")
+        self._object_z = array("d")
+        self._object_point_type = array("b")
+        self._object_speed = array("d")
+        self._object_distance = array("d")
+
+        self._other_data: dict[int, dict[str, Any]] = {}
+        self._player_other_data: dict[tuple[int, int], dict[str, Any]] = {}
+        self._statistics: dict[int, list] = {}
+        self._irregular_values: dict[tuple[int, int], dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._frame_ids)
+
+    def object_index(self, player: Optional[Player]) -> int:
+        """Index of a player (or the ball, when `None`) on the object axis."""
+        if player is None:
+            return 0
+        index = self._player_index.get(player)
+        if index is None:
+            self.players.append(player)
+            index = self._player_index[player] = len(self.players)
+        return index
+
+    def add_frame(
+        self,
+        frame_id: int,
+        period: Period,
+        timestamp: Union[timedelta, float],
+        ball_state: Optional[BallState] = None,
+        ball_owning_team: Optional[Team] = None,
+        other_data: Optional[dict[str, Any]] = None,
+        statistics: Optional[list] = None,
+    ) -> int:
+        """Start a new frame and return its index."""
+        index = len(self._frame_ids)
+        self._frame_ids.append(frame_id)
+        self._period_indices.append(self._period_index[period.id])
+        self._timestamps.append(
+            timestamp.total_seconds()
+            if isinstance(timestamp, timedelta)
+            else timestamp
+        )
+        self._ball_states.append(
+            _BALL_STATES.index(ball_state) if ball_state is not None else -1
+        )
+        self._ball_owning_teams.append(
+            self._team_index[ball_owning_team]
+            if ball_owning_team is not None
+            else -1
+        )
+        if other_data:
+            self._other_data[index] = other_data
+        if statistics:
+            self._statistics[index] = statistics
+        return index
+
+    def add_object(
+        self,
+        object_index: int,
+        x: float,
+        y: float,
+        z: Optional[float] = None,
+        point_type: int = POINT_2D,
+        speed: Optional[float] = None,
+        distance: Optional[float] = None,
+        other_data: Optional[dict[str, Any]] = None,
+    ):
+        """Add the position of an object to the most recently added frame."""
+        frame_index = len(self._frame_ids) - 1
+        self._object_frame.append(frame_index)
+        self._object_index.append(object_index)
+        self._object_x.append(x)
+        self._object_y.append(y)
+        self._object_z.append(z if z is not None else float("nan"))
+        self._object_point_type.append(point_type)
+        self._object_speed.append(
+            self._to_float(frame_index, object_index, "speed", speed)
+        )
+        self._object_distance.append(
+            self._to_float(frame_index, object_index, "distance", distance)
+        )
+        if other_data:
+            self._player_other_data[(frame_index, object_index)] = other_data
+
+    def _to_float(
+        self, frame_index: int, object_index: int, name: str, value: Any
+    ) -> float:
+        if value is None:
+            return float("nan")
+        if isinstance(value, (int, float)):
+            return value
+        # Keep values that don't fit in a float array (some providers
+        # deliver vectors instead of scalars) aside
+        self._irregular_values.setdefault((frame_index, object_index), {})[
+            name
+        ] = value
+        return float("nan")
+
+    def _add_point(
+        self,
+        object_index: int,
+        point: Optional[Point],
+        speed: Optional[float] = None,
+        distance: Optional[float] = None,
+        other_data: Optional[dict[str, Any]] = None,
+    ):
+        if point is None:
+            self.add_object(
+                object_index,
+                float("nan"),
+                float("nan"),
+                point_type=POINT_NONE,
+                speed=speed,
+                distance=distance,
+                other_data=other_data,
+            )
+            return
+        if isinstance(point, Point3D):
+            point_type = POINT_3D if point.z is not None else POINT_3D_WITHOUT_Z
+            z = point.z
+        else:
+            point_type = POINT_2D
+            z = None
+        self.add_object(
+            object_index,
+            point.x,
+            point.y,
+            z,
+            point_type=point_type,
+            speed=speed,
+            distance=distance,
+            other_data=other_data,
+        )
+
+    def append(self, frame: Frame):
+        """Add a `Frame` object."""
+        self.add_frame(
+            frame_id=frame.frame_id,
+            period=frame.period,
+            timestamp=frame.timestamp,
+            ball_state=frame.ball_state,
+            ball_owning_team=frame.ball_owning_team,
+            other_data=frame.other_data,
+            statistics=frame.statistics,
+        )
+        if frame.ball_coordinates is not None or frame.ball_speed is not None:
+            self._add_point(0, frame.ball_coordinates, speed=frame.ball_speed)
+        for player, player_data in frame.players_data.items():
+            self._add_point(
+                self.object_index(player),
+                player_data.coordinates,
+                speed=player_data.speed,
+                distance=player_data.distance,
+                other_data=player_data.other_data,
+            )
+
+    def build(self) -> ColumnarFrames:
+        """Convert the collected values to `ColumnarFrames`."""
+        np = import_numpy()
+
+        n_frames = len(self._frame_ids)
+        n_objects = len(self.players) + 1
+
+        frame_indices = np.frombuffer(self._object_frame, dtype=np.int64)
+        object_indices = np.asarray(self._object_index, dtype=np.intp)
+
+        coordinates = np.full((n_frames, n_objects, 3), np.nan)
+        coordinates[frame_indices, object_indices, 0] = self._object_x
+        coordinates[frame_indices, object_indices, 1] = self._object_y
+        coordinates[frame_indices, object_indices, 2] = self._object_z
+
+        point_types = np.zeros((n_frames, n_objects), dtype=np.int8)
+        point_types[frame_indices, object_indices] = self._object_point_type
+
+        speeds = np.full((n_frames, n_objects), np.nan)
+        speeds[frame_indices, object_indices] = self._object_speed
+        distances = np.full((n_frames, n_objects), np.nan)
+        distances[frame_indices, object_indices] = self._object_distance
+
+        return ColumnarFrames(
+            periods=self.periods,
+            teams=self.teams,
+            players=list(self.players),
+            frame_ids=np.array(self._frame_ids, dtype=np.int64),
+            period_indices=np.array(self._period_indices, dtype=np.int16),
+            timestamps=np.array(self._timestamps, dtype=np.float64),
+            ball_states=np.array(self._ball_states, dtype=np.int8),
+            ball_owning_team_indices=np.array(
+                self._ball_owning_teams, dtype=np.int8
+            ),
+            coordinates=coordinates,
+            point_types=point_types,
+            speeds=speeds,
+            distances=distances,
+            other_data=self._other_data,
+            player_other_data=self._player_other_data,
+            statistics=self._statistics,
+            irregular_values=self._irregular_values,
+        )
+
+
 @dataclass
 @docstring_inherit_attributes(Dataset)
 class TrackingDataset(Dataset[Frame]):
@@ -71,6 +715,61 @@ class TrackingDataset(Dataset[Frame]):
 
     dataset_type: DatasetType = DatasetType.TRACKING
 
+    def __post_init__(self):
+        from kloppy.config import get_config
+
+        if (
+            not isinstance(self.records, ColumnarFrames)
+            and get_config("tracking.storage") == "columnar"
+        ):
+            self.records = ColumnarFrames.from_frames(
+                self.records, self.metadata.periods, self.metadata.teams
+            )
+        super().__post_init__()
+
+    def _link_records(self):
+        if isinstance(self.records, ColumnarFrames):
+            self.records = self.records.bind(self)
+        else:
+            super()._link_records()
+
+    def _relink_records(self):
+        if not isinstance(self.records, ColumnarFrames):
+            super()._relink_records()
+
+    def _select_records(self, positions: list[int], records: list[Frame]):
+        if isinstance(self.records, ColumnarFrames):
+            return self.records.take(positions)
+        return records
+
+    def map(self, mapper: Callable[[Frame], Frame]):
+        """
+        Apply `mapper` to every frame.
+
+        Columnar datasets stay columnar: the frames returned by `mapper` are
+        stored in new columnar storage.
+        """
+        if not isinstance(self.records, ColumnarFrames):
+            return super().map(mapper)
+        return replace(
+            self,
+            records=ColumnarFrames.from_frames(
+                (mapper(frame) for frame in self.records),
+                self.metadata.periods,
+                self.metadata.teams,
+            ),
+        )
+
+    def _record_ids(self):
+        if isinstance(self.records, ColumnarFrames):
+            return self.records.frame_ids.tolist()
+        return super()._record_ids()
+
+    def _record_id_at(self, position: int):
+        if isinstance(self.records, ColumnarFrames):
+            return int(self.records.frame_ids[position])
+        return super()._record_id_at(position)
+
     @property
     def frames(self):
         return self.records
@@ -79,5 +778,359 @@ class TrackingDataset(Dataset[Frame]):
     def frame_rate(self):
         return self.metadata.frame_rate
 
+    @property
+    def is_columnar(self) -> bool:
+        """Whether the frames are kept in [`ColumnarFrames`][kloppy.domain.ColumnarFrames]."""
+        return isinstance(self.records, ColumnarFrames)
+
+    def to_dict(
+        self,
+        *columns: Unpack[tuple["Column"]],
+        orient: Literal["list"] = "list",
+        layout: Literal["wide", "long"] = "wide",
+        **named_columns: "NamedColumns",
+    ) -> dict[str, list[Any]]:
+        """
+        Convert the frames to a dict with a list of values per column.
+
+        Args:
+            orient: Only "list" is supported.
+            layout: "wide" for one row per frame with columns for each
+                player, or "long" for one row per tracked object per frame.
+                The long layout has a fixed set of columns (frame, team,
+                player, coordinates, distance and speed) and can't be
+                combined with custom columns.
+        """
+        if layout == "wide":
+            return super().to_dict(*columns, orient=orient, **named_columns)
+        elif layout != "long":
+            raise KloppyParameterError(
+                f"Layout {layout} is not supported. Use 'wide' or 'long'"
+            )
+        if columns or named_columns:
+            raise KloppyParameterError(
+                "Columns can't be specified when layout='long'"
+            )
+        if orient != "list":
+            raise KloppyParameterError(
+                f"Orient {orient} is not supported. Only orient='list' is supported"
+            )
+
+        from ..services.transformers.long import frames_to_long_dict
+
+        return frames_to_long_dict(self.records, self.metadata.teams)
+
+    def to_df(
+        self,
+        *columns: Unpack[tuple["Column"]],
+        engine: Optional[Literal["polars", "pandas", "pandas[pyarrow]"]] = None,
+        layout: Literal["wide", "long"] = "wide",
+        **named_columns: "NamedColumns",
+    ):
+        """
+        Convert the frames to a dataframe.
+
+        Args:
+            engine: The dataframe library to use.
+            layout: "wide" for one row per frame with columns for each
+                player, or "long" for one row per tracked object per frame.
+
+        Examples:
+            >>> df = dataset.to_df(layout="long")
+            >>> df.columns  # period_id, ..., team_id, player_id, x, y, z, d, s
+        """
+        return dict_to_df(
+            lambda: self.to_dict(
+                *columns, orient="list", layout=layout, **named_columns
+            ),
+            engine,
+        )
+
+    def to_arrow(
+        self,
+        layout: Literal["wide", "long"] = "wide",
+        chunk_size: int = 10_000,
+    ):
+        """
+        Convert the frames to a `pyarrow.Table` with a typed schema.
+
+        The table is built from record batches of `chunk_size` frames
+        without creating intermediate dicts. Requires pyarrow.
+
+        Args:
+            layout: "wide" for one row per frame with columns for each
+                player, or "long" for one row per tracked object per frame.
+            chunk_size: The number of frames in each record batch.
+        """
+        from ..services.transformers.arrow import frames_to_arrow
+
+        return frames_to_arrow(
+            self.records, self.metadata, layout=layout, chunk_size=chunk_size
+        )
+
+    def to_parquet(
+        self,
+        path: "FileLike",
+        layout: Literal["wide", "long"] = "wide",
+        chunk_size: int = 10_000,
+        **kwargs,
+    ):
+        """
+        Write the frames to a Parquet file.
+
+        Frames are written in chunks of `chunk_size` frames, so the memory
+        needed for the export does not grow with the number of frames.
+        Additional keyword arguments are passed to `pyarrow.parquet.ParquetWriter`.
+        Requires pyarrow.
+
+        Args:
+            path: The file to write to.
+            layout: "wide" for one row per frame with columns for each
+                player, or "long" for one row per tracked object per frame.
+            chunk_size: The number of frames in each row group.
+        """
+        from ..services.transformers.arrow import frames_to_parquet
+
+        frames_to_parquet(
+            self.records,
+            self.metadata,
+            path,
+            layout=layout,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    def to_columnar(self) -> "TrackingDataset":
+        """
+        Convert the dataset to columnar storage.
+
+        The frames are moved into contiguous NumPy arrays and materialised
+        as `Frame` objects only when accessed. This reduces the memory
+        footprint of a full match by an order of magnitude. Requires numpy.
+
+        Examples:
+            >>> dataset = dataset.to_columnar()
+            >>> dataset.frames.coordinates.shape  # (frames, objects, xyz)
+        """
+        if self.is_columnar:
+            return self
+
+        return replace(
+            self,
+            records=ColumnarFrames.from_frames(
+                self.records, self.metadata.periods, self.metadata.teams
+            ),
+        )
+
+    def add_kinematics(
+        self,
+        smoothing: Optional[int] = None,
+        max_gap: Optional[timedelta] = timedelta(seconds=1),
+        overwrite: bool = True,
+    ) -> "TrackingDataset":
+        """
+        Compute the velocity, speed, acceleration and distance of all objects.
+
+        The values are computed with NumPy over whole trajectories and are
+        in meters and seconds. Trajectories are split at period boundaries,
+        at missing samples and at gaps longer than `max_gap`. The speed and
+        cumulative distance are stored in `PlayerData.speed` and
+        `PlayerData.distance` (`Frame.ball_speed` for the ball), the
+        velocity and acceleration in `other_data`. Requires numpy.
+
+        Args:
+            smoothing: The size (in frames) of a centered moving average
+                that is applied to the positions first.
+            max_gap: The longest gap between two observations of an object
+                within one trajectory segment.
+            overwrite: Whether to replace the speeds and distances that were
+                set by the data provider.
+
+        Returns:
+            A new dataset with the kinematics added to the frames.
+
+        Examples:
+            >>> dataset = dataset.add_kinematics(smoothing=5)
+            >>> frame.players_data[player].other_data["acceleration"]
+        """
+        from ..services.kinematics import add_kinematics
+
+        return add_kinematics(
+            self, smoothing=smoothing, max_gap=max_gap, overwrite=overwrite
+        )
+
+    def resample(
+        self,
+        target_hz: float,
+        method: Literal["linear", "nearest"] = "linear",
+        max_gap: Optional[timedelta] = timedelta(seconds=0.5),
+    ) -> "TrackingDataset":
+        """
+        Resample the frames to a different frame rate.
+
+        Every period is resampled onto a regular grid of timestamps that
+        starts at its first frame. Coordinates, speeds and distances are
+        interpolated between the surrounding observations of each object
+        ("linear") or taken from the nearest one ("nearest"). The ball
+        state, ball owning team and `other_data` are taken from the nearest
+        source frame. Requires numpy.
+
+        Args:
+            target_hz: The frame rate of the resampled dataset.
+            method: "linear" or "nearest".
+            max_gap: The longest time between two observations of an object
+                that is filled in when it briefly drops out. Use `None` to
+                fill all gaps within a period.
+
+        Returns:
+            A new dataset with the resampled frames.
+
+        Examples:
+            >>> dataset = dataset.resample(10)
+            >>> dataset.frame_rate
+            10
+        """
+        from ..services.resampling import resample
+
+        return resample(self, target_hz, method=method, max_gap=max_gap)
+
+
+class TrackingDataStream:
+    """
+    Tracking data frames that are yielded while the raw data is parsed.
+
+    The metadata is available before the first frame is read, which makes it
+    possible to process a full match without keeping all frames in memory.
+    A stream can only be iterated once. The frames are not linked to a
+    dataset, so `prev_record`, `next_record` and `dataset` are not set.
+
+    The underlying inputs are released when the stream is exhausted or
+    closed. Use the stream as a context manager when it might not be fully
+    consumed.
+
+    Attributes:
+        metadata (Metadata): Metadata of the tracking data.
+
+    Examples:
+        >>> with tracab.iter_frames(meta_data, raw_data) as stream:
+        ...     for frame in stream:
+        ...         process(frame)
+    """
+
+    def __init__(self, metadata: Metadata, frames: Iterable[Frame]):
+        self.metadata = metadata
+        self._frames = iter(frames)
+        self._close_callbacks: list[Callable[[], Any]] = []
+        self._closed = False
+
+    def call_on_close(self, callback: Callable[[], Any]):
+        """Register a callback that is called when the stream is closed."""
+        self._close_callbacks.append(callback)
+
+    def __iter__(self) -> Iterator[Frame]:
+        if self._closed:
+            raise RuntimeError("The stream is closed")
+
+        try:
+            for frame in self._frames:
+                yield frame
+                if self._closed:
+                    break
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop parsing and release the underlying inputs."""
+        if self._closed:
+            return
+
+        self._closed = True
+        close = getattr(self._frames, "close", None)
+        if close is not None:
+            close()
+        while self._close_callbacks:
+            self._close_callbacks.pop()()
+
+    def __enter__(self) -> "TrackingDataStream":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def to_arrow(
+        self,
+        layout: Literal["wide", "long"] = "wide",
+        chunk_size: int = 10_000,
+    ):
+        """
+        Consume the remaining frames into a `pyarrow.Table` with a typed schema.
+
+        The table is built from record batches of `chunk_size` frames
+        without creating intermediate dicts. Requires pyarrow.
+
+        Args:
+            layout: "wide" for one row per frame with columns for each
+                player, or "long" for one row per tracked object per frame.
+            chunk_size: The number of frames in each record batch.
+        """
+        from ..services.transformers.arrow import frames_to_arrow
+
+        return frames_to_arrow(
+            self, self.metadata, layout=layout, chunk_size=chunk_size
+        )
+
+    def to_parquet(
+        self,
+        path: "FileLike",
+        layout: Literal["wide", "long"] = "wide",
+        chunk_size: int = 10_000,
+        **kwargs,
+    ):
+        """
+        Write the remaining frames to a Parquet file.
+
+        Frames are written in chunks of `chunk_size` frames, so the memory
+        needed for the export does not grow with the number of frames.
+        Additional keyword arguments are passed to `pyarrow.parquet.ParquetWriter`.
+        Requires pyarrow.
+
+        Args:
+            path: The file to write to.
+            layout: "wide" for one row per frame with columns for each
+                player, or "long" for one row per tracked object per frame.
+            chunk_size: The number of frames in each row group.
+        """
+        from ..services.transformers.arrow import frames_to_parquet
+
+        frames_to_parquet(
+            self,
+            self.metadata,
+            path,
+            layout=layout,
+            chunk_size=chunk_size,
+            **kwargs,
+        )
+
+    def to_dataset(self) -> TrackingDataset:
+        """Consume the remaining frames into a `TrackingDataset`."""
+        from kloppy.config import get_config
+
+        with self:
+            if get_config("tracking.storage") == "columnar":
+                records = ColumnarFrames.from_frames(
+                    self, self.metadata.periods, self.metadata.teams
+                )
+            else:
+                records = list(self)
+
+        return TrackingDataset(records=records, metadata=self.metadata)
+
 
-__all__ = ["Frame", "TrackingDataset", "PlayerData"]
+__all__ = [
+    "Frame",
+    "TrackingDataset",
+    "TrackingDataStream",
+    "PlayerData",
+    "ColumnarFrames",
+    "ColumnarFramesBuilder",
+]
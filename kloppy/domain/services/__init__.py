@@ -3,6 +3,8 @@ from collections import Counter, defaultdict
 from kloppy.domain import AttackingDirection, Frame, Ground, Period
 
 from .event_factory import EventFactory, create_event
+from .kinematics import Kinematics, compute_kinematics
+from .synchronizer import EventTrackingSynchronizer
 from .transformers import DatasetTransformer, DatasetTransformerBuilder
 
 # NOT YET: from .enrichers import TrackingPossessionEnricher
@@ -72,6 +74,9 @@ __all__ = [
     "DatasetTransformer",
     "DatasetTransformerBuilder",
     "EventFactory",
+    "EventTrackingSynchronizer",
+    "Kinematics",
+    "compute_kinematics",
     "create_event",
     "attacking_direction_from_frame",
     "attacking_directions_from_multi_frames",
@@ -4,6 +4,9 @@ import warnings
 
 from kloppy.domain import Frame
 
+# Looking up the fields of a dataclass is slow, and this runs for every frame
+_FRAME_INIT_FIELDS = [field for field in fields(Frame) if field.init]
+
 
 def create_frame(**kwargs) -> Frame:
     """
@@ -18,9 +21,8 @@ def create_frame(**kwargs) -> Frame:
 
     relevant_kwargs = {
         field.name: kwargs.get(field.name, field.default)
-        for field in fields(Frame)
-        if field.init
-        and not (
+        for field in _FRAME_INIT_FIELDS
+        if not (
             field.default == dataclasses.MISSING and field.name not in kwargs
         )
     }
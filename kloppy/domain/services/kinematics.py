@@ -0,0 +1,420 @@
+"""Kinematics of the players and the ball in a tracking dataset.
+
+The velocity, speed, acceleration and cumulative distance of every tracked
+object are computed with NumPy over whole trajectories, instead of walking
+from frame to frame.
+
+A trajectory is split into segments at period boundaries, at frames in
+which the object is missing and at gaps in time longer than `max_gap`.
+Velocities are computed with central differences within a segment (and
+one-sided differences at its ends), so values are never derived from
+positions in different segments. The distance is accumulated within the
+segments only.
+
+All values are in meters and seconds, whatever the coordinate system of the
+dataset. Only the x and y coordinates are used, so the ball speed is its
+speed in the horizontal plane.
+
+Examples:
+    >>> dataset = dataset.add_kinematics(smoothing=5)
+    >>> dataset.frames[100].players_data[player].speed  # m/s
+    >>> df = compute_kinematics(dataset).to_df()
+"""
+
+from dataclasses import dataclass, replace
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Literal, Optional
+import warnings
+
+from kloppy.domain import (
+    DEFAULT_PITCH_LENGTH,
+    DEFAULT_PITCH_WIDTH,
+    ColumnarFrames,
+    Player,
+    TrackingDataset,
+    get_transformation_plan,
+)
+from kloppy.domain.models.common import dict_to_df
+from kloppy.exceptions import KloppyParameterError
+from kloppy.utils import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+KINEMATICS_COLUMNS = (
+    "period_id",
+    "timestamp",
+    "frame_id",
+    "player_id",
+    "vx",
+    "vy",
+    "speed",
+    "acceleration",
+    "distance",
+)
+
+BALL_ID = "ball"
+
+
+@dataclass
+class Kinematics:
+    """
+    The kinematics of the tracked objects in a tracking dataset.
+
+    The objects are laid out along the second axis of the arrays, in the
+    same way as in [`ColumnarFrames`][kloppy.domain.ColumnarFrames]: the
+    first object is the ball, followed by `players`. Values are NaN when an
+    object is missing or when they can't be computed (e.g. the velocity of
+    an object that is tracked in a single frame).
+
+    Attributes:
+        frames: The frames the kinematics were computed from.
+        players: The players along the object axis (after the ball).
+        velocity: Array of shape (n_frames, n_objects, 2) with the velocity
+            along the x and y axis (m/s).
+        speed: Array of shape (n_frames, n_objects) with the speed (m/s).
+        acceleration: Array of shape (n_frames, n_objects) with the rate of
+            change of the speed (m/s²). Negative values are decelerations.
+        distance: Array of shape (n_frames, n_objects) with the distance
+            covered since the first frame (m).
+    """
+
+    frames: ColumnarFrames
+    players: list[Player]
+    velocity: "np.ndarray"
+    speed: "np.ndarray"
+    acceleration: "np.ndarray"
+    distance: "np.ndarray"
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the kinematics to columns in the long layout.
+
+        Every tracked object in a frame becomes one row, starting with the
+        ball (`player_id` "ball"). Objects without coordinates in a frame
+        are left out.
+        """
+        np = import_numpy()
+
+        frames = self.frames
+        frame_indices, object_indices = np.nonzero(frames.has_coordinates)
+        period_ids = np.array(
+            [period.id for period in frames.periods], dtype=np.int64
+        )
+        player_ids = np.array(
+            [BALL_ID] + [player.player_id for player in self.players],
+            dtype=object,
+        )
+        timestamps = (
+            np.round(frames.timestamps[frame_indices] * 1e6)
+            .astype(np.int64)
+            .astype("timedelta64[us]")
+        )
+        velocity = self.velocity[frame_indices, object_indices]
+        return {
+            "period_id": period_ids[frames.period_indices[frame_indices]],
+            "timestamp": timestamps,
+            "frame_id": frames.frame_ids[frame_indices],
+            "player_id": player_ids[object_indices],
+            "vx": velocity[:, 0],
+            "vy": velocity[:, 1],
+            "speed": self.speed[frame_indices, object_indices],
+            "acceleration": self.acceleration[frame_indices, object_indices],
+            "distance": self.distance[frame_indices, object_indices],
+        }
+
+    def to_df(
+        self,
+        engine: Optional[Literal["polars", "pandas", "pandas[pyarrow]"]] = None,
+    ):
+        """Convert the kinematics to a dataframe in the long layout."""
+        return dict_to_df(self.to_dict, engine)
+
+
+def _metric_coordinates(dataset: TrackingDataset, frames: ColumnarFrames):
+    pitch_dimensions = dataset.metadata.pitch_dimensions
+    if (
+        pitch_dimensions.pitch_length is None
+        or pitch_dimensions.pitch_width is None
+    ):
+        warnings.warn(
+            "The pitch length and width are not specified. "
+            "Assuming a standard pitch size of 105x68 meters. "
+            "This may lead to incorrect results.",
+            stacklevel=3,
+        )
+        pitch_length = DEFAULT_PITCH_LENGTH
+        pitch_width = DEFAULT_PITCH_WIDTH
+    else:
+        pitch_length = pitch_dimensions.pitch_length
+        pitch_width = pitch_dimensions.pitch_width
+
+    plan = get_transformation_plan(
+        pitch_dimensions,
+        None,
+        pitch_length=pitch_length,
+        pitch_width=pitch_width,
+    )
+    return plan.apply_array(frames.coordinates[..., :2])
+
+
+def _differentiate(np, values, timestamps, starts, ends):
+    """Central differences within the segments, one-sided at their ends."""
+    n = len(timestamps)
+    index = np.arange(n)[:, None]
+    before = np.where(index - 1 >= starts, index - 1, index)
+    after = np.where(index + 1 <= ends, index + 1, index)
+    dt = timestamps[after] - timestamps[before]
+
+    if values.ndim == 3:
+        delta = np.take_along_axis(
+            values, after[..., None], axis=0
+        ) - np.take_along_axis(values, before[..., None], axis=0)
+        dt = dt[..., None]
+    else:
+        delta = np.take_along_axis(values, after, axis=0) - np.take_along_axis(
+            values, before, axis=0
+        )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(dt > 0, delta / dt, np.nan)
+
+
+def compute_kinematics(
+    dataset: TrackingDataset,
+    smoothing: Optional[int] = None,
+    max_gap: Optional[timedelta] = timedelta(seconds=1),
+) -> Kinematics:
+    """
+    Compute the velocity, speed, acceleration and distance of all objects.
+
+    Args:
+        dataset: The tracking dataset. The frames should be in chronological
+            order.
+        smoothing: The size (in frames) of a centered moving average that
+            is applied to the positions before the velocities and distances
+            are computed. Even sizes are rounded up. The average does not
+            cross segment boundaries and its window shrinks near them.
+        max_gap: The longest time between two consecutive observations of
+            an object within one segment. Use `None` to only split at
+            period boundaries and missing objects.
+
+    Returns:
+        The kinematics of the ball and the players.
+
+    Note:
+        Requires numpy.
+    """
+    np = import_numpy()
+
+    if smoothing is not None and smoothing < 1:
+        raise KloppyParameterError("smoothing should be at least 1 frame")
+
+    frames = dataset.records
+    if not isinstance(frames, ColumnarFrames):
+        frames = ColumnarFrames.from_frames(
+            frames, dataset.metadata.periods, dataset.metadata.teams
+        )
+
+    n_frames, n_objects = frames.point_types.shape
+    positions = _metric_coordinates(dataset, frames)
+    timestamps = np.asarray(frames.timestamps, dtype=np.float64)
+    valid = frames.has_coordinates & np.isfinite(positions).all(axis=2)
+
+    # Whether each observation continues the segment of the previous frame
+    linked = np.zeros((n_frames, n_objects), dtype=bool)
+    if n_frames > 1:
+        dt = np.diff(timestamps)
+        same_segment = (np.diff(frames.period_indices) == 0) & (dt > 0)
+        if max_gap is not None:
+            same_segment &= dt <= max_gap.total_seconds() + 1e-9
+        linked[1:] = same_segment[:, None] & valid[1:] & valid[:-1]
+
+    # The first and last frame of the segment of each observation
+    index = np.broadcast_to(np.arange(n_frames)[:, None], linked.shape)
+    starts = np.maximum.accumulate(np.where(linked, 0, index), axis=0)
+    ends_linked = np.zeros_like(linked)
+    ends_linked[:-1] = linked[1:]
+    ends = np.minimum.accumulate(
+        np.where(ends_linked, n_frames - 1, index)[::-1], axis=0
+    )[::-1]
+
+    positions = np.where(valid[..., None], positions, 0.0)
+    if smoothing is not None and smoothing > 1:
+        # The window shrinks near the ends of a segment to stay centered
+        half = np.minimum(
+            smoothing // 2, np.minimum(index - starts, ends - index)
+        )
+        lo = index - half
+        hi = index + half
+        cumulative = np.zeros((n_frames + 1, n_objects, 2))
+        np.cumsum(positions, axis=0, out=cumulative[1:])
+        total = np.take_along_axis(
+            cumulative, (hi + 1)[..., None], axis=0
+        ) - np.take_along_axis(cumulative, lo[..., None], axis=0)
+        positions = total / (hi - lo + 1)[..., None]
+
+    velocity = _differentiate(np, positions, timestamps, starts, ends)
+    speed = np.hypot(velocity[..., 0], velocity[..., 1])
+    acceleration = _differentiate(np, speed, timestamps, starts, ends)
+
+    steps = np.zeros((n_frames, n_objects))
+    if n_frames > 1:
+        steps[1:] = np.hypot(*np.moveaxis(positions[1:] - positions[:-1], 2, 0))
+    distance = np.cumsum(np.where(linked, steps, 0.0), axis=0)
+
+    velocity[~valid] = np.nan
+    speed[~valid] = np.nan
+    acceleration[~valid] = np.nan
+    distance[~valid] = np.nan
+    return Kinematics(
+        frames=frames,
+        players=frames.players,
+        velocity=velocity,
+        speed=speed,
+        acceleration=acceleration,
+        distance=distance,
+    )
+
+
+def _float(value: float) -> Optional[float]:
+    return value if value == value else None
+
+
+def add_kinematics(
+    dataset: TrackingDataset,
+    smoothing: Optional[int] = None,
+    max_gap: Optional[timedelta] = timedelta(seconds=1),
+    overwrite: bool = True,
+) -> TrackingDataset:
+    """
+    Add the kinematics of the players and the ball to the frames.
+
+    The speed and cumulative distance of the players are stored in
+    `PlayerData.speed` and `PlayerData.distance`, and the velocity and
+    acceleration in `PlayerData.other_data` ("vx", "vy" and
+    "acceleration"). The speed of the ball is stored in `Frame.ball_speed`,
+    and its velocity and acceleration in `Frame.other_data` ("ball_vx",
+    "ball_vy" and "ball_acceleration"). Players without coordinates in a
+    frame are left unchanged.
+
+    See [`compute_kinematics`][kloppy.domain.compute_kinematics] for the
+    arguments.
+
+    Args:
+        overwrite: Whether to replace the speeds and distances that are
+            already set (e.g. by the data provider).
+
+    Returns:
+        A new dataset with the kinematics added to the frames.
+    """
+    np = import_numpy()
+
+    kinematics = compute_kinematics(
+        dataset, smoothing=smoothing, max_gap=max_gap
+    )
+
+    if isinstance(dataset.records, ColumnarFrames):
+        frames = dataset.records
+        # Objects without coordinates keep their speed and distance
+        missing = ~frames.has_coordinates
+        speeds = np.where(missing, frames.speeds, kinematics.speed)
+        distances = np.where(missing, frames.distances, kinematics.distance)
+        if not overwrite:
+            speeds = np.where(np.isnan(frames.speeds), speeds, frames.speeds)
+            distances = np.where(
+                np.isnan(frames.distances), distances, frames.distances
+            )
+            distances[:, 0] = frames.distances[:, 0]
+        else:
+            distances[:, 0] = np.nan
+
+        other_data = {i: dict(data) for i, data in frames.other_data.items()}
+        player_other_data = {
+            key: dict(data) for key, data in frames.player_other_data.items()
+        }
+        frame_indices, object_indices = np.nonzero(frames.has_coordinates)
+        vx = kinematics.velocity[..., 0].tolist()
+        vy = kinematics.velocity[..., 1].tolist()
+        acceleration = kinematics.acceleration.tolist()
+        for i, j in zip(frame_indices.tolist(), object_indices.tolist()):
+            values = {
+                "vx": _float(vx[i][j]),
+                "vy": _float(vy[i][j]),
+                "acceleration": _float(acceleration[i][j]),
+            }
+            if j == 0:
+                other_data.setdefault(i, {}).update(
+                    {f"ball_{key}": value for key, value in values.items()}
+                )
+            else:
+                player_other_data.setdefault((i, j), {}).update(values)
+
+        return replace(
+            dataset,
+            records=frames.replace_values(
+                speeds=speeds,
+                distances=distances,
+                other_data=other_data,
+                player_other_data=player_other_data,
+            ),
+        )
+
+    object_indices = {
+        player: j for j, player in enumerate(kinematics.players, start=1)
+    }
+    vx = kinematics.velocity[..., 0].tolist()
+    vy = kinematics.velocity[..., 1].tolist()
+    speed = kinematics.speed.tolist()
+    acceleration = kinematics.acceleration.tolist()
+    distance = kinematics.distance.tolist()
+
+    records = []
+    for i, frame in enumerate(dataset.records):
+        players_data = {}
+        for player, player_data in frame.players_data.items():
+            j = object_indices.get(player)
+            if j is None or player_data.coordinates is None:
+                # Players without coordinates have no kinematics
+                players_data[player] = player_data
+                continue
+            players_data[player] = replace(
+                player_data,
+                speed=(
+                    _float(speed[i][j])
+                    if overwrite or player_data.speed is None
+                    else player_data.speed
+                ),
+                distance=(
+                    _float(distance[i][j])
+                    if overwrite or player_data.distance is None
+                    else player_data.distance
+                ),
+                other_data={
+                    **player_data.other_data,
+                    "vx": _float(vx[i][j]),
+                    "vy": _float(vy[i][j]),
+                    "acceleration": _float(acceleration[i][j]),
+                },
+            )
+        records.append(
+            replace(
+                frame,
+                players_data=players_data,
+                ball_speed=(
+                    _float(speed[i][0])
+                    if frame.ball_coordinates is not None
+                    and (overwrite or frame.ball_speed is None)
+                    else frame.ball_speed
+                ),
+                other_data={
+                    **frame.other_data,
+                    "ball_vx": _float(vx[i][0]),
+                    "ball_vy": _float(vy[i][0]),
+                    "ball_acceleration": _float(acceleration[i][0]),
+                },
+            )
+        )
+    return replace(dataset, records=records)
+
+
+__all__ = ["Kinematics", "add_kinematics", "compute_kinematics"]
@@ -1,8 +1,9 @@
 from collections import defaultdict
 from collections.abc import Iterator
 from dataclasses import dataclass
+from datetime import timedelta
 from functools import partial
-from typing import Callable
+from typing import Callable, Optional, Union
 
 from kloppy.domain import (
     CarryEvent,
@@ -122,9 +123,32 @@ class Match:
     captures: dict[str, list[Event]]
 
 
-def search(dataset: EventDataset, pattern: Node[Tok, Out]):
+def search(
+    dataset: EventDataset,
+    pattern: Union[Node[Tok, Out], RegExp[Tok, Out]],
+    max_length: Optional[int] = None,
+    max_duration: Optional[timedelta] = None,
+):
+    """
+    Search all occurrences of a pattern in the events of a dataset.
+
+    For every event, the longest match starting at that event is returned.
+    Matches never span multiple periods.
+
+    Args:
+        dataset: The dataset to search.
+        pattern: The pattern, or a RegExp compiled from it with
+            `RegExp.from_ast`. Compiling once saves time when the same
+            pattern is searched in many datasets.
+        max_length: The maximum number of events in a match.
+        max_duration: The maximum time between the first and last event of
+            a match.
+    """
     events = dataset.events
-    re = RegExp.from_ast(pattern)
+    if isinstance(pattern, RegExp):
+        re = pattern
+    else:
+        re = RegExp.from_ast(pattern)
 
     results = []
     events_per_period = defaultdict(list)
@@ -133,29 +157,35 @@ def search(dataset: EventDataset, pattern: Node[Tok, Out]):
 
     for period, events_ in sorted(events_per_period.items()):
         # Search per period. Patterns should never match over periods
-        results.extend(_search(events_, re))
+        results.extend(_search(events_, re, max_length, max_duration))
     return results
 
 
-def _search(events: list[Event], re: RegExp[Tok, Out]):
-    i = 0
+def _search(
+    events: list[Event],
+    re: RegExp[Tok, Out],
+    max_length: Optional[int] = None,
+    max_duration: Optional[timedelta] = None,
+):
+    within = None
+    if max_duration is not None:
+
+        def within(first: Event, event: Event) -> bool:
+            return event.timestamp - first.timestamp <= max_duration
+
     results = []
-    for i in range(len(events)):
-        matches = re.match(events[i:], consume_all=False)
-        if matches:
-            results.append(
-                Match(
-                    events=matches[0].trail,
-                    # TODO: check trail[0] because this points to the first event in the capture and not
-                    #       all of them
-                    captures={
-                        capture_name: capture_value[0].trail[0]
-                        for capture_name, capture_value in matches[
-                            0
-                        ].children.items()
-                    },
-                )
+    for match in re.search(events, max_length=max_length, within=within):
+        results.append(
+            Match(
+                events=match.trail,
+                # TODO: check trail[0] because this points to the first event in the capture and not
+                #       all of them
+                captures={
+                    capture_name: capture_value[0].trail[0]
+                    for capture_name, capture_value in match.children.items()
+                },
             )
+        )
 
     return results
 
@@ -164,6 +194,8 @@ def _search(events: list[Event], re: RegExp[Tok, Out]):
 class Query:
     event_types: list[str]
     pattern: Node[Tok, Out]
+    max_length: Optional[int] = None
+    max_duration: Optional[timedelta] = None
 
 
 __all__ = [
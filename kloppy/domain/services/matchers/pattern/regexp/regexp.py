@@ -1,9 +1,13 @@
+from collections import deque
 from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from itertools import product
 from types import MappingProxyType
 from typing import (
+    Any,
+    Callable,
     Generic,
+    Optional,
 )
 
 import networkx as nx
@@ -20,7 +24,7 @@ from .ast import (
     _Initial,
     _Terminal,
 )
-from .matchers import Out, Tok, _TrailItem
+from .matchers import Matcher, Out, Tok, _TrailItem
 
 
 def ast_to_graph(root: Node) -> nx.DiGraph:
@@ -489,30 +493,80 @@ class MatchList(tuple, Generic[Out]):
             return super().__getitem__(item)
 
 
-def _make_match(trail: tuple[_TrailItem, ...]) -> _Match[Out]:
+def _make_match(trail: tuple[_TrailItem, ...], offset: int = 0) -> _Match[Out]:
     """
     Transforms an explorer into a Match object using its trail
 
     Parameters
     ----------
-    explorer
-        Explorer that you want to transform
+    trail
+        Trail of the explorer that you want to transform
+    offset
+        Index of the first token of the trail in the input sequence
     """
 
-    match = _Match(0)
+    match = _Match(offset)
 
     for i, token in enumerate(trail):
         for stop in token.data.get("stop_captures", []):
             match.stop(stop)
 
         for start in token.data.get("start_captures", []):
-            match.start(start, i)
+            match.start(start, offset + i)
 
         match.append(token.item)
 
     return match
 
 
+@dataclass(frozen=True)
+class _Program:
+    """
+    Compact transition table of a regular expression graph, used by
+    `RegExp#search()` so it doesn't have to query the networkx graph for
+    every token.
+
+    States are the indices of the graph nodes, the initial node being 0. For
+    each state, `transitions` contains the outgoing edges to Final nodes as
+    (target state, matcher, edge data, hashable edge data key) and
+    `terminal` indicates if the state is connected to the terminal node.
+    """
+
+    transitions: tuple[tuple[tuple[int, Matcher, dict, tuple], ...], ...]
+    terminal: tuple[bool, ...]
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph) -> "_Program":
+        initial = _Initial()
+        nodes = [initial] + [
+            n for n in graph.nodes if isinstance(n, Final) and n != initial
+        ]
+        states = {node: i for i, node in enumerate(nodes)}
+
+        def data_key(data: dict) -> tuple:
+            return tuple(
+                (k, tuple(id(capture) for capture in v))
+                for k, v in sorted(data.items())
+            )
+
+        transitions = []
+        for node in nodes:
+            edges = []
+            for s in graph.successors(node):
+                if not isinstance(s, Final):
+                    continue
+                data = graph.get_edge_data(node, s, default={})
+                edges.append((states[s], s.statement, data, data_key(data)))
+            transitions.append(tuple(edges))
+
+        return cls(
+            transitions=tuple(transitions),
+            terminal=tuple(
+                graph.has_successor(node, _Terminal()) for node in nodes
+            ),
+        )
+
+
 class RegExp(Generic[Tok, Out]):
     """
     Core of the RegExp system. Don't instantiate this directly. There is so
@@ -544,6 +598,17 @@ class RegExp(Generic[Tok, Out]):
         """
 
         self.graph = graph
+        self._program: Optional[_Program] = None
+
+    @property
+    def program(self) -> _Program:
+        """
+        The transition table of the graph, compiled on first use
+        """
+
+        if self._program is None:
+            self._program = _Program.from_graph(self.graph)
+        return self._program
 
     @classmethod
     def from_ast(cls, root: Node[Tok, Out]) -> "RegExp[Tok, Out]":
@@ -630,6 +695,115 @@ class RegExp(Generic[Tok, Out]):
             for s in terminal
         )
 
+    def search(
+        self,
+        seq: Sequence[Tok],
+        join_trails: bool = False,
+        max_length: Optional[int] = None,
+        within: Optional[Callable[[Tok, Tok], bool]] = None,
+    ) -> Iterator[Match[Out]]:
+        """
+        Finds, for every start position in the sequence, the longest match
+        starting at this position. This gives the same results as calling
+        `match(seq[i:], consume_all=False)` for every index but all start
+        positions are run through a single pass over the sequence.
+
+        Notes
+        -----
+        Matches are generated lazily and ordered by their `start_pos`. A match
+        is emitted as soon as the runs of all earlier start positions are
+        finished, so you can stop iterating early without reading the rest of
+        the sequence.
+
+        A run stops as soon as none of its explorers can advance any further.
+        Use `max_length` or `within` to bound the window in which a match is
+        searched. The longest match inside the window is returned.
+
+        Parameters
+        ----------
+        seq
+            Sequence in which to search
+        join_trails
+            See `match()`
+        max_length
+            Maximum number of tokens in a match
+        within
+            Called with the first token of a run and a new token. The run
+            stops when it returns False.
+        """
+
+        program = self.program
+        transitions = program.transitions
+        terminal = program.terminal
+
+        # A run is [start, explorers, best terminal trails]. Explorers are
+        # stored by their de-duplication key: (state, items and edges).
+        runs: deque[list[Any]] = deque()
+
+        for pos, token in enumerate(seq):
+            runs.append([pos, {(0, ()): (0, ())}, None])
+
+            for run in runs:
+                start, explorers, _ = run
+                if explorers is None:
+                    continue
+
+                if (max_length is not None and pos - start >= max_length) or (
+                    within is not None and not within(seq[start], token)
+                ):
+                    run[1] = None
+                    continue
+
+                advanced = {}
+                for (_, key), (state, trail) in explorers.items():
+                    for target, matcher, data, data_key in transitions[state]:
+                        possible_trail = trail + (
+                            _TrailItem(item=None, data=data),
+                        )
+                        for m in matcher.match(token, trail=possible_trail):
+                            new_key = key + ((id(m), data_key),)
+                            advanced[(target, new_key)] = (
+                                target,
+                                trail + (_TrailItem(item=m, data=data),),
+                            )
+
+                trails = [
+                    trail
+                    for state, trail in advanced.values()
+                    if terminal[state]
+                ]
+                if trails:
+                    run[2] = trails
+
+                # Explorers without outgoing transitions can't advance
+                run[1] = {
+                    k: v for k, v in advanced.items() if transitions[k[0]]
+                } or None
+
+            while runs and runs[0][1] is None:
+                start, _, trails = runs.popleft()
+                if trails:
+                    yield self._best_match(start, trails, join_trails)
+
+        for start, _, trails in runs:
+            if trails:
+                yield self._best_match(start, trails, join_trails)
+
+    @staticmethod
+    def _best_match(
+        start: int,
+        trails: list[tuple[_TrailItem, ...]],
+        join_trails: bool,
+    ) -> Match[Out]:
+        """
+        Picks the same match among the terminal trails of a run as `match()`
+        would do
+        """
+
+        return _make_match(min(trails), offset=start).as_match(
+            join_trails=join_trails
+        )
+
     def _de_duplicate(
         self, stack: Iterator[Explorer[Tok, Out]], key: str = "signature"
     ) -> Iterator[Explorer[Tok, Out]]:
@@ -0,0 +1,249 @@
+"""Resampling of tracking data to a different frame rate.
+
+The frames of every period are resampled onto a regular grid of timestamps,
+starting at the first frame of the period. The coordinates of all objects
+are interpolated at once with NumPy, instead of frame by frame.
+
+Objects that drop out for a short time are filled in from their last
+observation before and their first observation after the gap. Values that
+can't be interpolated (the ball state, the ball owning team and the
+`other_data`) are taken from the source frame nearest in time.
+
+Examples:
+    >>> dataset = dataset.resample(25, method="linear")
+    >>> dataset.frame_rate
+    25
+"""
+
+from dataclasses import replace
+from datetime import timedelta
+from typing import Literal, Optional
+
+from kloppy.domain import ColumnarFrames, Frame, TrackingDataset
+from kloppy.domain.models.tracking import POINT_MISSING
+from kloppy.exceptions import KloppyParameterError
+from kloppy.utils import import_numpy
+
+METHODS = ("linear", "nearest")
+
+
+def _source_frame_rate(np, dataset: TrackingDataset, frames: ColumnarFrames):
+    if dataset.metadata.frame_rate:
+        return float(dataset.metadata.frame_rate)
+    steps = np.diff(frames.timestamps)
+    steps = steps[(steps > 0) & (np.diff(frames.period_indices) == 0)]
+    return 1.0 / float(np.median(steps)) if len(steps) else None
+
+
+def _to_frames(frames: ColumnarFrames) -> list[Frame]:
+    """Convert columnar storage back to plain `Frame` objects."""
+    return [
+        Frame(
+            frame_id=frame.frame_id,
+            period=frame.period,
+            timestamp=frame.timestamp,
+            statistics=frame.statistics,
+            ball_owning_team=frame.ball_owning_team,
+            ball_state=frame.ball_state,
+            players_data=frame.players_data,
+            other_data=frame.other_data,
+            ball_coordinates=frame.ball_coordinates,
+            ball_speed=frame.ball_speed,
+        )
+        for frame in frames
+    ]
+
+
+def resample(
+    dataset: TrackingDataset,
+    target_hz: float,
+    method: Literal["linear", "nearest"] = "linear",
+    max_gap: Optional[timedelta] = timedelta(seconds=0.5),
+) -> TrackingDataset:
+    """
+    Resample the frames of a tracking dataset to a different frame rate.
+
+    Args:
+        dataset: The tracking dataset. The frames should be in chronological
+            order.
+        target_hz: The frame rate of the resampled dataset.
+        method: "linear" to interpolate the coordinates, speeds and
+            distances between the surrounding observations, or "nearest" to
+            take them from the nearest observation.
+        max_gap: The longest time between two observations of an object
+            that is filled in. Observations in consecutive frames are always
+            interpolated. Use `None` to fill all gaps within a period.
+
+    Returns:
+        A new dataset with the resampled frames, in the same storage as the
+        original dataset. The frame ids count the frames at the new frame
+        rate, such that resampling to the original frame rate keeps them.
+
+    Note:
+        Requires numpy.
+    """
+    np = import_numpy()
+
+    if method not in METHODS:
+        raise KloppyParameterError(
+            f"Method {method} is not supported. Use 'linear' or 'nearest'"
+        )
+    if not target_hz or target_hz <= 0:
+        raise KloppyParameterError("target_hz should be a positive number")
+
+    frames = dataset.records
+    if not isinstance(frames, ColumnarFrames):
+        frames = ColumnarFrames.from_frames(
+            frames, dataset.metadata.periods, dataset.metadata.teams
+        )
+
+    n_frames = len(frames)
+    metadata = replace(dataset.metadata, frame_rate=target_hz)
+    if n_frames == 0:
+        return replace(dataset, metadata=metadata)
+
+    timestamps = np.asarray(frames.timestamps, dtype=np.float64)
+    source_hz = _source_frame_rate(np, dataset, frames)
+
+    # The regular grid of timestamps of each period and its source frames
+    bounds = np.concatenate(
+        [[0], np.flatnonzero(np.diff(frames.period_indices)) + 1, [n_frames]]
+    ).tolist()
+    target_times, segment_starts, segment_ends, frame_ids = [], [], [], []
+    lefts = []
+    next_frame_id = None
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        duration = timestamps[end - 1] - timestamps[start]
+        count = int(np.floor(duration * target_hz + 1e-6)) + 1
+        period_times = timestamps[start] + np.arange(count) / target_hz
+        target_times.append(period_times)
+        segment_starts.append(np.full(count, start))
+        segment_ends.append(np.full(count, end))
+        # The last source frame at or before each timestamp
+        lefts.append(
+            start
+            + np.searchsorted(
+                timestamps[start:end], period_times + 1e-6, "right"
+            )
+            - 1
+        )
+
+        first_frame_id = int(frames.frame_ids[start])
+        if source_hz:
+            first_frame_id = round(first_frame_id * target_hz / source_hz)
+        if next_frame_id is not None:
+            first_frame_id = max(first_frame_id, next_frame_id)
+        frame_ids.append(first_frame_id + np.arange(count, dtype=np.int64))
+        next_frame_id = first_frame_id + count
+
+    times = np.concatenate(target_times)
+    starts = np.concatenate(segment_starts)[:, None]
+    ends = np.concatenate(segment_ends)[:, None]
+    left = np.concatenate(lefts)
+    right = np.minimum(left + 1, ends[:, 0] - 1)
+    nearest_frame = np.where(
+        times - timestamps[left] <= timestamps[right] - times, left, right
+    )
+
+    # The last observation at or before and the first observation after
+    # each source frame, per object
+    valid = frames.has_coordinates
+    index = np.broadcast_to(np.arange(n_frames)[:, None], valid.shape)
+    prev_valid = np.maximum.accumulate(np.where(valid, index, -1), axis=0)
+    next_valid = np.full((n_frames + 1, valid.shape[1]), n_frames)
+    next_valid[:-1] = np.minimum.accumulate(
+        np.where(valid, index, n_frames)[::-1], axis=0
+    )[::-1]
+
+    before = prev_valid[left]
+    after = next_valid[left + 1]
+    has_before = before >= starts
+    has_after = after < ends
+    before = np.where(has_before, before, 0)
+    after = np.where(has_after, after, 0)
+
+    time_before = timestamps[before]
+    time_after = timestamps[after]
+    exact = has_before & (np.abs(times[:, None] - time_before) < 1e-6)
+    bridged = has_before & has_after
+    if max_gap is not None:
+        bridged &= (after - before == 1) | (
+            time_after - time_before <= max_gap.total_seconds() + 1e-9
+        )
+    present = exact | bridged
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = np.where(
+            exact | ~bridged,
+            0.0,
+            (times[:, None] - time_before) / (time_after - time_before),
+        )
+    source = np.where(weight <= 0.5, before, after)
+    objects = np.arange(valid.shape[1])
+
+    if method == "linear":
+
+        def interpolate(values):
+            value_before = values[before, objects]
+            value_after = values[after, objects]
+            w = weight if values.ndim == 2 else weight[..., None]
+            return np.where(
+                w > 0,
+                value_before + w * (value_after - value_before),
+                value_before,
+            )
+
+    else:
+
+        def interpolate(values):
+            return values[source, objects]
+
+    coordinates = interpolate(frames.coordinates)
+    speeds = interpolate(frames.speeds)
+    distances = interpolate(frames.distances)
+    point_types = np.where(
+        present, frames.point_types[source, objects], POINT_MISSING
+    ).astype(frames.point_types.dtype)
+    coordinates[~present] = np.nan
+    speeds[~present] = np.nan
+    distances[~present] = np.nan
+
+    other_data, statistics = {}, {}
+    for i, position in enumerate(nearest_frame.tolist()):
+        if position in frames.other_data:
+            other_data[i] = dict(frames.other_data[position])
+        if position in frames.statistics:
+            statistics[i] = frames.statistics[position]
+
+    player_other_data, irregular_values = {}, {}
+    if frames.player_other_data or frames.irregular_values:
+        for i, j in zip(*(axis.tolist() for axis in np.nonzero(present))):
+            key = (int(source[i, j]), j)
+            if key in frames.player_other_data:
+                player_other_data[(i, j)] = dict(frames.player_other_data[key])
+            if key in frames.irregular_values:
+                irregular_values[(i, j)] = frames.irregular_values[key]
+
+    resampled = frames.replace_values(
+        frame_ids=np.concatenate(frame_ids),
+        period_indices=frames.period_indices[left],
+        timestamps=times,
+        ball_states=frames.ball_states[nearest_frame],
+        ball_owning_team_indices=frames.ball_owning_team_indices[nearest_frame],
+        coordinates=coordinates,
+        point_types=point_types,
+        speeds=speeds,
+        distances=distances,
+        other_data=other_data,
+        player_other_data=player_other_data,
+        statistics=statistics,
+        irregular_values=irregular_values,
+    )
+    if not isinstance(dataset.records, ColumnarFrames):
+        return replace(
+            dataset, metadata=metadata, records=_to_frames(resampled)
+        )
+    return replace(dataset, metadata=metadata, records=resampled)
+
+
+__all__ = ["resample"]
@@ -0,0 +1,320 @@
+"""Synchronization of event data with the tracking data of the same match.
+
+The synchronizer sorts the frames of a tracking dataset on their
+(period, timestamp) and matches events to frames with a vectorized binary
+search, instead of scanning all frames for every event.
+
+Examples:
+    >>> synchronizer = EventTrackingSynchronizer(
+    ...     tracking_dataset,
+    ...     offsets={2: timedelta(seconds=-0.4)},
+    ...     ball_window=timedelta(seconds=0.5),
+    ... )
+    >>> frames = synchronizer.match(event_dataset.events)
+    >>> synchronizer.add_freeze_frames(event_dataset.events)
+"""
+
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Optional
+
+from kloppy.domain import ColumnarFrames, Event, Frame, TrackingDataset
+from kloppy.domain.models.tracking import POINT_MISSING
+from kloppy.exceptions import KloppyParameterError
+from kloppy.utils import import_numpy
+
+
+class EventTrackingSynchronizer:
+    """
+    Match events to the frames of a tracking dataset.
+
+    Events are matched on their period and timestamp (the time elapsed
+    since the start of the period). Events in a period without frames are
+    not matched.
+
+    Args:
+        tracking_dataset: The tracking data of the match.
+        offsets: A time offset per period id, added to the timestamps of
+            the events in that period before matching. Use this when the
+            event and tracking data don't start the periods at the same
+            moment.
+        tolerance: The maximum time between an event and its frame. Events
+            without a frame within the tolerance are not matched. By
+            default, the nearest frame is always matched.
+        ball_window: When set, the frame in which the ball is nearest to the
+            location of the event is matched among the frames within this
+            time of the event. The event coordinates must be in the same
+            coordinate system and orientation as the tracking data. Events
+            without coordinates are matched on time only.
+
+    Note:
+        Requires numpy.
+    """
+
+    def __init__(
+        self,
+        tracking_dataset: TrackingDataset,
+        offsets: Optional[dict[int, timedelta]] = None,
+        tolerance: Optional[timedelta] = None,
+        ball_window: Optional[timedelta] = None,
+    ):
+        np = import_numpy()
+
+        if ball_window is not None and ball_window < timedelta(0):
+            raise KloppyParameterError("ball_window can't be negative")
+        if tolerance is not None and tolerance < timedelta(0):
+            raise KloppyParameterError("tolerance can't be negative")
+
+        self.tracking_dataset = tracking_dataset
+        self.offsets = {
+            period_id: offset.total_seconds()
+            for period_id, offset in (offsets or {}).items()
+        }
+        self.tolerance = (
+            tolerance.total_seconds() if tolerance is not None else None
+        )
+        self.ball_window = (
+            ball_window.total_seconds() if ball_window is not None else None
+        )
+
+        frames = tracking_dataset.records
+        if isinstance(frames, ColumnarFrames):
+            period_ids = np.array(
+                [period.id for period in frames.periods], dtype=np.int64
+            )[frames.period_indices]
+            timestamps = np.asarray(frames.timestamps, dtype=np.float64)
+        else:
+            period_ids = np.array(
+                [frame.period.id for frame in frames], dtype=np.int64
+            )
+            timestamps = np.array(
+                [frame.timestamp.total_seconds() for frame in frames],
+                dtype=np.float64,
+            )
+
+        # The positions of the frames in the dataset, sorted on time
+        self._order = np.lexsort((timestamps, period_ids))
+        self._timestamps = timestamps[self._order]
+        sorted_period_ids = period_ids[self._order]
+        self._periods = {}
+        for period_id in np.unique(sorted_period_ids).tolist():
+            self._periods[period_id] = (
+                int(np.searchsorted(sorted_period_ids, period_id, "left")),
+                int(np.searchsorted(sorted_period_ids, period_id, "right")),
+            )
+        self._ball_xy = None
+
+    def _get_ball_xy(self):
+        """The x and y coordinates of the ball in the sorted frames."""
+        if self._ball_xy is None:
+            np = import_numpy()
+            frames = self.tracking_dataset.records
+            if isinstance(frames, ColumnarFrames):
+                ball_xy = np.array(frames.coordinates[:, 0, :2], dtype=float)
+                ball_xy[frames.point_types[:, 0] == POINT_MISSING] = np.nan
+            else:
+                ball_xy = np.array(
+                    [
+                        (
+                            frame.ball_coordinates.x,
+                            frame.ball_coordinates.y,
+                        )
+                        if frame.ball_coordinates is not None
+                        else (np.nan, np.nan)
+                        for frame in frames
+                    ],
+                    dtype=float,
+                ).reshape(-1, 2)
+            self._ball_xy = ball_xy[self._order]
+        return self._ball_xy
+
+    def _event_times(self, events: Sequence[Event]):
+        np = import_numpy()
+        period_ids = np.array(
+            [event.period.id if event.period else -1 for event in events],
+            dtype=np.int64,
+        )
+        timestamps = np.array(
+            [
+                event.timestamp.total_seconds()
+                + self.offsets.get(event.period.id if event.period else -1, 0)
+                if event.timestamp is not None
+                else np.nan
+                for event in events
+            ],
+            dtype=np.float64,
+        )
+        return period_ids, timestamps
+
+    def _match(self, events: Sequence[Event]):
+        """The sorted positions of the matched frames, or -1."""
+        np = import_numpy()
+        period_ids, timestamps = self._event_times(events)
+        matches = np.full(len(events), -1, dtype=np.int64)
+
+        for period_id, (start, end) in self._periods.items():
+            selected = np.nonzero(
+                (period_ids == period_id) & ~np.isnan(timestamps)
+            )[0]
+            if not len(selected) or start == end:
+                continue
+
+            frame_times = self._timestamps[start:end]
+            event_times = timestamps[selected]
+            right = np.searchsorted(frame_times, event_times, "left")
+            right = np.minimum(right, len(frame_times) - 1)
+            left = np.maximum(right - 1, 0)
+            nearest = np.where(
+                np.abs(frame_times[left] - event_times)
+                <= np.abs(frame_times[right] - event_times),
+                left,
+                right,
+            )
+            if self.ball_window is not None:
+                nearest = self._refine_with_ball(
+                    [events[i] for i in selected],
+                    event_times,
+                    nearest,
+                    frame_times,
+                    start,
+                )
+            if self.tolerance is not None:
+                within = (
+                    np.abs(frame_times[nearest] - event_times)
+                    <= self.tolerance + 1e-9
+                )
+                matches[selected[within]] = nearest[within] + start
+            else:
+                matches[selected] = nearest + start
+        return matches
+
+    def _refine_with_ball(
+        self, events, event_times, nearest, frame_times, start: int
+    ):
+        np = import_numpy()
+        event_xy = np.array(
+            [
+                (event.coordinates.x, event.coordinates.y)
+                if event.coordinates is not None
+                else (np.nan, np.nan)
+                for event in events
+            ],
+            dtype=float,
+        ).reshape(-1, 2)
+
+        lo = np.searchsorted(
+            frame_times, event_times - self.ball_window - 1e-9, "left"
+        )
+        hi = np.searchsorted(
+            frame_times, event_times + self.ball_window + 1e-9, "right"
+        )
+        width = int((hi - lo).max()) if len(lo) else 0
+        if width == 0:
+            return nearest
+
+        # One row of candidate frames per event
+        candidates = lo[:, None] + np.arange(width)
+        valid = candidates < hi[:, None]
+        candidates = np.minimum(candidates, len(frame_times) - 1)
+        ball_xy = self._get_ball_xy()[start : start + len(frame_times)]
+        distances = np.sum(
+            (ball_xy[candidates] - event_xy[:, None, :]) ** 2, axis=2
+        )
+        distances[~valid | np.isnan(distances)] = np.inf
+        best = np.argmin(distances, axis=1)
+        found = np.isfinite(distances[np.arange(len(events)), best])
+        return np.where(
+            found, candidates[np.arange(len(events)), best], nearest
+        )
+
+    def frame_positions(self, events: Sequence[Event]):
+        """
+        Find the frame of each event.
+
+        Returns:
+            A NumPy array with the position of the matched frame in the
+            records of the tracking dataset, or -1 for unmatched events.
+        """
+        np = import_numpy()
+        matches = self._match(events)
+        return np.where(matches >= 0, self._order[matches], -1)
+
+    def match(self, events: Sequence[Event]) -> list[Optional[Frame]]:
+        """Find the frame of each event, or `None` for unmatched events."""
+        frames = self.tracking_dataset.records
+        return [
+            frames[position] if position >= 0 else None
+            for position in self.frame_positions(events).tolist()
+        ]
+
+    def windows(
+        self,
+        events: Sequence[Event],
+        before: timedelta,
+        after: timedelta,
+    ) -> list[list[Frame]]:
+        """
+        Find the frames around each event.
+
+        The window of an event contains the frames from `before` the event
+        up to `after` the event (both inclusive) in the same period. Period
+        offsets are applied, the tolerance and ball window are not.
+
+        Returns:
+            A list of frames per event, sorted on time.
+        """
+        np = import_numpy()
+        period_ids, timestamps = self._event_times(events)
+        starts = np.zeros(len(events), dtype=np.int64)
+        ends = np.zeros(len(events), dtype=np.int64)
+
+        for period_id, (start, end) in self._periods.items():
+            selected = np.nonzero(
+                (period_ids == period_id) & ~np.isnan(timestamps)
+            )[0]
+            frame_times = self._timestamps[start:end]
+            event_times = timestamps[selected]
+            starts[selected] = start + np.searchsorted(
+                frame_times,
+                event_times - before.total_seconds() - 1e-9,
+                "left",
+            )
+            ends[selected] = start + np.searchsorted(
+                frame_times,
+                event_times + after.total_seconds() + 1e-9,
+                "right",
+            )
+
+        frames = self.tracking_dataset.records
+        order = self._order.tolist()
+        return [
+            [frames[position] for position in order[start:end]]
+            for start, end in zip(starts.tolist(), ends.tolist())
+        ]
+
+    def add_freeze_frames(
+        self, events: Sequence[Event], overwrite: bool = False
+    ) -> int:
+        """
+        Set the `freeze_frame` of the events to their matched frame.
+
+        Args:
+            events: The events to update.
+            overwrite: Whether to replace the freeze frames that are already
+                set (e.g. by the event data provider).
+
+        Returns:
+            The number of updated events.
+        """
+        if not overwrite:
+            events = [event for event in events if event.freeze_frame is None]
+
+        count = 0
+        for event, frame in zip(events, self.match(events)):
+            if frame is not None:
+                event.freeze_frame = frame
+                count += 1
+        return count
+
+
+__all__ = ["EventTrackingSynchronizer"]
@@ -0,0 +1,370 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, Literal, Optional, Union
+
+from kloppy.domain import ColumnarFrames, Frame, Metadata
+from kloppy.domain.models.tracking import (
+    _BALL_STATES,
+    POINT_3D,
+    POINT_MISSING,
+    POINT_NONE,
+)
+from kloppy.domain.services.transformers.long import PlayerOrder
+from kloppy.exceptions import KloppyError, KloppyParameterError
+from kloppy.io import FileLike, open_as_file
+from kloppy.utils import import_numpy, import_pyarrow
+
+Layout = Literal["wide", "long"]
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _str(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+class FrameToArrowTransformer:
+    """
+    Convert tracking frames to Arrow record batches with a fixed schema.
+
+    The schema only depends on the metadata, so all batches of a dataset
+    (or a stream) share the same schema and can be written to a single
+    Parquet file. In the "wide" layout every frame is one row with four
+    columns per player (`{player_id}_x`, `_y`, `_d` and `_s`). In the
+    "long" layout every tracked object in a frame is one row, starting
+    with the ball (`player_id` "ball"), followed by the players in the
+    order of the metadata.
+
+    Frames stored in [`ColumnarFrames`][kloppy.domain.ColumnarFrames] are
+    converted straight from the NumPy arrays. The untyped `other_data`
+    of frames and players is not exported.
+
+    Args:
+        metadata: The metadata of the tracking data.
+        layout: "wide" or "long".
+    """
+
+    def __init__(self, metadata: Metadata, layout: Layout = "wide"):
+        if layout not in ("wide", "long"):
+            raise KloppyParameterError(
+                f"Layout {layout} is not supported. Use 'wide' or 'long'"
+            )
+
+        self.pa = import_pyarrow()
+        self.layout = layout
+        self.players = [
+            player for team in metadata.teams for player in team.players
+        ]
+        self._player_index = {
+            player: i for i, player in enumerate(self.players)
+        }
+        self._player_order = PlayerOrder(metadata.teams)
+        self.schema = self._build_schema()
+
+    def _build_schema(self):
+        pa = self.pa
+        fields = [
+            pa.field("period_id", pa.int8()),
+            pa.field("timestamp", pa.duration("us")),
+            pa.field("frame_id", pa.int64()),
+            pa.field("ball_state", pa.string()),
+            pa.field("ball_owning_team_id", pa.string()),
+        ]
+        if self.layout == "wide":
+            fields.extend(
+                pa.field(name, pa.float64())
+                for name in ("ball_x", "ball_y", "ball_z", "ball_speed")
+            )
+            for player in self.players:
+                fields.extend(
+                    pa.field(f"{player.player_id}_{name}", pa.float64())
+                    for name in ("x", "y", "d", "s")
+                )
+        else:
+            fields.extend(
+                [
+                    pa.field("team_id", pa.string()),
+                    pa.field("player_id", pa.string()),
+                ]
+            )
+            fields.extend(
+                pa.field(name, pa.float64())
+                for name in ("x", "y", "z", "d", "s")
+            )
+        return pa.schema(fields)
+
+    def transform(
+        self,
+        frames: Union[ColumnarFrames, Iterable[Frame]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator:
+        """Yield record batches of at most `chunk_size` frames."""
+        if chunk_size < 1:
+            raise KloppyParameterError("chunk_size should be at least 1")
+
+        if isinstance(frames, ColumnarFrames):
+            for start in range(0, len(frames), chunk_size):
+                yield self._columnar_batch(
+                    frames, slice(start, start + chunk_size)
+                )
+        else:
+            frames = iter(frames)
+            while chunk := list(islice(frames, chunk_size)):
+                if self.layout == "wide":
+                    yield self._wide_batch(chunk)
+                else:
+                    yield self._long_batch(chunk)
+
+    def _frame_columns(self, frames: list[Frame]) -> list[list]:
+        return [
+            [frame.period.id if frame.period else None for frame in frames],
+            [frame.timestamp for frame in frames],
+            [frame.frame_id for frame in frames],
+            [
+                frame.ball_state.value if frame.ball_state else None
+                for frame in frames
+            ],
+            [
+                _str(frame.ball_owning_team.team_id)
+                if frame.ball_owning_team
+                else None
+                for frame in frames
+            ],
+        ]
+
+    def _wide_batch(self, frames: list[Frame]):
+        n = len(frames)
+        columns = self._frame_columns(frames)
+        ball = [[None] * n for _ in range(4)]
+        players = [[None] * n for _ in range(4 * len(self.players))]
+
+        for i, frame in enumerate(frames):
+            point = frame.ball_coordinates
+            if point is not None:
+                ball[0][i] = _number(point.x)
+                ball[1][i] = _number(point.y)
+                ball[2][i] = _number(getattr(point, "z", None))
+            ball[3][i] = _number(frame.ball_speed)
+
+            for player, player_data in frame.players_data.items():
+                index = self._player_index.get(player)
+                if index is None:
+                    raise KloppyError(
+                        f"Player {player.player_id} is not part of the "
+                        f"metadata. Use layout='long' instead."
+                    )
+                offset = 4 * index
+                point = player_data.coordinates
+                if point is not None:
+                    players[offset][i] = _number(point.x)
+                    players[offset + 1][i] = _number(point.y)
+                players[offset + 2][i] = _number(player_data.distance)
+                players[offset + 3][i] = _number(player_data.speed)
+
+        return self.pa.RecordBatch.from_arrays(
+            [
+                self.pa.array(values, type=field.type)
+                for values, field in zip(columns + ball + players, self.schema)
+            ],
+            schema=self.schema,
+        )
+
+    def _long_batch(self, frames: list[Frame]):
+        frame_columns = self._frame_columns(frames)
+        rows = [[] for _ in frame_columns]
+        columns = [[] for _ in range(7)]
+
+        def add_row(i, team_id, player_id, point, distance, speed):
+            for values, frame_values in zip(rows, frame_columns):
+                values.append(frame_values[i])
+            columns[0].append(team_id)
+            columns[1].append(player_id)
+            if point is not None:
+                columns[2].append(_number(point.x))
+                columns[3].append(_number(point.y))
+                columns[4].append(_number(getattr(point, "z", None)))
+            else:
+                columns[2].append(None)
+                columns[3].append(None)
+                columns[4].append(None)
+            columns[5].append(_number(distance))
+            columns[6].append(_number(speed))
+
+        for i, frame in enumerate(frames):
+            add_row(
+                i, None, "ball", frame.ball_coordinates, None, frame.ball_speed
+            )
+            for player, player_data in self._player_order.sort(
+                frame.players_data
+            ):
+                add_row(
+                    i,
+                    _str(player.team.team_id) if player.team else None,
+                    _str(player.player_id),
+                    player_data.coordinates,
+                    player_data.distance,
+                    player_data.speed,
+                )
+
+        return self.pa.RecordBatch.from_arrays(
+            [
+                self.pa.array(values, type=field.type)
+                for values, field in zip(rows + columns, self.schema)
+            ],
+            schema=self.schema,
+        )
+
+    def _columnar_frame_arrays(self, np, frames: ColumnarFrames, rows):
+        pa = self.pa
+        period_ids = np.array(
+            [period.id for period in frames.periods], dtype=np.int8
+        )
+        ball_states = np.array(
+            [ball_state.value for ball_state in _BALL_STATES] + [None],
+            dtype=object,
+        )
+        team_ids = np.array(
+            [_str(team.team_id) for team in frames.teams] + [None],
+            dtype=object,
+        )
+        timestamps = np.round(frames.timestamps[rows] * 1e6).astype(np.int64)
+        return [
+            pa.array(period_ids[frames.period_indices[rows]], type=pa.int8()),
+            pa.array(timestamps, type=pa.duration("us")),
+            pa.array(frames.frame_ids[rows], type=pa.int64()),
+            # index -1 (unknown) maps to the trailing None
+            pa.array(ball_states[frames.ball_states[rows]], type=pa.string()),
+            pa.array(
+                team_ids[frames.ball_owning_team_indices[rows]],
+                type=pa.string(),
+            ),
+        ]
+
+    def _columnar_batch(self, frames: ColumnarFrames, rows: slice):
+        np = import_numpy()
+        pa = self.pa
+
+        def floats(values, mask):
+            return pa.array(values, mask=mask, type=pa.float64())
+
+        coordinates = frames.coordinates[rows]
+        point_types = frames.point_types[rows]
+        speeds = frames.speeds[rows]
+        distances = frames.distances[rows]
+        missing = point_types == POINT_MISSING
+        no_coordinates = missing | (point_types == POINT_NONE)
+        arrays = self._columnar_frame_arrays(np, frames, rows)
+
+        if self.layout == "wide":
+            arrays.extend(
+                [
+                    floats(coordinates[:, 0, 0], no_coordinates[:, 0]),
+                    floats(coordinates[:, 0, 1], no_coordinates[:, 0]),
+                    floats(coordinates[:, 0, 2], point_types[:, 0] != POINT_3D),
+                    floats(speeds[:, 0], np.isnan(speeds[:, 0])),
+                ]
+            )
+            object_indices = {
+                player: j for j, player in enumerate(frames.players, start=1)
+            }
+            for player in object_indices:
+                if player not in self._player_index:
+                    raise KloppyError(
+                        f"Player {player.player_id} is not part of the "
+                        f"metadata. Use layout='long' instead."
+                    )
+            n = len(point_types)
+            for player in self.players:
+                j = object_indices.get(player)
+                if j is None:
+                    arrays.extend(pa.nulls(n, pa.float64()) for _ in range(4))
+                    continue
+                arrays.extend(
+                    [
+                        floats(coordinates[:, j, 0], no_coordinates[:, j]),
+                        floats(coordinates[:, j, 1], no_coordinates[:, j]),
+                        floats(distances[:, j], np.isnan(distances[:, j])),
+                        floats(speeds[:, j], np.isnan(speeds[:, j])),
+                    ]
+                )
+        else:
+            order = self._player_order.object_order(frames)
+            present = ~missing[:, order]
+            present[:, 0] = True
+            frame_indices, positions = np.nonzero(present)
+            object_indices = order[positions]
+            take = pa.array(frame_indices)
+            arrays = [array.take(take) for array in arrays]
+
+            team_ids = np.array(
+                [None]
+                + [
+                    _str(player.team.team_id) if player.team else None
+                    for player in frames.players
+                ],
+                dtype=object,
+            )
+            player_ids = np.array(
+                ["ball"]
+                + [_str(player.player_id) for player in frames.players],
+                dtype=object,
+            )
+            points = coordinates[frame_indices, object_indices]
+            point_missing = no_coordinates[frame_indices, object_indices]
+            speeds = speeds[frame_indices, object_indices]
+            distances = distances[frame_indices, object_indices]
+            arrays.extend(
+                [
+                    pa.array(team_ids[object_indices], type=pa.string()),
+                    pa.array(player_ids[object_indices], type=pa.string()),
+                    floats(points[:, 0], point_missing),
+                    floats(points[:, 1], point_missing),
+                    floats(
+                        points[:, 2],
+                        point_types[frame_indices, object_indices] != POINT_3D,
+                    ),
+                    floats(distances, np.isnan(distances)),
+                    floats(speeds, np.isnan(speeds)),
+                ]
+            )
+
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+def frames_to_arrow(
+    frames: Union[ColumnarFrames, Iterable[Frame]],
+    metadata: Metadata,
+    layout: Layout = "wide",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """Convert tracking frames to an Arrow table."""
+    transformer = FrameToArrowTransformer(metadata, layout)
+    return transformer.pa.Table.from_batches(
+        transformer.transform(frames, chunk_size), schema=transformer.schema
+    )
+
+
+def frames_to_parquet(
+    frames: Union[ColumnarFrames, Iterable[Frame]],
+    metadata: Metadata,
+    path: FileLike,
+    layout: Layout = "wide",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs,
+):
+    """Write tracking frames to a Parquet file, one row group per chunk."""
+    transformer = FrameToArrowTransformer(metadata, layout)
+    import pyarrow.parquet as pq
+
+    with (
+        open_as_file(path, mode="wb") as fp,
+        pq.ParquetWriter(fp, transformer.schema, **kwargs) as writer,
+    ):
+        for batch in transformer.transform(frames, chunk_size):
+            writer.write_batch(batch)
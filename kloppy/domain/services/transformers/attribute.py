@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 import math
 import sys
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 from kloppy.domain import (
     BodyPartQualifier,
@@ -9,6 +9,7 @@ from kloppy.domain import (
     Event,
     Frame,
     Orientation,
+    Player,
     Point,
     QualifierMixin,
     ResultMixin,
@@ -159,6 +160,59 @@ def create_transformer_from_qualifier(
     return _Transformer
 
 
+def _event_type_column(event: Event) -> str:
+    if event.event_type != EventType.GENERIC:
+        return event.event_type.value
+    return f"GENERIC:{event.event_name}"
+
+
+def _result_column(event: Event) -> Any:
+    if isinstance(event, ResultMixin) and event.result is not None:
+        return event.result.value
+    return None
+
+
+def _success_column(event: Event) -> Optional[bool]:
+    if isinstance(event, ResultMixin) and event.result is not None:
+        return event.result.is_success
+    return None
+
+
+# Columns of the default event row that are computed the same way for
+# every event type
+_EVENT_COLUMN_GETTERS: dict[str, Callable[[Event], Any]] = {
+    "event_id": lambda event: event.event_id,
+    "event_type": _event_type_column,
+    "period_id": lambda event: event.period.id,
+    "timestamp": lambda event: event.timestamp,
+    "ball_state": lambda event: (
+        event.ball_state.value if event.ball_state else None
+    ),
+    "ball_owning_team": lambda event: (
+        event.ball_owning_team.team_id if event.ball_owning_team else None
+    ),
+    "team_id": lambda event: event.team.team_id if event.team else None,
+    "player_id": lambda event: event.player.player_id if event.player else None,
+    "coordinates_x": lambda event: (
+        event.coordinates.x if event.coordinates else None
+    ),
+    "coordinates_y": lambda event: (
+        event.coordinates.y if event.coordinates else None
+    ),
+    "result": _result_column,
+    "success": _success_column,
+}
+
+# Columns of the default event row that depend on the event type
+_EVENT_TYPE_SPECIFIC_COLUMNS = {
+    "end_timestamp",
+    "end_coordinates_x",
+    "end_coordinates_y",
+    "receiver_player_id",
+    "card_type",
+}
+
+
 class DefaultEventTransformer(EventAttributeTransformer):
     def __init__(
         self,
@@ -280,6 +334,84 @@ class DefaultEventTransformer(EventAttributeTransformer):
         else:
             return row
 
+    @staticmethod
+    def get_column_getter(column: str) -> Optional[Callable[[Event], Any]]:
+        """Return a function that computes a single column.
+
+        The function returns the value of `column` in the default row, or
+        the attribute of the event when the default row doesn't contain
+        it. `None` is returned when the column can only be found by
+        building the full row.
+        """
+        if column in _EVENT_COLUMN_GETTERS:
+            return _EVENT_COLUMN_GETTERS[column]
+        if (
+            column in _EVENT_TYPE_SPECIFIC_COLUMNS
+            # Qualifier columns
+            or column.startswith("is_")
+            or column.endswith("_type")
+        ):
+            return None
+        return lambda event: getattr(event, column, None)
+
+
+# Columns of the default frame row that don't depend on the players
+_FRAME_COLUMN_GETTERS: dict[str, Callable[[Frame], Any]] = {
+    "period_id": lambda frame: frame.period.id if frame.period else None,
+    "timestamp": lambda frame: frame.timestamp,
+    "frame_id": lambda frame: frame.frame_id,
+    "ball_state": lambda frame: (
+        frame.ball_state.value if frame.ball_state else None
+    ),
+    "ball_owning_team_id": lambda frame: (
+        frame.ball_owning_team.team_id if frame.ball_owning_team else None
+    ),
+    "ball_x": lambda frame: (
+        frame.ball_coordinates.x if frame.ball_coordinates else None
+    ),
+    "ball_y": lambda frame: (
+        frame.ball_coordinates.y if frame.ball_coordinates else None
+    ),
+    "ball_z": lambda frame: (
+        getattr(frame.ball_coordinates, "z", None)
+        if frame.ball_coordinates
+        else None
+    ),
+    "ball_speed": lambda frame: frame.ball_speed,
+}
+
+_PLAYER_COLUMN_GETTERS = {
+    "x": lambda player_data: (
+        player_data.coordinates.x if player_data.coordinates else None
+    ),
+    "y": lambda player_data: (
+        player_data.coordinates.y if player_data.coordinates else None
+    ),
+    "d": lambda player_data: player_data.distance,
+    "s": lambda player_data: player_data.speed,
+}
+
+
+def _player_column_getter(
+    column: str, player_id: str, name: str
+) -> Callable[[Frame], Any]:
+    # Players are hashed and compared by their id, so this key finds the
+    # player in `Frame.players_data` without scanning it
+    player_key = Player(player_id=player_id, team=None, jersey_no=None)
+    value_getter = _PLAYER_COLUMN_GETTERS[name]
+
+    def getter(frame: Frame) -> Any:
+        if frame.other_data and column in frame.other_data:
+            return frame.other_data[column]
+        player_data = frame.players_data.get(player_key)
+        if player_data is None:
+            return getattr(frame, column, None)
+        if player_data.other_data and name in player_data.other_data:
+            return player_data.other_data[name]
+        return value_getter(player_data)
+
+    return getter
+
 
 class DefaultFrameTransformer:
     def __init__(
@@ -358,6 +490,39 @@ class DefaultFrameTransformer:
         else:
             return row
 
+    @staticmethod
+    def get_column_getter(column: str) -> Optional[Callable[[Frame], Any]]:
+        """Return a function that computes a single column.
+
+        The function returns the value of `column` in the default row, or
+        the attribute of the frame when the default row doesn't contain
+        it. `None` is returned when the column can only be found by
+        building the full row.
+        """
+        if column in _FRAME_COLUMN_GETTERS:
+            value_getter = _FRAME_COLUMN_GETTERS[column]
+
+            def getter(frame: Frame) -> Any:
+                if frame.other_data and column in frame.other_data:
+                    return frame.other_data[column]
+                return value_getter(frame)
+
+            return getter
+
+        player_id, _, name = column.rpartition("_")
+        if player_id and name in _PLAYER_COLUMN_GETTERS:
+            return _player_column_getter(column, player_id, name)
+        return None
+
+
+_CODE_COLUMN_GETTERS: dict[str, Callable[[Code], Any]] = {
+    "code_id": lambda code: code.code_id,
+    "period_id": lambda code: code.period.id if code.period else None,
+    "timestamp": lambda code: code.timestamp,
+    "end_timestamp": lambda code: code.end_timestamp,
+    "code": lambda code: code.code,
+}
+
 
 class DefaultCodeTransformer:
     def __init__(
@@ -388,5 +553,23 @@ class DefaultCodeTransformer:
         else:
             return row
 
+    @staticmethod
+    def get_column_getter(column: str) -> Optional[Callable[[Code], Any]]:
+        """Return a function that computes a single column.
+
+        The function returns the value of `column` in the default row, or
+        the attribute of the code when the default row doesn't contain it.
+        """
+        value_getter = _CODE_COLUMN_GETTERS.get(
+            column, lambda code: getattr(code, column, None)
+        )
+
+        def getter(code: Code) -> Any:
+            if column in code.labels:
+                return code.labels[column]
+            return value_getter(code)
+
+        return getter
+
 
 BodyPartTransformer = create_transformer_from_qualifier(BodyPartQualifier)
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from fnmatch import fnmatch
+from collections import defaultdict
+from collections.abc import Sequence
+import fnmatch
+from itertools import repeat
+import re
 import sys
-from typing import Any, Callable, Generic, TypeVar, Union
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
 
 if sys.version_info >= (3, 11):
     from typing import Unpack
@@ -22,6 +26,14 @@ NamedColumns = dict[str, Column]
 
 
 class DataRecordToDictTransformer(ABC, Generic[T]):
+    """Convert data records to dicts with the requested columns.
+
+    The column specification is compiled once into a plan. String columns
+    are resolved to getters that compute only that column, so the full
+    default row is only built when a column can't be computed on its own
+    (wildcards, `"*"` or provider specific columns).
+    """
+
     @abstractmethod
     def default_transformer(self) -> Callable[[T], dict]: ...
 
@@ -30,55 +42,152 @@ class DataRecordToDictTransformer(ABC, Generic[T]):
         *columns: Unpack[tuple[Column]],
         **named_columns: NamedColumns,
     ):
+        self.default = self.default_transformer()
+        # The names and getters of the columns when the columns don't
+        # depend on the record, `None` otherwise
+        self.column_getters: Optional[
+            dict[str, Callable[[T, Optional[dict]], Any]]
+        ] = None
+        self.needs_default_row = False
+
         if not columns and not named_columns:
-            converter = self.default_transformer()
-        else:
-            default = self.default_transformer()
-            has_string_columns = any(not callable(column) for column in columns)
-
-            def converter(data_record: T) -> dict[str, Any]:
-                if has_string_columns:
-                    default_row = default(data_record)
-                else:
-                    default_row = {}
-
-                row = {}
-                for column in columns:
-                    if callable(column):
-                        res = column(data_record)
-                        if not isinstance(res, dict):
-                            raise KloppyError(
-                                "A function column should return a dictionary"
-                            )
-                        row.update(res)
-                    else:
-                        if column == "*":
-                            row.update(default_row)
-                        elif "*" in column:
-                            row.update(
-                                {
-                                    k: v
-                                    for k, v in default_row.items()
-                                    if fnmatch(k, column)
-                                }
-                            )
-                        elif column in default_row:
-                            row[column] = default_row[column]
-                        else:
-                            row[column] = getattr(data_record, column, None)
-
-                for name, column in named_columns.items():
-                    row[name] = (
-                        column(data_record) if callable(column) else column
-                    )
-
-                return row
+            self.converter = self.default
+            return
+
+        steps = []
+        column_getters = {}
+        for column in columns:
+            if callable(column):
+                steps.append(self._function_column_step(column))
+                column_getters = None
+            elif "*" in column:
+                steps.append(self._wildcard_column_step(column))
+                self.needs_default_row = True
+                column_getters = None
+            else:
+                getter = self._column_getter(column)
+                steps.append(self._getter_step(column, getter))
+                if column_getters is not None:
+                    column_getters[column] = getter
+
+        for name, column in named_columns.items():
+            getter = self._named_column_getter(column)
+            steps.append(self._getter_step(name, getter))
+            if column_getters is not None:
+                column_getters[name] = getter
+
+        self.column_getters = column_getters
+        needs_default_row = self.needs_default_row
+        default = self.default
+
+        def converter(data_record: T) -> dict[str, Any]:
+            default_row = default(data_record) if needs_default_row else None
+            row = {}
+            for step in steps:
+                step(data_record, default_row, row)
+            return row
 
         self.converter = converter
 
+    def _column_getter(self, column: str) -> Callable[[T, Optional[dict]], Any]:
+        getter = getattr(self.default, "get_column_getter", None)
+        value_getter = getter(column) if getter else None
+        if value_getter is not None:
+            return lambda data_record, default_row: value_getter(data_record)
+
+        # The column can only be found in the full default row
+        self.needs_default_row = True
+
+        def row_getter(data_record: T, default_row: dict) -> Any:
+            if column in default_row:
+                return default_row[column]
+            return getattr(data_record, column, None)
+
+        return row_getter
+
+    @staticmethod
+    def _named_column_getter(
+        column: Column,
+    ) -> Callable[[T, Optional[dict]], Any]:
+        if callable(column):
+            return lambda data_record, default_row: column(data_record)
+        return lambda data_record, default_row: column
+
+    @staticmethod
+    def _getter_step(name: str, getter: Callable[[T, Optional[dict]], Any]):
+        def step(data_record: T, default_row: Optional[dict], row: dict):
+            row[name] = getter(data_record, default_row)
+
+        return step
+
+    @staticmethod
+    def _function_column_step(column: Callable[[T], Any]):
+        def step(data_record: T, default_row: Optional[dict], row: dict):
+            res = column(data_record)
+            if not isinstance(res, dict):
+                raise KloppyError(
+                    "A function column should return a dictionary"
+                )
+            row.update(res)
+
+        return step
+
+    @staticmethod
+    def _wildcard_column_step(column: str):
+        if column == "*":
+
+            def step(data_record: T, default_row: dict, row: dict):
+                row.update(default_row)
+
+            return step
+
+        match = re.compile(fnmatch.translate(column)).match
+        # The keys of the default rows hardly differ between records, so
+        # remember for every key whether it matches
+        matches: dict[str, bool] = {}
+
+        def step(data_record: T, default_row: dict, row: dict):
+            for k, v in default_row.items():
+                is_match = matches.get(k)
+                if is_match is None:
+                    is_match = matches[k] = match(k) is not None
+                if is_match:
+                    row[k] = v
+
+        return step
+
     def __call__(self, data_record: T) -> dict[str, Any]:
         return self.converter(data_record)
 
+    def to_columns(self, data_records: Sequence[T]) -> dict[str, list[Any]]:
+        """Convert data records to a list of values per column.
+
+        When the columns are known upfront, every column is filled straight
+        from its getter without building a dict per record.
+        """
+        if self.column_getters is None:
+            c = len(data_records)
+            items = defaultdict(lambda: [None] * c)
+            for i, data_record in enumerate(data_records):
+                for k, v in self.converter(data_record).items():
+                    items[k][i] = v
+            return items
+
+        if self.needs_default_row:
+            default_rows = [
+                self.default(data_record) for data_record in data_records
+            ]
+        else:
+            default_rows = repeat(None)
+
+        return {
+            name: [
+                getter(data_record, default_row)
+                for data_record, default_row in zip(data_records, default_rows)
+            ]
+            for name, getter in self.column_getters.items()
+        }
+
 
 class EventToDictTransformer(DataRecordToDictTransformer[Event]):
     def default_transformer(self) -> Callable[[Event], dict]:
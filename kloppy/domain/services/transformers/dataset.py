@@ -22,11 +22,14 @@ from kloppy.domain import (
     ProviderCoordinateSystem,
     Team,
     TrackingDataset,
+    TransformationPlan,
     build_coordinate_system,
+    get_transformation_plan,
 )
 from kloppy.domain.models.event import Event
-from kloppy.domain.models.tracking import PlayerData
-from kloppy.exceptions import KloppyError
+from kloppy.domain.models.tracking import ColumnarFrames, PlayerData
+from kloppy.exceptions import KloppyError, MissingDimensionError
+from kloppy.utils import import_numpy
 
 
 class DatasetTransformer:
@@ -87,6 +90,9 @@ class DatasetTransformer:
                 "You must specify both the source and target Orientation"
             )
 
+        self.__dimensions_plan: Optional[TransformationPlan] = None
+        self.__coordinate_system_plan: Optional[TransformationPlan] = None
+
     @property
     def _needs_coordinate_system_change(self):
         return self._from_coordinate_system != self._to_coordinate_system
@@ -99,29 +105,45 @@ class DatasetTransformer:
     def _needs_orientation_change(self):
         return self._from_orientation != self._to_orientation
 
+    def _get_transformation_plan(
+        self, flip_vertical: bool = False
+    ) -> TransformationPlan:
+        return get_transformation_plan(
+            self._from_pitch_dimensions,
+            self._to_pitch_dimensions,
+            pitch_length=(
+                self._from_pitch_dimensions.pitch_length or DEFAULT_PITCH_LENGTH
+            ),
+            pitch_width=(
+                self._from_pitch_dimensions.pitch_width or DEFAULT_PITCH_WIDTH
+            ),
+            flip_vertical=flip_vertical,
+        )
+
+    @property
+    def _dimensions_plan(self) -> TransformationPlan:
+        if self.__dimensions_plan is None:
+            self.__dimensions_plan = self._get_transformation_plan()
+        return self.__dimensions_plan
+
+    @property
+    def _coordinate_system_plan(self) -> TransformationPlan:
+        if self.__coordinate_system_plan is None:
+            self.__coordinate_system_plan = self._get_transformation_plan(
+                flip_vertical=(
+                    self._from_coordinate_system.vertical_orientation
+                    != self._to_coordinate_system.vertical_orientation
+                )
+            )
+        return self.__coordinate_system_plan
+
     def change_point_dimensions(
         self, point: Union[Point, Point3D, None]
     ) -> Union[Point, Point3D, None]:
         if point is None:
             return None
 
-        base_pitch_length = (
-            self._from_pitch_dimensions.pitch_length or DEFAULT_PITCH_LENGTH
-        )
-        base_pitch_width = (
-            self._from_pitch_dimensions.pitch_width or DEFAULT_PITCH_WIDTH
-        )
-
-        point_base = self._from_pitch_dimensions.to_metric_base(
-            point, pitch_length=base_pitch_length, pitch_width=base_pitch_width
-        )
-        point_to = self._to_pitch_dimensions.from_metric_base(
-            point=point_base,
-            pitch_length=base_pitch_length,
-            pitch_width=base_pitch_width,
-        )
-
-        return point_to
+        return self._dimensions_plan.apply(point)
 
     def flip_point(
         self, point: Union[Point, Point3D, None]
@@ -257,33 +279,7 @@ class DatasetTransformer:
         if not point:
             return None
 
-        base_pitch_length = (
-            self._from_pitch_dimensions.pitch_length or DEFAULT_PITCH_LENGTH
-        )
-        base_pitch_width = (
-            self._from_pitch_dimensions.pitch_width or DEFAULT_PITCH_WIDTH
-        )
-
-        point_base = self._from_pitch_dimensions.to_metric_base(
-            point, pitch_length=base_pitch_length, pitch_width=base_pitch_width
-        )
-
-        if (
-            self._from_coordinate_system.vertical_orientation
-            != self._to_coordinate_system.vertical_orientation
-        ):
-            point_base = replace(
-                point_base,
-                y=base_pitch_width - point_base.y,
-            )
-
-        point_to = self._to_pitch_dimensions.from_metric_base(
-            point_base,
-            pitch_length=base_pitch_length,
-            pitch_width=base_pitch_width,
-        )
-
-        return point_to
+        return self._coordinate_system_plan.apply(point)
 
     def __flip_frame(self, frame: Frame):
         players_data = {}
@@ -309,6 +305,79 @@ class DatasetTransformer:
             statistics=frame.statistics,
         )
 
+    def transform_frames(self, frames: ColumnarFrames) -> ColumnarFrames:
+        """Transform all frames in columnar storage at once.
+
+        This applies the same transformations as `transform_frame`, but on
+        the coordinate arrays of the whole dataset instead of frame by frame.
+        """
+        np = import_numpy()
+
+        coordinates = frames.coordinates
+        if self._needs_coordinate_system_change:
+            coordinates = self._coordinate_system_plan.apply_array(coordinates)
+        elif self._needs_pitch_dimensions_change:
+            coordinates = self._dimensions_plan.apply_array(coordinates)
+
+        if self._needs_orientation_change:
+            flip = self.__flip_mask(np, frames)
+            if flip.any():
+                if coordinates is frames.coordinates:
+                    coordinates = coordinates.copy()
+                coordinates[flip] = self.__flip_coordinates(
+                    np, coordinates[flip]
+                )
+
+        if coordinates is frames.coordinates:
+            return frames
+        return frames.replace_values(coordinates=coordinates)
+
+    def __flip_mask(self, np, frames: ColumnarFrames):
+        """Boolean array that marks the frames that need to be flipped.
+
+        The attacking direction only depends on the period and the ball
+        owning team, so the flip decision is made once per combination.
+        """
+        keys = frames.period_indices.astype(np.int64) * (
+            len(frames.teams) + 1
+        ) + (frames.ball_owning_team_indices.astype(np.int64) + 1)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        decisions = np.array(
+            [
+                self.__needs_flip(
+                    period=frames.periods[key // (len(frames.teams) + 1)],
+                    ball_owning_team=(
+                        frames.teams[key % (len(frames.teams) + 1) - 1]
+                        if key % (len(frames.teams) + 1)
+                        else None
+                    ),
+                )
+                for key in unique_keys.tolist()
+            ],
+            dtype=bool,
+        )
+        return decisions[inverse.reshape(-1)]
+
+    def __flip_coordinates(self, np, coordinates):
+        x_dim = self._to_pitch_dimensions.x_dim
+        y_dim = self._to_pitch_dimensions.y_dim
+        if (
+            x_dim.min is None
+            or x_dim.max is None
+            or y_dim.min is None
+            or y_dim.max is None
+        ):
+            raise MissingDimensionError()
+
+        flipped = coordinates.copy()
+        flipped[..., 0] = (
+            1 - (coordinates[..., 0] - x_dim.min) / (x_dim.max - x_dim.min)
+        ) * (x_dim.max - x_dim.min) + x_dim.min
+        flipped[..., 1] = (
+            1 - (coordinates[..., 1] - y_dim.min) / (y_dim.max - y_dim.min)
+        ) * (y_dim.max - y_dim.min) + y_dim.min
+        return flipped
+
     def transform_event(self, event: Event) -> Event:
         # Change coordinate system
         if self._needs_coordinate_system_change:
@@ -461,10 +530,13 @@ class DatasetTransformer:
             )
 
         if isinstance(dataset, TrackingDataset):
-            frames = [
-                transformer.transform_frame(record)
-                for record in dataset.records
-            ]
+            if dataset.is_columnar:
+                frames = transformer.transform_frames(dataset.records)
+            else:
+                frames = [
+                    transformer.transform_frame(record)
+                    for record in dataset.records
+                ]
 
             return TrackingDataset(
                 metadata=metadata,
@@ -0,0 +1,241 @@
+from collections.abc import Iterable
+import math
+import sys
+from typing import Any, Optional, Union
+
+from kloppy.domain import ColumnarFrames, Frame, Player, PlayerData, Team
+from kloppy.domain.models.tracking import _BALL_STATES, POINT_3D, POINT_MISSING
+from kloppy.utils import import_numpy
+
+LONG_COLUMNS = (
+    "period_id",
+    "timestamp",
+    "frame_id",
+    "ball_state",
+    "ball_owning_team_id",
+    "team_id",
+    "player_id",
+    "x",
+    "y",
+    "z",
+    "d",
+    "s",
+)
+
+BALL_ID = "ball"
+
+
+def _str(value: Any) -> Optional[str]:
+    return sys.intern(str(value)) if value is not None else None
+
+
+def _float(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return math.nan
+
+
+class PlayerOrder:
+    """
+    The order of the player rows of a frame in the long layout.
+
+    Players follow the order of the teams and their players in the metadata.
+    Players that are not part of the metadata come last, in the order in
+    which they first appear.
+
+    Args:
+        teams: The teams of the metadata.
+    """
+
+    def __init__(self, teams: Iterable[Team]):
+        self._ranks = {
+            player: i
+            for i, player in enumerate(
+                player for team in teams for player in team.players
+            )
+        }
+
+    def rank(self, player: Player) -> int:
+        rank = self._ranks.get(player)
+        if rank is None:
+            rank = self._ranks[player] = len(self._ranks)
+        return rank
+
+    def sort(
+        self, players_data: dict[Player, PlayerData]
+    ) -> list[tuple[Player, PlayerData]]:
+        """The items of `Frame.players_data` in row order."""
+        return sorted(players_data.items(), key=lambda item: self.rank(item[0]))
+
+    def object_order(self, frames: ColumnarFrames):
+        """The object indices of columnar storage in row order, ball first."""
+        np = import_numpy()
+
+        ranks = [self.rank(player) for player in frames.players]
+        return np.concatenate(
+            [
+                [0],
+                np.argsort(np.array(ranks, dtype=np.int64), kind="stable") + 1,
+            ]
+        ).astype(np.intp)
+
+
+def frames_to_long_dict(
+    frames: Union[ColumnarFrames, Iterable[Frame]],
+    teams: Iterable[Team] = (),
+) -> dict[str, Any]:
+    """
+    Convert tracking frames to columns in the long (tidy) layout.
+
+    Every tracked object in a frame becomes one row, starting with the ball
+    (`player_id` "ball"), followed by the players in the order of `teams`
+    and their players (see `PlayerOrder`). The columns are filled directly,
+    without building a dict per frame or per row. Team and player ids are
+    interned, so every row of a player refers to the same string objects.
+    The coordinate, distance and speed columns hold floats, with NaN for
+    missing values.
+
+    Frames stored in [`ColumnarFrames`][kloppy.domain.ColumnarFrames] are
+    converted straight from the NumPy arrays. In that case the columns are
+    NumPy arrays. The untyped `other_data` of frames and players is not
+    exported.
+    """
+    player_order = PlayerOrder(teams)
+    if isinstance(frames, ColumnarFrames):
+        return _columnar_to_long_dict(frames, player_order)
+
+    columns = {name: [] for name in LONG_COLUMNS}
+    period_ids = columns["period_id"]
+    timestamps = columns["timestamp"]
+    frame_ids = columns["frame_id"]
+    ball_states = columns["ball_state"]
+    ball_owning_team_ids = columns["ball_owning_team_id"]
+    team_ids = columns["team_id"]
+    player_ids = columns["player_id"]
+    xs = columns["x"]
+    ys = columns["y"]
+    zs = columns["z"]
+    distances = columns["d"]
+    speeds = columns["s"]
+
+    player_keys: dict[Player, tuple[Optional[str], str]] = {}
+    for frame in frames:
+        n = len(frame.players_data) + 1
+        period_ids.extend([frame.period.id if frame.period else None] * n)
+        timestamps.extend([frame.timestamp] * n)
+        frame_ids.extend([frame.frame_id] * n)
+        ball_states.extend(
+            [frame.ball_state.value if frame.ball_state else None] * n
+        )
+        ball_owning_team_ids.extend(
+            [
+                _str(frame.ball_owning_team.team_id)
+                if frame.ball_owning_team
+                else None
+            ]
+            * n
+        )
+
+        point = frame.ball_coordinates
+        team_ids.append(None)
+        player_ids.append(BALL_ID)
+        if point is not None:
+            xs.append(_float(point.x))
+            ys.append(_float(point.y))
+            zs.append(_float(getattr(point, "z", None)))
+        else:
+            xs.append(math.nan)
+            ys.append(math.nan)
+            zs.append(math.nan)
+        distances.append(math.nan)
+        speeds.append(_float(frame.ball_speed))
+
+        for player, player_data in player_order.sort(frame.players_data):
+            keys = player_keys.get(player)
+            if keys is None:
+                keys = player_keys[player] = (
+                    _str(player.team.team_id) if player.team else None,
+                    _str(player.player_id),
+                )
+            team_ids.append(keys[0])
+            player_ids.append(keys[1])
+            point = player_data.coordinates
+            if point is not None:
+                xs.append(_float(point.x))
+                ys.append(_float(point.y))
+                zs.append(_float(getattr(point, "z", None)))
+            else:
+                xs.append(math.nan)
+                ys.append(math.nan)
+                zs.append(math.nan)
+            distances.append(_float(player_data.distance))
+            speeds.append(_float(player_data.speed))
+
+    return columns
+
+
+def _columnar_to_long_dict(
+    frames: ColumnarFrames, player_order: PlayerOrder
+) -> dict[str, Any]:
+    np = import_numpy()
+
+    missing = frames.point_types == POINT_MISSING
+    order = player_order.object_order(frames)
+    present = ~missing[:, order]
+    # The ball always gets a row
+    present[:, 0] = True
+    frame_indices, positions = np.nonzero(present)
+    object_indices = order[positions]
+
+    period_ids = np.array(
+        [period.id for period in frames.periods], dtype=np.int64
+    )
+    # Index -1 (unknown) maps to the trailing None
+    ball_states = np.array(
+        [ball_state.value for ball_state in _BALL_STATES] + [None],
+        dtype=object,
+    )
+    ball_owning_team_ids = np.array(
+        [_str(team.team_id) for team in frames.teams] + [None], dtype=object
+    )
+    team_ids = np.array(
+        [None]
+        + [
+            _str(player.team.team_id) if player.team else None
+            for player in frames.players
+        ],
+        dtype=object,
+    )
+    player_ids = np.array(
+        [BALL_ID] + [_str(player.player_id) for player in frames.players],
+        dtype=object,
+    )
+
+    points = frames.coordinates[frame_indices, object_indices]
+    point_missing = missing[frame_indices, object_indices]
+    point_types = frames.point_types[frame_indices, object_indices]
+    x = np.where(point_missing, np.nan, points[:, 0])
+    y = np.where(point_missing, np.nan, points[:, 1])
+    z = np.where(point_types == POINT_3D, points[:, 2], np.nan)
+    timestamps = (
+        np.round(frames.timestamps[frame_indices] * 1e6)
+        .astype(np.int64)
+        .astype("timedelta64[us]")
+    )
+
+    return {
+        "period_id": period_ids[frames.period_indices[frame_indices]],
+        "timestamp": timestamps,
+        "frame_id": frames.frame_ids[frame_indices],
+        "ball_state": ball_states[frames.ball_states[frame_indices]],
+        "ball_owning_team_id": ball_owning_team_ids[
+            frames.ball_owning_team_indices[frame_indices]
+        ],
+        "team_id": team_ids[object_indices],
+        "player_id": player_ids[object_indices],
+        "x": x,
+        "y": y,
+        "z": z,
+        "d": frames.distances[frame_indices, object_indices],
+        "s": frames.speeds[frame_indices, object_indices],
+    }
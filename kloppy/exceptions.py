@@ -42,5 +42,17 @@ class KloppyParameterError(KloppyError):
     pass
 
 
+class BatchLoadError(KloppyError):
+    """Loading one of the matches of a batch failed.
+
+    Attributes:
+        index: The position of the match in the batch.
+    """
+
+    def __init__(self, message: str, index: int):
+        super().__init__(message)
+        self.index = index
+
+
 class DeserializationWarning(Warning):
     pass
@@ -0,0 +1,287 @@
+"""An on-disk cache of parsed datasets.
+
+When the "cache.datasets" config is enabled, the provider loaders store the
+datasets they parse in the cache directory and return the cached dataset
+the next time they are called with the same inputs and parameters. Entries
+are keyed on a hash of the content of the inputs (not their name or
+location), the load parameters, the config values that affect parsing and
+the kloppy version. Entries of other kloppy versions are removed
+automatically and the least recently used entries are evicted when the
+cache grows beyond "cache.datasets.max_size" bytes.
+
+Examples:
+    >>> from kloppy import tracab
+    >>> from kloppy.config import set_config
+    >>> set_config("cache.datasets", True)
+    >>> dataset = tracab.load(meta_data="meta.xml", raw_data="raw.dat")
+    >>> # The second call loads the dataset from the cache
+    >>> dataset = tracab.load(meta_data="meta.xml", raw_data="raw.dat")
+"""
+
+from enum import Enum
+from functools import wraps
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Any, Callable, Optional, TypeVar
+
+from kloppy.config import get_config
+from kloppy.io import Source, open_as_file, prefetch
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024
+
+T = TypeVar("T")
+
+
+class _Uncacheable(Exception):
+    """Raised when a call can't be fingerprinted reliably."""
+
+
+def _hash_input(digest, input_: Any) -> None:
+    if input_ is None:
+        digest.update(b"\x00none")
+    elif isinstance(input_, Source):
+        digest.update(
+            f"\x00source:{input_.optional}:{input_.skip_if_missing}".encode()
+        )
+        _hash_input(digest, input_.data)
+    elif isinstance(input_, bytes):
+        digest.update(b"\x00bytes")
+        digest.update(input_)
+    elif isinstance(input_, str) and ("{" in input_ or "<" in input_):
+        digest.update(b"\x00inline")
+        digest.update(input_.encode("utf8"))
+    elif isinstance(input_, (str, os.PathLike)):
+        if os.path.isdir(input_):
+            raise _Uncacheable(f"{input_} is a directory")
+        digest.update(b"\x00file")
+        with open_as_file(input_) as fp:
+            if fp is None:
+                digest.update(b"\x00missing")
+                return
+            while chunk := fp.read(_CHUNK_SIZE):
+                digest.update(chunk)
+    elif isinstance(input_, (list, tuple)):
+        digest.update(f"\x00list:{len(input_)}".encode())
+        for item in input_:
+            _hash_input(digest, item)
+    else:
+        # Open file objects can't be read without changing their position
+        raise _Uncacheable(f"Can't fingerprint input of type {type(input_)}")
+
+
+def _canonical(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    raise _Uncacheable(f"Can't fingerprint parameter of type {type(value)}")
+
+
+def _cache_key(
+    func: Callable, arguments: dict[str, Any], inputs: tuple[str, ...]
+) -> str:
+    from kloppy import __version__
+
+    if get_config("event_factory") is not None:
+        raise _Uncacheable("A custom event factory is configured")
+
+    params = {
+        "version": __version__,
+        "loader": f"{func.__module__}.{func.__qualname__}",
+        "config": {
+            key: get_config(key)
+            for key in (
+                "coordinate_system",
+                "tracking.storage",
+                "event_types.pushdown",
+            )
+        },
+        "arguments": {
+            name: _canonical(value)
+            for name, value in arguments.items()
+            if name not in inputs
+        },
+    }
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    for name in inputs:
+        digest.update(f"\x00input:{name}".encode())
+        _hash_input(digest, arguments[name])
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """
+    A directory with pickled datasets, evicted in least recently used order.
+
+    Args:
+        path: The directory in which the datasets are stored. Every kloppy
+            version uses its own subdirectory.
+        max_size: The maximum total size of the stored datasets (in bytes).
+    """
+
+    def __init__(self, path: str, max_size: int):
+        from kloppy import __version__
+
+        self.root = os.path.join(path, "datasets")
+        self.path = os.path.join(self.root, __version__)
+        self.max_size = max_size
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.pkl")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached dataset or `None` when there is no entry."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as fp:
+                dataset = pickle.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring corrupt cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        # The modification time marks when the entry was last used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return dataset
+
+    def put(self, key: str, dataset: Any) -> None:
+        """Store a dataset and evict entries that exceed the maximum size."""
+        os.makedirs(self.path, exist_ok=True)
+        self._remove_other_versions()
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump(dataset, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            if os.path.getsize(tmp_path) > self.max_size:
+                logger.info(
+                    "Not caching dataset: it is larger than the maximum "
+                    "cache size"
+                )
+                os.remove(tmp_path)
+                return
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception as e:
+            logger.warning(f"Could not cache dataset: {e}")
+            self._remove(tmp_path)
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits."""
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".pkl"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self._remove(path)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all entries (of all kloppy versions)."""
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _remove_other_versions(self) -> None:
+        for entry in os.scandir(self.root):
+            if entry.is_dir() and entry.path != self.path:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def get_dataset_cache() -> Optional[DatasetCache]:
+    """
+    Return the dataset cache of the current config, or `None` when the
+    "cache" config doesn't set a cache directory.
+    """
+    path = get_config("cache")
+    if path is None:
+        return None
+    return DatasetCache(path, get_config("cache.datasets.max_size"))
+
+
+def cached_load(
+    *inputs: str, ignore: tuple[str, ...] = ()
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Cache the datasets returned by a loader function.
+
+    Args:
+        inputs: The names of the arguments that are file-like inputs. Remote
+            inputs are prefetched concurrently and their content is hashed.
+            All other arguments must be simple values (strings, numbers,
+            enums, lists or dicts of those); calls with other values (e.g. a
+            custom event factory or an open file object) bypass the cache.
+        ignore: The names of the arguments that don't affect the dataset.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            # Fetch the remote inputs concurrently instead of one by one
+            prefetch([bound.arguments.get(name) for name in inputs])
+
+            if not get_config("cache.datasets"):
+                return func(*args, **kwargs)
+
+            cache = get_dataset_cache()
+            if cache is None:
+                logger.debug("Not using the dataset cache: no cache directory")
+                return func(*args, **kwargs)
+
+            arguments = {
+                name: value
+                for name, value in bound.arguments.items()
+                if name not in ignore
+            }
+            try:
+                key = _cache_key(func, arguments, inputs)
+            except _Uncacheable as e:
+                logger.debug(f"Not using the dataset cache: {e}")
+                return func(*args, **kwargs)
+
+            dataset = cache.get(key)
+            if dataset is None:
+                dataset = func(*args, **kwargs)
+                cache.put(key, dataset)
+            return dataset
+
+        return wrapper
+
+    return decorator
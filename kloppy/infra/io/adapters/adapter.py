@@ -25,6 +25,17 @@ class Adapter(ABC):
             output: BufferedStream to write to
         """
 
+    def prefetch(self, url: str) -> None:
+        """Fetch the content of the given URL in advance.
+
+        Adapters that cache remote content can implement this to download it
+        before it is read, such that several inputs can be fetched
+        concurrently. Does nothing by default.
+
+        Args:
+            url: The source URL
+        """
+
     def write_from_stream(self, url: str, input: BufferedStream, mode: str):  # noqa: A002
         """Write content from BufferedStream to the given URL.
 
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 import re
-from typing import Optional
+import threading
+from typing import Callable, Optional
 
 import fsspec
+from fsspec.implementations.cached import SimpleCacheFileSystem
 
 from kloppy.config import get_config
 from kloppy.exceptions import InputNotFoundError
@@ -12,6 +15,28 @@ from .adapter import Adapter
 
 
 class FSSpecAdapter(Adapter, ABC):
+    def __init__(self):
+        self._filesystems: dict[Hashable, fsspec.AbstractFileSystem] = {}
+        self._filesystems_lock = threading.Lock()
+
+    def _get_pooled_filesystem(
+        self,
+        key: Hashable,
+        create: Callable[[], fsspec.AbstractFileSystem],
+    ) -> fsspec.AbstractFileSystem:
+        """
+        Get a filesystem from the pool of this adapter, or create it.
+
+        Reusing the filesystems keeps their sessions and connections open
+        across reads. The key should include every config value that the
+        filesystem depends on.
+        """
+        with self._filesystems_lock:
+            fs = self._filesystems.get(key)
+            if fs is None:
+                fs = self._filesystems[key] = create()
+            return fs
+
     def _infer_protocol(self, url: str) -> str:
         """
         Infer the protocol based on the URL prefix.
@@ -30,12 +55,18 @@ class FSSpecAdapter(Adapter, ABC):
         """
         protocol = self._infer_protocol(url)
         if no_cache:
-            return fsspec.filesystem(protocol)
-
-        return fsspec.filesystem(
-            "simplecache",
-            target_protocol=protocol,
-            cache_storage=get_config("cache"),
+            return self._get_pooled_filesystem(
+                (protocol,), lambda: fsspec.filesystem(protocol)
+            )
+
+        cache_storage = get_config("cache")
+        return self._get_pooled_filesystem(
+            (protocol, cache_storage),
+            lambda: fsspec.filesystem(
+                "simplecache",
+                target_protocol=protocol,
+                cache_storage=cache_storage,
+            ),
         )
 
     def _get_filesystem_for_reading(
@@ -84,6 +115,22 @@ class FSSpecAdapter(Adapter, ABC):
         except FileNotFoundError as e:
             raise InputNotFoundError(f"Input file not found: {url}") from e
 
+    def prefetch(self, url: str) -> None:
+        """
+        Downloads the content of the given URL to the cache, unless it is
+        cached already. Does nothing for filesystems without a cache.
+        """
+        fs = self._get_filesystem_for_reading(url)
+        if not isinstance(fs, SimpleCacheFileSystem):
+            return
+
+        try:
+            # Opening a file downloads it to the cache
+            with fs.open(url, "rb"):
+                pass
+        except FileNotFoundError as e:
+            raise InputNotFoundError(f"Input file not found: {url}") from e
+
     def write_from_stream(self, url: str, input: BufferedStream, mode: str):  # noqa: A002
         """
         Writes content from BufferedStream to the given URL.
@@ -64,14 +64,24 @@ class HTTPAdapter(FSSpecAdapter):
                     "Provide a dictionary with 'login' and 'password' keys, or tuple."
                 ) from e
 
+        # The filesystems (and their client sessions) are reused for all
+        # reads with the same authentication
+        auth = client_kwargs.get("auth")
         if no_cache:
-            return fsspec.filesystem("http", client_kwargs=client_kwargs)
+            return self._get_pooled_filesystem(
+                ("http", auth),
+                lambda: fsspec.filesystem("http", client_kwargs=client_kwargs),
+            )
         else:
-            return fsspec.filesystem(
-                "simplecache",
-                target_protocol="http",
-                target_options={"client_kwargs": client_kwargs},
-                cache_storage=get_config("cache"),
+            cache_storage = get_config("cache")
+            return self._get_pooled_filesystem(
+                ("simplecache", auth, cache_storage),
+                lambda: fsspec.filesystem(
+                    "simplecache",
+                    target_protocol="http",
+                    target_options={"client_kwargs": client_kwargs},
+                    cache_storage=cache_storage,
+                ),
             )
 
     def is_directory(self, url: str) -> bool:
@@ -21,12 +21,19 @@ class S3Adapter(FSSpecAdapter):
                 " install it using: pip install s3fs"
             )
 
-        s3_fs = get_config("adapters.s3.s3fs") or s3fs.S3FileSystem()
+        custom_s3_fs = get_config("adapters.s3.s3fs")
+        s3_fs = custom_s3_fs or self._get_pooled_filesystem(
+            ("s3",), s3fs.S3FileSystem
+        )
 
         if no_cache:
             return s3_fs
-        return fsspec.filesystem(
-            "simplecache",
-            fs=s3_fs,
-            cache_storage=get_config("cache"),
+        cache_storage = get_config("cache")
+        return self._get_pooled_filesystem(
+            ("simplecache", id(s3_fs), cache_storage),
+            lambda: fsspec.filesystem(
+                "simplecache",
+                fs=s3_fs,
+                cache_storage=cache_storage,
+            ),
         )
@@ -12,6 +12,7 @@ from kloppy.domain import (
     DatasetFlag,
     Event,
     EventDataset,
+    EventType,
     Ground,
     Metadata,
     Orientation,
@@ -60,6 +61,12 @@ DF_EVENT_CLASS_PASSES = {
     DF_EVENT_CLASS_CORNERKICKS,
 }
 DF_EVENT_CLASS_CARDS = {DF_EVENT_CLASS_YELLOW_CARDS, DF_EVENT_CLASS_RED_CARDS}
+NOT_IN_PLAY_EVENT_CLASSES = {
+    DF_EVENT_CLASS_YELLOW_CARDS,
+    DF_EVENT_CLASS_RED_CARDS,
+    DF_EVENT_CLASS_SUBSTITUTIONS,
+    DF_EVENT_CLASS_PENALTY_SHOOTOUT,
+}
 
 # status event types
 DF_EVENT_TYPE_STATUS_MATCH_START = 1
@@ -333,6 +340,28 @@ def _parse_substitution(raw_event: dict, team: Team) -> dict:
     return dict(player=player, replacement_player=replacement_player)
 
 
+def _get_event_types(e_class: str, raw_event: dict) -> tuple[EventType, ...]:
+    """The types of the events a raw event is deserialized into."""
+    if e_class in DF_EVENT_CLASS_PASSES:
+        event_type = EventType.PASS
+    elif e_class == DF_EVENT_CLASS_SHOTS:
+        event_type = EventType.SHOT
+    elif e_class == DF_EVENT_CLASS_STEALINGS:
+        event_type = EventType.RECOVERY
+    elif e_class == DF_EVENT_CLASS_FOULS:
+        event_type = EventType.FOUL_COMMITTED
+    elif e_class in DF_EVENT_CLASS_CARDS:
+        event_type = EventType.CARD
+    elif e_class == DF_EVENT_CLASS_SUBSTITUTIONS:
+        event_type = EventType.SUBSTITUTION
+    else:
+        event_type = EventType.GENERIC
+
+    if raw_event["type"] in BALL_OUT_EVENTS:
+        return event_type, EventType.BALL_OUT
+    return (event_type,)
+
+
 def _include_event(event: Event, wanted_event_types: list) -> bool:
     return not wanted_event_types or event.event_type in wanted_event_types
 
@@ -493,6 +522,13 @@ class DatafactoryDeserializer(EventDataDeserializer[DatafactoryInputs]):
                     raw_events[i + 1][2] if i + 1 < len(raw_events) else None
                 )
 
+                if not self.should_deserialize(
+                    *_get_event_types(e_class, raw_event)
+                ):
+                    if e_class not in NOT_IN_PLAY_EVENT_CLASSES:
+                        previous_event = raw_event
+                    continue
+
                 team, player = _get_team_and_player(
                     raw_event, home_team, away_team
                 )
@@ -595,12 +631,7 @@ class DatafactoryDeserializer(EventDataDeserializer[DatafactoryInputs]):
                 events.append(transformer.transform_event(event))
 
                 # only consider as a previous_event a ball-in-play event
-                if e_class not in (
-                    DF_EVENT_CLASS_YELLOW_CARDS,
-                    DF_EVENT_CLASS_RED_CARDS,
-                    DF_EVENT_CLASS_SUBSTITUTIONS,
-                    DF_EVENT_CLASS_PENALTY_SHOOTOUT,
-                ):
+                if e_class not in NOT_IN_PLAY_EVENT_CLASSES:
                     previous_event = raw_event
 
         metadata = Metadata(
@@ -3,6 +3,7 @@ from dataclasses import fields, replace
 from typing import Any, Generic, Optional, TypeVar, Union
 import warnings
 
+from kloppy.config import get_config
 from kloppy.domain import (
     DatasetTransformer,
     DatasetTransformerBuilder,
@@ -16,6 +17,10 @@ from kloppy.domain import (
 
 T = TypeVar("T")
 
+# Events that are always deserialized, because the dataset needs them to keep
+# track of the formations and player positions.
+STATE_EVENT_TYPES = (EventType.SUBSTITUTION, EventType.FORMATION_CHANGE)
+
 
 class EventDataDeserializer(ABC, Generic[T]):
     def __init__(
@@ -35,6 +40,10 @@ class EventDataDeserializer(ABC, Generic[T]):
             )
             for event_type in event_types
         ]
+        # See `should_deserialize`
+        self.skip_excluded_events = bool(self.event_types) and get_config(
+            "event_types.pushdown"
+        )
 
         self.transformer_builder = DatasetTransformerBuilder(coordinate_system)
 
@@ -47,6 +56,29 @@ class EventDataDeserializer(ABC, Generic[T]):
             return True
         return event.event_type in self.event_types
 
+    def should_deserialize(self, *event_types: EventType) -> bool:
+        """Whether to deserialize a raw event that results in events of
+        (one of) these types.
+
+        Deserializers call this before building the events of a raw event, to
+        skip the raw events that would be filtered out anyway. This only
+        happens when the "event_types.pushdown" config is enabled: the
+        dataset returned for `event_types` is a view on a dataset that then
+        only holds the requested event types, substitutions and formation
+        changes, instead of all events. So `prev_record`, `Event.prev()`,
+        `Event.next()` and `get_related_events()` only see those events.
+        Substitutions and formation changes are always deserialized.
+
+        Args:
+            event_types: The types of the events the raw event can result in.
+        """
+        if not self.skip_excluded_events:
+            return True
+        return any(
+            event_type in self.event_types or event_type in STATE_EVENT_TYPES
+            for event_type in event_types
+        )
+
     def get_transformer(
         self,
         pitch_length: Optional[float] = None,
@@ -109,6 +141,19 @@ class EventDataDeserializer(ABC, Generic[T]):
                 updated_metadata = replace(dataset.metadata, **known_updates)
                 dataset = replace(dataset, metadata=updated_metadata)
 
+        if self.skip_excluded_events:
+            # Drop the events that were only deserialized because the
+            # requested events depend on them (e.g. the passes before a shot
+            # to mark assists)
+            dataset = replace(
+                dataset,
+                records=[
+                    event
+                    for event in dataset.records
+                    if self.should_deserialize(event.event_type)
+                ],
+            )
+
         # Check if we need to return a FilteredEventDataset
         if self.event_types:
             return dataset.filter(self.should_include_event)
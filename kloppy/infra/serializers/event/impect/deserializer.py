@@ -1,9 +1,8 @@
 from dataclasses import replace
 from datetime import timedelta
-import json
 import logging
 import re
-from typing import IO, NamedTuple, Optional, Union
+from typing import IO, Callable, NamedTuple, Optional, Union
 import warnings
 
 from kloppy.domain import (
@@ -29,6 +28,7 @@ from kloppy.domain import (
     SubstitutionEvent,
     Team,
 )
+from kloppy.infra.serializers import json_stream
 from kloppy.infra.serializers.event.deserializer import EventDataDeserializer
 from kloppy.infra.serializers.event.impect.helpers import (
     insert,
@@ -36,6 +36,7 @@ from kloppy.infra.serializers.event.impect.helpers import (
     parse_timestamp,
 )
 from kloppy.infra.serializers.event.impect.specification import (
+    EVENT,
     create_impect_events,
 )
 from kloppy.utils import performance_logging
@@ -82,6 +83,54 @@ position_types_mapping: dict[tuple[str, str], PositionType] = {
 }
 
 
+def _get_events_to_deserialize(
+    impect_events: list[EVENT],
+    should_deserialize: Callable[..., bool],
+) -> list[bool]:
+    """Determine which raw events to deserialize.
+
+    Cards are always deserialized, because they are needed to match the
+    substitutions. Passes are marked as (shot) assists based on the shots
+    that follow them, so when passes are wanted every shot is deserialized
+    as well. The events before each shot are added by
+    `_add_assist_windows`.
+    """
+    deserialize_passes = should_deserialize(EventType.PASS)
+    return [
+        should_deserialize(*impect_event.event_types)
+        or EventType.CARD in impect_event.event_types
+        or (deserialize_passes and EventType.SHOT in impect_event.event_types)
+        for impect_event in impect_events
+    ]
+
+
+def _add_assist_windows(
+    events_by_index: dict[int, list[Event]],
+    deserialize_event: Callable[[int], list[Event]],
+):
+    """Deserialize the raw events that precede each shot.
+
+    `mark_events_as_assists` looks at the two kloppy events before each
+    shot. A raw event can create zero, one or more kloppy events, so the
+    raw events before a shot are deserialized until they created (at
+    least) two kloppy events.
+    """
+    for index in sorted(events_by_index):
+        events = events_by_index[index]
+        for position, event in enumerate(events):
+            if event.event_type != EventType.SHOT:
+                continue
+            count = position
+            previous_index = index - 1
+            while count < 2 and previous_index >= 0:
+                if previous_index not in events_by_index:
+                    events_by_index[previous_index] = deserialize_event(
+                        previous_index
+                    )
+                count += len(events_by_index[previous_index])
+                previous_index -= 1
+
+
 class ImpectInputs(NamedTuple):
     meta_data: IO[bytes]
     event_data: IO[bytes]
@@ -99,19 +148,21 @@ class ImpectDeserializer(EventDataDeserializer[ImpectInputs]):
         self.transformer = self.get_transformer()
 
         with performance_logging("load data", logger=logger):
-            metadata = json.load(inputs.meta_data)
-            raw_events = json.load(inputs.event_data)
+            metadata = json_stream.load(inputs.meta_data)
+            # The periods and the events are built from all raw events, so
+            # the feed is parsed at once instead of streamed
+            raw_events = json_stream.load(inputs.event_data)
 
             # Load optional squads and players data for enrichment
             squads_lookup = None
             players_lookup = None
             if inputs.squads_data:
-                squads_data = json.load(inputs.squads_data)
+                squads_data = json_stream.load(inputs.squads_data)
                 squads_lookup = {
                     str(squad["id"]): squad for squad in squads_data
                 }
             if inputs.players_data:
-                players_data = json.load(inputs.players_data)
+                players_data = json_stream.load(inputs.players_data)
                 players_lookup = {
                     str(player["id"]): player for player in players_data
                 }
@@ -127,16 +178,36 @@ class ImpectDeserializer(EventDataDeserializer[ImpectInputs]):
 
         # Create events
         with performance_logging("parse events", logger=logger):
-            events = []
             impect_events = create_impect_events(raw_events)
-            for impect_event in impect_events.values():
-                new_events = impect_event.set_refs(
-                    periods, teams, impect_events
-                ).deserialize(self.event_factory, teams)
-                for event in new_events:
-                    # Transform event to the coordinate system
-                    event = self.transformer.transform_event(event)
-                    events.append(event)
+            impect_event_list = list(impect_events.values())
+
+            def deserialize_event(index: int) -> list[Event]:
+                new_events = (
+                    impect_event_list[index]
+                    .set_refs(periods, teams, impect_events)
+                    .deserialize(self.event_factory, teams)
+                )
+                # Transform events to the coordinate system
+                return [
+                    self.transformer.transform_event(event)
+                    for event in new_events
+                ]
+
+            events_to_deserialize = _get_events_to_deserialize(
+                impect_event_list, self.should_deserialize
+            )
+            events_by_index = {
+                index: deserialize_event(index)
+                for index, deserialize in enumerate(events_to_deserialize)
+                if deserialize
+            }
+            if self.should_deserialize(EventType.PASS):
+                _add_assist_windows(events_by_index, deserialize_event)
+            events = [
+                event
+                for index in sorted(events_by_index)
+                for event in events_by_index[index]
+            ]
 
         self.mark_events_as_assists(events)
         substitution_events = self.parse_substitutions(
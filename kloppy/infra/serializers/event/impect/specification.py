@@ -13,6 +13,7 @@ from kloppy.domain import (
     DuelType,
     Event,
     EventFactory,
+    EventType,
     GoalkeeperActionType,
     GoalkeeperQualifier,
     InterceptionResult,
@@ -97,6 +98,9 @@ class EVENT:
         raw_event: The raw JSON event.
     """
 
+    # The types of the events created by `_create_events`
+    event_types: tuple[EventType, ...] = (EventType.GENERIC,)
+
     def __init__(self, raw_event: dict):
         self.raw_event = raw_event
 
@@ -194,6 +198,8 @@ class EVENT:
 class PASS(EVENT):
     """Impect Pass event."""
 
+    event_types = (EventType.PASS,)
+
     class ACTION(Enum):
         LOW_PASS = "LOW_PASS"
         LOW_CROSS = "LOW_CROSS"
@@ -236,6 +242,8 @@ class PASS(EVENT):
 class DRIBBLE(EVENT):
     """Impect Dribble event."""
 
+    event_types = (EventType.CARRY,)
+
     class ACTION(Enum):
         DRIBBLE = "DRIBBLE"
 
@@ -286,6 +294,8 @@ class DRIBBLE(EVENT):
 class SHOT(EVENT):
     """Impect Shot event."""
 
+    event_types = (EventType.SHOT,)
+
     class ACTION(Enum):
         LONG_RANGE_SHOT = "LONG_RANGE_SHOT"
         MID_RANGE_SHOT = "MID_RANGE_SHOT"
@@ -339,6 +349,8 @@ class SHOT(EVENT):
 
 
 class LOOSE_BALL_REGAIN(EVENT):
+    event_types = (EventType.DUEL, EventType.RECOVERY)
+
     class ACTION(Enum):
         LOOSE_BALL_REGAIN = "LOOSE_BALL_REGAIN"
 
@@ -412,6 +424,8 @@ class LOOSE_BALL_REGAIN(EVENT):
 
 
 class INTERCEPTION(EVENT):
+    event_types = (EventType.INTERCEPTION,)
+
     class ACTION(Enum):
         INTERCEPTION = "INTERCEPTION"
 
@@ -435,6 +449,8 @@ class INTERCEPTION(EVENT):
 
 
 class CLEARANCE(EVENT):
+    event_types = (EventType.CLEARANCE,)
+
     class ACTION(Enum):
         CLEARANCE = "CLEARANCE"
 
@@ -458,6 +474,8 @@ class CLEARANCE(EVENT):
 
 
 class GROUND_DUEL(EVENT):
+    event_types = (EventType.DUEL,)
+
     class ACTION(Enum):
         DUEL = "DUEL"
 
@@ -502,6 +520,8 @@ class GROUND_DUEL(EVENT):
 
 
 class KICK_OFF(EVENT):
+    event_types = (EventType.PASS,)
+
     class ACTION(Enum):
         KICKOFF_WHISTLE = "KICKOFF_WHISTLE"
 
@@ -534,6 +554,8 @@ class KICK_OFF(EVENT):
 
 
 class THROW_IN(EVENT):
+    event_types = (EventType.PASS,)
+
     class ACTION(Enum):
         THROW_IN = "THROW_IN"
 
@@ -566,6 +588,8 @@ class THROW_IN(EVENT):
 
 
 class FREE_KICK(EVENT):
+    event_types = (EventType.PASS, EventType.SHOT)
+
     class ACTION(Enum):
         FREE_KICK = "FREE_KICK"
         DIRECT_FREE_KICK = "DIRECT_FREE_KICK"
@@ -624,6 +648,8 @@ class FREE_KICK(EVENT):
 
 
 class GOAL_KICK(EVENT):
+    event_types = (EventType.PASS,)
+
     class ACTION(Enum):
         GOAL_KICK = "GOAL_KICK"
 
@@ -656,6 +682,8 @@ class GOAL_KICK(EVENT):
 
 
 class CORNER(EVENT):
+    event_types = (EventType.PASS,)
+
     class ACTION(Enum):
         CORNER = "CORNER"
 
@@ -688,6 +716,8 @@ class CORNER(EVENT):
 
 
 class GK_CATCH(EVENT):
+    event_types = (EventType.GOALKEEPER,)
+
     class ACTION(Enum):
         CATCH = "CATCH"
 
@@ -711,6 +741,8 @@ class GK_CATCH(EVENT):
 
 
 class GK_SAVE(EVENT):
+    event_types = (EventType.GOALKEEPER,)
+
     class ACTION(Enum):
         SAVE = "SAVE"
 
@@ -734,6 +766,8 @@ class GK_SAVE(EVENT):
 
 
 class OUT(EVENT):
+    event_types = (EventType.BALL_OUT,)
+
     class ACTION(Enum):
         BALL_OUT_OF_GOAL_LINE = "BALL_OUT_OF_GOAL_LINE"
         BALL_OUT_OF_SIDE_LINE = "BALL_OUT_OF_SIDE_LINE"
@@ -756,6 +790,8 @@ class OUT(EVENT):
 
 
 class FOUL(EVENT):
+    event_types = (EventType.FOUL_COMMITTED,)
+
     class ACTION(Enum):
         FOUL = "FOUL"
 
@@ -774,6 +810,8 @@ class FOUL(EVENT):
 
 
 class YELLOW_CARD(EVENT):
+    event_types = (EventType.CARD,)
+
     class ACTION(Enum):
         YELLOW_CARD = "YELLOW_CARD"
 
@@ -793,6 +831,8 @@ class YELLOW_CARD(EVENT):
 
 
 class SECOND_YELLOW_CARD(EVENT):
+    event_types = (EventType.CARD,)
+
     class ACTION(Enum):
         SECOND_YELLOW_CARD = "SECOND_YELLOW_CARD"
 
@@ -812,6 +852,8 @@ class SECOND_YELLOW_CARD(EVENT):
 
 
 class RED_CARD(EVENT):
+    event_types = (EventType.CARD,)
+
     class ACTION(Enum):
         RED_CARD = "RED_CARD"
 
@@ -831,6 +873,8 @@ class RED_CARD(EVENT):
 
 
 class OWN_GOAL(EVENT):
+    event_types = (EventType.SHOT,)
+
     class ACTION(Enum):
         OWN_GOAL = "OWN_GOAL"
 
@@ -1,6 +1,6 @@
+from collections.abc import Iterable
 from dataclasses import replace
 from datetime import timedelta
-import json
 import logging
 from typing import IO, NamedTuple, Optional
 
@@ -10,6 +10,7 @@ from kloppy.domain import (
     BodyPartQualifier,
     CarryResult,
     EventDataset,
+    EventType,
     PassResult,
     Period,
     Point,
@@ -23,6 +24,7 @@ from kloppy.domain import (
     Team,
 )
 from kloppy.exceptions import DeserializationError
+from kloppy.infra.serializers import json_stream
 from kloppy.infra.serializers.event.deserializer import EventDataDeserializer
 from kloppy.infra.serializers.tracking.metrica_epts.metadata import (
     load_metadata,
@@ -240,6 +242,37 @@ def _parse_ball_owning_team(event_type: int, team: Team) -> Optional[Team]:
         return None
 
 
+def _get_event_types(
+    event_type: int, subtypes: Optional[list]
+) -> tuple[EventType, ...]:
+    """The types of the events a raw event is deserialized into."""
+    if event_type == MS_SET_PIECE:
+        return ()
+    elif event_type in MS_PASS_TYPES:
+        event_types = (EventType.PASS,)
+    elif event_type == MS_EVENT_TYPE_SHOT:
+        event_types = (EventType.SHOT,)
+    elif subtypes and MS_EVENT_TYPE_DRIBBLE in subtypes:
+        event_types = (EventType.TAKE_ON,)
+    elif event_type == MS_EVENT_TYPE_CARRY:
+        event_types = (EventType.CARRY,)
+    elif event_type == MS_EVENT_TYPE_RECOVERY:
+        return (EventType.RECOVERY,)
+    elif event_type == MS_EVENT_TYPE_FOUL_COMMITTED:
+        return (EventType.FOUL_COMMITTED,)
+    else:
+        return (EventType.GENERIC,)
+    # Events with a result can end with a synthetic ball out event
+    return event_types + (EventType.BALL_OUT,)
+
+
+def _with_previous(raw_events: Iterable[dict]):
+    previous_event = None
+    for raw_event in raw_events:
+        yield previous_event, raw_event
+        previous_event = raw_event
+
+
 class MetricaJsonEventDataInputs(NamedTuple):
     meta_data: IO[bytes]
     event_data: IO[bytes]
@@ -254,7 +287,7 @@ class MetricaJsonEventDataDeserializer(
 
     def _deserialize(self, inputs: MetricaJsonEventDataInputs) -> EventDataset:
         with performance_logging("load data", logger=logger):
-            raw_events = json.load(inputs.event_data)
+            raw_events = json_stream.iter_items(inputs.event_data, key="data")
             metadata = load_metadata(
                 inputs.meta_data, provider=Provider.METRICA
             )
@@ -266,9 +299,7 @@ class MetricaJsonEventDataDeserializer(
 
         with performance_logging("parse data", logger=logger):
             events = []
-            for previous_event, raw_event in zip(
-                [None] + raw_events["data"], raw_events["data"]
-            ):
+            for previous_event, raw_event in _with_previous(raw_events):
                 if raw_event["team"]["id"] == metadata.teams[0].team_id:
                     team = metadata.teams[0]
                 elif raw_event["team"]["id"] == metadata.teams[1].team_id:
@@ -281,6 +312,11 @@ class MetricaJsonEventDataDeserializer(
                 player = team.get_player_by_id(raw_event["from"]["id"])
                 event_type = raw_event["type"]["id"]
                 subtypes = _parse_subtypes(raw_event)
+                if not self.should_deserialize(
+                    *_get_event_types(event_type, subtypes)
+                ):
+                    continue
+
                 period = [
                     period
                     for period in metadata.periods
@@ -1,7 +1,7 @@
 from collections import OrderedDict
 from datetime import datetime, timedelta
 import logging
-from typing import IO, NamedTuple
+from typing import IO, Callable, NamedTuple
 
 from lxml import objectify
 
@@ -301,6 +301,12 @@ SPORTEC_EVENT_NAME_CORNER_KICK = "CornerKick"
 SPORTEC_EVENT_NAME_FREE_KICK = "FreeKick"
 SPORTEC_PASS_EVENT_NAMES = (SPORTEC_EVENT_NAME_PASS, SPORTEC_EVENT_NAME_CROSS)
 
+SPORTEC_RESTART_SET_PIECE_TYPES = (
+    SetPieceType.THROW_IN,
+    SetPieceType.GOAL_KICK,
+    SetPieceType.CORNER_KICK,
+)
+
 SPORTEC_EVENT_NAME_BALL_CLAIMING = "BallClaiming"
 SPORTEC_EVENT_NAME_SUBSTITUTION = "Substitution"
 SPORTEC_EVENT_NAME_CAUTION = "Caution"
@@ -439,6 +445,59 @@ def _parse_foul(event_attributes: dict, teams: list[Team]) -> dict:
     return dict(team=team, player=player)
 
 
+def _get_event_types(event_chain: OrderedDict) -> tuple[EventType, ...]:
+    """The types of the events a raw event is deserialized into."""
+    event_name = next(reversed(event_chain))
+    if event_name in SPORTEC_SHOT_EVENT_NAMES:
+        return (EventType.SHOT,)
+    elif event_name in SPORTEC_PASS_EVENT_NAMES:
+        if any(
+            qualifier.value in SPORTEC_RESTART_SET_PIECE_TYPES
+            for qualifier in _get_event_setpiece_qualifiers(event_chain)
+        ):
+            # A restart adds a synthetic ball out event
+            return EventType.PASS, EventType.BALL_OUT
+        return (EventType.PASS,)
+    elif event_name == SPORTEC_EVENT_NAME_BALL_CLAIMING:
+        return (EventType.RECOVERY,)
+    elif event_name == SPORTEC_EVENT_NAME_SUBSTITUTION:
+        return (EventType.SUBSTITUTION,)
+    elif event_name == SPORTEC_EVENT_NAME_CAUTION:
+        return (EventType.CARD,)
+    elif event_name == SPORTEC_EVENT_NAME_FOUL:
+        return (EventType.FOUL_COMMITTED,)
+    return (EventType.GENERIC,)
+
+
+def _get_events_to_deserialize(
+    event_chains: list[OrderedDict],
+    should_deserialize: Callable[..., bool],
+) -> list[bool]:
+    """Determine which raw events to deserialize.
+
+    A pass gets its receiver coordinates from the next event and a restart
+    changes the result of the previous pass. These neighbouring events are
+    deserialized as well, so the wanted events are the same as in a full
+    load.
+    """
+    event_types = [_get_event_types(chain) for chain in event_chains]
+    wanted = [should_deserialize(*types) for types in event_types]
+    deserialize = list(wanted)
+
+    # Final whistles don't result in an event
+    indices = [
+        i
+        for i, chain in enumerate(event_chains)
+        if SPORTEC_EVENT_NAME_FINAL_WHISTLE not in chain
+    ]
+    for i, next_i in zip(indices, indices[1:]):
+        if wanted[i] and EventType.PASS in event_types[i]:
+            deserialize[next_i] = True
+        if wanted[next_i] and EventType.BALL_OUT in event_types[next_i]:
+            deserialize[i] = True
+    return deserialize
+
+
 def _parse_coordinates(event_attributes: dict) -> Point:
     if "X-Position" not in event_attributes:
         return None
@@ -483,8 +542,16 @@ class SportecEventDataDeserializer(
             period_id = 0
             events = []
 
-            for event_elm in event_root.iterchildren("Event"):
-                event_chain = _event_chain_from_xml_elm(event_elm)
+            event_chains = [
+                _event_chain_from_xml_elm(event_elm)
+                for event_elm in event_root.iterchildren("Event")
+            ]
+            events_to_deserialize = _get_events_to_deserialize(
+                event_chains, self.should_deserialize
+            )
+            for event_chain, deserialize in zip(
+                event_chains, events_to_deserialize
+            ):
                 timestamp = _parse_datetime(event_chain["Event"]["EventTime"])
 
                 if (
@@ -515,6 +582,9 @@ class SportecEventDataDeserializer(
                     # Skip any events that happened before the first kick off
                     continue
 
+                if not deserialize:
+                    continue
+
                 team = None
                 player = None
                 flatten_attributes = dict()
@@ -613,11 +683,7 @@ class SportecEventDataDeserializer(
                 if (
                     event.event_type == EventType.PASS
                     and event.get_qualifier_value(SetPieceQualifier)
-                    in (
-                        SetPieceType.THROW_IN,
-                        SetPieceType.GOAL_KICK,
-                        SetPieceType.CORNER_KICK,
-                    )
+                    in SPORTEC_RESTART_SET_PIECE_TYPES
                 ):
                     # 1. update previous pass
                     if events[-1].event_type == EventType.PASS:
@@ -1,7 +1,7 @@
+from collections.abc import Mapping
 from itertools import zip_longest
-import json
 import logging
-from typing import IO, NamedTuple, Optional
+from typing import IO, Any, NamedTuple, Optional
 
 from kloppy.domain import (
     DatasetFlag,
@@ -17,6 +17,7 @@ from kloppy.domain import (
     Team,
 )
 from kloppy.exceptions import DeserializationError
+from kloppy.infra.serializers import json_stream
 from kloppy.infra.serializers.event.deserializer import EventDataDeserializer
 from kloppy.utils import performance_logging
 
@@ -33,6 +34,48 @@ class StatsBombInputs(NamedTuple):
     three_sixty_data: Optional[IO[bytes]]
 
 
+class ThreeSixtyLookup(Mapping):
+    """The 360 freeze frames by event id.
+
+    The feed is only parsed when the first event is looked up. It is read
+    incrementally and only the freeze frame and visible area of each event
+    are kept.
+    """
+
+    def __init__(self, three_sixty_data: Optional[IO[bytes]]):
+        self._feed = three_sixty_data
+        self._data: Optional[dict[str, dict[str, Any]]] = None
+
+    @property
+    def data(self) -> dict[str, dict[str, Any]]:
+        if self._data is None:
+            self._data = (
+                {
+                    item["event_uuid"]: {
+                        "freeze_frame": item["freeze_frame"],
+                        "visible_area": item["visible_area"],
+                    }
+                    for item in json_stream.iter_items(self._feed)
+                }
+                if self._feed
+                else {}
+            )
+            self._feed = None
+        return self._data
+
+    def __getitem__(self, event_id: str) -> dict[str, Any]:
+        return self.data[event_id]
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
 class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
     @property
     def provider(self) -> Provider:
@@ -69,6 +112,8 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
         with performance_logging("parse events", logger=logger):
             events = []
             for raw_event in raw_events.values():
+                if not self.should_deserialize(*raw_event.get_event_types()):
+                    continue
                 new_events = (
                     raw_event.set_version(data_version)
                     .set_refs(periods, teams, raw_events)
@@ -137,7 +182,7 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
     def load_data(self, inputs: StatsBombInputs):
         raw_events = {}
         shot_fidelity_version, xy_fidelity_version = 1, 1
-        for event in json.load(inputs.event_data):
+        for event in json_stream.iter_items(inputs.event_data):
             # load the event
             raw_events[event["id"]] = SB.event_decoder(event)
             # determine the fidelity version
@@ -160,16 +205,9 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
             xy_fidelity_version=xy_fidelity_version,
         )
 
-        lineups = json.load(inputs.lineup_data)
+        lineups = json_stream.load(inputs.lineup_data)
 
-        three_sixty_data = (
-            {
-                item["event_uuid"]: item
-                for item in json.load(inputs.three_sixty_data)
-            }
-            if inputs.three_sixty_data
-            else {}
-        )
+        three_sixty_data = ThreeSixtyLookup(inputs.three_sixty_data)
 
         return raw_events, lineups, three_sixty_data, version
 
@@ -15,6 +15,7 @@ from kloppy.domain import (
     DuelType,
     Event,
     EventFactory,
+    EventType,
     ExpectedGoals,
     FormationType,
     GoalkeeperActionType,
@@ -253,9 +254,20 @@ class EVENT:
         data_version: The version of the StatsBomb data.
     """
 
+    # The types of the events created by `_create_events`
+    event_types: tuple[EventType, ...] = (EventType.GENERIC,)
+
     def __init__(self, raw_event: dict):
         self.raw_event = raw_event
 
+    def get_event_types(self) -> tuple[EventType, ...]:
+        """The types of the events `deserialize` can return for this event.
+
+        Besides the events created by `_create_events`, any event can result
+        in an aerial duel and a ball out event.
+        """
+        return (*self.event_types, EventType.DUEL, EventType.BALL_OUT)
+
     def set_version(self, data_version: Version):
         self.fidelity_version = data_version.xy_fidelity_version
         return self
@@ -403,6 +415,8 @@ class EVENT:
 class PASS(EVENT):
     """StatsBomb 30/Pass event."""
 
+    event_types = (EventType.PASS, EventType.INTERCEPTION)
+
     class TYPE(Enum, metaclass=TypesEnumMeta):
         ONE_TOUCH_INTERCEPTION = 64
         RECOVERY = 66
@@ -532,6 +546,8 @@ class PASS(EVENT):
 class BALL_RECEIPT(EVENT):
     """StatsBomb 42/Ball Receipt* event."""
 
+    event_types = (EventType.GENERIC,)
+
     def _create_ball_out_event(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -566,6 +582,8 @@ class BALL_RECEIPT(EVENT):
 class SHOT(EVENT):
     """StatsBomb 16/Shot event."""
 
+    event_types = (EventType.SHOT,)
+
     class TYPE(Enum, metaclass=TypesEnumMeta):
         OPEN_PLAY = 87
         FREE_KICK = 62
@@ -673,6 +691,8 @@ class SHOT(EVENT):
 class INTERCEPTION(EVENT):
     """StatsBomb 10/Interception event."""
 
+    event_types = (EventType.INTERCEPTION,)
+
     class OUTCOME(Enum, metaclass=TypesEnumMeta):
         LOST = 1
         WON = 4
@@ -747,6 +767,8 @@ class INTERCEPTION(EVENT):
 class OWN_GOAL_AGAINST(EVENT):
     """StatsBomb 20/Own goal against event."""
 
+    event_types = (EventType.SHOT,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -761,6 +783,8 @@ class OWN_GOAL_AGAINST(EVENT):
 class OWN_GOAL_FOR(EVENT):
     """StatsBomb 25/Own goal for event."""
 
+    event_types = ()
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -770,6 +794,8 @@ class OWN_GOAL_FOR(EVENT):
 class CLEARANCE(EVENT):
     """StatsBomb 9/Clearance event."""
 
+    event_types = (EventType.CLEARANCE,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -789,6 +815,8 @@ class CLEARANCE(EVENT):
 class MISCONTROL(EVENT):
     """StatsBomb 38/Miscontrol event."""
 
+    event_types = (EventType.MISCONTROL,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -804,6 +832,8 @@ class MISCONTROL(EVENT):
 class DRIBBLE(EVENT):
     """StatsBomb 14/Dribble event."""
 
+    event_types = (EventType.TAKE_ON,)
+
     class OUTCOME(Enum, metaclass=TypesEnumMeta):
         COMPLETE = 8
         INCOMPLETE = 9
@@ -843,6 +873,8 @@ class DRIBBLE(EVENT):
 class CARRY(EVENT):
     """StatsBomb 43/Carry event."""
 
+    event_types = (EventType.CARRY,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -865,6 +897,8 @@ class CARRY(EVENT):
 class DUEL(EVENT):
     """StatsBomb 4/Duel event."""
 
+    event_types = (EventType.DUEL,)
+
     class TYPE(Enum, metaclass=TypesEnumMeta):
         AERIAL_LOST = 10
         TACKLE = 11
@@ -941,6 +975,8 @@ class DUEL(EVENT):
 class FIFTY_FIFTY(EVENT):
     """StatsBomb 33/Fifty-Fifty event."""
 
+    event_types = (EventType.DUEL,)
+
     class OUTCOME(Enum, metaclass=TypesEnumMeta):
         WON = 4
         LOST = 1
@@ -981,6 +1017,13 @@ class FIFTY_FIFTY(EVENT):
 class GOALKEEPER(EVENT):
     """StatsBomb 23/Goalkeeper event."""
 
+    event_types = (
+        EventType.GOALKEEPER,
+        EventType.RECOVERY,
+        EventType.CLEARANCE,
+        EventType.GENERIC,
+    )
+
     class TYPE(Enum, metaclass=TypesEnumMeta):
         COLLECTED = 25
         GOAL_CONCEDED = 26
@@ -1164,6 +1207,8 @@ class GOALKEEPER(EVENT):
 class SUBSTITUTION(EVENT):
     """StatsBomb 19/Substitution event."""
 
+    event_types = (EventType.SUBSTITUTION,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -1197,6 +1242,8 @@ class SUBSTITUTION(EVENT):
 class BAD_BEHAVIOUR(EVENT):
     """StatsBomb 24/Bad behaviour event."""
 
+    event_types = (EventType.CARD, EventType.GENERIC)
+
     class CARD(Enum, metaclass=TypesEnumMeta):
         FIRST_YELLOW = 7
         SECOND_YELLOW = 6
@@ -1228,6 +1275,8 @@ class BAD_BEHAVIOUR(EVENT):
 class FOUL_COMMITTED(EVENT):
     """StatsBomb 22/Foul committed event."""
 
+    event_types = (EventType.FOUL_COMMITTED, EventType.CARD)
+
     class CARD(Enum, metaclass=TypesEnumMeta):
         FIRST_YELLOW = 7
         SECOND_YELLOW = 6
@@ -1265,6 +1314,8 @@ class FOUL_COMMITTED(EVENT):
 class PLAYER_ON(EVENT):
     """StatsBomb 26/Player on event."""
 
+    event_types = (EventType.PLAYER_ON,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -1279,6 +1330,8 @@ class PLAYER_ON(EVENT):
 class PLAYER_OFF(EVENT):
     """StatsBomb 27/Player off event."""
 
+    event_types = (EventType.PLAYER_OFF,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -1293,6 +1346,8 @@ class PLAYER_OFF(EVENT):
 class BALL_RECOVERY(EVENT):
     """StatsBomb 2/Ball recovery event."""
 
+    event_types = (EventType.RECOVERY, EventType.DUEL)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -1319,6 +1374,8 @@ class BALL_RECOVERY(EVENT):
 class PRESSURE(EVENT):
     """StatsBomb 17/Pressure event."""
 
+    event_types = (EventType.PRESSURE,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
@@ -1338,6 +1395,8 @@ class PRESSURE(EVENT):
 class TACTICAL_SHIFT(EVENT):
     """StatsBomb 36/Tactical shift event."""
 
+    event_types = (EventType.FORMATION_CHANGE,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> list[Event]:
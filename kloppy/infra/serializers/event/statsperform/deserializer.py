@@ -17,6 +17,7 @@ from kloppy.domain import (
     DuelResult,
     DuelType,
     EventDataset,
+    EventType,
     ExpectedGoals,
     GoalkeeperActionType,
     GoalkeeperQualifier,
@@ -695,6 +696,47 @@ def _get_event_type_name(type_id: int) -> str:
     return event_type_names.get(type_id, "unknown")
 
 
+def _get_event_types(raw_event: OptaEvent) -> tuple[EventType, ...]:
+    """The types of the events a raw event is deserialized into."""
+    type_id = raw_event.type_id
+    if type_id in (EVENT_TYPE_PASS, EVENT_TYPE_OFFSIDE_PASS):
+        return (EventType.PASS,)
+    elif type_id == EVENT_TYPE_TAKE_ON:
+        return (EventType.TAKE_ON,)
+    elif type_id in (
+        EVENT_TYPE_SHOT_MISS,
+        EVENT_TYPE_SHOT_POST,
+        EVENT_TYPE_SHOT_SAVED,
+        EVENT_TYPE_SHOT_GOAL,
+    ):
+        return (EventType.SHOT,)
+    elif type_id == EVENT_TYPE_RECOVERY:
+        return (EventType.RECOVERY,)
+    elif type_id == EVENT_TYPE_CLEARANCE:
+        return (EventType.CLEARANCE,)
+    elif type_id in DUEL_EVENTS:
+        return (EventType.DUEL,)
+    elif type_id in (EVENT_TYPE_INTERCEPTION, EVENT_TYPE_BLOCKED_PASS):
+        return (EventType.INTERCEPTION,)
+    elif type_id in KEEPER_EVENTS:
+        if 94 in raw_event.qualifiers:
+            return (EventType.GENERIC,)
+        return (EventType.GOALKEEPER,)
+    elif type_id == EVENT_TYPE_BALL_TOUCH and raw_event.outcome == 0:
+        return (EventType.MISCONTROL,)
+    elif type_id == EVENT_TYPE_FOUL_COMMITTED and raw_event.outcome == 0:
+        return (EventType.FOUL_COMMITTED,)
+    elif type_id in BALL_OUT_EVENTS:
+        return (EventType.BALL_OUT,)
+    elif type_id == EVENT_TYPE_FORMATION_CHANGE:
+        return (EventType.FORMATION_CHANGE,)
+    elif type_id == EVENT_TYPE_PLAYER_OFF:
+        return (EventType.SUBSTITUTION,)
+    elif type_id == EVENT_TYPE_CARD:
+        return (EventType.CARD,)
+    return (EventType.GENERIC,)
+
+
 class StatsPerformInputs(NamedTuple):
     meta_data: IO[bytes]
     meta_feed: str
@@ -807,6 +849,11 @@ class StatsPerformDeserializer(EventDataDeserializer[StatsPerformInputs]):
                     else:
                         ball_state = BallState.ALIVE
 
+                    if not self.should_deserialize(
+                        *_get_event_types(raw_event)
+                    ):
+                        continue
+
                     generic_event_kwargs = dict(
                         # from DataRecord
                         period=period,
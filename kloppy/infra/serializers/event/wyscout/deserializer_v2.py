@@ -1,6 +1,5 @@
 from dataclasses import replace
 from datetime import timedelta
-import json
 import logging
 from typing import IO, NamedTuple, Optional
 
@@ -34,6 +33,7 @@ from kloppy.domain import (
     ShotResult,
     Team,
 )
+from kloppy.infra.serializers import json_stream
 from kloppy.utils import performance_logging
 
 from ..deserializer import EventDataDeserializer
@@ -456,6 +456,44 @@ def _players_to_dict(players: list[Player]):
     return {player.player_id: player for player in players}
 
 
+def _get_event_types(raw_event: dict) -> tuple[EventType, ...]:
+    """The types of the events a raw event is deserialized into."""
+    event_id = raw_event["eventId"]
+    if event_id == wyscout_events.SHOT.EVENT:
+        event_types = (EventType.SHOT,)
+    elif event_id == wyscout_events.PASS.EVENT:
+        event_types = (EventType.PASS,)
+    elif event_id == wyscout_events.FOUL.EVENT:
+        event_types = (EventType.FOUL_COMMITTED, EventType.CARD)
+    elif event_id == wyscout_events.INTERRUPTION.EVENT:
+        event_types = (EventType.BALL_OUT,)
+    elif event_id == wyscout_events.SAVE.EVENT:
+        event_types = (EventType.GOALKEEPER,)
+    elif event_id == wyscout_events.FREE_KICK.EVENT:
+        if raw_event["subEventId"] in wyscout_events.FREE_KICK.PASS_TYPES:
+            event_types = (EventType.PASS,)
+        elif raw_event["subEventId"] in wyscout_events.FREE_KICK.SHOT_TYPES:
+            event_types = (EventType.SHOT,)
+        else:
+            event_types = ()
+    elif event_id == wyscout_events.OTHERS_ON_BALL.EVENT:
+        event_types = (
+            EventType.CLEARANCE,
+            EventType.MISCONTROL,
+            EventType.RECOVERY,
+        )
+    elif event_id == wyscout_events.DUEL.EVENT:
+        event_types = (EventType.DUEL,)
+    elif event_id == wyscout_events.OFFSIDE.EVENT:
+        event_types = ()
+    else:
+        event_types = (EventType.GENERIC,)
+
+    if _has_tag(raw_event, wyscout_tags.INTERCEPTION):
+        event_types += (EventType.INTERCEPTION,)
+    return event_types
+
+
 class WyscoutInputs(NamedTuple):
     event_data: IO[bytes]
 
@@ -469,7 +507,7 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
         transformer = self.get_transformer()
 
         with performance_logging("load data", logger=logger):
-            raw_events = json.load(inputs.event_data)
+            raw_events = json_stream.load(inputs.event_data)
             for event in raw_events["events"]:
                 if "eventId" not in event:
                     event["eventId"] = event["eventName"]
@@ -525,6 +563,16 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                         + timedelta(seconds=raw_event["eventSec"]),
                     )
 
+                if not self.should_deserialize(*_get_event_types(raw_event)):
+                    # An interception duel replaces the previous (duel) event,
+                    # so that one has to be deserialized too
+                    if not (
+                        next_event
+                        and next_event["eventId"] == wyscout_events.DUEL.EVENT
+                        and _has_tag(next_event, wyscout_tags.INTERCEPTION)
+                    ):
+                        continue
+
                 generic_event_args = {
                     "event_id": str(raw_event["id"]),
                     "raw_event": raw_event,
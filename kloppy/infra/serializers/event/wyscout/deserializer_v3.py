@@ -1,7 +1,6 @@
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-import json
 import logging
 from typing import Optional
 import warnings
@@ -16,6 +15,7 @@ from kloppy.domain import (
     DuelResult,
     DuelType,
     EventDataset,
+    EventType,
     ExpectedGoals,
     FormationType,
     GoalkeeperActionType,
@@ -42,6 +42,7 @@ from kloppy.domain import (
     Team,
 )
 from kloppy.exceptions import DeserializationError, DeserializationWarning
+from kloppy.infra.serializers import json_stream
 from kloppy.utils import performance_logging
 
 from ..deserializer import EventDataDeserializer
@@ -699,6 +700,54 @@ def _players_to_dict(players: list[Player]):
     return {player.player_id: player for player in players}
 
 
+def _get_event_types(raw_event: dict) -> tuple[EventType, ...]:
+    """The types of the events a raw event is deserialized into."""
+    primary_event_type = raw_event["type"]["primary"]
+    secondary_event_types = raw_event["type"]["secondary"]
+    if primary_event_type in ("shot", "own_goal"):
+        return (EventType.SHOT,)
+    elif primary_event_type == "pass":
+        return (EventType.PASS,)
+    elif primary_event_type == "duel":
+        if "dribble" in secondary_event_types:
+            return (EventType.TAKE_ON,)
+        return (EventType.DUEL,)
+    elif primary_event_type == "clearance":
+        return (EventType.CLEARANCE,)
+    elif primary_event_type == "interception":
+        return (EventType.INTERCEPTION,)
+    elif (
+        primary_event_type == "shot_against" and "save" in secondary_event_types
+    ):
+        return (EventType.GOALKEEPER,)
+    elif (
+        primary_event_type in ("throw_in", "goal_kick")
+        or (
+            primary_event_type == "free_kick"
+            and "free_kick_shot" not in secondary_event_types
+        )
+        or (
+            primary_event_type == "corner"
+            and "shot" not in secondary_event_types
+        )
+    ):
+        return (EventType.PASS,)
+    elif primary_event_type in ("penalty", "free_kick", "corner"):
+        return (EventType.SHOT,)
+    elif primary_event_type == "infraction":
+        if "foul" in secondary_event_types:
+            return (EventType.FOUL_COMMITTED,)
+        if (
+            "yellow_card" in secondary_event_types
+            or "red_card" in secondary_event_types
+        ):
+            return (EventType.CARD,)
+        return ()
+    elif "carry" in secondary_event_types:
+        return (EventType.CARRY,)
+    return (EventType.GENERIC,)
+
+
 def _parse_period_id(raw_period: str) -> int:
     if "H" in raw_period:
         period_id = int(raw_period.replace("H", ""))
@@ -763,7 +812,7 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
         transformer = self.get_transformer()
 
         with performance_logging("load data", logger=logger):
-            raw_events = json.load(inputs.event_data)
+            raw_events = json_stream.load(inputs.event_data)
             for event in raw_events["events"]:
                 if "id" not in event:
                     event["id"] = event["type"]["primary"]
@@ -874,7 +923,15 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
 
                 primary_event_type = raw_event["type"]["primary"]
                 secondary_event_types = raw_event["type"]["secondary"]
-                if (
+                event_types = _get_event_types(raw_event)
+                if not self.should_deserialize(*event_types):
+                    event = None
+                    if primary_event_type == "pass":
+                        next_pass_is_kickoff = False
+                    elif primary_event_type == "infraction" and event_types:
+                        # Fouls and cards don't add formation changes
+                        continue
+                elif (
                     primary_event_type == "shot"
                     or primary_event_type == "own_goal"
                 ):
@@ -0,0 +1,250 @@
+"""Incremental JSON parsing for large feeds.
+
+`iter_items` yields the elements of a JSON array one at a time, so the
+deserializers can build events while the feed is read instead of first
+materializing the complete document. It also reads JSON Lines files, in
+which every line is one element.
+
+When [ijson](https://pypi.org/project/ijson/) is installed, it is used to
+stream the arrays. When [orjson](https://pypi.org/project/orjson/) is
+installed, it is used to parse complete documents and JSON Lines. Both are
+optional: the standard library `json` module is used otherwise.
+"""
+
+import codecs
+from collections.abc import Iterator
+import json
+import re
+from typing import IO, Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+
+_decoder = json.JSONDecoder()
+
+# A field with a scalar value, followed by a comma or the end of the object
+_FIELD = re.compile(
+    rb'\s*"((?:[^"\\]|\\.)*)"\s*:\s*'
+    rb'("(?:[^"\\]|\\.)*"|true|false|null|-?[0-9][0-9.eE+-]*)'
+    rb"\s*(?:,|(?=\}))"
+)
+
+
+def loads(data: bytes) -> Any:
+    """Parse a complete JSON document."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the json module (e.g. NaN values)
+            pass
+    return json.loads(data)
+
+
+def load(fp: IO[bytes]) -> Any:
+    """Parse a complete JSON document from a binary stream."""
+    return loads(fp.read())
+
+
+def loads_prefix(
+    line: bytes, keys: Optional[tuple[str, ...]] = None
+) -> dict[str, Any]:
+    """Parse the leading scalar fields of a JSON object on a single line.
+
+    Parsing stops at the first field with an object or array value, or as
+    soon as all `keys` are found. This is much cheaper than parsing the full
+    line when the needed fields (e.g. the frame id and period of a tracking
+    frame) come first. Callers should fall back to parsing the full line when
+    a key is missing from the result.
+    """
+    fields: dict[str, Any] = {}
+    pos = line.find(b"{") + 1
+    if not pos:
+        return fields
+
+    remaining = len(keys) if keys is not None else -1
+    while remaining:
+        match = _FIELD.match(line, pos)
+        if match is None:
+            break
+        key = match.group(1).decode()
+        if keys is None or key in keys:
+            fields[key] = json.loads(match.group(2))
+            remaining -= 1
+        pos = match.end()
+    return fields
+
+
+class _Chained:
+    """A binary stream that returns `head` before the rest of `fp`."""
+
+    def __init__(self, head: bytes, fp: IO[bytes]):
+        self.head = head
+        self.fp = fp
+
+    def read(self, size: int = -1) -> bytes:
+        if not self.head:
+            return self.fp.read(size)
+        if size < 0:
+            data, self.head = self.head + self.fp.read(), b""
+        else:
+            data, self.head = self.head[:size], self.head[size:]
+        return data
+
+
+class _Scanner:
+    """Decode JSON values one by one from a binary stream."""
+
+    def __init__(self, fp: IO[bytes]):
+        self.fp = fp
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int = _CHUNK_SIZE) -> bool:
+        if self.eof:
+            return False
+        data = self.fp.read(size)
+        if not data:
+            self.eof = True
+            self.buffer = self.buffer[self.pos :] + self.decoder.decode(
+                b"", final=True
+            )
+        else:
+            self.buffer = self.buffer[self.pos :] + self.decoder.decode(data)
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ("" at the end)."""
+        while True:
+            while (
+                self.pos < len(self.buffer)
+                and self.buffer[self.pos] in _WHITESPACE
+            ):
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                f"Invalid JSON: expected one of {chars!r}, found {char!r}"
+            )
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        size = _CHUNK_SIZE
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # The value is incomplete, read more of it
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            if end == len(self.buffer) and self._fill(size):
+                # A number or literal might continue in the next chunk
+                size *= 2
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(scanner: _Scanner) -> Iterator[Any]:
+    scanner.expect("[")
+    if scanner.peek() == "]":
+        return
+    while True:
+        yield scanner.value()
+        if scanner.expect(",]") == "]":
+            return
+
+
+class _LineReader:
+    """Iterate over the lines of a stream that only supports `read`."""
+
+    def __init__(self, stream: _Chained):
+        self.stream = stream
+
+    def __iter__(self) -> Iterator[bytes]:
+        rest = b""
+        while chunk := self.stream.read(_CHUNK_SIZE):
+            lines = (rest + chunk).split(b"\n")
+            rest = lines.pop()
+            yield from lines
+        if rest:
+            yield rest
+
+
+def _iter_lines(fp: IO[bytes]) -> Iterator[Any]:
+    for line in fp:
+        line = line.strip()
+        if line:
+            yield loads(line)
+
+
+def iter_items(fp: IO[bytes], key: Optional[str] = None) -> Iterator[Any]:
+    """
+    Iterate over the elements of a JSON array without loading all of them.
+
+    Args:
+        fp: A binary stream with a JSON document or JSON Lines.
+        key: When given, the document should be an object and the elements
+            of the array under this key are yielded. Otherwise, the document
+            should be an array or JSON Lines.
+
+    Yields:
+        The parsed elements.
+
+    Raises:
+        ValueError: If the document does not have the expected structure.
+    """
+    head = fp.read(_CHUNK_SIZE)
+    stripped = head.lstrip(codecs.BOM_UTF8 + _WHITESPACE.encode())
+    first = stripped[:1]
+    stream = _Chained(head, fp)
+
+    if key is None and first == b"{":
+        yield from _iter_lines(_LineReader(stream))
+        return
+
+    if ijson is not None:
+        prefix = "item" if key is None else f"{key}.item"
+        yield from ijson.items(stream, prefix, use_float=True)
+        return
+
+    scanner = _Scanner(stream)
+    if key is None:
+        yield from _iter_array(scanner)
+        return
+
+    scanner.expect("{")
+    if scanner.peek() != "}":
+        while True:
+            name = scanner.value()
+            scanner.expect(":")
+            if name == key:
+                yield from _iter_array(scanner)
+                return
+            scanner.value()
+            if scanner.expect(",}") == "}":
+                break
+    raise ValueError(f"Invalid JSON: key {key!r} not found")
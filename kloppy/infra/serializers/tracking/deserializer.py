@@ -1,23 +1,69 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, TypeVar, Union
+from collections.abc import Iterable, Iterator
+from io import BytesIO
+import os
+from typing import IO, Callable, Generic, Optional, TypeVar, Union
+import warnings
 
 from kloppy.domain import (
+    AttackingDirection,
     DatasetTransformer,
     DatasetTransformerBuilder,
     DatasetType,
+    Frame,
+    Orientation,
     Provider,
     TrackingDataset,
+    TrackingDataStream,
+    attacking_direction_from_frame,
+)
+
+from .frame_index import (
+    FrameIndex,
+    FrameKey,
+    FrameRange,
+    TimeRange,
+    get_frame_index,
+    validate_ranges,
 )
 
 T = TypeVar("T")
 
 
+class FrameSampler:
+    """
+    Decide which raw frames to parse, based on the sample rate.
+
+    Parsing a raw frame is by far the most expensive step of loading tracking
+    data. Deserializers call `keep` once for every raw frame that passes
+    their own filters (e.g. `only_alive`), using only the cheapest fields of
+    the raw frame such as the frame id or period, and only parse the frames
+    for which it returns `True`.
+
+    Args:
+        sample_rate: The fraction of the frames to keep.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        self.sample = 1.0 / sample_rate
+        self.n = 0
+
+    def keep(self) -> bool:
+        """Register the next frame and return whether it should be parsed."""
+        keep = self.n % self.sample == 0
+        self.n += 1
+        return keep
+
+
 class TrackingDataDeserializer(ABC, Generic[T]):
     def __init__(
         self,
         limit: Optional[int] = None,
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
+        frame_range: Optional[FrameRange] = None,
+        time_range: Optional[TimeRange] = None,
+        frame_index: Optional[Union[FrameIndex, str, os.PathLike]] = None,
     ):
         if not limit:
             limit = 0
@@ -27,6 +73,11 @@ class TrackingDataDeserializer(ABC, Generic[T]):
             sample_rate = 1.0
         self.sample_rate = sample_rate
 
+        validate_ranges(frame_range, time_range)
+        self.frame_range = frame_range
+        self.time_range = time_range
+        self.frame_index = frame_index
+
         self.transformer_builder = DatasetTransformerBuilder(coordinate_system)
 
     def get_transformer(
@@ -50,3 +101,95 @@ class TrackingDataDeserializer(ABC, Generic[T]):
     @abstractmethod
     def deserialize(self, inputs: T) -> TrackingDataset:
         raise NotImplementedError
+
+    def select_raw_data(
+        self,
+        raw_data: IO[bytes],
+        parse_line: Callable[[bytes], Optional[FrameKey]],
+    ) -> tuple[IO[bytes], Optional[IO[bytes]]]:
+        """Select the lines of the frames in `frame_range` and `time_range`.
+
+        The byte offsets of the frames are looked up in the frame index,
+        which is built (and stored in the sidecar file) when needed. Only the
+        selected lines are read from the raw data. The loaders open
+        uncompressed local files directly when a range is set (see
+        [`open_as_seekable_file`][kloppy.io.open_as_seekable_file]), so the
+        other lines are not read from disk. Other inputs (e.g. compressed or
+        remote files) are already read into memory by `open_as_file`; for
+        these, only parsing the other lines is skipped.
+
+        Returns:
+            The selected raw data and the line of the first frame of the
+            first period, from which the orientation can be determined when
+            the selection does not contain it. When no range is set, the raw
+            data is returned as-is.
+        """
+        if self.frame_range is None and self.time_range is None:
+            return raw_data, None
+
+        if not raw_data.seekable():
+            raw_data = BytesIO(raw_data.read())
+
+        frame_index = get_frame_index(raw_data, parse_line, self.frame_index)
+        start, end = frame_index.select(self.frame_range, self.time_range)
+        return (
+            frame_index.read(raw_data, start, end),
+            frame_index.read_period_start(raw_data, 1),
+        )
+
+    def deserialize_stream(self, inputs: T) -> TrackingDataStream:
+        """Deserialize the inputs into a stream of frames.
+
+        Deserializers that can parse the raw data incrementally override
+        this method. By default, all frames are loaded first.
+        """
+        dataset = self.deserialize(inputs)
+        return TrackingDataStream(
+            metadata=dataset.metadata, frames=dataset.records
+        )
+
+
+def _orientation_from_frame(frame: Frame) -> Orientation:
+    return (
+        Orientation.HOME_AWAY
+        if attacking_direction_from_frame(frame) == AttackingDirection.LTR
+        else Orientation.AWAY_HOME
+    )
+
+
+def peek_orientation(
+    frames: Iterable[Frame],
+    reference_frames: Optional[Iterable[Frame]] = None,
+) -> tuple[Orientation, Iterator[Frame]]:
+    """Determine the orientation from the first frame of the first period.
+
+    Frames are only consumed up to the first frame of the first period. The
+    returned iterator yields all frames, including the consumed ones. When
+    the frames do not contain the first period (e.g., a slice of the match),
+    the first frame of the first period in `reference_frames` is used.
+    """
+    frames = iter(frames)
+    buffer = []
+    for frame in frames:
+        buffer.append(frame)
+        if frame.period.id == 1:
+            orientation = _orientation_from_frame(frame)
+            break
+    else:
+        reference_frame = next(
+            (frame for frame in reference_frames or () if frame.period.id == 1),
+            None,
+        )
+        if reference_frame is not None:
+            orientation = _orientation_from_frame(reference_frame)
+        else:
+            warnings.warn(
+                "Could not determine orientation of dataset, defaulting to NOT_SET"
+            )
+            orientation = Orientation.NOT_SET
+
+    def _iter():
+        yield from buffer
+        yield from frames
+
+    return orientation, _iter()
@@ -0,0 +1,252 @@
+"""An index of the byte offsets of the frames in line-based raw tracking data.
+
+Several providers store one frame per line (TRACAB .dat, SecondSpectrum
+JSONL, Stats Perform MA25). The index maps the frame id and the
+(period, timestamp) of every frame to the byte offset of its line, which
+allows reading only the lines of a slice of the match instead of parsing the
+whole file. The index can be stored in a sidecar file next to the raw data,
+such that it only has to be built once.
+
+Examples:
+    >>> from kloppy import tracab
+    >>> dataset = tracab.load(
+    ...     meta_data="meta.xml",
+    ...     raw_data="raw.dat",
+    ...     time_range=(event.time - timedelta(seconds=5), event.time + timedelta(seconds=5)),
+    ...     frame_index="raw.dat.index.json",
+    ... )
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from io import BytesIO
+import json
+import logging
+import os
+from typing import IO, Callable, Optional, Union
+
+from kloppy.domain import Time
+from kloppy.exceptions import KloppyParameterError
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+FrameKey = tuple[int, int, float]
+"""The frame id, period id and timestamp (in seconds) of a frame."""
+
+FrameRange = tuple[Optional[int], Optional[int]]
+TimeRange = tuple[Optional[Time], Optional[Time]]
+
+
+@dataclass
+class FrameIndex:
+    """
+    The byte offsets of the frames in a line-based raw data file.
+
+    The frames are expected to be stored in chronological order, which is the
+    case for all supported formats.
+
+    Attributes:
+        frame_ids: The id of each frame.
+        period_ids: The id of the period of each frame.
+        timestamps: The time elapsed since the start of the period of each
+            frame (in seconds).
+        offsets: The byte offset of the line of each frame.
+        size: The size of the indexed file (in bytes).
+    """
+
+    frame_ids: list[int]
+    period_ids: list[int]
+    timestamps: list[float]
+    offsets: list[int]
+    size: int
+
+    _times: Optional[list[tuple[int, float]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def build(
+        cls,
+        feed: IO[bytes],
+        parse_line: Callable[[bytes], Optional[FrameKey]],
+    ) -> "FrameIndex":
+        """
+        Build the index by reading all lines of a raw data file.
+
+        Args:
+            feed: The raw data.
+            parse_line: Returns the key of the frame on a line, or `None` for
+                lines without a frame. Only the cheap-to-parse fields of a line
+                should be decoded.
+        """
+        frame_ids, period_ids, timestamps, offsets = [], [], [], []
+
+        feed.seek(0)
+        offset = 0
+        for line in feed:
+            key = parse_line(line)
+            if key is not None:
+                frame_id, period_id, timestamp = key
+                frame_ids.append(frame_id)
+                period_ids.append(period_id)
+                timestamps.append(timestamp)
+                offsets.append(offset)
+            offset += len(line)
+        feed.seek(0)
+
+        return cls(
+            frame_ids=frame_ids,
+            period_ids=period_ids,
+            timestamps=timestamps,
+            offsets=offsets,
+            size=offset,
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "FrameIndex":
+        """Read an index from a sidecar file."""
+        with open(path) as fp:
+            data = json.load(fp)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported frame index version: {data.get('version')}"
+            )
+        return cls(
+            frame_ids=data["frame_ids"],
+            period_ids=data["period_ids"],
+            timestamps=data["timestamps"],
+            offsets=data["offsets"],
+            size=data["size"],
+        )
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Write the index to a sidecar file."""
+        with open(path, "w") as fp:
+            json.dump(
+                {
+                    "version": FORMAT_VERSION,
+                    "size": self.size,
+                    "frame_ids": self.frame_ids,
+                    "period_ids": self.period_ids,
+                    "timestamps": self.timestamps,
+                    "offsets": self.offsets,
+                },
+                fp,
+                separators=(",", ":"),
+            )
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def _time_position(self, time: Time, bisect: Callable) -> int:
+        if self._times is None:
+            self._times = list(zip(self.period_ids, self.timestamps))
+        return bisect(
+            self._times, (time.period.id, time.timestamp.total_seconds())
+        )
+
+    def select(
+        self,
+        frame_range: Optional[FrameRange] = None,
+        time_range: Optional[TimeRange] = None,
+    ) -> tuple[int, int]:
+        """
+        Find the frames within the given ranges.
+
+        Both ranges include their bounds. A bound can be `None` to leave the
+        range open on that side. When both ranges are given, the frames must
+        be in both.
+
+        Returns:
+            The position of the first selected frame and the position after
+            the last selected frame.
+        """
+        start, end = 0, len(self)
+        if frame_range is not None:
+            first, last = frame_range
+            if first is not None:
+                start = max(start, bisect_left(self.frame_ids, first))
+            if last is not None:
+                end = min(end, bisect_right(self.frame_ids, last))
+        if time_range is not None:
+            first, last = time_range
+            if first is not None:
+                start = max(start, self._time_position(first, bisect_left))
+            if last is not None:
+                end = min(end, self._time_position(last, bisect_right))
+        return start, max(start, end)
+
+    def read(self, feed: IO[bytes], start: int, end: int) -> IO[bytes]:
+        """Read the lines of the frames at positions `start` up to `end`."""
+        if start >= end:
+            return BytesIO()
+
+        begin = self.offsets[start]
+        stop = self.offsets[end] if end < len(self) else self.size
+        feed.seek(begin)
+        return BytesIO(feed.read(stop - begin))
+
+    def read_period_start(self, feed: IO[bytes], period_id: int) -> IO[bytes]:
+        """Read the line of the first frame of a period."""
+        start = bisect_left(self.period_ids, period_id)
+        if start == len(self) or self.period_ids[start] != period_id:
+            return BytesIO()
+        return self.read(feed, start, start + 1)
+
+
+def _feed_size(feed: IO[bytes]) -> int:
+    position = feed.tell()
+    size = feed.seek(0, os.SEEK_END)
+    feed.seek(position)
+    return size
+
+
+def get_frame_index(
+    feed: IO[bytes],
+    parse_line: Callable[[bytes], Optional[FrameKey]],
+    frame_index: Optional[Union[FrameIndex, str, os.PathLike]] = None,
+) -> FrameIndex:
+    """
+    Get the index of a raw data file.
+
+    Args:
+        feed: The raw data. It must be seekable.
+        parse_line: Returns the key of the frame on a line. See
+            [`FrameIndex.build`][kloppy.infra.serializers.tracking.frame_index.FrameIndex.build].
+        frame_index: A prebuilt index or the path of a sidecar file. The
+            sidecar file is (re)built when it does not exist or does not
+            match the size of the raw data.
+    """
+    if isinstance(frame_index, FrameIndex):
+        return frame_index
+
+    size = _feed_size(feed)
+    if frame_index is not None and os.path.exists(frame_index):
+        try:
+            index = FrameIndex.load(frame_index)
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring invalid frame index {frame_index}: {e}")
+        else:
+            if index.size == size:
+                return index
+            logger.info(f"Frame index {frame_index} is outdated, rebuilding")
+
+    index = FrameIndex.build(feed, parse_line)
+    if frame_index is not None:
+        index.save(frame_index)
+    return index
+
+
+def validate_ranges(
+    frame_range: Optional[FrameRange], time_range: Optional[TimeRange]
+) -> None:
+    for name, range_ in (
+        ("frame_range", frame_range),
+        ("time_range", time_range),
+    ):
+        if range_ is not None and len(range_) != 2:
+            raise KloppyParameterError(
+                f"{name} should be a (start, end) tuple, got {range_!r}"
+            )
@@ -1,7 +1,12 @@
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from datetime import datetime, timedelta, timezone
 from itertools import zip_longest
-import json
 import logging
 import re
 from typing import (
@@ -32,6 +37,7 @@ from kloppy.domain import (
     attacking_direction_from_frame,
 )
 from kloppy.exceptions import DeserializationError
+from kloppy.infra.serializers import json_stream
 from kloppy.io import FileLike, get_file_extension, open_as_file
 from kloppy.utils import performance_logging
 
@@ -50,6 +56,7 @@ class HawkEyeInputs(NamedTuple):
     player_centroid_feeds: Iterable[FileLike]
     meta_data: Optional[FileLike] = None
     show_progress: Optional[bool] = False
+    workers: Optional[int] = 1
 
 
 class HawkEyeObjectIdentifier:
@@ -70,6 +77,135 @@ class HawkEyeObjectIdentifier:
         return object_id
 
 
+class _MinuteFeed(NamedTuple):
+    """The decoded ball and player feeds of one minute.
+
+    Only the values that are used by the deserializer are kept, as plain
+    tuples, such that they can be sent cheaply between processes.
+    """
+
+    object_id: str
+    match_id: Any
+    teams: list[dict[str, Any]]
+    players: list[dict[str, Any]]
+    segments: list[dict[str, Any]]
+    period_id: int
+    minute: int
+    player_period_id: int
+    player_minute: int
+    # (time, x, y, z, speed) per ball detection
+    ball: list[tuple[float, float, float, float, float]]
+    # (player id, [(time, x, y, distance, speed), ...]) per player
+    players_centroids: list[
+        tuple[str, list[tuple[float, float, float, float, float]]]
+    ]
+
+
+def _read_feeds(
+    ball_feed: FileLike, player_centroid_feed: FileLike
+) -> tuple[bytes, bytes]:
+    with open_as_file(ball_feed) as ball_data_fp:
+        ball_data = ball_data_fp.read()
+    with open_as_file(player_centroid_feed) as player_centroid_data_fp:
+        player_centroid_data = player_centroid_data_fp.read()
+    return ball_data, player_centroid_data
+
+
+def _decode_feeds(ball_data: bytes, player_centroid_data: bytes) -> _MinuteFeed:
+    ball_tracking_data = json_stream.loads(ball_data)
+    player_tracking_data = json_stream.loads(player_centroid_data)
+
+    object_id = HawkEyeObjectIdentifier.get_identifier_variable(
+        player_tracking_data
+    )
+    return _MinuteFeed(
+        object_id=object_id,
+        match_id=ball_tracking_data["details"]["match"]["id"][object_id],
+        teams=ball_tracking_data["details"]["teams"],
+        players=player_tracking_data["details"]["players"],
+        segments=ball_tracking_data["segments"],
+        period_id=ball_tracking_data["sequences"]["segment"],
+        minute=ball_tracking_data["sequences"]["match-minute"] - 1,
+        player_period_id=player_tracking_data["sequences"]["segment"],
+        player_minute=player_tracking_data["sequences"]["match-minute"] - 1,
+        ball=[
+            (
+                detection["time"],
+                detection["pos"][0],
+                detection["pos"][1],
+                detection["pos"][2],
+                detection["speed"]["mps"],
+            )
+            for detection in ball_tracking_data["samples"]["ball"]
+        ],
+        players_centroids=[
+            (
+                detection["personId"][object_id],
+                [
+                    (
+                        centroid["time"],
+                        centroid["pos"][0],
+                        centroid["pos"][1],
+                        centroid["distance"]["metres"],
+                        centroid["speed"]["mps"],
+                    )
+                    for centroid in detection["centroid"]
+                ],
+            )
+            for detection in player_tracking_data["samples"]["people"]
+            if detection["role"]["name"] in ["Outfielder", "Goalkeeper"]
+        ],
+    )
+
+
+def _fetch_and_decode(
+    ball_feed: FileLike,
+    player_centroid_feed: FileLike,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> _MinuteFeed:
+    feeds = _read_feeds(ball_feed, player_centroid_feed)
+    if pool is None:
+        return _decode_feeds(*feeds)
+    return pool.submit(_decode_feeds, *feeds).result()
+
+
+def _iter_minute_feeds(
+    feeds: list[tuple[FileLike, FileLike]], workers: int
+) -> Iterator[_MinuteFeed]:
+    """Fetch and decode the feeds concurrently, in the order of `feeds`.
+
+    The feeds are read in a pool of threads, such that the (remote) files
+    are fetched concurrently, and decoded in a pool of processes. At most
+    two feeds per worker are processed ahead of the feed that is yielded
+    next.
+    """
+    if workers == 1 or len(feeds) <= 1:
+        for ball_feed, player_centroid_feed in feeds:
+            yield _fetch_and_decode(ball_feed, player_centroid_feed)
+        return
+
+    window = 2 * workers
+    with (
+        ProcessPoolExecutor(max_workers=min(workers, len(feeds))) as pool,
+        ThreadPoolExecutor(max_workers=min(window, len(feeds))) as io_pool,
+    ):
+        pending: deque[Future] = deque()
+        submitted = 0
+        try:
+            for _ in range(len(feeds)):
+                while submitted < len(feeds) and len(pending) < window:
+                    pending.append(
+                        io_pool.submit(
+                            _fetch_and_decode, *feeds[submitted], pool
+                        )
+                    )
+                    submitted += 1
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
     def __init__(
         self,
@@ -137,12 +273,12 @@ class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
         return parsed_players
 
     @staticmethod
-    def __infer_frame_rate(ball_tracking_data, n_samples=25):
+    def __infer_frame_rate(ball_detections, n_samples=25):
         total_time_difference = 0
 
-        for i in range(len(ball_tracking_data["samples"]["ball"]) - 1):
-            current_time = ball_tracking_data["samples"]["ball"][i]["time"]
-            next_time = ball_tracking_data["samples"]["ball"][i + 1]["time"]
+        for i in range(len(ball_detections) - 1):
+            current_time = ball_detections[i][0]
+            next_time = ball_detections[i + 1][0]
 
             time_difference = next_time - current_time
             total_time_difference += time_difference
@@ -154,7 +290,7 @@ class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
 
     def __parse_meta_data_json(self, meta_data):
         with open_as_file(meta_data) as meta_data_fp:
-            meta_data = json.load(meta_data_fp)
+            meta_data = json_stream.load(meta_data_fp)
 
         kick_off_time = meta_data.get("KickOffTime")
         match_day = re.search(r"\d+", meta_data.get("MatchDay"))
@@ -241,62 +377,49 @@ class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
         parsed_teams = {}
         parsed_players = {}
         parsed_periods = {}
-        parsed_periods = {}
         parsed_frames = {}
         frame_rate = None
 
-        it = list(zip_longest(inputs.ball_feeds, inputs.player_centroid_feeds))
+        feeds = list(
+            zip_longest(inputs.ball_feeds, inputs.player_centroid_feeds)
+        )
+        it = _iter_minute_feeds(feeds, workers=inputs.workers or 1)
         if inputs.show_progress:
             if tqdm is None:
                 warnings.warn(
                     "tqdm not installed, progress bar will not be shown"
                 )
             else:
-                it = tqdm.tqdm(it)
+                it = tqdm.tqdm(it, total=len(feeds))
 
-        for ball_feed, player_centroid_feed in it:
-            # Read the ball and player tracking data feeds.
-            with open_as_file(ball_feed) as ball_data_fp:
-                ball_tracking_data = json.load(ball_data_fp)
-            with open_as_file(player_centroid_feed) as player_centroid_data_fp:
-                player_tracking_data = json.load(player_centroid_data_fp)
-
-            self.object_id = HawkEyeObjectIdentifier.get_identifier_variable(
-                player_tracking_data
-            )
+        for minute_feed in it:
+            self.object_id = minute_feed.object_id
 
             if frame_rate is None:
-                frame_rate = self.__infer_frame_rate(ball_tracking_data)
+                frame_rate = self.__infer_frame_rate(minute_feed.ball)
 
             if not self._game_id:
-                self._game_id = ball_tracking_data["details"]["match"]["id"][
-                    self.object_id
-                ]
+                self._game_id = minute_feed.match_id
 
             # Parse the teams, players and periods. A value can be added by
             # later feeds, but we will not overwrite existing values.
             with performance_logging("Parsing meta data", logger=logger):
-                parsed_teams = {
-                    **self.__parse_teams(
-                        ball_tracking_data["details"]["teams"]
-                    ),
-                    **parsed_teams,
-                }
-                parsed_players = {
-                    **self.__parse_players(
-                        player_tracking_data["details"]["players"],
-                        parsed_teams,
-                    ),
-                    **parsed_players,
-                }
-                parsed_periods = {
-                    **self.__parse_periods(ball_tracking_data["segments"]),
-                    **parsed_periods,
-                }
+                for team_id, team in self.__parse_teams(
+                    minute_feed.teams
+                ).items():
+                    parsed_teams.setdefault(team_id, team)
+                for player_id, player in self.__parse_players(
+                    minute_feed.players, parsed_teams
+                ).items():
+                    parsed_players.setdefault(player_id, player)
+                for period_id, period in self.__parse_periods(
+                    minute_feed.segments
+                ).items():
+                    parsed_periods.setdefault(period_id, period)
 
             # Parse the ball tracking data
-            period_id = ball_tracking_data["sequences"]["segment"]
-            minute = ball_tracking_data["sequences"]["match-minute"] - 1
+            period_id = minute_feed.period_id
+            minute = minute_feed.minute
 
             period_minute = (
                 minute
@@ -313,21 +436,15 @@ class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
             with performance_logging(
                 "Parsing ball tracking data", logger=logger
             ):
-                for detection in ball_tracking_data["samples"]["ball"]:
-                    frame_id = int(
-                        (minute * 60 + float(detection["time"])) * frame_rate
-                    )
+                for time, x, y, z, speed in minute_feed.ball:
+                    frame_id = int((minute * 60 + float(time)) * frame_rate)
                     parsed_frames[frame_id] = Frame(
                         frame_id=frame_id,
                         timestamp=timedelta(
-                            minutes=period_minute, seconds=detection["time"]
+                            minutes=period_minute, seconds=time
                         ),
-                        ball_coordinates=Point3D(
-                            x=detection["pos"][0],
-                            y=detection["pos"][1],
-                            z=detection["pos"][2],
-                        ),
-                        ball_speed=detection["speed"]["mps"],
+                        ball_coordinates=Point3D(x=x, y=y, z=z),
+                        ball_speed=speed,
                         ball_state=None,
                         ball_owning_team=None,
                         players_data={},
@@ -337,36 +454,24 @@ class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
                     )
 
             # Parse the player tracking data
-            _period_id = player_tracking_data["sequences"]["segment"]
-            _minute = player_tracking_data["sequences"]["match-minute"] - 1
-
-            if _period_id != period_id or _minute != minute:
+            if (
+                minute_feed.player_period_id != period_id
+                or minute_feed.player_minute != minute
+            ):
                 raise DeserializationError(
                     "The feed for ball tracking and player tracking are not in sync"
                 )
             with performance_logging(
                 "Parsing player tracking data", logger=logger
             ):
-                for detection in player_tracking_data["samples"]["people"]:
-                    if detection["role"]["name"] not in [
-                        "Outfielder",
-                        "Goalkeeper",
-                    ]:
-                        continue
-                    player = parsed_players[
-                        detection["personId"][self.object_id]
-                    ]
-                    for centroid in detection["centroid"]:
-                        frame_id = int(
-                            (minute * 60 + centroid["time"]) * frame_rate
-                        )
+                for player_id, centroids in minute_feed.players_centroids:
+                    player = parsed_players[player_id]
+                    for time, x, y, distance, speed in centroids:
+                        frame_id = int((minute * 60 + time) * frame_rate)
                         player_data = PlayerData(
-                            coordinates=Point(
-                                x=centroid["pos"][0],
-                                y=centroid["pos"][1],
-                            ),
-                            distance=centroid["distance"]["metres"],
-                            speed=centroid["speed"]["mps"],
+                            coordinates=Point(x=x, y=y),
+                            distance=distance,
+                            speed=speed,
                         )
                         if frame_id in parsed_frames:
                             parsed_frames[frame_id].players_data[player] = (
@@ -377,7 +482,7 @@ class HawkEyeDeserializer(TrackingDataDeserializer[HawkEyeInputs]):
                                 frame_id=frame_id,
                                 timestamp=timedelta(
                                     minutes=period_minute,
-                                    seconds=centroid["time"],
+                                    seconds=time,
                                 ),
                                 ball_coordinates=Point3D(
                                     float("nan"), float("nan"), float("nan")
@@ -2,6 +2,7 @@ from collections import defaultdict
 from datetime import timedelta, timezone
 import json
 import logging
+import re
 from typing import IO, NamedTuple, Optional, Union
 
 from dateutil.parser import parse
@@ -26,13 +27,18 @@ from kloppy.domain import (
 from kloppy.domain.services import attacking_direction_from_frame
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.exceptions import DeserializationError
+from kloppy.infra.serializers.json_stream import loads_prefix
 from kloppy.infra.serializers.tracking.deserializer import (
+    FrameSampler,
     TrackingDataDeserializer,
 )
 from kloppy.utils import performance_logging
 
 logger = logging.getLogger(__name__)
 
+_FRAME_KEYS = ("frameNum", "period")
+_NO_GAME_EVENT = re.compile(rb'"game_event"\s*:\s*null')
+
 
 position_types_mapping: dict[str, PositionType] = {
     "CB": PositionType.CenterBack,
@@ -191,6 +197,14 @@ class PFF_TrackingDeserializer(TrackingDataDeserializer[PFF_TrackingInputs]):
             other_data={},
         )
 
+    @staticmethod
+    def _parse_frame_key(raw_frame: bytes) -> dict:
+        """Decode the frame number and period from the start of a line."""
+        frame = loads_prefix(raw_frame, _FRAME_KEYS)
+        if len(frame) < len(_FRAME_KEYS):
+            frame = json.loads(raw_frame)
+        return frame
+
     @classmethod
     def __get_periods(cls, tracking, frame_rate):
         """Gets the Periods contained in the tracking data"""
@@ -198,7 +212,7 @@ class PFF_TrackingDeserializer(TrackingDataDeserializer[PFF_TrackingInputs]):
         frames_by_period = defaultdict(list)
 
         for raw_frame in tracking:
-            frame = json.loads(raw_frame)
+            frame = cls._parse_frame_key(raw_frame)
             if frame["period"] is not None:
                 frames_by_period[frame["period"]].append(frame)
 
@@ -307,17 +321,24 @@ class PFF_TrackingDeserializer(TrackingDataDeserializer[PFF_TrackingInputs]):
         with performance_logging("Loading data", logger=logger):
 
             def _iter():
-                sample = 1.0 / self.sample_rate
-
-                n = 0
+                sampler = FrameSampler(self.sample_rate)
 
                 for raw_frame in raw_data:
-                    frame = json.loads(raw_frame)
-                    # Identify Period
-                    frame_period = frame.get("period")
-
-                    # Find ball owning team
-                    game_event = frame.get("game_event")
+                    # Only lines with a game event change the ball state, the
+                    # other lines are only decoded when they are sampled
+                    if _NO_GAME_EVENT.search(raw_frame):
+                        frame = None
+                        frame_period = self._parse_frame_key(raw_frame)[
+                            "period"
+                        ]
+                        game_event = None
+                    else:
+                        frame = json.loads(raw_frame)
+                        # Identify Period
+                        frame_period = frame.get("period")
+
+                        # Find ball owning team
+                        game_event = frame.get("game_event")
 
                     if game_event:
                         game_event_type = game_event.get("game_event_type")
@@ -349,11 +370,11 @@ class PFF_TrackingDeserializer(TrackingDataDeserializer[PFF_TrackingInputs]):
                     if self.only_alive and self._ball_state == BallState.DEAD:
                         continue
 
-                    if frame_period is not None and n % sample == 0:
+                    if sampler.keep() and frame_period is not None:
+                        if frame is None:
+                            frame = json.loads(raw_frame)
                         yield frame, frame_period
 
-                    n += 1
-
         frames, et_frames = [], []
         n_frames = 0
 
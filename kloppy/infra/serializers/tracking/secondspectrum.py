@@ -1,18 +1,17 @@
 from datetime import datetime, timedelta, timezone
 import json
 import logging
+import os
+import re
 from typing import IO, NamedTuple, Optional, Union
-import warnings
 
 from lxml import objectify
 
 from kloppy.domain import (
-    AttackingDirection,
     BallState,
     DatasetFlag,
     Ground,
     Metadata,
-    Orientation,
     Period,
     Player,
     PlayerData,
@@ -23,15 +22,24 @@ from kloppy.domain import (
     Score,
     Team,
     TrackingDataset,
-    attacking_direction_from_frame,
+    TrackingDataStream,
 )
 from kloppy.domain.services.frame_factory import create_frame
+from kloppy.infra.serializers.json_stream import loads_prefix
 from kloppy.utils import Readable, performance_logging
 
-from .deserializer import TrackingDataDeserializer
+from .deserializer import (
+    FrameSampler,
+    TrackingDataDeserializer,
+    peek_orientation,
+)
+from .frame_index import FrameIndex, FrameKey, FrameRange, TimeRange
 
 logger = logging.getLogger(__name__)
 
+_LIVE = re.compile(rb'"live"\s*:\s*(true|false)')
+_INDEX_KEYS = ("frameIdx", "period", "gameClock")
+
 
 position_mapping = {
     "GK": PositionType.Goalkeeper,
@@ -73,14 +81,45 @@ class SecondSpectrumDeserializer(
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         only_alive: Optional[bool] = False,
+        frame_range: Optional[FrameRange] = None,
+        time_range: Optional[TimeRange] = None,
+        frame_index: Optional[Union[FrameIndex, str, os.PathLike]] = None,
     ):
-        super().__init__(limit, sample_rate, coordinate_system)
+        super().__init__(
+            limit,
+            sample_rate,
+            coordinate_system,
+            frame_range=frame_range,
+            time_range=time_range,
+            frame_index=frame_index,
+        )
         self.only_alive = only_alive
 
     @property
     def provider(self) -> Provider:
         return Provider.SECONDSPECTRUM
 
+    @staticmethod
+    def _is_live(line: bytes) -> bool:
+        match = _LIVE.search(line)
+        if match is None:
+            return json.loads(line)["live"]
+        return match.group(1) == b"true"
+
+    @staticmethod
+    def _parse_index_key(line: bytes) -> Optional[FrameKey]:
+        line = line.strip()
+        if not line:
+            return None
+        frame_data = loads_prefix(line, _INDEX_KEYS)
+        if len(frame_data) < len(_INDEX_KEYS):
+            frame_data = json.loads(line)
+        return (
+            frame_data["frameIdx"],
+            frame_data["period"],
+            frame_data["gameClock"],
+        )
+
     @classmethod
     def _frame_from_framedata(cls, teams, period, frame_data):
         frame_id = frame_data["frameIdx"]
@@ -143,6 +182,12 @@ class SecondSpectrumDeserializer(
             raise ValueError("Please specify a value for 'raw_data'")
 
     def deserialize(self, inputs: SecondSpectrumInputs) -> TrackingDataset:
+        with performance_logging("Loading data", logger=logger):
+            return self.deserialize_stream(inputs).to_dataset()
+
+    def deserialize_stream(
+        self, inputs: SecondSpectrumInputs
+    ) -> TrackingDataStream:
         metadata = None
 
         # Handles the XML metadata that contains the pitch dimensions and frame info
@@ -269,61 +314,49 @@ class SecondSpectrumDeserializer(
                     )
 
         # Handles the tracking frame data
-        with performance_logging("Loading data", logger=logger):
-            transformer = self.get_transformer(
-                pitch_length=pitch_size_height, pitch_width=pitch_size_width
-            )
-
-            def _iter():
-                n = 0
-                sample = 1 / self.sample_rate
+        transformer = self.get_transformer(
+            pitch_length=pitch_size_height, pitch_width=pitch_size_width
+        )
 
-                for line_ in inputs.raw_data.readlines():
-                    line_ = line_.strip().decode("utf-8-sig")
+        raw_data, reference_data = self.select_raw_data(
+            inputs.raw_data, self._parse_index_key
+        )
 
-                    if not line_:
-                        continue
+        def _iter(feed):
+            sampler = FrameSampler(self.sample_rate)
 
-                    # Each line is just json so we just parse it
-                    frame_data = json.loads(line_)
+            for line_ in feed:
+                line_ = line_.strip()
 
-                    if self.only_alive and not frame_data["live"]:
-                        continue
+                if not line_:
+                    continue
 
-                    if n % sample == 0:
-                        yield frame_data
+                if self.only_alive and not self._is_live(line_):
+                    continue
 
-                    n += 1
+                if sampler.keep():
+                    # Each line is just json so we just parse it
+                    yield json.loads(line_.decode("utf-8-sig"))
 
-            frames = []
+        def _iter_frames(feed):
             n_frames = 0
-            for frame_data in _iter():
+            for frame_data in _iter(feed):
                 period = periods[frame_data["period"] - 1]
 
                 frame = self._frame_from_framedata(teams, period, frame_data)
-                frame = transformer.transform_frame(frame)
-                frames.append(frame)
+                yield transformer.transform_frame(frame)
 
                 n_frames += 1
 
                 if self.limit and n_frames >= self.limit:
                     break
 
-        try:
-            first_frame = next(
-                frame for frame in frames if frame.period.id == 1
-            )
-            orientation = (
-                Orientation.HOME_AWAY
-                if attacking_direction_from_frame(first_frame)
-                == AttackingDirection.LTR
-                else Orientation.AWAY_HOME
-            )
-        except StopIteration:
-            warnings.warn(
-                "Could not determine orientation of dataset, defaulting to NOT_SET"
-            )
-            orientation = Orientation.NOT_SET
+        orientation, frames = peek_orientation(
+            _iter_frames(raw_data),
+            _iter_frames(reference_data)
+            if reference_data is not None
+            else None,
+        )
 
         if metadata:
             score = Score(
@@ -355,7 +388,4 @@ class SecondSpectrumDeserializer(
             game_id=game_id,
         )
 
-        return TrackingDataset(
-            records=frames,
-            metadata=metadata,
-        )
+        return TrackingDataStream(metadata=metadata, frames=frames)
@@ -25,7 +25,9 @@ from kloppy.domain import (
 )
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.exceptions import DeserializationError
+from kloppy.infra.serializers.json_stream import loads_prefix
 from kloppy.infra.serializers.tracking.deserializer import (
+    FrameSampler,
     TrackingDataDeserializer,
 )
 from kloppy.utils import performance_logging
@@ -34,6 +36,8 @@ logger = logging.getLogger(__name__)
 
 frame_rate = 10
 
+_FRAME_KEYS = ("frame", "timestamp", "time", "period")
+
 position_types_mapping: dict[int, PositionType] = {
     0: PositionType.Goalkeeper,
     1: PositionType.Unknown,  # Does not exist
@@ -321,18 +325,33 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
                 raise DeserializationError("Could not parse JSON data")
 
         elif start_byte == b"{":
-            # It's a JSONL file
-            try:
-                data = []
-                for line in file:
-                    obj = json.loads(line)
-                    data.append(self.__replace_timestamp(obj))
-                return data
-            except json.JSONDecodeError:
-                raise DeserializationError("Could not parse JSONL data")
+            # It's a JSONL file. The lines are only decoded when needed.
+            return [line for line in file if line.strip()]
 
         raise DeserializationError("Could not determine raw data format")
 
+    def __decode_frame(self, raw_frame):
+        """Decode a raw frame, which is either a dict or a JSONL line."""
+        if isinstance(raw_frame, dict):
+            return raw_frame
+        try:
+            return self.__replace_timestamp(json.loads(raw_frame))
+        except json.JSONDecodeError:
+            raise DeserializationError("Could not parse JSONL data")
+
+    def __get_frame_key(self, raw_frame):
+        """Decode only the frame number, time and period of a raw frame."""
+        if isinstance(raw_frame, dict):
+            return raw_frame
+        frame = loads_prefix(raw_frame, _FRAME_KEYS)
+        if (
+            "frame" not in frame
+            or "period" not in frame
+            or ("time" not in frame and "timestamp" not in frame)
+        ):
+            return self.__decode_frame(raw_frame)
+        return self.__replace_timestamp(frame)
+
     @classmethod
     def __get_periods(cls, tracking):
         """gets the Periods contained in the tracking data"""
@@ -404,9 +423,10 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
     def deserialize(self, inputs: SkillCornerInputs) -> TrackingDataset:
         metadata = json.load(inputs.meta_data)
         raw_data = self.__load_json_raw(inputs.raw_data)
+        frame_keys = [self.__get_frame_key(raw_frame) for raw_frame in raw_data]
 
         with performance_logging("Loading metadata", logger=logger):
-            periods = self.__get_periods(raw_data)
+            periods = self.__get_periods(frame_keys)
 
             teamdict = {
                 metadata["home_team"].get("id"): "home_team",
@@ -516,16 +536,11 @@ class SkillCornerDeserializer(TrackingDataDeserializer[SkillCornerInputs]):
         with performance_logging("Loading data", logger=logger):
 
             def _iter():
-                n = 0
-                sample = 1.0 / self.sample_rate
-
-                for frame in raw_data:
-                    frame_period = frame["period"]
+                sampler = FrameSampler(self.sample_rate)
 
-                    if frame_period is not None:
-                        if n % sample == 0:
-                            yield frame
-                        n += 1
+                for raw_frame, frame_key in zip(raw_data, frame_keys):
+                    if frame_key["period"] is not None and sampler.keep():
+                        yield self.__decode_frame(raw_frame)
 
         frames = []
 
@@ -1,7 +1,8 @@
+from array import array
 from collections import defaultdict
 from datetime import datetime, timedelta
 import logging
-from typing import IO, Callable, NamedTuple, Optional, Union
+from typing import IO, NamedTuple, Optional, Union
 
 from lxml import etree, objectify
 
@@ -44,252 +45,238 @@ def elem2dict(node):
     return dict(node.items())
 
 
-def any_of(*predicates: Callable[..., bool]) -> Callable[..., bool]:
-    """
-    Return a new function that is True if ANY of the given predicates are True.
-    """
-
-    def combined(*args, **kwargs) -> bool:
-        return any(pred(*args, **kwargs) for pred in predicates)
+_FRAMESET_ARRAYS = (
+    "frame_ids",
+    "x",
+    "y",
+    "z",
+    "speed",
+    "ball_status",
+    "ball_possession",
+)
 
-    return combined
 
+class _FrameSetData:
+    """The frames of one object in one period, stored as numeric arrays.
 
-def all_of(*predicates: Callable[..., bool]) -> Callable[..., bool]:
-    """
-    Return a new function that is True if ALL of the given predicates are True.
+    Values that are missing in the XML are stored as 0. The ball status
+    and possession are only stored for the ball.
     """
 
-    def combined(*args, **kwargs) -> bool:
-        return all(pred(*args, **kwargs) for pred in predicates)
+    __slots__ = (
+        "period_id",
+        "object_id",
+        "frame_ids",
+        "x",
+        "y",
+        "z",
+        "speed",
+        "ball_status",
+        "ball_possession",
+        "is_sorted",
+        "is_filtered",
+    )
 
-    return combined
+    def __init__(self, period_id: int, object_id: str):
+        self.period_id = period_id
+        self.object_id = object_id
+        self.frame_ids = array("q")
+        self.x = array("d")
+        self.y = array("d")
+        self.z = array("d")
+        self.speed = array("d")
+        self.ball_status = array("b")
+        self.ball_possession = array("b")
+        self.is_sorted = True
+        # False when the frames of a player still need to be matched with
+        # the frames in which the ball is alive (see `_parse_framesets`)
+        self.is_filtered = True
+
+    def append(self, frame_id: int, elem) -> None:
+        if self.frame_ids and frame_id <= self.frame_ids[-1]:
+            self.is_sorted = False
+        self.frame_ids.append(frame_id)
+        self.x.append(float(elem.get("X", 0)))
+        self.y.append(float(elem.get("Y", 0)))
+        self.speed.append(float(elem.get("S", 0)))
+        if self.object_id == "ball":
+            self.z.append(float(elem.get("Z", 0)))
+            self.ball_status.append(int(elem.get(BALL_STATUS, 0)))
+            self.ball_possession.append(int(elem.get(BALL_POSSESSION, 0)))
+
+    def select(self, indices: list[int]) -> None:
+        """Only keep the frames at the given indices."""
+        for name in _FRAMESET_ARRAYS:
+            values = getattr(self, name)
+            if not values:
+                # Only the ball has a status and possession
+                continue
+            setattr(
+                self,
+                name,
+                array(values.typecode, map(values.__getitem__, indices)),
+            )
+
+    def sort(self) -> None:
+        """Sort the frames by id. Of duplicate frames, the last one is kept."""
+        if self.is_sorted:
+            return
+        last_index = {frame_id: i for i, frame_id in enumerate(self.frame_ids)}
+        self.select([last_index[frame_id] for frame_id in sorted(last_index)])
+        self.is_sorted = True
+
+    def __len__(self) -> int:
+        return len(self.frame_ids)
 
 
-def _unstack_framesets(
+def _parse_framesets(
     raw_data: IO[bytes],
     limit: Optional[int] = None,
     only_alive: bool = False,
     objects_to_skip: Optional[set[str]] = None,
-) -> dict[int, dict[int, dict]]:
-    """Unstack framesets.
+) -> list[_FrameSetData]:
+    """Parse the framesets in a single pass over the XML.
 
-    Sportec groups frames per period and object in a frameset. This function
-    unstacks the framesets and returns a nested dict:
-
-        { period: { frame_id: { object_id: {attr: value, ...}, ...}, ...}, ... }
+    Sportec groups frames per period and object in a frameset. The frames of
+    each frameset are written to numeric arrays, and the XML elements are
+    cleared as soon as they are parsed.
 
     Args:
         raw_data: The raw XML data stream to be parsed.
-        limit: Max frames to collect.
+        limit: Max frames to collect per object.
         only_alive: Only include frames where BALL_STATUS == "1".
         objects_to_skip: A set of object IDs to skip.
 
     Returns:
-        A nested dict period → frame_id → object_id → attributes.
+        The framesets, in the order of the XML.
 
     Notes:
-        This function assumes that the framesets are ordered by period and
-        that the frames in each frameset are ordered.
+        With `only_alive`, the frames of a player are only kept when the
+        ball is alive in the same frame. A player's frameset can precede
+        the ball's frameset of the same period. Its frames are then kept
+        until the ball is parsed and filtered at the end, which is also
+        when the limit is applied to them.
     """
     objects_to_skip = objects_to_skip or set()
-    frames: dict[int, dict[int, dict[str, dict[str, str]]]] = defaultdict(
-        lambda: defaultdict(dict)
-    )
+    framesets: list[_FrameSetData] = []
     frames_per_obj: dict[str, int] = defaultdict(int)
+    # The ids of the frames in which the ball is alive, per period
+    alive_frame_ids: dict[int, set[int]] = {}
 
-    def _make_pass(
-        skip_frameset: Optional[Callable[[int, str], bool]] = None,
-        end_frameset: Optional[Callable[[int, str], bool]] = None,
-        skip_frame: Optional[Callable[[int, str, dict[str, str]], bool]] = None,
-    ) -> None:
-        """Generic pass over the XML to collect frames.
-
-        Args:
-            skip_framset: A callable that returns True when the parsing should skip a frameset.
-            end_frameset: A callable that returns True when the frameset should be ended.
-            skip_frame: A callable that returns True when a frame should be skipped.
-        """
-        raw_data.seek(0)
-        context = etree.iterparse(
-            raw_data, events=("start", "end"), huge_tree=True
-        )
-        current_period = None
-        current_obj = None
-
-        for event, elem in context:
-            if event == "start" and elem.tag == "FrameSet":
-                section = elem.get("GameSection")
-                current_period = GAME_SECTION_TO_PERIOD_ID.get(section)
-                if current_period is None:
+    current_elem = None
+    current: Optional[_FrameSetData] = None
+    alive: Optional[set[int]] = None
+
+    def _end_frameset():
+        if current is not None and current.object_id == "ball" and only_alive:
+            alive_frame_ids.setdefault(current.period_id, set()).update(
+                current.frame_ids
+            )
+
+    context = etree.iterparse(
+        raw_data, events=("end",), tag="Frame", huge_tree=True
+    )
+    for _, elem in context:
+        frameset_elem = elem.getparent()
+        if frameset_elem is not current_elem:
+            _end_frameset()
+            current_elem = frameset_elem
+            current = None
+            # Remove the parsed framesets
+            while frameset_elem.getprevious() is not None:
+                del frameset_elem.getparent()[0]
+
+            if frameset_elem.tag == "FrameSet":
+                period_id = GAME_SECTION_TO_PERIOD_ID.get(
+                    frameset_elem.get("GameSection")
+                )
+                object_id = (
+                    "ball"
+                    if frameset_elem.get("TeamId") == "BALL"
+                    else frameset_elem.get("PersonId")
+                )
+                if period_id is None:
                     logger.warning(
                         "Found FrameSet with unknown or missing period: %s",
-                        elem2dict(elem),
+                        elem2dict(frameset_elem),
                     )
-                    continue
-                current_obj = (
-                    "ball"
-                    if elem.get("TeamId") == "BALL"
-                    else elem.get("PersonId")
-                )
-                if current_obj is None:
+                elif object_id is None:
                     logger.warning(
                         "Found FrameSet with unknown or missing object ID: %s",
-                        elem2dict(elem),
+                        elem2dict(frameset_elem),
+                    )
+                elif object_id in objects_to_skip:
+                    logger.debug(
+                        "Skipping FrameSet for object %s in period %s",
+                        object_id,
+                        period_id,
+                    )
+                else:
+                    logger.debug(
+                        "Processing FrameSet for object %s in period %s",
+                        object_id,
+                        period_id,
+                    )
+                    current = _FrameSetData(period_id, object_id)
+                    framesets.append(current)
+                    alive = (
+                        alive_frame_ids.get(period_id)
+                        if only_alive and object_id != "ball"
+                        else None
+                    )
+                    current.is_filtered = not only_alive or (
+                        object_id == "ball" or alive is not None
                     )
-                    continue
-                if skip_frameset is not None and skip_frameset(
-                    current_period, current_obj
-                ):
-                    current_period = None
-                    current_obj = None
-                    continue
-                logger.debug(
-                    "Processing FrameSet for object %s in period %s",
-                    current_obj,
-                    current_period,
-                )
 
-            elif (
-                event == "start"
-                and elem.tag == "Frame"
-                and current_period is not None
-                and current_obj is not None
+        if current is not None and not (
+            limit and frames_per_obj[current.object_id] >= limit
+        ):
+            frame_id = elem.get("N")
+            if (
+                only_alive
+                and current.object_id == "ball"
+                and int(elem.get(BALL_STATUS, "0")) != 1
             ):
-                frame_data = elem2dict(elem)
-                if skip_frame is not None and skip_frame(
-                    current_period, current_obj, frame_data
-                ):
-                    continue
-                if "N" not in frame_data:
-                    logger.warning(
-                        "Found Frame with missing ID: %s",
-                        frame_data,
-                    )
-                    continue
-                fid = int(frame_data["N"])
-                frames[current_period][fid][current_obj] = elem2dict(elem)
-                frames_per_obj[current_obj] += 1
-                if end_frameset is not None and end_frameset(
-                    current_period, current_obj
-                ):
-                    current_period = None
-                    current_obj = None
-
-            # Always clear elements to save memory
-            elif event == "end" and elem.tag in ("Frame", "FrameSet"):
-                elem.clear()
-                while elem.getprevious() is not None:
-                    del elem.getparent()[0]
-
-    def make_object_filter(
-        objects: set[str],
-        include: bool = True,
-    ) -> Callable[[int, str], bool]:
-        """
-        Returns a callable that checks if the current object should be skipped
-        based on membership in the given set.
-
-        Args:
-            objects: Set of object names to include/exclude.
-            include: If True, only allow objects IN the set. If False, exclude objects IN the set.
-        """
-
-        def _filter(current_period: int, current_obj: str) -> bool:
-            skip = (
-                (current_obj not in objects)
-                if include
-                else (current_obj in objects)
-            )
-            if skip:
-                logger.debug(
-                    "Skipping FrameSet for object %s in period %s (reason: %s objects=%s)",
-                    current_obj,
-                    current_period,
-                    ("not in" if include else "in"),
-                    objects,
+                pass
+            elif frame_id is None:
+                logger.warning(
+                    "Found Frame with missing ID: %s", elem2dict(elem)
                 )
-            return skip
-
-        return _filter
-
-    def check_limit(current_period: int, current_obj: str) -> bool:
-        """
-        Check if the limit has been reached for the current object.
-        """
-        assert limit is not None
-        skip = frames_per_obj.get(current_obj, 0) >= limit
-        if skip:
-            logger.debug(
-                "Reached limit=%d for object %s in period %s",
-                frames_per_obj.get(current_obj, 0),
-                current_obj,
-                current_period,
-            )
-        return skip
-
-    def check_only_alive(
-        current_period: int, current_obj: str, frame_data: dict[str, str]
-    ) -> bool:
-        """
-        Check if the ball is out of play in the current frame.
-        """
-        assert only_alive is True
-        fid = int(frame_data.get("N", 0))
-
-        if current_obj == "ball":
-            skip = int(frame_data.get(BALL_STATUS, "0")) != 1
-        else:
-            skip = "ball" not in frames.get(current_period, {}).get(fid, {})
-
-        if skip:
-            logger.debug(
-                "Skipping Frame %d for object %s in period %s (reason: ball not in play)",
-                fid,
-                current_obj,
-                current_period,
-            )
-        return skip
-
-    # --- Build predicates dynamically ---
-
-    skip_frameset = make_object_filter(objects_to_skip, include=False)
-    skip_frameset_ball = make_object_filter({"ball"}, include=True)
-    skip_frameset_players = make_object_filter(
-        objects_to_skip | {"ball"}, include=False
-    )
-
-    if limit:
-        skip_frameset = any_of(skip_frameset, check_limit)
-        skip_frameset_ball = any_of(skip_frameset_ball, check_limit)
-        skip_frameset_players = any_of(skip_frameset_players, check_limit)
-
-    end_frameset = check_limit if limit else None
-    skip_frame = check_only_alive if only_alive else None
-
-    # --- Processing passes ---
+            else:
+                frame_id = int(frame_id)
+                if alive is None or frame_id in alive:
+                    current.append(frame_id, elem)
+                    if current.is_filtered:
+                        frames_per_obj[current.object_id] += 1
+
+        # Always clear elements to save memory
+        elem.clear()
+        while elem.getprevious() is not None:
+            del frameset_elem[0]
+    _end_frameset()
 
     if only_alive:
-        # First pass: only the ball to get the frames where the ball is alive
-        _make_pass(
-            skip_frameset=skip_frameset_ball,
-            end_frameset=end_frameset,
-            skip_frame=skip_frame,
-        )
-        # Second pass: all other objects in these frames
-        _make_pass(
-            skip_frameset=skip_frameset_players,
-            end_frameset=end_frameset,
-            skip_frame=skip_frame,
-        )
-    else:
-        _make_pass(
-            skip_frameset=skip_frameset,
-            end_frameset=end_frameset,
-            skip_frame=skip_frame,
-        )
-
-    return dict(frames)
+        # Match the players that preceded the ball with the alive frames and
+        # apply the limit in the order of the XML
+        frames_per_obj.clear()
+        for frameset in framesets:
+            if frameset.object_id == "ball":
+                frames_per_obj["ball"] += len(frameset)
+                continue
+            alive = alive_frame_ids.get(frameset.period_id, set())
+            indices = []
+            for i, frame_id in enumerate(frameset.frame_ids):
+                if limit and frames_per_obj[frameset.object_id] >= limit:
+                    break
+                if frameset.is_filtered or frame_id in alive:
+                    indices.append(i)
+                    frames_per_obj[frameset.object_id] += 1
+            if len(indices) < len(frameset):
+                frameset.select(indices)
+
+    for frameset in framesets:
+        frameset.sort()
+    return framesets
 
 
 class SportecTrackingDataInputs(NamedTuple):
@@ -340,7 +327,7 @@ class SportecTrackingDataDeserializer(TrackingDataDeserializer):
 
         # Stream and process tracking data
         with performance_logging("parse tracking data", logger=logger):
-            period_frames = _unstack_framesets(
+            framesets = _parse_framesets(
                 inputs.raw_data,
                 limit=(
                     int(self.limit / self.sample_rate)
@@ -356,79 +343,85 @@ class SportecTrackingDataDeserializer(TrackingDataDeserializer):
             frame_count = 0
 
             for period in periods:
-                raw_period_frames = period_frames.get(period.id, {})
+                # Later framesets of the same object overwrite earlier ones
+                period_framesets = [
+                    frameset
+                    for frameset in framesets
+                    if frameset.period_id == period.id and len(frameset)
+                ]
+                sorted_frame_ids = sorted(
+                    {
+                        frame_id
+                        for frameset in period_framesets
+                        for frame_id in frameset.frame_ids
+                    }
+                )
+                cursors = [0] * len(period_framesets)
 
-                sorted_frame_ids = sorted(raw_period_frames.keys())
-                for (
-                    i,
-                    frame_id,
-                ) in enumerate(sorted_frame_ids):
+                for i, frame_id in enumerate(sorted_frame_ids):
                     if self.limit and frame_count >= self.limit:
                         break
 
-                    frame_data = raw_period_frames[frame_id]
+                    # The position of each object in this frame
+                    frame_data: dict[str, tuple[_FrameSetData, int]] = {}
+                    for j, frameset in enumerate(period_framesets):
+                        frame_ids = frameset.frame_ids
+                        c = cursors[j]
+                        while c < len(frame_ids) and frame_ids[c] < frame_id:
+                            c += 1
+                        cursors[j] = c
+                        if c < len(frame_ids) and frame_ids[c] == frame_id:
+                            frame_data[frameset.object_id] = (frameset, c)
+
                     if "ball" not in frame_data:
                         continue
 
-                    ball_data = frame_data.get("ball", {})
-                    if (
-                        self.only_alive
-                        and int(ball_data.get(BALL_STATUS, 0)) != 1
-                    ):
+                    ball, b = frame_data.pop("ball")
+                    if self.only_alive and ball.ball_status[b] != 1:
                         continue
 
                     if i % sample != 0:
                         continue
 
-                    try:
-                        frame = create_frame(
-                            frame_id=frame_id,
-                            timestamp=timedelta(
-                                seconds=(
-                                    frame_id
-                                    - period.start_timestamp.seconds
-                                    * sportec_metadata.fps
-                                )
-                                / sportec_metadata.fps
-                            ),
-                            ball_owning_team=(
-                                home_team
-                                if int(ball_data.get(BALL_POSSESSION, 0)) == 1
-                                else away_team
-                            ),
-                            ball_state=(
-                                BallState.ALIVE
-                                if int(ball_data.get(BALL_STATUS, 0)) == 1
-                                else BallState.DEAD
-                            ),
-                            period=period,
-                            players_data={
-                                player_map[object_id]: PlayerData(
-                                    coordinates=Point(
-                                        x=float(data.get("X", 0)),
-                                        y=float(data.get("Y", 0)),
-                                    ),
-                                    speed=float(data.get("S", 0)),
-                                )
-                                for object_id, data in frame_data.items()
-                                if object_id != "ball"
-                                and object_id not in official_ids
-                                and object_id in player_map
-                            },
-                            ball_coordinates=Point3D(
-                                x=float(ball_data.get("X", 0)),
-                                y=float(ball_data.get("Y", 0)),
-                                z=float(ball_data.get("Z", 0)),
-                            ),
-                            ball_speed=float(ball_data.get("S", 0)),
-                            other_data={},
-                        )
-                        frames.append(transformer.transform_frame(frame))
-                        frame_count += 1
-                    except KeyError as e:
-                        logger.warning(
-                            f"Skipping frame {frame_id} due to missing data: {e}"
-                        )
+                    frame = create_frame(
+                        frame_id=frame_id,
+                        timestamp=timedelta(
+                            seconds=(
+                                frame_id
+                                - period.start_timestamp.seconds
+                                * sportec_metadata.fps
+                            )
+                            / sportec_metadata.fps
+                        ),
+                        ball_owning_team=(
+                            home_team
+                            if ball.ball_possession[b] == 1
+                            else away_team
+                        ),
+                        ball_state=(
+                            BallState.ALIVE
+                            if ball.ball_status[b] == 1
+                            else BallState.DEAD
+                        ),
+                        period=period,
+                        players_data={
+                            player_map[object_id]: PlayerData(
+                                coordinates=Point(
+                                    x=frameset.x[c], y=frameset.y[c]
+                                ),
+                                speed=frameset.speed[c],
+                            )
+                            for object_id, (frameset, c) in frame_data.items()
+                            if object_id in player_map
+                        },
+                        ball_coordinates=Point3D(
+                            x=ball.x[b], y=ball.y[b], z=ball.z[b]
+                        ),
+                        ball_speed=ball.speed[b],
+                        other_data={},
+                    )
+                    frames.append(transformer.transform_frame(frame))
+                    frame_count += 1
 
         # Determine orientation
         try:
@@ -1,14 +1,13 @@
 from datetime import timedelta
+from io import BytesIO
 import logging
+import os
 from typing import IO, NamedTuple, Optional, Union
-import warnings
 
 from kloppy.domain import (
-    AttackingDirection,
     BallState,
     DatasetFlag,
     Metadata,
-    Orientation,
     Player,
     PlayerData,
     Point,
@@ -16,14 +15,19 @@ from kloppy.domain import (
     PositionType,
     Provider,
     TrackingDataset,
-    attacking_direction_from_frame,
+    TrackingDataStream,
 )
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.exceptions import DeserializationError
 from kloppy.infra.serializers.event.statsperform.parsers import get_parser
 from kloppy.utils import performance_logging
 
-from .deserializer import TrackingDataDeserializer
+from .deserializer import (
+    FrameSampler,
+    TrackingDataDeserializer,
+    peek_orientation,
+)
+from .frame_index import FrameIndex, FrameKey, FrameRange, TimeRange
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +47,18 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         only_alive: Optional[bool] = False,
+        frame_range: Optional[FrameRange] = None,
+        time_range: Optional[TimeRange] = None,
+        frame_index: Optional[Union[FrameIndex, str, os.PathLike]] = None,
     ):
-        super().__init__(limit, sample_rate, coordinate_system)
+        super().__init__(
+            limit,
+            sample_rate,
+            coordinate_system,
+            frame_range=frame_range,
+            time_range=time_range,
+            frame_index=frame_index,
+        )
         self.only_alive = only_alive
         self._provider = provider
 
@@ -52,13 +66,19 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
     def provider(self) -> Provider:
         return self._provider
 
+    @staticmethod
+    def _parse_index_key(line: bytes) -> Optional[FrameKey]:
+        frame_id, _, frame_info = line.partition(b";")
+        if not frame_info:
+            return None
+        timestamp, period_id = frame_info.split(b",", 2)[:2]
+        return int(frame_id), int(period_id), int(timestamp) / 1000
+
     @classmethod
-    def __get_frame_rate(cls, tracking):
-        """Infer the frame rate of the tracking data."""
+    def __get_frame_rate(cls, timestamps):
+        """Infer the frame rate from the timestamps (in milliseconds)."""
 
-        frame_numbers = [
-            int(line.split(";")[1].split(",")[0]) for line in tracking[1:]
-        ]
+        frame_numbers = timestamps[1:]
 
         deltas = [
             frame_numbers[i + 1] - frame_numbers[i]
@@ -144,6 +164,12 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
         return frame
 
     def deserialize(self, inputs: StatsPerformInputs) -> TrackingDataset:
+        with performance_logging("Loading tracking data", logger=logger):
+            return self.deserialize_stream(inputs).to_dataset()
+
+    def deserialize_stream(
+        self, inputs: StatsPerformInputs
+    ) -> TrackingDataStream:
         with performance_logging("Loading meta data", logger=logger):
             meta_data_parser = get_parser(inputs.meta_data, "MA1")
 
@@ -157,30 +183,55 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
             game_week = meta_data_parser.extract_game_week()
             game_id = meta_data_parser.extract_game_id()
 
-        with performance_logging("Loading tracking data", logger=logger):
-            tracking_data = inputs.raw_data.read().decode("ascii").splitlines()
-            frame_rate = self.__get_frame_rate(tracking_data)
-
-            transformer = self.get_transformer(
-                pitch_length=inputs.pitch_length,
-                pitch_width=inputs.pitch_width,
-            )
-
-            def _iter():
-                n = 0
-                sample = 1.0 / self.sample_rate
-
-                for line_ in tracking_data:
-                    splits = line_.split(";")[1].split(",")
-                    period_id = int(splits[1])
-                    period_ = periods[period_id]
-                    if n % sample == 0:
-                        yield period_, line_
-                    n += 1
-
-            frames = []
+        raw_data = inputs.raw_data
+        if not raw_data.seekable():
+            raw_data = BytesIO(raw_data.read())
+        selected_raw_data, reference_data = self.select_raw_data(
+            raw_data, self._parse_index_key
+        )
+
+        def _frame_info(feed):
+            feed.seek(0)
+            for line_ in feed:
+                # The frame id is followed by "timestamp,period,status:"
+                yield line_, line_.partition(b";")[2].split(b",", 3)
+
+        with performance_logging("Inferring frame rate", logger=logger):
+            timestamps = [
+                int(frame_info[0])
+                for _, frame_info in _frame_info(selected_raw_data)
+            ]
+            # Fall back to all frames when too few frames are selected
+            if len(timestamps) < 3:
+                timestamps = [
+                    int(frame_info[0])
+                    for _, frame_info in _frame_info(raw_data)
+                ]
+            frame_rate = self.__get_frame_rate(timestamps)
+
+        transformer = self.get_transformer(
+            pitch_length=inputs.pitch_length,
+            pitch_width=inputs.pitch_width,
+        )
+
+        def _iter(feed):
+            sampler = FrameSampler(self.sample_rate)
+
+            for line_, frame_info in _frame_info(feed):
+                period_ = periods[int(frame_info[1])]
+                if not sampler.keep():
+                    continue
+                # Dead frames are dropped after sampling, skip parsing them
+                if (
+                    self.only_alive
+                    and int(frame_info[2].split(b":", 1)[0]) != 0
+                ):
+                    continue
+                yield period_, line_.decode("ascii").rstrip("\r\n")
+
+        def _iter_frames(feed):
             n_frames = 0
-            for frame_data in _iter():
+            for frame_data in _iter(feed):
                 period = frame_data[0]
                 frame = self._frame_from_framedata(
                     teams_list, period, frame_data
@@ -190,28 +241,19 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
                     self.only_alive and frame.ball_state == BallState.DEAD
                 ):
                     continue
-                frames.append(frame)
+                yield frame
 
                 n_frames += 1
 
                 if self.limit and n_frames >= self.limit:
                     break
 
-        try:
-            first_frame = next(
-                frame for frame in frames if frame.period.id == 1
-            )
-            orientation = (
-                Orientation.HOME_AWAY
-                if attacking_direction_from_frame(first_frame)
-                == AttackingDirection.LTR
-                else Orientation.AWAY_HOME
-            )
-        except StopIteration:
-            warnings.warn(
-                "Could not determine orientation of dataset, defaulting to NOT_SET"
-            )
-            orientation = Orientation.NOT_SET
+        orientation, frames = peek_orientation(
+            _iter_frames(selected_raw_data),
+            _iter_frames(reference_data)
+            if reference_data is not None
+            else None,
+        )
 
         meta_data = Metadata(
             teams=teams_list,
@@ -228,7 +270,4 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
             game_id=game_id,
         )
 
-        return TrackingDataset(
-            records=frames,
-            metadata=meta_data,
-        )
+        return TrackingDataStream(metadata=meta_data, frames=frames)
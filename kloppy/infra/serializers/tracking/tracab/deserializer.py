@@ -1,20 +1,26 @@
 import logging
+import os
 from typing import IO, NamedTuple, Optional, Union
-import warnings
 
+from kloppy.config import get_config
 from kloppy.domain import (
-    AttackingDirection,
+    ColumnarFramesBuilder,
     DatasetFlag,
     Metadata,
-    Orientation,
     Provider,
     TrackingDataset,
-    attacking_direction_from_frame,
+    TrackingDataStream,
 )
+from kloppy.exceptions import KloppyParameterError
 from kloppy.utils import performance_logging
 
-from ..deserializer import TrackingDataDeserializer
-from .parsers import get_metadata_parser, get_raw_data_parser
+from ..deserializer import TrackingDataDeserializer, peek_orientation
+from ..frame_index import FrameIndex, FrameRange, TimeRange
+from .parsers import (
+    TracabDatParser,
+    get_metadata_parser,
+    get_raw_data_parser,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +37,18 @@ class TRACABDeserializer(TrackingDataDeserializer[TRACABInputs]):
         sample_rate: Optional[float] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         only_alive: bool = False,
+        frame_range: Optional[FrameRange] = None,
+        time_range: Optional[TimeRange] = None,
+        frame_index: Optional[Union[FrameIndex, str, os.PathLike]] = None,
     ):
-        super().__init__(limit, sample_rate, coordinate_system)
+        super().__init__(
+            limit,
+            sample_rate,
+            coordinate_system,
+            frame_range=frame_range,
+            time_range=time_range,
+            frame_index=frame_index,
+        )
         self.only_alive = only_alive
 
     @property
@@ -40,6 +56,12 @@ class TRACABDeserializer(TrackingDataDeserializer[TRACABInputs]):
         return Provider.TRACAB
 
     def deserialize(self, inputs: TRACABInputs) -> TrackingDataset:
+        with performance_logging("Loading data", logger=logger):
+            if get_config("tracking.storage") == "columnar":
+                return self._deserialize_columnar(inputs)
+            return self.deserialize_stream(inputs).to_dataset()
+
+    def _read_metadata(self, inputs: TRACABInputs):
         with performance_logging("Loading metadata", logger=logger):
             metadata_parser = get_metadata_parser(inputs.meta_data)
             (
@@ -49,62 +71,98 @@ class TRACABDeserializer(TrackingDataDeserializer[TRACABInputs]):
             teams = metadata_parser.extract_lineups()
             periods = metadata_parser.extract_periods()
             frame_rate = metadata_parser.extract_frame_rate()
-            date = metadata_parser.extract_date()
-            game_id = metadata_parser.extract_game_id()
-            orientation = metadata_parser.extract_orientation()
 
         transformer = self.get_transformer(
             pitch_length=pitch_length, pitch_width=pitch_width
         )
+        metadata = Metadata(
+            teams=list(teams),
+            periods=periods,
+            pitch_dimensions=transformer.get_to_coordinate_system().pitch_dimensions,
+            score=None,
+            frame_rate=frame_rate,
+            orientation=metadata_parser.extract_orientation(),
+            provider=Provider.TRACAB,
+            flags=DatasetFlag.BALL_OWNING_TEAM | DatasetFlag.BALL_STATE,
+            coordinate_system=transformer.get_to_coordinate_system(),
+            date=metadata_parser.extract_date(),
+            game_id=metadata_parser.extract_game_id(),
+        )
+        raw_data_parser = get_raw_data_parser(
+            inputs.raw_data, periods, teams, frame_rate
+        )
 
-        with performance_logging("Loading data", logger=logger):
-            raw_data_parser = get_raw_data_parser(
-                inputs.raw_data, periods, teams, frame_rate
+        reference_frames = None
+        if self.frame_range is not None or self.time_range is not None:
+            if not isinstance(raw_data_parser, TracabDatParser):
+                raise KloppyParameterError(
+                    "frame_range and time_range are only supported for "
+                    "TRACAB .dat files"
+                )
+            raw_data, reference_data = self.select_raw_data(
+                inputs.raw_data, raw_data_parser.index_key_parser()
+            )
+            raw_data_parser.root = raw_data
+            reference_frames = (
+                transformer.transform_frame(frame)
+                for frame in TracabDatParser(
+                    reference_data, periods, teams, frame_rate
+                ).extract_frames(1.0, False)
             )
-            frames = []
+
+        return metadata, transformer, raw_data_parser, reference_frames
+
+    def _limit_reached(self, n: int) -> bool:
+        return bool(self.limit) and n + 1 >= (self.limit / self.sample_rate)
+
+    def deserialize_stream(self, inputs: TRACABInputs) -> TrackingDataStream:
+        (
+            metadata,
+            transformer,
+            raw_data_parser,
+            reference_frames,
+        ) = self._read_metadata(inputs)
+
+        def _iter():
             for n, frame in enumerate(
                 raw_data_parser.extract_frames(
                     self.sample_rate, self.only_alive
                 )
             ):
-                frame = transformer.transform_frame(frame)
-                frames.append(frame)
+                yield transformer.transform_frame(frame)
 
-                if self.limit and n + 1 >= (self.limit / self.sample_rate):
+                if self._limit_reached(n):
                     break
 
-        if orientation is None:
-            try:
-                first_frame = next(
-                    frame for frame in frames if frame.period.id == 1
-                )
-                orientation = (
-                    Orientation.HOME_AWAY
-                    if attacking_direction_from_frame(first_frame)
-                    == AttackingDirection.LTR
-                    else Orientation.AWAY_HOME
-                )
-            except StopIteration:
-                warnings.warn(
-                    "Could not determine orientation of dataset, defaulting to NOT_SET"
-                )
-                orientation = Orientation.NOT_SET
+        frames = _iter()
+        if metadata.orientation is None:
+            metadata.orientation, frames = peek_orientation(
+                frames, reference_frames
+            )
 
-        metadata = Metadata(
-            teams=list(teams),
-            periods=periods,
-            pitch_dimensions=transformer.get_to_coordinate_system().pitch_dimensions,
-            score=None,
-            frame_rate=frame_rate,
-            orientation=orientation,
-            provider=Provider.TRACAB,
-            flags=DatasetFlag.BALL_OWNING_TEAM | DatasetFlag.BALL_STATE,
-            coordinate_system=transformer.get_to_coordinate_system(),
-            date=date,
-            game_id=game_id,
-        )
+        return TrackingDataStream(metadata=metadata, frames=frames)
 
-        return TrackingDataset(
-            records=frames,
-            metadata=metadata,
-        )
+    def _deserialize_columnar(self, inputs: TRACABInputs) -> TrackingDataset:
+        """Parse the raw data straight into columnar storage.
+
+        No `Frame` or `PlayerData` objects are created while parsing.
+        """
+        (
+            metadata,
+            transformer,
+            raw_data_parser,
+            reference_frames,
+        ) = self._read_metadata(inputs)
+
+        builder = ColumnarFramesBuilder(metadata.periods, metadata.teams)
+        for n in raw_data_parser.extract_columnar(
+            builder, self.sample_rate, self.only_alive
+        ):
+            if self._limit_reached(n):
+                break
+        frames = transformer.transform_frames(builder.build())
+
+        if metadata.orientation is None:
+            metadata.orientation, _ = peek_orientation(frames, reference_frames)
+
+        return TrackingDataset(records=frames, metadata=metadata)
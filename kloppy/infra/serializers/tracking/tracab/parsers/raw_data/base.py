@@ -8,7 +8,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from typing import IO
 
-from kloppy.domain import Frame, Period, Team
+from kloppy.domain import ColumnarFramesBuilder, Frame, Period, Team
 
 
 class TracabDataParser(ABC):
@@ -38,3 +38,19 @@ class TracabDataParser(ABC):
         self, sample_rate: float, only_alive: bool
     ) -> Iterator[Frame]:
         """Extract all frames."""
+
+    def extract_columnar(
+        self,
+        builder: ColumnarFramesBuilder,
+        sample_rate: float,
+        only_alive: bool,
+    ) -> Iterator[int]:
+        """Add all frames to a columnar builder.
+
+        Yields the index of each frame after it was added. Parsers can
+        override this to write the raw values without creating `Frame`
+        objects.
+        """
+        for frame in self.extract_frames(sample_rate, only_alive):
+            builder.append(frame)
+            yield len(builder) - 1
@@ -1,9 +1,12 @@
+from bisect import bisect_right
 from collections.abc import Iterator
 from datetime import timedelta
-from typing import IO
+import math
+from typing import IO, Callable, Optional
 
 from kloppy.domain import (
     BallState,
+    ColumnarFramesBuilder,
     Frame,
     Period,
     Player,
@@ -12,8 +15,11 @@ from kloppy.domain import (
     Point3D,
     Team,
 )
+from kloppy.domain.models.tracking import POINT_2D, POINT_3D
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.exceptions import DeserializationError
+from kloppy.infra.serializers.tracking.deserializer import FrameSampler
+from kloppy.infra.serializers.tracking.frame_index import FrameKey
 
 from .base import TracabDataParser
 
@@ -26,72 +32,225 @@ class TracabDatParser(TracabDataParser):
         teams: tuple[Team, Team],
         frame_rate: int,
     ) -> None:
-        self.root = feed.readlines()
+        self.root = feed
         self.periods = periods
         self.teams = teams
         self.frame_rate = frame_rate
+        self._players: dict[tuple[int, str], Optional[Player]] = {}
 
-    def extract_frames(
+    def _period_bounds(self) -> tuple[list[Period], list[int], list[int]]:
+        """The first and last frame id of each period, sorted by start."""
+        periods = sorted(
+            self.periods, key=lambda period: period.start_timestamp
+        )
+
+        def frame_time(frame_id: int) -> timedelta:
+            return timedelta(seconds=frame_id / self.frame_rate)
+
+        starts, ends = [], []
+        for period in periods:
+            assert isinstance(period.start_timestamp, timedelta), (
+                "The period's start_timestamp should be a relative time (i.e., a timedelta object)"
+            )
+            assert isinstance(period.end_timestamp, timedelta), (
+                "The period's start_timestamp should be a relative time (i.e., a timedelta object)"
+            )
+
+            # Frame ids are converted to a timedelta, which rounds to whole
+            # microseconds. Correct the estimate so the bounds match the
+            # timedelta comparison exactly.
+            start = math.ceil(
+                period.start_timestamp.total_seconds() * self.frame_rate
+            )
+            while frame_time(start - 1) >= period.start_timestamp:
+                start -= 1
+            while frame_time(start) < period.start_timestamp:
+                start += 1
+
+            end = math.floor(
+                period.end_timestamp.total_seconds() * self.frame_rate
+            )
+            while frame_time(end + 1) <= period.end_timestamp:
+                end += 1
+            while frame_time(end) > period.end_timestamp:
+                end -= 1
+
+            starts.append(start)
+            ends.append(end)
+        return periods, starts, ends
+
+    def index_key_parser(self) -> Callable[[bytes], Optional[FrameKey]]:
+        """Parse the key of a frame from the start of a raw line.
+
+        Lines that do not belong to a period have no key.
+        """
+        periods, starts, ends = self._period_bounds()
+
+        def parse_line(line: bytes) -> Optional[FrameKey]:
+            frame_id = line[:12].split(b":", 1)[0].strip()
+            if not frame_id:
+                return None
+
+            frame_id = int(frame_id)
+            i = bisect_right(starts, frame_id) - 1
+            if i < 0 or frame_id > ends[i]:
+                return None
+
+            timestamp = (
+                timedelta(seconds=frame_id / self.frame_rate)
+                - periods[i].start_timestamp
+            )
+            return frame_id, periods[i].id, timestamp.total_seconds()
+
+        return parse_line
+
+    def _iter_lines(
         self, sample_rate: float, only_alive: bool
-    ) -> Iterator[Frame]:
-        n = 0
-        sample = 1.0 / sample_rate
+    ) -> Iterator[tuple[Period, str]]:
+        """Yield the sampled lines that belong to a period.
+
+        Lines are selected based on the frame id at the start of the line
+        and only the selected lines are decoded.
+        """
+        sampler = FrameSampler(sample_rate)
+        periods, starts, ends = self._period_bounds()
 
         for line in self.root:
-            line = line.strip().decode("ascii")
+            line = line.strip()
             if not line:
                 continue
 
-            frame_id = int(line[:10].split(":", 1)[0])
-            if only_alive and not line.endswith("Alive;:"):
+            frame_id = int(line[:10].split(b":", 1)[0])
+            if only_alive and not line.endswith(b"Alive;:"):
                 continue
 
-            for period in self.periods:
-                assert isinstance(period.start_timestamp, timedelta), (
-                    "The period's start_timestamp should be a relative time (i.e., a timedelta object)"
-                )
-                assert isinstance(period.end_timestamp, timedelta), (
-                    "The period's start_timestamp should be a relative time (i.e., a timedelta object)"
+            i = bisect_right(starts, frame_id) - 1
+            if i < 0 or frame_id > ends[i]:
+                continue
+
+            if sampler.keep():
+                yield periods[i], line.decode("ascii")
+
+    def extract_frames(
+        self, sample_rate: float, only_alive: bool
+    ) -> Iterator[Frame]:
+        for period, line in self._iter_lines(sample_rate, only_alive):
+            yield self._parse_frame(period, line)
+
+    def extract_columnar(
+        self,
+        builder: ColumnarFramesBuilder,
+        sample_rate: float,
+        only_alive: bool,
+    ) -> Iterator[int]:
+        object_indices: dict[tuple[int, str], int] = {}
+
+        for period, line in self._iter_lines(sample_rate, only_alive):
+            frame_id, players, ball = line.split(":")[:3]
+            frame_id = int(frame_id)
+            (
+                ball_x,
+                ball_y,
+                ball_z,
+                _,
+                ball_owning_team,
+                ball_state,
+            ) = ball.rstrip(";").split(",")[:6]
+
+            index = builder.add_frame(
+                frame_id=frame_id,
+                period=period,
+                timestamp=timedelta(seconds=frame_id / self.frame_rate)
+                - period.start_timestamp,
+                ball_state=self._parse_ball_state(ball_state),
+                ball_owning_team=self._parse_ball_owning_team(ball_owning_team),
+            )
+
+            for player_data in players.split(";")[:-1]:
+                team_id, _, jersey_no, x, y, speed = player_data.split(",")
+                key = (int(team_id), jersey_no)
+                object_index = object_indices.get(key)
+                if object_index is None:
+                    player = self._get_player(*key)
+                    if player is None:
+                        continue
+                    object_index = object_indices[key] = builder.object_index(
+                        player
+                    )
+                builder.add_object(
+                    object_index,
+                    float(x),
+                    float(y),
+                    point_type=POINT_2D,
+                    speed=float(speed),
                 )
 
-                if (
-                    period.start_timestamp
-                    <= timedelta(seconds=frame_id / self.frame_rate)
-                    <= period.end_timestamp
-                ):
-                    if n % sample == 0:
-                        frame = self._parse_frame(period, line)
-                        yield frame
-                    n += 1
+            builder.add_object(
+                0,
+                float(ball_x),
+                float(ball_y),
+                float(ball_z),
+                point_type=POINT_3D,
+            )
+
+            yield index
+
+    def _get_player(self, team_id: int, jersey_no: str) -> Optional[Player]:
+        """Look up (or create) the player, or `None` for other objects."""
+        key = (team_id, jersey_no)
+        if key in self._players:
+            return self._players[key]
+
+        if team_id == 1:
+            team = self.teams[0]
+        elif team_id == 0:
+            team = self.teams[1]
+        elif team_id in (-1, 3, 4):
+            self._players[key] = None
+            return None
+        else:
+            raise DeserializationError(f"Unknown Player Team ID: {team_id}")
+
+        player = team.get_player_by_jersey_number(jersey_no)
+
+        if not player:
+            player = Player(
+                player_id=f"{team.ground}_{jersey_no}",
+                team=team,
+                jersey_no=int(jersey_no),
+            )
+            team.players.append(player)
+
+        self._players[key] = player
+        return player
+
+    def _parse_ball_owning_team(self, ball_owning_team: str) -> Team:
+        if ball_owning_team == "H":
+            return self.teams[0]
+        elif ball_owning_team == "A":
+            return self.teams[1]
+        raise DeserializationError(
+            f"Unknown ball owning team: {ball_owning_team}"
+        )
+
+    @staticmethod
+    def _parse_ball_state(ball_state: str) -> BallState:
+        if ball_state == "Alive":
+            return BallState.ALIVE
+        elif ball_state == "Dead":
+            return BallState.DEAD
+        raise DeserializationError(f"Unknown ball state: {ball_state}")
 
     def _parse_frame(self, period, line) -> Frame:
-        line = str(line)
-        frame_id, players, ball = line.strip().split(":")[:3]
+        frame_id, players, ball = line.split(":")[:3]
 
         players_data = {}
 
         for player_data in players.split(";")[:-1]:
             team_id, target_id, jersey_no, x, y, speed = player_data.split(",")
-            team_id = int(team_id)
-
-            if team_id == 1:
-                team = self.teams[0]
-            elif team_id == 0:
-                team = self.teams[1]
-            elif team_id in (-1, 3, 4):
+            player = self._get_player(int(team_id), jersey_no)
+            if player is None:
                 continue
-            else:
-                raise DeserializationError(f"Unknown Player Team ID: {team_id}")
-
-            player = team.get_player_by_jersey_number(jersey_no)
-
-            if not player:
-                player = Player(
-                    player_id=f"{team.ground}_{jersey_no}",
-                    team=team,
-                    jersey_no=int(jersey_no),
-                )
-                team.players.append(player)
 
             players_data[player] = PlayerData(
                 coordinates=Point(float(x), float(y)), speed=float(speed)
@@ -108,22 +267,6 @@ class TracabDatParser(TracabDataParser):
 
         frame_id = int(frame_id)
 
-        if ball_owning_team == "H":
-            ball_owning_team = self.teams[0]
-        elif ball_owning_team == "A":
-            ball_owning_team = self.teams[1]
-        else:
-            raise DeserializationError(
-                f"Unknown ball owning team: {ball_owning_team}"
-            )
-
-        if ball_state == "Alive":
-            ball_state = BallState.ALIVE
-        elif ball_state == "Dead":
-            ball_state = BallState.DEAD
-        else:
-            raise DeserializationError(f"Unknown ball state: {ball_state}")
-
         frame = create_frame(
             frame_id=frame_id,
             timestamp=timedelta(seconds=frame_id / self.frame_rate)
@@ -131,8 +274,8 @@ class TracabDatParser(TracabDataParser):
             ball_coordinates=Point3D(
                 float(ball_x), float(ball_y), float(ball_z)
             ),
-            ball_state=ball_state,
-            ball_owning_team=ball_owning_team,
+            ball_state=self._parse_ball_state(ball_state),
+            ball_owning_team=self._parse_ball_owning_team(ball_owning_team),
             players_data=players_data,
             period=period,
             other_data={},
@@ -14,6 +14,7 @@ from kloppy.domain import (
 )
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.exceptions import DeserializationError
+from kloppy.infra.serializers.tracking.deserializer import FrameSampler
 
 from .base import TracabDataParser
 
@@ -36,31 +37,26 @@ class TracabJSONParser(TracabDataParser):
     ) -> Iterator[Frame]:
         raw_data = self.root["FrameData"]
 
-        n = 0
-        sample = 1.0 / sample_rate
+        sampler = FrameSampler(sample_rate)
+        for period in self.periods:
+            assert isinstance(period.start_timestamp, timedelta), (
+                "The period's start_timestamp should be a relative time (i.e., a timedelta object)"
+            )
+            assert isinstance(period.end_timestamp, timedelta), (
+                "The period's start_timestamp should be a relative time (i.e., a timedelta object)"
+            )
 
         for frame in raw_data:
             if only_alive and frame["BallPosition"][0]["BallStatus"] == "Dead":
                 continue
 
-            frame_id = frame["FrameCount"]
+            frame_time = timedelta(
+                seconds=frame["FrameCount"] / self.frame_rate
+            )
             for period in self.periods:
-                assert isinstance(period.start_timestamp, timedelta), (
-                    "The period's start_timestamp should be a relative time (i.e., a timedelta object)"
-                )
-                assert isinstance(period.end_timestamp, timedelta), (
-                    "The period's start_timestamp should be a relative time (i.e., a timedelta object)"
-                )
-
-                if (
-                    period.start_timestamp
-                    <= timedelta(seconds=frame_id / self.frame_rate)
-                    <= period.end_timestamp
-                ):
-                    if n % sample == 0:
-                        frame = self._parse_frame(period, frame)
-                        yield frame
-                    n += 1
+                if period.start_timestamp <= frame_time <= period.end_timestamp:
+                    if sampler.keep():
+                        yield self._parse_frame(period, frame)
 
     def _parse_frame(self, period, raw_frame):
         frame_id = raw_frame["FrameCount"]
@@ -2,6 +2,7 @@
 
 import bz2
 from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 from contextlib import AbstractContextManager
 from dataclasses import dataclass, replace
@@ -22,6 +23,7 @@ logger = logging.getLogger(__name__)
 DEFAULT_GZIP_COMPRESSION = 1
 DEFAULT_BZ2_COMPRESSION = 9
 DEFAULT_XZ_COMPRESSION = 6
+DEFAULT_PREFETCH_WORKERS = 8
 
 
 FilePath = Union[str, bytes, os.PathLike]
@@ -487,6 +489,121 @@ def open_as_file(
     raise TypeError(f"Unsupported input type: {type(input_)}")
 
 
+def open_as_seekable_file(
+    input_: FileLike,
+) -> AbstractContextManager[Optional[BinaryIO]]:
+    """Open a byte stream from the given input object for random access.
+
+    Like [`open_as_file`][kloppy.io.open_as_file], but uncompressed local
+    files are opened directly instead of being read into memory first. A
+    reader that only needs some parts of the file can seek to them, without
+    reading the rest of the file. Other inputs are opened with
+    `open_as_file`.
+
+    Args:
+        input_ (FileLike): The input object to be opened.
+
+    Returns:
+        BinaryIO: A binary stream from the input object.
+    """
+    if isinstance(input_, Source):
+        if input_.data is None or not isinstance(
+            input_.data, (str, os.PathLike)
+        ):
+            return open_as_file(input_)
+        path = os.fspath(input_.data)
+    elif isinstance(input_, (str, os.PathLike)):
+        path = os.fspath(input_)
+    else:
+        return open_as_file(input_)
+
+    if (
+        isinstance(path, str)
+        and os.path.isfile(path)
+        and _detect_format_from_extension(path) is None
+        and _detect_format_from_content(path) is None
+    ):
+        return open(path, "rb")
+    return open_as_file(input_)
+
+
+def _remote_uris(inputs: Any) -> Iterator[str]:
+    if isinstance(inputs, Source):
+        yield from _remote_uris(inputs.data)
+    elif isinstance(inputs, (list, tuple)):
+        for item in inputs:
+            yield from _remote_uris(item)
+    elif isinstance(inputs, (str, os.PathLike)):
+        uri = _filepath_from_path_or_filelike(inputs)
+        # Local paths and inline data are not fetched
+        if (
+            "{" not in uri
+            and "<" not in uri
+            and re.match(r"^[a-zA-Z0-9+.-]+://", uri)
+            and not uri.startswith("file://")
+        ):
+            yield uri
+
+
+def prefetch(
+    inputs: Union[FileLike, Iterable[FileLike]],
+    max_workers: Optional[int] = None,
+) -> None:
+    """Fetch remote inputs concurrently.
+
+    The inputs are downloaded to the cache of their adapter (see the "cache"
+    config), such that opening them afterwards with
+    [`open_as_file`][kloppy.io.open_as_file] does not wait for the network.
+    This is useful for batch jobs that load many matches from HTTP or S3.
+    The loaders of the providers also prefetch their inputs, so the inputs
+    of a single match are fetched concurrently too.
+
+    Local files, inline data and open file objects are ignored. Inputs that
+    can't be fetched are skipped; the error is raised when they are opened.
+
+    Args:
+        inputs: The input object or a list of input objects.
+        max_workers: The maximum number of concurrent downloads. Defaults to
+            8.
+
+    Example:
+
+        >>> prefetch(
+        ...     [
+        ...         f"s3://bucket/{match_id}/{name}"
+        ...         for match_id in match_ids
+        ...         for name in ("meta.xml", "raw.dat")
+        ...     ]
+        ... )
+    """
+    if isinstance(inputs, Iterator):
+        # Consuming an iterator would leave nothing to load for the caller
+        return
+
+    uris = list(dict.fromkeys(_remote_uris(inputs)))
+    if not uris:
+        return
+
+    def _prefetch(uri: str) -> None:
+        adapter = get_adapter(uri)
+        if adapter is None:
+            return
+        try:
+            adapter.prefetch(uri)
+        except Exception as e:
+            logger.debug(f"Failed to prefetch {uri}: {e}")
+
+    if len(uris) == 1:
+        _prefetch(uris[0])
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers or DEFAULT_PREFETCH_WORKERS, len(uris))
+    ) as pool:
+        # Raises no errors, see _prefetch
+        list(pool.map(_prefetch, uris))
+
+
 def _natural_sort_key(path: str) -> list[Union[int, str]]:
     # Split string into list of chunks for natural sorting
     return [
@@ -1,5 +1,5 @@
 """Functions for loading Second Spectrum tracking data."""
 
-from ._providers.secondspectrum import load
+from ._providers.secondspectrum import iter_frames, load
 
-__all__ = ["load"]
+__all__ = ["iter_frames", "load"]
@@ -1,5 +1,10 @@
 """Functions for loading Stats Perform data."""
 
-from ._providers.statsperform import load, load_event, load_tracking
+from ._providers.statsperform import (
+    iter_frames,
+    load,
+    load_event,
+    load_tracking,
+)
 
-__all__ = ["load", "load_event", "load_tracking"]
+__all__ = ["iter_frames", "load", "load_event", "load_tracking"]
@@ -1,10 +1,29 @@
 """Module to store common fixtures."""
 
+from datetime import timedelta
 import os
 from pathlib import Path
 
 import pytest
 
+from kloppy.domain import (
+    BallState,
+    Dimension,
+    Ground,
+    Metadata,
+    NormalizedPitchDimensions,
+    Orientation,
+    Period,
+    Player,
+    PlayerData,
+    Point,
+    Point3D,
+    Provider,
+    Team,
+    TrackingDataset,
+)
+from kloppy.domain.services.frame_factory import create_frame
+
 
 @pytest.fixture(scope="session")
 def base_dir() -> Path:
@@ -17,3 +36,90 @@ def with_visualization(base_dir):
     if enable_viz:
         (base_dir / "outputs").mkdir(exist_ok=True)
     return enable_viz
+
+
+@pytest.fixture(params=["objects", "columnar"])
+def storage(request) -> str:
+    """The storage of the tracking datasets: frame objects or columnar."""
+    return request.param
+
+
+@pytest.fixture
+def teams() -> list[Team]:
+    return [
+        Team(team_id="home", name="home", ground=Ground.HOME),
+        Team(team_id="away", name="away", ground=Ground.AWAY),
+    ]
+
+
+@pytest.fixture
+def player(teams) -> Player:
+    return Player(team=teams[0], player_id="home_1", jersey_no=1)
+
+
+@pytest.fixture
+def build_tracking_dataset(teams, player, storage):
+    """
+    Return a function that builds a dataset with one player and the ball,
+    at 10 Hz, in the `storage` of the test.
+
+    The function takes (period_id, frame_id, x) tuples. The player moves
+    along the x axis at the given position (or is missing when x is None)
+    with a speed of 99 and the ball follows 1 meter in front of the player.
+    The ball goes out of play in the last frame.
+    """
+    periods = [
+        Period(id=1, start_timestamp=0.0, end_timestamp=45 * 60.0),
+        Period(id=2, start_timestamp=50 * 60.0, end_timestamp=95 * 60.0),
+    ]
+
+    def build(positions) -> TrackingDataset:
+        frames = []
+        for i, (period_id, frame_id, x) in enumerate(positions):
+            players_data = {}
+            if x is not None:
+                players_data[player] = PlayerData(
+                    coordinates=Point(x=x, y=34.0), speed=99.0
+                )
+            frames.append(
+                create_frame(
+                    frame_id=frame_id,
+                    timestamp=timedelta(seconds=frame_id / 10),
+                    ball_owning_team=None,
+                    ball_state=(
+                        BallState.DEAD
+                        if i == len(positions) - 1
+                        else BallState.ALIVE
+                    ),
+                    period=periods[period_id - 1],
+                    players_data=players_data,
+                    other_data={"frame": frame_id},
+                    ball_coordinates=Point3D(
+                        x=x + 1 if x is not None else 50.0, y=34.0, z=0.0
+                    ),
+                )
+            )
+        dataset = TrackingDataset(
+            metadata=Metadata(
+                teams=teams,
+                periods=periods,
+                pitch_dimensions=NormalizedPitchDimensions(
+                    x_dim=Dimension(0, 105),
+                    y_dim=Dimension(0, 68),
+                    pitch_length=105,
+                    pitch_width=68,
+                ),
+                score=None,
+                frame_rate=10,
+                orientation=Orientation.HOME_AWAY,
+                flags=None,
+                provider=Provider.OTHER,
+                coordinate_system=None,
+            ),
+            records=frames,
+        )
+        if storage == "columnar":
+            return dataset.to_columnar()
+        return dataset
+
+    return build
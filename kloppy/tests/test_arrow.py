@@ -0,0 +1,107 @@
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from kloppy import metrica, tracab
+from kloppy.domain import TrackingDataset
+from kloppy.exceptions import KloppyParameterError
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture(scope="module")
+def tracab_dataset(base_dir: Path) -> TrackingDataset:
+    return tracab.load(
+        meta_data=base_dir / "files" / "tracab_meta.xml",
+        raw_data=base_dir / "files" / "tracab_raw.dat",
+        coordinates="tracab",
+    )
+
+
+@pytest.fixture(scope="module")
+def metrica_dataset(base_dir: Path) -> TrackingDataset:
+    return metrica.load_tracking_csv(
+        home_data=base_dir / "files" / "metrica_home.csv",
+        away_data=base_dir / "files" / "metrica_away.csv",
+    )
+
+
+class TestToArrow:
+    def test_wide_layout(self, tracab_dataset: TrackingDataset):
+        table = tracab_dataset.to_arrow(chunk_size=2)
+        df = tracab_dataset.to_df(engine="pandas")
+
+        assert table.num_rows == len(tracab_dataset)
+        assert table.schema.field("timestamp").type == pa.duration("us")
+        assert table.schema.field("ball_x").type == pa.float64()
+        assert table.column("frame_id").to_pylist() == df["frame_id"].tolist()
+        assert table.column("ball_x").to_pylist() == df["ball_x"].tolist()
+
+        player = tracab_dataset.metadata.teams[0].players[0]
+        assert (
+            table.column(f"{player.player_id}_x").to_pylist()
+            == df[f"{player.player_id}_x"].tolist()
+        )
+
+    def test_long_layout(self, tracab_dataset: TrackingDataset):
+        table = tracab_dataset.to_arrow(layout="long")
+
+        frame = tracab_dataset.frames[0]
+        assert table.num_rows == sum(
+            len(frame.players_data) + 1 for frame in tracab_dataset.frames
+        )
+        rows = table.slice(0, len(frame.players_data) + 1).to_pylist()
+        assert rows[0]["player_id"] == "ball"
+        assert rows[0]["x"] == frame.ball_coordinates.x
+        assert rows[0]["z"] == frame.ball_coordinates.z
+        # The players follow the order of the metadata
+        players = [
+            player
+            for team in tracab_dataset.metadata.teams
+            for player in team.players
+            if player in frame.players_data
+        ]
+        assert [row["player_id"] for row in rows[1:]] == [
+            player.player_id for player in players
+        ]
+        player, player_data = players[0], frame.players_data[players[0]]
+        assert rows[1]["team_id"] == player.team.team_id
+        assert rows[1]["x"] == player_data.coordinates.x
+
+    @pytest.mark.parametrize("layout", ["wide", "long"])
+    def test_columnar(self, metrica_dataset: TrackingDataset, layout: str):
+        """The columnar fast path produces the same table."""
+        table = metrica_dataset.to_arrow(layout=layout, chunk_size=3)
+        columnar = metrica_dataset.to_columnar().to_arrow(
+            layout=layout, chunk_size=5
+        )
+
+        assert columnar.equals(table)
+
+    def test_invalid_layout(self, tracab_dataset: TrackingDataset):
+        with pytest.raises(KloppyParameterError):
+            tracab_dataset.to_arrow(layout="diagonal")
+
+
+class TestToParquet:
+    def test_row_groups(self, tracab_dataset: TrackingDataset):
+        buffer = BytesIO()
+        tracab_dataset.to_parquet(buffer, chunk_size=2)
+
+        parquet_file = pq.ParquetFile(BytesIO(buffer.getvalue()))
+        assert parquet_file.num_row_groups == 4
+        assert parquet_file.read().equals(tracab_dataset.to_arrow())
+
+    def test_stream(self, base_dir: Path, tracab_dataset: TrackingDataset):
+        buffer = BytesIO()
+        tracab.iter_frames(
+            meta_data=base_dir / "files" / "tracab_meta.xml",
+            raw_data=base_dir / "files" / "tracab_raw.dat",
+            coordinates="tracab",
+        ).to_parquet(buffer, layout="long")
+
+        assert pq.read_table(BytesIO(buffer.getvalue())).equals(
+            tracab_dataset.to_arrow(layout="long")
+        )
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+
+from kloppy import batch, metrica, tracab
+from kloppy.exceptions import BatchLoadError, KloppyParameterError
+
+
+@pytest.fixture(scope="module")
+def specs(base_dir: Path) -> list[dict]:
+    return [
+        {
+            "provider": "tracab",
+            "meta_data": base_dir / "files" / "tracab_meta.xml",
+            "raw_data": base_dir / "files" / "tracab_raw.dat",
+        },
+        {
+            "provider": "metrica",
+            "loader": "load_tracking_csv",
+            "home_data": base_dir / "files" / "metrica_home.csv",
+            "away_data": base_dir / "files" / "metrica_away.csv",
+        },
+        {
+            "provider": "tracab",
+            "meta_data": base_dir / "files" / "tracab_meta.xml",
+            "raw_data": base_dir / "files" / "tracab_raw.dat",
+            "limit": 2,
+        },
+    ]
+
+
+class TestBatch:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_load_in_order(self, specs: list[dict], workers: int):
+        datasets = batch.load(specs, workers=workers)
+
+        expected = [
+            tracab.load(
+                meta_data=specs[0]["meta_data"], raw_data=specs[0]["raw_data"]
+            ),
+            metrica.load_tracking_csv(
+                home_data=specs[1]["home_data"],
+                away_data=specs[1]["away_data"],
+            ),
+            tracab.load(
+                meta_data=specs[2]["meta_data"],
+                raw_data=specs[2]["raw_data"],
+                limit=2,
+            ),
+        ]
+        assert [len(dataset) for dataset in datasets] == [
+            len(dataset) for dataset in expected
+        ]
+        for dataset, other in zip(datasets, expected):
+            assert dataset.metadata.provider == other.metadata.provider
+            assert dataset.frames[-1].frame_id == other.frames[-1].frame_id
+            assert dataset.frames[1].prev_record is dataset.frames[0]
+
+    def test_apply_and_progress(self, specs: list[dict]):
+        progress = []
+
+        lengths = batch.load(
+            specs,
+            workers=2,
+            apply=len,
+            progress=lambda done, total: progress.append((done, total)),
+        )
+
+        assert lengths == [7, 6, 2]
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+
+    def test_errors(self, specs: list[dict], base_dir: Path):
+        broken = dict(specs[0], raw_data=base_dir / "files" / "missing.dat")
+
+        with pytest.raises(BatchLoadError) as exc_info:
+            batch.load([specs[0], broken], workers=2)
+        assert exc_info.value.index == 1
+
+        results = batch.load([broken, specs[2]], workers=2, on_error="return")
+        assert isinstance(results[0], BatchLoadError)
+        assert len(results[1]) == 2
+
+    def test_invalid_spec(self):
+        with pytest.raises(KloppyParameterError):
+            batch.load([{"provider": "unknown"}])
+        with pytest.raises(KloppyParameterError):
+            batch.load([{"provider": "tracab", "loader": "unknown"}])
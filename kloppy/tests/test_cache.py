@@ -0,0 +1,134 @@
+import os
+from pathlib import Path
+import shutil
+
+import pytest
+
+from kloppy import opta, tracab
+from kloppy.config import config_context
+from kloppy.infra.cache import get_dataset_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path):
+    with config_context("cache", str(tmp_path), "cache.datasets", True):
+        yield tmp_path
+
+
+@pytest.fixture
+def raw_data(base_dir: Path, tmp_path: Path) -> Path:
+    path = tmp_path / "tracab_raw.dat"
+    shutil.copy(base_dir / "files" / "tracab_raw.dat", path)
+    return path
+
+
+def _entries(cache_dir: Path) -> list[Path]:
+    return sorted((cache_dir / "datasets").glob("*/*.pkl"))
+
+
+class TestDatasetCache:
+    def test_hit(self, cache_dir: Path, base_dir: Path, raw_data: Path):
+        meta_data = base_dir / "files" / "tracab_meta.xml"
+        dataset = tracab.load(meta_data=meta_data, raw_data=raw_data)
+        assert len(_entries(cache_dir)) == 1
+
+        cached = tracab.load(meta_data=str(meta_data), raw_data=raw_data)
+        assert cached is not dataset
+        assert len(cached) == len(dataset)
+        assert cached.metadata.provider == dataset.metadata.provider
+        assert cached.frames[1].prev_record is cached.frames[0]
+        assert cached.to_df().equals(dataset.to_df())
+
+    def test_event_data(self, cache_dir: Path, base_dir: Path):
+        kwargs = dict(
+            f7_data=base_dir / "files" / "opta_f7.xml",
+            f24_data=base_dir / "files" / "opta_f24.xml",
+        )
+        dataset = opta.load(**kwargs)
+        cached = opta.load(**kwargs)
+
+        assert len(_entries(cache_dir)) == 1
+        assert [event.event_id for event in cached] == [
+            event.event_id for event in dataset
+        ]
+        assert cached.events[1].prev() is cached.events[0]
+
+    def test_miss(self, cache_dir: Path, base_dir: Path, raw_data: Path):
+        meta_data = base_dir / "files" / "tracab_meta.xml"
+        tracab.load(meta_data=meta_data, raw_data=raw_data)
+        tracab.load(meta_data=meta_data, raw_data=raw_data, limit=2)
+        tracab.load(
+            meta_data=meta_data, raw_data=raw_data, coordinates="tracab"
+        )
+        with config_context("coordinate_system", "tracab"):
+            tracab.load(meta_data=meta_data, raw_data=raw_data)
+        assert len(_entries(cache_dir)) == 4
+
+        # Changing the content of an input invalidates the entry
+        lines = raw_data.read_bytes().splitlines(keepends=True)
+        raw_data.write_bytes(b"".join(lines[:3]))
+        dataset = tracab.load(meta_data=meta_data, raw_data=raw_data)
+        assert len(dataset) == 3
+        assert len(_entries(cache_dir)) == 5
+
+    def test_bypass(self, cache_dir: Path, base_dir: Path):
+        with open(base_dir / "files" / "tracab_raw.dat", "rb") as raw_data:
+            tracab.load(
+                meta_data=base_dir / "files" / "tracab_meta.xml",
+                raw_data=raw_data,
+            )
+        assert _entries(cache_dir) == []
+
+        with config_context("cache.datasets", False):
+            tracab.load(
+                meta_data=base_dir / "files" / "tracab_meta.xml",
+                raw_data=base_dir / "files" / "tracab_raw.dat",
+            )
+        assert _entries(cache_dir) == []
+
+    def test_eviction(self, cache_dir: Path, base_dir: Path, raw_data: Path):
+        meta_data = base_dir / "files" / "tracab_meta.xml"
+        tracab.load(meta_data=meta_data, raw_data=raw_data, limit=1)
+        (entry,) = _entries(cache_dir)
+        size = entry.stat().st_size
+        os.utime(entry, (0, 0))
+
+        with config_context("cache.datasets.max_size", int(size * 1.5)):
+            tracab.load(meta_data=meta_data, raw_data=raw_data, limit=2)
+
+        # The least recently used entry is evicted
+        entries = _entries(cache_dir)
+        assert len(entries) == 1
+        assert entries[0] != entry
+
+        with config_context("cache.datasets.max_size", 10):
+            tracab.load(meta_data=meta_data, raw_data=raw_data)
+        assert _entries(cache_dir) == entries
+
+    def test_version_invalidation(
+        self, cache_dir: Path, base_dir: Path, raw_data: Path
+    ):
+        old_version = cache_dir / "datasets" / "0.0.1"
+        old_version.mkdir(parents=True)
+        (old_version / "entry.pkl").write_bytes(b"")
+
+        tracab.load(
+            meta_data=base_dir / "files" / "tracab_meta.xml",
+            raw_data=raw_data,
+        )
+
+        assert not old_version.exists()
+        assert len(_entries(cache_dir)) == 1
+
+        get_dataset_cache().clear()
+        assert _entries(cache_dir) == []
+
+    def test_no_cache_dir(self, base_dir: Path, raw_data: Path):
+        with config_context("cache", None, "cache.datasets", True):
+            assert get_dataset_cache() is None
+            dataset = tracab.load(
+                meta_data=base_dir / "files" / "tracab_meta.xml",
+                raw_data=raw_data,
+            )
+
+        assert len(dataset) == 7
@@ -0,0 +1,270 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from kloppy import metrica, secondspectrum, tracab
+from kloppy.config import config_context
+from kloppy.domain import (
+    ColumnarFrames,
+    Orientation,
+    PlayerData,
+    TrackingDataset,
+)
+
+
+@pytest.fixture(scope="module")
+def tracab_dataset(base_dir: Path) -> TrackingDataset:
+    return tracab.load(
+        meta_data=base_dir / "files" / "tracab_meta.xml",
+        raw_data=base_dir / "files" / "tracab_raw.dat",
+        coordinates="tracab",
+    )
+
+
+@pytest.fixture(scope="module")
+def metrica_dataset(base_dir: Path) -> TrackingDataset:
+    return metrica.load_tracking_csv(
+        home_data=base_dir / "files" / "metrica_home.csv",
+        away_data=base_dir / "files" / "metrica_away.csv",
+    )
+
+
+@pytest.fixture(scope="module")
+def secondspectrum_dataset(base_dir: Path) -> TrackingDataset:
+    return secondspectrum.load(
+        meta_data=base_dir / "files" / "second_spectrum_fake_metadata.xml",
+        raw_data=base_dir / "files" / "second_spectrum_fake_data.jsonl",
+        additional_meta_data=base_dir
+        / "files"
+        / "second_spectrum_fake_metadata.json",
+    )
+
+
+def assert_frames_equal(frame, other):
+    assert frame.frame_id == other.frame_id
+    assert frame.period == other.period
+    assert frame.timestamp == other.timestamp
+    assert frame.ball_state == other.ball_state
+    assert frame.ball_owning_team == other.ball_owning_team
+    assert frame.ball_coordinates == other.ball_coordinates
+    assert frame.ball_speed == other.ball_speed
+    assert frame.players_data == other.players_data
+    assert frame.other_data == (other.other_data or {})
+
+
+class TestColumnarFrames:
+    @pytest.mark.parametrize(
+        "dataset",
+        [
+            pytest.lazy_fixture("tracab_dataset"),
+            pytest.lazy_fixture("metrica_dataset"),
+            pytest.lazy_fixture("secondspectrum_dataset"),
+        ],
+    )
+    def test_roundtrip(self, dataset: TrackingDataset):
+        """Frames materialised from columnar storage equal the originals."""
+        columnar = dataset.to_columnar()
+
+        assert columnar.is_columnar
+        assert not dataset.is_columnar
+        assert isinstance(columnar.frames, ColumnarFrames)
+        assert len(columnar) == len(dataset)
+        for frame, other in zip(columnar.frames, dataset.frames):
+            assert_frames_equal(frame, other)
+
+    def test_arrays(self, tracab_dataset: TrackingDataset):
+        frames = tracab_dataset.to_columnar().frames
+
+        n_objects = len(frames.players) + 1
+        assert frames.coordinates.shape == (len(frames), n_objects, 3)
+        assert frames.speeds.shape == (len(frames), n_objects)
+        assert frames.frame_ids.tolist() == [
+            frame.frame_id for frame in tracab_dataset.frames
+        ]
+        assert frames.coordinates[0, 0].tolist() == [
+            tracab_dataset.frames[0].ball_coordinates.x,
+            tracab_dataset.frames[0].ball_coordinates.y,
+            tracab_dataset.frames[0].ball_coordinates.z,
+        ]
+
+    def test_navigation(self, tracab_dataset: TrackingDataset):
+        dataset = tracab_dataset.to_columnar()
+
+        frame = dataset.frames[1]
+        assert frame.dataset is dataset
+        assert frame.prev_record.frame_id == dataset.frames[0].frame_id
+        assert frame.next_record.frame_id == dataset.frames[2].frame_id
+        assert dataset.frames[0].prev_record is None
+        assert dataset.frames[-1].next_record is None
+        assert [f.frame_id for f in dataset.frames[1:3]] == [
+            f.frame_id for f in tracab_dataset.frames[1:3]
+        ]
+
+    def test_shared_storage(self, tracab_dataset: TrackingDataset):
+        """Datasets sharing arrays keep their own frames' dataset."""
+        dataset = tracab_dataset.to_columnar()
+        other = replace(
+            dataset,
+            metadata=replace(
+                dataset.metadata, orientation=Orientation.HOME_AWAY
+            ),
+        )
+
+        assert other.frames.coordinates is dataset.frames.coordinates
+        assert dataset.frames[0].dataset is dataset
+        assert other.frames[0].dataset is other
+        assert (
+            dataset.frames[0].attacking_direction
+            != other.frames[0].attacking_direction
+        )
+
+    def test_record_lookup(self, tracab_dataset: TrackingDataset):
+        dataset = tracab_dataset.to_columnar()
+
+        frame_id = tracab_dataset.frames[3].frame_id
+        assert dataset.get_record_position(frame_id) == 3
+        assert dataset.get_record_by_id(frame_id).frame_id == frame_id
+        assert dataset.get_records_by_ids([frame_id, -1])[1] is None
+
+    def test_filter(self, tracab_dataset: TrackingDataset):
+        dataset = tracab_dataset.to_columnar()
+
+        filtered = dataset.filter(lambda frame: frame.period.id == 2)
+        expected = tracab_dataset.filter(lambda frame: frame.period.id == 2)
+
+        assert filtered.is_columnar
+        assert len(filtered) == len(expected)
+        for frame, other in zip(filtered.frames, expected.frames):
+            assert_frames_equal(frame, other)
+        # Like the records of any filtered dataset, the frames keep their
+        # dataset and neighbours
+        assert filtered.frames[0].dataset is dataset
+        assert filtered.get_prev_record(filtered.frames[0]) is None
+        assert (
+            filtered.get_next_record(filtered.frames[0]).frame_id
+            == expected.frames[1].frame_id
+        )
+        assert (
+            filtered.frames[0].prev_record.frame_id
+            == expected.frames[0].prev_record.frame_id
+        )
+
+    def test_map(self, tracab_dataset: TrackingDataset):
+        dataset = tracab_dataset.to_columnar()
+
+        mapped = dataset.map(lambda frame: replace(frame, ball_speed=1.0))
+
+        assert mapped.is_columnar
+        assert len(mapped) == len(dataset)
+        assert all(frame.ball_speed == 1.0 for frame in mapped.frames)
+        assert mapped.frames[0].dataset is mapped
+
+    def test_read_only(self, tracab_dataset: TrackingDataset):
+        """Changes to a materialised frame would be lost, so they raise."""
+        dataset = tracab_dataset.to_columnar()
+
+        frame = dataset.frames[0]
+        with pytest.raises(AttributeError):
+            frame.ball_state = None
+
+        frame.other_data["changed"] = True
+        assert "changed" not in dataset.frames[0].other_data
+        assert replace(frame, ball_speed=1.0).ball_speed == 1.0
+
+    def test_players_without_coordinates(self, tracab_dataset: TrackingDataset):
+        """Objects without coordinates keep their speed and other data."""
+        frame = tracab_dataset.frames[0]
+        player = next(iter(frame.players_data))
+        player_data = PlayerData(
+            coordinates=None, speed=3.0, other_data={"source": "test"}
+        )
+        dataset = tracab_dataset.map(
+            lambda frame: replace(
+                frame,
+                ball_coordinates=None,
+                ball_speed=2.0,
+                players_data={**frame.players_data, player: player_data},
+            )
+        )
+
+        columnar = dataset.to_columnar()
+
+        assert not columnar.frames.has_coordinates[0, 0]
+        for frame, other in zip(columnar.frames, dataset.frames):
+            assert_frames_equal(frame, other)
+        assert columnar.frames[0].players_data[player] == player_data
+        assert columnar.frames[0].ball_speed == 2.0
+
+    @pytest.mark.parametrize(
+        "dataset",
+        [
+            pytest.lazy_fixture("tracab_dataset"),
+            pytest.lazy_fixture("metrica_dataset"),
+        ],
+    )
+    def test_long_layout(self, dataset: TrackingDataset):
+        """Both storages produce the same rows in the long layout."""
+        expected = dataset.to_dict(layout="long")
+        columns = dataset.to_columnar().to_dict(layout="long")
+
+        assert list(columns["frame_id"]) == expected["frame_id"]
+        assert list(columns["player_id"]) == expected["player_id"]
+        for name in ("x", "y", "z", "d", "s"):
+            assert list(columns[name]) == pytest.approx(
+                expected[name], nan_ok=True
+            )
+
+    def test_storage_config(self, base_dir: Path):
+        with config_context("tracking.storage", "columnar"):
+            dataset = tracab.load(
+                meta_data=base_dir / "files" / "tracab_meta.xml",
+                raw_data=base_dir / "files" / "tracab_raw.dat",
+            )
+
+        assert dataset.is_columnar
+        assert len(dataset) == 7
+
+    @pytest.mark.parametrize(
+        "dataset",
+        [
+            pytest.lazy_fixture("tracab_dataset"),
+            pytest.lazy_fixture("metrica_dataset"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"to_coordinate_system": "opta"},
+            {"to_orientation": "AWAY_HOME"},
+            {
+                "to_coordinate_system": "statsbomb",
+                "to_orientation": "AWAY_HOME",
+            },
+        ],
+    )
+    def test_transform(self, dataset: TrackingDataset, kwargs):
+        """The vectorized transform matches the frame by frame transform."""
+        expected = dataset.transform(**kwargs)
+        transformed = dataset.to_columnar().transform(**kwargs)
+
+        assert transformed.is_columnar
+        assert transformed.metadata == expected.metadata
+        for frame, other in zip(transformed.frames, expected.frames):
+            if other.ball_coordinates is None:
+                assert frame.ball_coordinates is None
+            else:
+                assert frame.ball_coordinates.x == pytest.approx(
+                    other.ball_coordinates.x
+                )
+                assert frame.ball_coordinates.y == pytest.approx(
+                    other.ball_coordinates.y
+                )
+            for player, player_data in other.players_data.items():
+                coordinates = frame.players_data[player].coordinates
+                assert coordinates.x == pytest.approx(
+                    player_data.coordinates.x, nan_ok=True
+                )
+                assert coordinates.y == pytest.approx(
+                    player_data.coordinates.y, nan_ok=True
+                )
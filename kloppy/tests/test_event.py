@@ -1,7 +1,15 @@
 import pytest
 
 from kloppy import statsbomb
-from kloppy.domain import EventDataset, FilteredDataset
+from kloppy.domain import (
+    EventDataset,
+    EventType,
+    FilteredDataset,
+    PassResult,
+    ShotResult,
+    compile_event_filter,
+)
+from kloppy.exceptions import InvalidFilterError, KloppyParameterError
 
 
 class TestEvent:
@@ -47,6 +55,62 @@ class TestEvent:
         assert first_goal.next(".goal").next(".goal") == goals[2]
         assert first_goal.next(".goal").next(".goal").next(".goal") is None
 
+    def test_indexed_navigation(self, dataset: EventDataset):
+        """
+        Test navigating with string filters and teams through the index
+        """
+        home_team, away_team = dataset.metadata.teams
+        event = dataset.events[2000]
+
+        def walk(event, predicate, forward):
+            record = event.next_record if forward else event.prev_record
+            while record and not predicate(record):
+                record = record.next_record if forward else record.prev_record
+            return record
+
+        assert event.prev("shot") is walk(
+            event, lambda e: e.event_type == EventType.SHOT, False
+        )
+        assert event.next("pass.complete") is walk(
+            event,
+            lambda e: (
+                e.event_type == EventType.PASS
+                and e.result == PassResult.COMPLETE
+            ),
+            True,
+        )
+        assert event.prev("shot", team=away_team) is walk(
+            event,
+            lambda e: e.event_type == EventType.SHOT and e.team == away_team,
+            False,
+        )
+        assert event.next(team=home_team) is walk(
+            event, lambda e: e.team == home_team, True
+        )
+        assert event.next(".goal").result == ShotResult.GOAL
+        assert event.prev("pass.goal") is None
+
+        # The index follows events that are replaced in place
+        shot = event.prev("shot")
+        position = dataset.get_record_position(shot.event_id)
+        dataset.records[position] = dataset.events[position - 1]
+        assert event.prev("shot") is shot.prev("shot")
+
+    def test_compile_event_filter(self):
+        """
+        Test string filters are parsed once
+        """
+        filter_ = compile_event_filter("pass.complete")
+        assert filter_ is compile_event_filter("pass.complete")
+        assert filter_.event_type == EventType.PASS
+        assert filter_.result == "COMPLETE"
+        assert compile_event_filter(".goal").event_type is None
+
+        with pytest.raises(InvalidFilterError):
+            compile_event_filter("unknown")
+        with pytest.raises(InvalidFilterError):
+            compile_event_filter("pass.complete.extra")
+
     def test_filter(self, dataset: EventDataset):
         """
         Test filtering allows simple 'css selector' (<event_type>.<result>)
@@ -71,6 +135,38 @@ class TestEvent:
         subset = goals_dataset.filter(lambda x: True)
         assert type(subset).__name__ == "FilteredEventDataset"
 
+    def test_filter_view(self, dataset: EventDataset):
+        """
+        Test filtered datasets are views on the unfiltered dataset
+        """
+        formations = [
+            dict(team.formations.items) for team in dataset.metadata.teams
+        ]
+
+        shots = dataset.filter("shot")
+        goals = shots.filter("shot.goal")
+
+        assert shots.metadata is dataset.metadata
+        assert goals.parent is dataset
+        assert [dataset.records[i] for i in goals.positions] == goals.records
+        assert goals.records[0] is dataset.find("shot.goal")
+
+        # The records keep their links in the unfiltered dataset
+        assert (
+            goals.records[0].prev_record
+            is dataset.records[goals.positions[0] - 1]
+        )
+        assert goals.get_prev_record(goals.records[0]) is None
+        assert goals.get_next_record(goals.records[0]) is goals.records[1]
+        assert goals.get_prev_record(goals.records[2]) is goals.records[1]
+        with pytest.raises(KloppyParameterError):
+            goals.get_next_record(dataset.records[0])
+
+        # Filtering does not replay the formation changes of the kept events
+        assert [
+            dict(team.formations.items) for team in dataset.metadata.teams
+        ] == formations
+
     def test_map(self, dataset: EventDataset):
         """
         Test the `map` method on a Dataset to allow chaining (filter and map)
@@ -98,3 +194,43 @@ class TestEvent:
         assert goals[0].next("shot.goal") == goals[1]
         assert goals[0].next("shot.goal") == goals[2].prev("shot.goal")
         assert goals[2].next("shot.goal") is None
+
+    def test_record_lookup(self, dataset: EventDataset):
+        """
+        Test looking up records by id
+        """
+        event = dataset.events[100]
+        assert dataset.get_record_by_id(event.event_id) is event
+        assert dataset.get_record_position(event.event_id) == 100
+        assert dataset.get_record_by_id("unknown") is None
+        assert dataset.get_records_by_ids(
+            [event.event_id, "unknown", dataset.events[0].event_id]
+        ) == [event, None, dataset.events[0]]
+
+        # Every dataset has its own index
+        goals_dataset = dataset.filter("shot.goal")
+        goal = goals_dataset.events[1]
+        assert goals_dataset.get_record_position(goal.event_id) == 1
+        assert goals_dataset.get_record_by_id(event.event_id) is None
+        assert dataset.get_record_position(goal.event_id) == (
+            dataset.events.index(goal)
+        )
+
+        # The index follows changes to the records
+        dataset.records[100] = dataset.events[101]
+        assert dataset.get_record_by_id(event.event_id) is None
+        dataset.records.append(event)
+        assert dataset.get_record_by_id(event.event_id) is event
+
+    def test_related_events(self, dataset: EventDataset):
+        pass_event = dataset.get_event_by_id(
+            "61da36dc-d862-416c-8ee3-1a0cd24dc086"
+        )
+        related_events = pass_event.get_related_events()
+
+        assert related_events
+        assert [event.event_id for event in related_events] == [
+            event_id
+            for event_id in pass_event.related_event_ids
+            if dataset.get_event_by_id(event_id) is not None
+        ]
@@ -0,0 +1,92 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from kloppy import event_pattern_matching as pm
+from kloppy import statsbomb
+from kloppy.domain import EventDataset
+from kloppy.domain.services.matchers.pattern.regexp import (
+    Eq,
+    Final,
+    RegExp,
+)
+
+
+@pytest.fixture(scope="module")
+def dataset(base_dir: Path) -> EventDataset:
+    return statsbomb.load(
+        event_data=base_dir / "files" / "statsbomb_event.json",
+        lineup_data=base_dir / "files" / "statsbomb_lineup.json",
+        event_types=["pass", "carry", "shot"],
+    )
+
+
+def possessions():
+    return (
+        pm.match_pass(capture="first_pass")
+        + (
+            pm.match_pass(team=pm.same_as("first_pass.team"))
+            | pm.match_carry(team=pm.same_as("first_pass.team"))
+        )
+        * slice(1, None)
+        + pm.match_any(capture="last_event")
+    )
+
+
+class TestSearch:
+    def test_search_equals_match_per_start(self, dataset: EventDataset):
+        """The single pass search finds the same matches as matching the
+        pattern from every start position."""
+        re = RegExp.from_ast(possessions())
+
+        expected = []
+        for period in dataset.metadata.periods:
+            events = [e for e in dataset.events if e.period == period]
+            for i in range(len(events)):
+                matches = re.match(events[i:], consume_all=False)
+                if matches:
+                    expected.append(matches[0])
+
+        matches = pm.search(dataset, re)
+
+        assert len(matches) == len(expected) > 0
+        for match, other in zip(matches, expected):
+            assert match.events == other.trail
+            assert match.captures == {
+                name: value[0].trail[0]
+                for name, value in other.children.items()
+            }
+
+    def test_max_length(self, dataset: EventDataset):
+        matches = pm.search(dataset, possessions(), max_length=3)
+
+        assert matches
+        assert all(2 <= len(match.events) <= 3 for match in matches)
+
+    def test_max_duration(self, dataset: EventDataset):
+        matches = pm.search(
+            dataset, possessions(), max_duration=timedelta(seconds=5)
+        )
+
+        assert matches
+        assert all(
+            match.events[-1].timestamp - match.events[0].timestamp
+            <= timedelta(seconds=5)
+            for match in matches
+        )
+
+    def test_regexp_search(self):
+        a = Final(Eq("a"))
+        b = Final(Eq("b"))
+        re = RegExp.from_ast(a["a"] + b * slice(1, None))
+
+        matches = list(re.search("abbxab", join_trails=True))
+        assert [(m.start_pos, m.trail) for m in matches] == [
+            (0, "abb"),
+            (4, "ab"),
+        ]
+        assert matches[1]["a"].start_pos == 4
+
+        # Matches are generated lazily, in order of their start position
+        assert next(re.search("abab", max_length=2)).trail == ("a", "b")
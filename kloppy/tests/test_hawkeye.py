@@ -86,6 +86,31 @@ class TestsHawkEyeInputs:
         )
         assert len(dataset) == 10
 
+    def test_workers(
+        self, ball_feeds: list[Path], player_centroid_feeds: list[Path]
+    ):
+        serial = hawkeye.load(
+            ball_feeds=ball_feeds,
+            player_centroid_feeds=player_centroid_feeds,
+            coordinates="hawkeye",
+            workers=1,
+        )
+        parallel = hawkeye.load(
+            ball_feeds=ball_feeds,
+            player_centroid_feeds=player_centroid_feeds,
+            coordinates="hawkeye",
+            workers=2,
+        )
+        assert [frame.frame_id for frame in parallel] == [
+            frame.frame_id for frame in serial
+        ]
+        assert parallel.records[-1].ball_coordinates == (
+            serial.records[-1].ball_coordinates
+        )
+        assert parallel.records[-1].players_data == (
+            serial.records[-1].players_data
+        )
+
     def test_sample_rate(
         self, ball_feeds: list[Path], player_centroid_feeds: list[Path]
     ):
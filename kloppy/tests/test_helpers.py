@@ -25,6 +25,7 @@ from kloppy.domain import (
     TrackingDataset,
 )
 from kloppy.domain.services.frame_factory import create_frame
+from kloppy.exceptions import KloppyParameterError
 
 
 class TestHelpers:
@@ -437,6 +438,32 @@ class TestHelpers:
         )
         assert_frame_equal(data_frame, expected_data_frame, check_like=True)
 
+    def test_to_pandas_long_layout(self):
+        tracking_data = self._get_tracking_dataset()
+
+        data_frame = tracking_data.to_df(engine="pandas", layout="long")
+
+        expected_data_frame = DataFrame.from_dict(
+            {
+                "period_id": [1, 2, 2],
+                "timestamp": [0.1, 0.2, 0.2],
+                "frame_id": [1, 2, 2],
+                "ball_state": [None, None, None],
+                "ball_owning_team_id": ["home", "away", "away"],
+                "team_id": [None, None, "home"],
+                "player_id": ["ball", "ball", "home_1"],
+                "x": [100.0, 0.0, 15.0],
+                "y": [-50.0, 50.0, 35.0],
+                "z": [0.0, 1.0, None],
+                "d": [None, None, 0.03],
+                "s": [None, None, 10.5],
+            }
+        )
+        assert_frame_equal(data_frame, expected_data_frame)
+
+        with pytest.raises(KloppyParameterError):
+            tracking_data.to_df("frame_id", layout="long")
+
     def test_to_pandas_generic_events(self, base_dir):
         dataset = opta.load(
             f7_data=base_dir / "files/opta_f7.xml",
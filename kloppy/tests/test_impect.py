@@ -1,5 +1,6 @@
 from collections import defaultdict
 from datetime import timedelta
+from types import SimpleNamespace
 from typing import cast
 
 import pytest
@@ -36,6 +37,9 @@ from kloppy.domain.models.event import (
     PassType,
     UnderPressureQualifier,
 )
+from kloppy.infra.serializers.event.impect.deserializer import (
+    _add_assist_windows,
+)
 from kloppy.infra.serializers.event.impect.helpers import parse_timestamp
 
 
@@ -94,6 +98,32 @@ class TestImpectHelpers:
             4,
         )
 
+    def test_assist_windows(self):
+        """It should deserialize raw events until two events precede a shot"""
+        raw_events = [
+            [EventType.PASS],
+            [EventType.PASS],
+            [EventType.PASS],
+            # A raw event that doesn't create an event
+            [],
+            [EventType.SHOT],
+            [EventType.INTERCEPTION, EventType.PASS],
+            [EventType.CARRY, EventType.SHOT],
+        ]
+
+        def deserialize_event(index):
+            return [
+                SimpleNamespace(event_type=event_type)
+                for event_type in raw_events[index]
+            ]
+
+        events_by_index = {
+            4: deserialize_event(4),
+            6: deserialize_event(6),
+        }
+        _add_assist_windows(events_by_index, deserialize_event)
+        assert sorted(events_by_index) == [1, 2, 3, 4, 5, 6]
+
     def test_period_id_for_all_events(self, dataset):
         for event in dataset.events:
             if event.raw_event:
@@ -371,6 +401,22 @@ class TestImpectPassEvent:
         ]
         assert len(goal_assists) == 3
 
+    def test_load_event_types(self, base_dir, dataset: EventDataset):
+        """It should mark the same assists when only passes are loaded"""
+        pass_dataset = impect.load(
+            event_data=base_dir / "files" / "impect_events.json",
+            lineup_data=base_dir / "files" / "impect_lineups.json",
+            coordinates="impect",
+            event_types=["pass"],
+        )
+        passes = dataset.find_all("pass")
+        assert [e.event_id for e in pass_dataset.events] == [
+            e.event_id for e in passes
+        ]
+        assert [e.qualifiers for e in pass_dataset.events] == [
+            e.qualifiers for e in passes
+        ]
+
 
 class TestImpectInterceptionEvent:
     """Tests related to deserialzing pass events"""
@@ -19,7 +19,14 @@ from kloppy.exceptions import InputNotFoundError, KloppyError
 from kloppy.infra.io import adapters
 from kloppy.infra.io.adapters import Adapter
 from kloppy.infra.io.buffered_stream import BufferedStream
-from kloppy.io import expand_inputs, get_file_extension, open_as_file
+from kloppy.io import (
+    Source,
+    expand_inputs,
+    get_file_extension,
+    open_as_file,
+    open_as_seekable_file,
+    prefetch,
+)
 
 # --- Shared Helpers ---
 
@@ -206,6 +213,36 @@ class TestOpenAsFile:
             open_as_file(path.open("rb"), mode="wb")
 
 
+class TestOpenAsSeekableFile:
+    """Tests for the open_as_seekable_file function."""
+
+    def test_read_local_file(self, populated_dir):
+        """It should open an uncompressed local file directly."""
+        path = populated_dir / "testfile.txt"
+        with open_as_seekable_file(path) as fp:
+            assert not isinstance(fp, BufferedStream)
+            fp.seek(7)
+            assert fp.read() == b"world!"
+
+    @pytest.mark.parametrize("ext", ["gz", "xz", "bz2"])
+    def test_read_compressed_local_file(self, populated_dir, ext):
+        """It should decompress a compressed local file."""
+        path = populated_dir / f"testfile.txt.{ext}"
+        with open_as_seekable_file(path) as fp:
+            assert fp.read() == b"Hello, world!"
+
+    def test_read_other_inputs(self, populated_dir, tmp_path):
+        """It should open other inputs with open_as_file."""
+        with open_as_seekable_file(b"Hello, world!") as fp:
+            assert fp.read() == b"Hello, world!"
+        with open_as_seekable_file(
+            Source.create(tmp_path / "missing.txt", skip_if_missing=True)
+        ) as fp:
+            assert fp is None
+        with pytest.raises(InputNotFoundError):
+            open_as_seekable_file(tmp_path / "missing.txt")
+
+
 class TestExpandInputs:
     @pytest.fixture
     def mock_fs(self, tmp_path):
@@ -272,6 +309,7 @@ class MockAdapter(Adapter):
 
     def __init__(self, initial_data: Optional[dict[str, bytes]] = None):
         self.storage = initial_data if initial_data else {}
+        self.prefetched = []
 
     def supports(self, url: str) -> bool:
         return url.startswith("mock://")
@@ -288,6 +326,9 @@ class MockAdapter(Adapter):
         else:
             raise FileNotFoundError(f"Mock file not found: {url}")
 
+    def prefetch(self, url: str) -> None:
+        self.prefetched.append(url)
+
     def write_from_stream(self, url: str, input: BinaryIO, mode: str):  # noqa: A002
         input.seek(0)
         self.storage[url] = input.read()
@@ -336,6 +377,22 @@ class TestMockAdapter:
         with open_as_file("mock://write/new.txt") as fp:
             assert fp.read() == b"New data"
 
+    def test_prefetch(self, adapter_setup, populated_dir):
+        prefetch(
+            [
+                "mock://read/data.txt",
+                Source.create("mock://read/config.json", optional=True),
+                "mock://read/data.txt",
+                str(populated_dir / "testfile.txt"),
+                '{"inline": "data"}',
+                None,
+            ]
+        )
+        assert sorted(adapter_setup.prefetched) == [
+            "mock://read/config.json",
+            "mock://read/data.txt",
+        ]
+
 
 class TestFileAdapter:
     """Tests for FileAdapter."""
@@ -459,6 +516,34 @@ class TestHTTPAdapter:
         with open_as_file(httpserver.url_for("/testfile.txt")) as fp:
             assert fp.read() == b"Hello, world!"
 
+    def test_prefetch(self, httpserver):
+        """It should download the files to the cache before they are read."""
+        urls = [
+            httpserver.url_for("/testfile.txt"),
+            httpserver.url_for("/testfile.txt.gz"),
+        ]
+        prefetch(urls)
+
+        # The files are read from the cache
+        httpserver.clear()
+        with open_as_file(urls[0]) as fp:
+            assert fp.read() == b"Hello, world!"
+        with open_as_file(urls[1]) as fp:
+            assert fp.read() == b"Hello, world!"
+
+    def test_reuse_filesystem(self, httpserver):
+        """It should reuse the filesystem (and its session) across reads."""
+        adapter = adapters.get_adapter(httpserver.url_for("/testfile.txt"))
+        url = httpserver.url_for("/testfile.txt")
+        assert adapter._get_filesystem(url) is adapter._get_filesystem(url)
+        with config_context(
+            "adapters.http.basic_authentication",
+            {"login": "Aladdin", "password": "OpenSesame"},
+        ):
+            assert adapter._get_filesystem(url) is not (
+                adapter._get_filesystem(url, no_cache=True)
+            )
+
     def test_read_compressed_auto_decompress(self, httpserver):
         """It should decompress files based on Content-Encoding header."""
         with open_as_file(httpserver.url_for("/compressed_endpoint")) as fp:
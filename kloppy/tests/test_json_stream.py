@@ -0,0 +1,92 @@
+from io import BytesIO
+import json
+import math
+
+import pytest
+
+from kloppy.infra.serializers import json_stream
+
+
+@pytest.fixture
+def items() -> list[dict]:
+    return [
+        {
+            "id": i,
+            "name": "é" * (i * 5_000),
+            "location": [1.5, 12345678901234, None],
+            "flags": [True, False],
+        }
+        for i in range(40)
+    ]
+
+
+class TestIterItems:
+    def test_array(self, items: list[dict]):
+        data = json.dumps(items, indent=2).encode()
+        assert list(json_stream.iter_items(BytesIO(data))) == items
+
+    def test_array_without_backend(
+        self, items: list[dict], monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(json_stream, "ijson", None)
+        data = b"\xef\xbb\xbf" + json.dumps(items).encode()
+        assert list(json_stream.iter_items(BytesIO(data))) == items
+        assert list(json_stream.iter_items(BytesIO(b" [ ] "))) == []
+        assert list(json_stream.iter_items(BytesIO(b"[1,2,3]"))) == [1, 2, 3]
+
+    def test_json_lines(self, items: list[dict]):
+        data = b"\n".join(json.dumps(item).encode() for item in items)
+        assert list(json_stream.iter_items(BytesIO(data))) == items
+
+    @pytest.mark.parametrize("backend", [True, False])
+    def test_key(
+        self,
+        items: list[dict],
+        backend: bool,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        if not backend:
+            monkeypatch.setattr(json_stream, "ijson", None)
+        data = json.dumps(
+            {"meta": {"data": [1]}, "data": items, "teams": {}}
+        ).encode()
+
+        assert list(json_stream.iter_items(BytesIO(data), key="data")) == items
+
+    def test_invalid(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(json_stream, "ijson", None)
+        with pytest.raises(ValueError):
+            list(json_stream.iter_items(BytesIO(b'{"a": []}'), key="data"))
+        with pytest.raises(ValueError):
+            list(json_stream.iter_items(BytesIO(b"[1, 2")))
+        with pytest.raises(ValueError):
+            list(json_stream.iter_items(BytesIO(b"[1 2]")))
+
+    def test_load(self, items: list[dict]):
+        data = json.dumps(items).encode()
+        assert json_stream.load(BytesIO(data)) == items
+        # Falls back to the json module for values the fast backend rejects
+        assert math.isnan(json_stream.loads(b"[NaN]")[0])
+
+
+class TestLoadsPrefix:
+    def test_leading_fields(self):
+        line = (
+            b'\xef\xbb\xbf{"frame": 10, "period": null, "time": "00:01.5", '
+            b'"live": true, "x": -1.5e2, "data": [{"period": 2}], "y": 1}\n'
+        )
+        assert json_stream.loads_prefix(line) == {
+            "frame": 10,
+            "period": None,
+            "time": "00:01.5",
+            "live": True,
+            "x": -150.0,
+        }
+
+    def test_keys(self):
+        line = b'{"a": "x\\"y", "b": 2, "c": 3}'
+        assert json_stream.loads_prefix(line, ("b",)) == {"b": 2}
+        assert json_stream.loads_prefix(line, ("a", "d")) == {
+            "a": 'x"y',
+        }
+        assert json_stream.loads_prefix(b'{"a": 1}', ("a",)) == {"a": 1}
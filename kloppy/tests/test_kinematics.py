@@ -0,0 +1,142 @@
+from pathlib import Path
+
+import pytest
+
+from kloppy import tracab
+from kloppy.domain import Player, PlayerData, compute_kinematics
+from kloppy.exceptions import KloppyParameterError
+
+np = pytest.importorskip("numpy")
+
+
+class TestKinematics:
+    def test_constant_velocity(self, build_tracking_dataset):
+        # 2 m/s along the x axis
+        dataset = build_tracking_dataset(
+            [(1, i, 10.0 + 0.2 * i) for i in range(10)]
+        )
+        kinematics = compute_kinematics(dataset)
+
+        assert kinematics.velocity[:, 1, 0] == pytest.approx([2.0] * 10)
+        assert kinematics.velocity[:, 1, 1] == pytest.approx([0.0] * 10)
+        assert kinematics.speed[:, 0] == pytest.approx([2.0] * 10)
+        assert kinematics.acceleration[:, 1] == pytest.approx([0.0] * 10)
+        assert kinematics.distance[:, 1] == pytest.approx(
+            [0.2 * i for i in range(10)]
+        )
+
+    def test_segments(self, build_tracking_dataset):
+        positions = (
+            [(1, i, 10.0 + 0.2 * i) for i in range(5)]
+            # Missing sample
+            + [(1, 5, None)]
+            + [(1, i, 10.0 + 0.5 * i) for i in range(6, 9)]
+            # Gap of 2 seconds
+            + [(1, 29, 20.0), (1, 30, 20.1)]
+            # Period boundary
+            + [(2, 30, 30.0), (2, 31, 30.3)]
+            # Singleton segment
+            + [(2, 50, 40.0)]
+        )
+        dataset = build_tracking_dataset(positions)
+        kinematics = compute_kinematics(dataset)
+
+        speed = kinematics.speed[:, 1]
+        assert speed[:5] == pytest.approx([2.0] * 5)
+        assert np.isnan(speed[5])
+        assert speed[6:9] == pytest.approx([5.0] * 3)
+        assert speed[9:11] == pytest.approx([1.0] * 2)
+        assert speed[11:13] == pytest.approx([3.0] * 2)
+        assert np.isnan(speed[13])
+
+        distance = kinematics.distance[:, 1]
+        assert distance[4] == pytest.approx(0.8)
+        assert np.isnan(distance[5])
+        assert distance[8] == pytest.approx(0.8 + 1.0)
+        assert distance[10] == pytest.approx(0.8 + 1.0 + 0.1)
+        assert distance[13] == pytest.approx(0.8 + 1.0 + 0.1 + 0.3)
+
+        # Without a maximum gap, the segment continues over the 2 seconds
+        kinematics = compute_kinematics(dataset, max_gap=None)
+        assert kinematics.distance[10, 1] == pytest.approx(
+            0.8 + 1.0 + 6.0 + 0.1
+        )
+
+    def test_smoothing(self, build_tracking_dataset):
+        # Jitter of 0.1 m around a constant velocity of 2 m/s
+        jitter = [0.0, 0.1, 0.0, -0.1]
+        dataset = build_tracking_dataset(
+            [(1, i, 10.0 + 0.2 * i + jitter[i % 4]) for i in range(12)]
+        )
+
+        raw = compute_kinematics(dataset)
+        smoothed = compute_kinematics(dataset, smoothing=3)
+        assert raw.distance[-1, 1] > smoothed.distance[-1, 1]
+        assert np.std(smoothed.speed[:, 1]) < np.std(raw.speed[:, 1])
+
+        with pytest.raises(KloppyParameterError):
+            compute_kinematics(dataset, smoothing=0)
+
+    def test_add_kinematics(self, player, build_tracking_dataset):
+        dataset = build_tracking_dataset(
+            [(1, i, 10.0 + 0.2 * i) for i in range(5)] + [(1, 5, None)]
+        )
+
+        kept = dataset.add_kinematics(overwrite=False)
+        assert kept.frames[2].players_data[player].speed == 99.0
+        assert kept.frames[2].players_data[player].distance == pytest.approx(
+            0.4
+        )
+
+        updated = dataset.add_kinematics()
+        frame = updated.frames[2]
+        player_data = frame.players_data[player]
+        assert player_data.speed == pytest.approx(2.0)
+        assert player_data.distance == pytest.approx(0.4)
+        assert player_data.other_data["vx"] == pytest.approx(2.0)
+        assert player_data.other_data["acceleration"] == pytest.approx(0.0)
+        assert frame.ball_speed == pytest.approx(2.0)
+        assert frame.other_data["ball_vx"] == pytest.approx(2.0)
+        assert player not in updated.frames[5].players_data
+
+        # The original dataset is not modified
+        assert dataset.frames[2].players_data[player].speed == 99.0
+
+    def test_to_df(self, build_tracking_dataset):
+        dataset = build_tracking_dataset(
+            [(1, i, 10.0 + 0.2 * i) for i in range(5)] + [(1, 5, None)]
+        )
+
+        df = compute_kinematics(dataset).to_df(engine="pandas")
+        assert list(df.columns) == [
+            "period_id",
+            "timestamp",
+            "frame_id",
+            "player_id",
+            "vx",
+            "vy",
+            "speed",
+            "acceleration",
+            "distance",
+        ]
+        # One row for the ball in every frame and one for the player in
+        # the frames in which the player is tracked
+        assert len(df) == 6 + 5
+        assert df[df["player_id"] == "home_1"]["speed"].tolist() == (
+            pytest.approx([2.0] * 5)
+        )
+
+    def test_players_without_coordinates(self, base_dir: Path):
+        """Players without coordinates are left unchanged."""
+        dataset = tracab.load(
+            meta_data=base_dir / "files" / "tracab_meta.xml",
+            raw_data=base_dir / "files" / "tracab_raw.dat",
+        )
+        player = Player(
+            player_id="extra", team=dataset.metadata.teams[0], jersey_no=99
+        )
+        player_data = PlayerData(coordinates=None, speed=3.0)
+        dataset.frames[0].players_data[player] = player_data
+
+        updated = dataset.add_kinematics()
+        assert updated.frames[0].players_data[player] == player_data
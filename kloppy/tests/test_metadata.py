@@ -10,6 +10,7 @@ from kloppy.domain import (
     Point,
     Point3D,
     Unit,
+    get_transformation_plan,
 )
 from kloppy.domain.services.transformers import DatasetTransformer
 
@@ -84,6 +85,44 @@ class TestPitchdimensions:
         point = pitch.from_metric_base(Point(107.625, 34))
         assert point == Point(105, 0)
 
+    def test_transformation_plan(self):
+        opta = OptaPitchDimensions()
+        metric = MetricPitchDimensions(
+            x_dim=Dimension(0, 105),
+            y_dim=Dimension(0, 68),
+            pitch_length=105,
+            pitch_width=68,
+            standardized=False,
+        )
+
+        plan = get_transformation_plan(opta, metric)
+        assert plan is get_transformation_plan(OptaPitchDimensions(), metric)
+        assert plan.apply(Point(11.5, 50)) == Point(11, 34)
+        assert plan.apply(Point3D(0, 50, 38)) == Point3D(0, 34, 2.44)
+
+        flipped = get_transformation_plan(opta, metric, flip_vertical=True)
+        assert flipped.apply(Point(11.5, 30)) == Point(
+            plan.apply(Point(11.5, 30)).x, 68 - plan.apply(Point(11.5, 30)).y
+        )
+
+    def test_transformation_plan_array(self):
+        np = pytest.importorskip("numpy")
+
+        opta = OptaPitchDimensions()
+        plan = get_transformation_plan(opta, None)
+        points = [
+            Point3D(11.5, 50, 38),
+            Point3D(60, 61, 0),
+            Point3D(-10, 120, 10),
+            Point3D(100, 0, 0),
+        ]
+
+        transformed = plan.apply_array(
+            np.array([[point.x, point.y, point.z] for point in points])
+        )
+        for point, row in zip(points, transformed.tolist()):
+            assert Point3D(*row) == opta.to_metric_base(point)
+
     def test_distance_between(self):
         pitch = OptaPitchDimensions(pitch_length=105, pitch_width=68)
 
@@ -0,0 +1,110 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from kloppy import sportec
+from kloppy.domain import BallState, TrackingDataset
+from kloppy.exceptions import KloppyParameterError
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def dataset(base_dir: Path, storage: str) -> TrackingDataset:
+    dataset = sportec.load_tracking(
+        raw_data=base_dir / "files/sportec_positional.xml",
+        meta_data=base_dir / "files/sportec_meta.xml",
+    )
+    if storage == "columnar":
+        return dataset.to_columnar()
+    return dataset
+
+
+class TestResample:
+    @pytest.mark.parametrize("method", ["linear", "nearest"])
+    def test_same_frame_rate(self, dataset, method):
+        resampled = dataset.resample(25, method=method)
+
+        assert len(resampled) == len(dataset)
+        for frame, other in zip(dataset.frames, resampled.frames):
+            assert frame.frame_id == other.frame_id
+            assert frame.time == other.time
+            assert frame.ball_coordinates == other.ball_coordinates
+            assert frame.players_data == other.players_data
+            assert frame.ball_state == other.ball_state
+            assert frame.ball_owning_team == other.ball_owning_team
+
+    def test_downsample(self, dataset, storage):
+        resampled = dataset.resample(10)
+
+        assert resampled.frame_rate == 10
+        assert resampled.is_columnar == (storage == "columnar")
+        # 4 seconds of data in each period
+        assert len(resampled) == 2 * 41
+        assert resampled.frames[0].frame_id == 4000
+        assert resampled.frames[1].timestamp == timedelta(seconds=0.1)
+        assert resampled.frames[41].period.id == 2
+        assert resampled.frames[41].timestamp == timedelta(0)
+
+        # Every 2.5th source frame: 10001 and 10002 are interpolated
+        source = dataset.frames
+        assert resampled.frames[1].ball_coordinates.x == pytest.approx(
+            (source[2].ball_coordinates.x + source[3].ball_coordinates.x) / 2
+        )
+
+    def test_upsample(self, player, build_tracking_dataset):
+        dataset = build_tracking_dataset(
+            [(1, i, x) for i, x in enumerate([10.0, 11.0, 12.0])]
+        )
+
+        linear = dataset.resample(20)
+        assert [
+            frame.players_data[player].coordinates.x for frame in linear.frames
+        ] == pytest.approx([10.0, 10.5, 11.0, 11.5, 12.0])
+        # The ball state is taken from the nearest frame
+        assert [frame.ball_state for frame in linear.frames] == [
+            BallState.ALIVE
+        ] * 4 + [BallState.DEAD]
+        assert [frame.other_data["frame"] for frame in linear.frames] == [
+            0,
+            0,
+            1,
+            1,
+            2,
+        ]
+
+        nearest = dataset.resample(20, method="nearest")
+        assert [
+            frame.players_data[player].coordinates.x for frame in nearest.frames
+        ] == [10.0, 10.0, 11.0, 11.0, 12.0]
+
+    def test_fill_gaps(self, player, build_tracking_dataset):
+        xs = [10.0, None, None, 13.0] + [None] * 8 + [30.0, None, 31.0, None]
+        dataset = build_tracking_dataset([(1, i, x) for i, x in enumerate(xs)])
+
+        resampled = dataset.resample(10)
+        xs = [
+            frame.players_data[player].coordinates.x
+            if player in frame.players_data
+            else None
+            for frame in resampled.frames
+        ]
+        # Short gaps are interpolated, the long gap and the end are not
+        assert xs[:4] == pytest.approx([10.0, 11.0, 12.0, 13.0])
+        assert xs[4:12] == [None] * 8
+        assert xs[12:] == pytest.approx([30.0, 30.5, 31.0, None])
+
+        resampled = dataset.resample(10, max_gap=None)
+        assert resampled.frames[8].players_data[player].coordinates.x == (
+            pytest.approx(13.0 + 17.0 * 5 / 9)
+        )
+
+        resampled = dataset.resample(10, max_gap=timedelta(0))
+        assert player not in resampled.frames[1].players_data
+
+    def test_invalid_arguments(self, dataset):
+        with pytest.raises(KloppyParameterError):
+            dataset.resample(10, method="cubic")
+        with pytest.raises(KloppyParameterError):
+            dataset.resample(0)
@@ -204,3 +204,25 @@ class TestSecondSpectrumTracking:
 
             data = json.loads(decoded_utf8sig)
             assert isinstance(data, dict)
+
+    def test_time_range(self, meta_data: Path, raw_data: Path):
+        dataset = secondspectrum.load(
+            meta_data=meta_data, raw_data=raw_data, only_alive=False
+        )
+        start, end = dataset.frames[200].time, dataset.frames[203].time
+
+        sliced = secondspectrum.load(
+            meta_data=meta_data,
+            raw_data=raw_data,
+            only_alive=False,
+            time_range=(start, end),
+        )
+
+        assert [frame.frame_id for frame in sliced] == [
+            frame.frame_id for frame in dataset.frames[200:204]
+        ]
+        assert sliced.frames[0].period.id == 2
+        assert sliced.metadata.orientation == dataset.metadata.orientation
+        assert sliced.frames[3].ball_coordinates == (
+            dataset.frames[203].ball_coordinates
+        )
@@ -112,6 +112,23 @@ class TestSportecEventData:
         assert first_pass.receiver_coordinates != first_pass.next().coordinates
         assert first_pass.receiver_coordinates == Point(x=77.75, y=38.71)
 
+    def test_load_event_types(
+        self, event_data: Path, meta_data: Path, dataset: EventDataset
+    ):
+        """It should deserialize the passes like in a full load"""
+        pass_dataset = sportec.load_event(
+            event_data=event_data,
+            meta_data=meta_data,
+            coordinates="sportec",
+            event_types=["pass"],
+        )
+        passes = dataset.find_all("pass")
+        assert len(passes) > 0
+        assert [
+            (e.event_id, e.result, e.receiver_coordinates)
+            for e in pass_dataset.events
+        ] == [(e.event_id, e.result, e.receiver_coordinates) for e in passes]
+
 
 class TestSportecTrackingData:
     """
@@ -6,6 +6,7 @@ from typing import cast
 import pytest
 
 from kloppy import statsbomb
+from kloppy.config import config_context
 from kloppy.domain import (
     BallState,
     BodyPart,
@@ -828,6 +829,88 @@ class TestStatsBombInterceptionEvent:
         assert interception.get_qualifier_value(BodyPartQualifier) is None
 
 
+class TestStatsBombEventTypes:
+    """Tests related to loading a subset of the event types"""
+
+    @pytest.fixture
+    def kwargs(self, base_dir: Path) -> dict:
+        return dict(
+            lineup_data=base_dir / "files" / "statsbomb_lineup.json",
+            event_data=base_dir / "files" / "statsbomb_event.json",
+        )
+
+    @pytest.mark.parametrize("pushdown", [False, True])
+    def test_load_event_types(self, kwargs: dict, pushdown: bool):
+        """It should only deserialize the requested event types"""
+        dataset = statsbomb.load(**kwargs)
+        with config_context("event_types.pushdown", pushdown):
+            shot_dataset = statsbomb.load(**kwargs, event_types=["shot"])
+
+        shots = dataset.find_all("shot")
+        assert len(shots) > 0
+        assert [e.event_id for e in shot_dataset.events] == [
+            e.event_id for e in shots
+        ]
+        assert [e.result for e in shot_dataset.events] == [
+            e.result for e in shots
+        ]
+
+    @pytest.mark.parametrize("pushdown", [False, True])
+    def test_load_event_types_player_positions(
+        self, kwargs: dict, pushdown: bool
+    ):
+        """Substitutions and tactical shifts should still update positions"""
+        dataset = statsbomb.load(**kwargs)
+        with config_context("event_types.pushdown", pushdown):
+            shot_dataset = statsbomb.load(**kwargs, event_types=["shot"])
+
+        shots = dataset.find_all("shot")
+        assert [
+            e.player.positions.value_at(e.time)
+            for e in shot_dataset.events
+            if e.player is not None
+        ] == [
+            e.player.positions.value_at(e.time)
+            for e in shots
+            if e.player is not None
+        ]
+
+    def test_load_event_types_navigation(self, kwargs: dict):
+        """By default, the events keep their neighbours of a full load"""
+        expected = statsbomb.load(**kwargs).filter("shot")
+        shot_dataset = statsbomb.load(**kwargs, event_types=["shot"])
+
+        assert len(shot_dataset.parent) == len(expected.parent)
+
+        def event_id(event):
+            return event.event_id if event is not None else None
+
+        for event, other in zip(shot_dataset.events, expected.events):
+            assert event_id(event.prev_record) == event_id(other.prev_record)
+            assert event_id(event.next_record) == event_id(other.next_record)
+            assert event_id(event.prev()) == event_id(other.prev())
+            assert event_id(event.next()) == event_id(other.next())
+            assert event_id(event.prev("pass")) == event_id(other.prev("pass"))
+            assert [e.event_id for e in event.get_related_events()] == [
+                e.event_id for e in other.get_related_events()
+            ]
+        assert any(event.get_related_events() for event in expected.events)
+
+    def test_load_event_types_pushdown(self, kwargs: dict):
+        """With pushdown, the events only see the deserialized events"""
+        with config_context("event_types.pushdown", True):
+            shot_dataset = statsbomb.load(**kwargs, event_types=["shot"])
+
+        assert {e.event_type for e in shot_dataset.parent.events} <= {
+            EventType.SHOT,
+            EventType.SUBSTITUTION,
+            EventType.FORMATION_CHANGE,
+        }
+        shot = shot_dataset.events[1]
+        assert shot.prev("pass") is None
+        assert shot.prev("shot").event_id == shot_dataset.events[0].event_id
+
+
 class TestStatsBombOwnGoalEvent:
     """Tests related to deserializing 20/Own Goal Against and 25/Own Goal For events"""
 
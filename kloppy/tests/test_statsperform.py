@@ -17,6 +17,7 @@ from kloppy.domain import (
     SportVUCoordinateSystem,
     Time,
     TrackingDataset,
+    TrackingDataStream,
 )
 
 
@@ -422,6 +423,95 @@ class TestStatsPerformTracking:
             )
 
 
+class TestStatsPerformTrackingStream:
+    def test_stream_yields_loaded_frames(
+        self,
+        tracking_dataset: TrackingDataset,
+        tracking_metadata_xml: Path,
+        tracking_data: Path,
+    ):
+        with statsperform.iter_frames(
+            ma1_data=tracking_metadata_xml,
+            ma25_data=tracking_data,
+            tracking_system="sportvu",
+            only_alive=False,
+            coordinates="sportvu",
+        ) as stream:
+            assert isinstance(stream, TrackingDataStream)
+            assert stream.metadata.frame_rate == tracking_dataset.frame_rate
+            assert (
+                stream.metadata.orientation
+                == tracking_dataset.metadata.orientation
+            )
+            frames = list(stream)
+
+        assert [frame.frame_id for frame in frames] == [
+            frame.frame_id for frame in tracking_dataset.frames
+        ]
+        assert (
+            frames[-1].players_data == tracking_dataset.frames[-1].players_data
+        )
+
+
+class TestStatsPerformTrackingFrameIndex:
+    def test_frame_range(
+        self,
+        tracking_dataset: TrackingDataset,
+        tracking_metadata_json: Path,
+        tracking_data: Path,
+    ):
+        frames = tracking_dataset.frames
+        sliced = statsperform.load_tracking(
+            ma1_data=tracking_metadata_json,
+            ma25_data=tracking_data,
+            only_alive=False,
+            coordinates="sportvu",
+            frame_range=(frames[24].frame_id, frames[27].frame_id),
+        )
+
+        assert [frame.frame_id for frame in sliced] == [
+            frame.frame_id for frame in frames[24:28]
+        ]
+        assert [frame.period.id for frame in sliced] == [1, 1, 2, 2]
+        assert sliced.metadata.orientation == (
+            tracking_dataset.metadata.orientation
+        )
+        assert sliced.frames[3].players_data == frames[27].players_data
+
+    def test_time_range_with_sidecar(
+        self,
+        tracking_dataset: TrackingDataset,
+        tracking_metadata_json: Path,
+        tracking_data: Path,
+        tmp_path: Path,
+    ):
+        frames = tracking_dataset.frames
+        sidecar = tmp_path / "statsperform_tracking_ma25.txt.index.json"
+        start, end = frames[30].time, frames[33].time
+
+        # A file object is read into memory instead of opened directly
+        for ma25_data in (tracking_data, tracking_data.read_bytes()):
+            sliced = statsperform.load_tracking(
+                ma1_data=tracking_metadata_json,
+                ma25_data=ma25_data,
+                only_alive=False,
+                coordinates="sportvu",
+                time_range=(start, end),
+                frame_index=sidecar,
+            )
+            assert sidecar.exists()
+            assert [frame.frame_id for frame in sliced] == [
+                frame.frame_id for frame in frames[30:34]
+            ]
+            assert sliced.frames[0].ball_coordinates == (
+                frames[30].ball_coordinates
+            )
+            # The orientation is determined from the first period
+            assert sliced.metadata.orientation == (
+                tracking_dataset.metadata.orientation
+            )
+
+
 class TestStatsPerformXMLWithBOM:
     def test_event_xml_with_bom(
         self, event_metadata_xml: Path, event_data_xml: Path
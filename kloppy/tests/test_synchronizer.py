@@ -0,0 +1,149 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from kloppy import sportec
+from kloppy.domain import (
+    EventDataset,
+    EventTrackingSynchronizer,
+    TrackingDataset,
+)
+from kloppy.exceptions import KloppyParameterError
+
+
+@pytest.fixture
+def event_dataset(base_dir: Path) -> EventDataset:
+    return sportec.load_event(
+        event_data=base_dir / "files/sportec_events.xml",
+        meta_data=base_dir / "files/sportec_meta.xml",
+    )
+
+
+@pytest.fixture
+def tracking_dataset(base_dir: Path, storage: str) -> TrackingDataset:
+    dataset = sportec.load_tracking(
+        raw_data=base_dir / "files/sportec_positional.xml",
+        meta_data=base_dir / "files/sportec_meta.xml",
+    )
+    if storage == "columnar":
+        return dataset.to_columnar()
+    return dataset
+
+
+def nearest_frame_position(tracking_dataset, event, offset=0.0):
+    """Reference implementation that scans all frames."""
+    best = None
+    for position, frame in enumerate(tracking_dataset.frames):
+        if frame.period.id != event.period.id:
+            continue
+        distance = abs(
+            frame.timestamp.total_seconds()
+            - event.timestamp.total_seconds()
+            - offset
+        )
+        if best is None or distance < best[0]:
+            best = (distance, position)
+    return best[1] if best else -1
+
+
+class TestEventTrackingSynchronizer:
+    def test_match_nearest_frame(self, event_dataset, tracking_dataset):
+        synchronizer = EventTrackingSynchronizer(tracking_dataset)
+
+        positions = synchronizer.frame_positions(event_dataset.events)
+        assert positions.tolist() == [
+            nearest_frame_position(tracking_dataset, event)
+            for event in event_dataset.events
+        ]
+
+        frames = synchronizer.match(event_dataset.events)
+        assert frames[1].frame_id == 10078
+        assert frames[1].period.id == 1
+
+    def test_offsets(self, event_dataset, tracking_dataset):
+        synchronizer = EventTrackingSynchronizer(
+            tracking_dataset, offsets={1: timedelta(seconds=-3)}
+        )
+
+        positions = synchronizer.frame_positions(event_dataset.events)
+        assert positions.tolist() == [
+            nearest_frame_position(
+                tracking_dataset, event, -3.0 if event.period.id == 1 else 0
+            )
+            for event in event_dataset.events
+        ]
+
+    def test_tolerance(self, event_dataset, tracking_dataset):
+        synchronizer = EventTrackingSynchronizer(
+            tracking_dataset, tolerance=timedelta(seconds=0.02)
+        )
+
+        frames = synchronizer.match(event_dataset.events)
+        # Only 3 events happen during the 4 seconds of tracking data
+        assert [frame.frame_id for frame in frames if frame] == [
+            10000,
+            10078,
+            100000,
+        ]
+
+    def test_ball_window(self, event_dataset, tracking_dataset):
+        synchronizer = EventTrackingSynchronizer(
+            tracking_dataset, ball_window=timedelta(seconds=2)
+        )
+        event = event_dataset.events[1]
+        frame = synchronizer.match([event])[0]
+
+        # The frame with the ball nearest to the event within the window
+        candidates = synchronizer.windows(
+            [event], timedelta(seconds=2), timedelta(seconds=2)
+        )[0]
+        assert (
+            frame.frame_id
+            == min(
+                candidates,
+                key=lambda frame: event.coordinates.distance_to(
+                    frame.ball_coordinates
+                ),
+            ).frame_id
+        )
+
+        with pytest.raises(KloppyParameterError):
+            EventTrackingSynchronizer(
+                tracking_dataset, ball_window=timedelta(seconds=-1)
+            )
+
+    def test_windows(self, event_dataset, tracking_dataset):
+        synchronizer = EventTrackingSynchronizer(tracking_dataset)
+
+        windows = synchronizer.windows(
+            event_dataset.events[:3],
+            before=timedelta(seconds=0.1),
+            after=timedelta(seconds=0.1),
+        )
+        assert [[frame.frame_id for frame in w] for w in windows] == [
+            [10000, 10001, 10002],
+            [10076, 10077, 10078, 10079, 10080],
+            [],
+        ]
+
+    def test_add_freeze_frames(self, event_dataset, tracking_dataset):
+        count = event_dataset.add_freeze_frames(
+            tracking_dataset, tolerance=timedelta(seconds=0.02)
+        )
+
+        assert count == 3
+        assert event_dataset.events[1].freeze_frame.frame_id == 10078
+        assert event_dataset.events[2].freeze_frame is None
+
+        # Existing freeze frames are kept unless overwrite is set
+        event_dataset.add_freeze_frames(
+            tracking_dataset, offsets={1: timedelta(seconds=1)}
+        )
+        assert event_dataset.events[1].freeze_frame.frame_id == 10078
+        event_dataset.add_freeze_frames(
+            tracking_dataset,
+            offsets={1: timedelta(seconds=1)},
+            overwrite=True,
+        )
+        assert event_dataset.events[1].freeze_frame.frame_id == 10100
@@ -3,8 +3,13 @@ from pathlib import Path
 
 import pytest
 
-from kloppy import statsbomb
-from kloppy.domain import EventDataset, Point
+from kloppy import sportscode, statsbomb, tracab
+from kloppy.domain import (
+    CodeDataset,
+    EventDataset,
+    Point,
+    TrackingDataset,
+)
 from kloppy.domain.services.transformers.attribute import (
     AngleToGoalTransformer,
     DistanceToGoalTransformer,
@@ -109,3 +114,95 @@ class TestToRecords:
             "timestamp": timedelta(seconds=0.098),
             "angle_to_goal": 89.49633196102769,
         }
+
+    def test_to_dict_columns(self, dataset: EventDataset):
+        """
+        The column plan used by to_dict must return the same values as
+        to_records, whether or not the columns depend on the record.
+        """
+        for columns in [
+            ("event_id", "timestamp", "end_coordinates_x", "coordinates"),
+            ("event_id", "coordinates_*", DistanceToGoalTransformer()),
+        ]:
+            records = dataset.to_records(*columns, period=lambda e: e.period.id)
+            columns_dict = dataset.to_dict(
+                *columns, period=lambda e: e.period.id
+            )
+            assert list(columns_dict.keys()) == list(records[0].keys())
+            for key, values in columns_dict.items():
+                assert values == [record.get(key) for record in records]
+
+
+def assert_to_dict_equals_to_records(dataset, *columns, **named_columns):
+    records = dataset.to_records(*columns, **named_columns)
+    columns_dict = dataset.to_dict(*columns, **named_columns)
+    assert list(columns_dict.keys()) == list(records[0].keys())
+    for key, values in columns_dict.items():
+        assert values == [record.get(key) for record in records]
+
+
+class TestToDictFrames:
+    @pytest.fixture
+    def dataset(self, base_dir: Path) -> TrackingDataset:
+        dataset = tracab.load(
+            meta_data=base_dir / "files" / "tracab_meta.xml",
+            raw_data=base_dir / "files" / "tracab_raw.dat",
+            coordinates="tracab",
+        )
+        frame = dataset.frames[1]
+        player_data = next(iter(frame.players_data.values()))
+        # Values in other_data override the columns of the default row
+        player_data.other_data = {"x": 1.0, "extra": 2}
+        frame.other_data = {"ball_speed": 5.0}
+        return dataset
+
+    def test_to_dict_columns(self, dataset: TrackingDataset):
+        """
+        The column plan used by to_dict must return the same values as
+        to_records for ball and player columns.
+        """
+        player = next(iter(dataset.frames[1].players_data))
+        other_player = dataset.metadata.teams[1].players[0]
+        assert_to_dict_equals_to_records(
+            dataset,
+            "frame_id",
+            "ball_x",
+            "ball_speed",
+            f"{player.player_id}_x",
+            f"{player.player_id}_y",
+            f"{player.player_id}_s",
+            f"{player.player_id}_extra",
+            f"{other_player.player_id}_x",
+            "unknown_x",
+            period=lambda frame: frame.period.id,
+        )
+
+    def test_player_other_data(self, dataset: TrackingDataset):
+        player = next(iter(dataset.frames[1].players_data))
+        columns = dataset.to_dict(
+            f"{player.player_id}_x", f"{player.player_id}_extra"
+        )
+        assert columns[f"{player.player_id}_x"][1] == 1.0
+        assert columns[f"{player.player_id}_extra"][1] == 2
+
+
+class TestToDictCodes:
+    @pytest.fixture
+    def dataset(self, base_dir: Path) -> CodeDataset:
+        return sportscode.load(base_dir / "files" / "code_xml.xml")
+
+    def test_to_dict_columns(self, dataset: CodeDataset):
+        """
+        The column plan used by to_dict must return the same values as
+        to_records for attributes and labels.
+        """
+        assert_to_dict_equals_to_records(
+            dataset,
+            "code_id",
+            "timestamp",
+            "code",
+            "Team",
+            "Packing.Value",
+            "unknown",
+            period=lambda code: code.period.id,
+        )
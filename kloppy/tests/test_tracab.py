@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from kloppy import tracab
+from kloppy.config import config_context
 from kloppy.domain import (
     BallState,
     DatasetType,
@@ -12,7 +13,9 @@ from kloppy.domain import (
     Point,
     Point3D,
     Provider,
+    TrackingDataStream,
 )
+from kloppy.exceptions import KloppyParameterError
 
 
 @pytest.fixture(scope="session")
@@ -190,6 +193,175 @@ class TestTracabDATTracking:
             assert game_id == "1"
 
 
+class TestTracabDATColumnar:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"only_alive": True}, {"sample_rate": 0.5, "limit": 2}],
+    )
+    def test_matches_frame_parser(
+        self, xml_meta_data: Path, dat_raw_data: Path, kwargs
+    ):
+        """Parsing straight into columnar storage yields the same frames."""
+        dataset = tracab.load(
+            meta_data=xml_meta_data, raw_data=dat_raw_data, **kwargs
+        )
+        with config_context("tracking.storage", "columnar"):
+            columnar = tracab.load(
+                meta_data=xml_meta_data, raw_data=dat_raw_data, **kwargs
+            )
+
+        assert columnar.is_columnar
+        assert columnar.metadata.orientation == dataset.metadata.orientation
+        assert len(columnar) == len(dataset)
+        for frame, other in zip(columnar.frames, dataset.frames):
+            assert frame.frame_id == other.frame_id
+            assert frame.period == other.period
+            assert frame.timestamp == other.timestamp
+            assert frame.ball_state == other.ball_state
+            assert frame.ball_owning_team == other.ball_owning_team
+            assert frame.ball_coordinates.x == pytest.approx(
+                other.ball_coordinates.x
+            )
+            assert frame.players_data.keys() == other.players_data.keys()
+            for player, player_data in other.players_data.items():
+                assert frame.players_data[
+                    player
+                ].coordinates.x == pytest.approx(player_data.coordinates.x)
+                assert frame.players_data[player].speed == player_data.speed
+
+
+class TestTracabDATStream:
+    def test_stream_yields_loaded_frames(
+        self, xml_meta_data: Path, dat_raw_data: Path
+    ):
+        dataset = tracab.load(
+            meta_data=xml_meta_data, raw_data=dat_raw_data, only_alive=False
+        )
+
+        with tracab.iter_frames(
+            meta_data=xml_meta_data, raw_data=dat_raw_data, only_alive=False
+        ) as stream:
+            assert isinstance(stream, TrackingDataStream)
+            assert stream.metadata.orientation == dataset.metadata.orientation
+            assert stream.metadata.frame_rate == dataset.metadata.frame_rate
+            frames = list(stream)
+
+        assert [frame.frame_id for frame in frames] == [
+            frame.frame_id for frame in dataset.frames
+        ]
+        assert frames[0].ball_coordinates == dataset.frames[0].ball_coordinates
+        assert frames[-1].players_data == dataset.frames[-1].players_data
+
+    def test_stream_limit_and_sample_rate(
+        self, xml_meta_data: Path, dat_raw_data: Path
+    ):
+        stream = tracab.iter_frames(
+            meta_data=xml_meta_data,
+            raw_data=dat_raw_data,
+            only_alive=False,
+            sample_rate=0.5,
+            limit=2,
+        )
+
+        assert [frame.frame_id for frame in stream] == [
+            frame.frame_id
+            for frame in tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=dat_raw_data,
+                only_alive=False,
+                sample_rate=0.5,
+                limit=2,
+            )
+        ]
+
+    def test_stream_close(self, xml_meta_data: Path, dat_raw_data: Path):
+        stream = tracab.iter_frames(
+            meta_data=xml_meta_data, raw_data=dat_raw_data, only_alive=False
+        )
+        frames = iter(stream)
+        next(frames)
+        stream.close()
+
+        assert list(frames) == []
+        with pytest.raises(RuntimeError):
+            list(stream)
+
+    def test_stream_to_dataset(self, xml_meta_data: Path, dat_raw_data: Path):
+        dataset = tracab.iter_frames(
+            meta_data=xml_meta_data, raw_data=dat_raw_data, only_alive=False
+        ).to_dataset()
+
+        assert len(dataset) == 7
+        assert dataset.frames[1].prev_record is dataset.frames[0]
+
+
+class TestTracabDATFrameIndex:
+    def test_frame_range(self, xml_meta_data: Path, dat_raw_data: Path):
+        dataset = tracab.load(meta_data=xml_meta_data, raw_data=dat_raw_data)
+        sliced = tracab.load(
+            meta_data=xml_meta_data,
+            raw_data=dat_raw_data,
+            frame_range=(1848510, 1942114),
+        )
+
+        assert [frame.frame_id for frame in sliced] == [
+            1848510,
+            1916408,
+            1942114,
+        ]
+        assert sliced.metadata.orientation == dataset.metadata.orientation
+        assert sliced.frames[0].players_data == dataset.frames[2].players_data
+        assert sliced.frames[2].ball_coordinates == (
+            dataset.frames[4].ball_coordinates
+        )
+
+    def test_time_range_with_sidecar(
+        self, xml_meta_data: Path, dat_raw_data: Path, tmp_path: Path
+    ):
+        dataset = tracab.load(meta_data=xml_meta_data, raw_data=dat_raw_data)
+        sidecar = tmp_path / "tracab_raw.dat.index.json"
+        start, end = dataset.frames[4].time, dataset.frames[5].time
+
+        for _ in range(2):
+            sliced = tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=dat_raw_data,
+                time_range=(start, end),
+                frame_index=sidecar,
+            )
+            assert sidecar.exists()
+            assert [frame.frame_id for frame in sliced] == [1942114, 1942115]
+            assert all(frame.period.id == 2 for frame in sliced)
+            # The orientation is determined from the first period
+            assert sliced.metadata.orientation == dataset.metadata.orientation
+
+    def test_columnar(self, xml_meta_data: Path, dat_raw_data: Path):
+        with config_context("tracking.storage", "columnar"):
+            sliced = tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=dat_raw_data,
+                frame_range=(1916408, None),
+            )
+
+        assert sliced.is_columnar
+        assert [frame.frame_id for frame in sliced] == [
+            1916408,
+            1942114,
+            1942115,
+            2017933,
+        ]
+
+    def test_json_not_supported(
+        self, json_meta_data: Path, json_raw_data: Path
+    ):
+        with pytest.raises(KloppyParameterError):
+            tracab.load(
+                meta_data=json_meta_data,
+                raw_data=json_raw_data,
+                frame_range=(0, 10),
+            )
+
+
 class TestTracabMeta2:
     def test_correct_deserialization(
         self, xml_meta2_data: Path, dat_raw_data: Path
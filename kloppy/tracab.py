@@ -1,5 +1,5 @@
 """Functions for loading Tracab tracking data."""
 
-from ._providers.tracab import load
+from ._providers.tracab import iter_frames, load
 
-__all__ = ["load"]
+__all__ = ["iter_frames", "load"]
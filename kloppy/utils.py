@@ -225,3 +225,27 @@ def github_resolve_raw_data_url(repository: str, branch: str, file: str) -> str:
         # If there's an error, fall back to the standard raw.githubusercontent.com URL
         # This ensures backwards compatibility
         return f"https://raw.githubusercontent.com/{repository}/{branch}/{encoded_file}"
+
+
+def import_numpy():
+    """Import numpy, raising a helpful error when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Seems like you don't have numpy installed. Please"
+            " install it using: pip install numpy"
+        )
+    return numpy
+
+
+def import_pyarrow():
+    """Import pyarrow, raising a helpful error when it is not installed."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Seems like you don't have pyarrow installed. Please"
+            " install it using: pip install pyarrow"
+        )
+    return pyarrow